@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+应用列表序列化基准测试
+
+对比 1,000 个应用的列表在两条路径上的耗时：
+- 旧路径：标准库 json 解析 JSON 列 -> 逐字段构造 ApplicationResponse ->
+  按响应模型再次校验并序列化（FastAPI response_model 的行为）-> JSONResponse
+- 新路径：json_codec（orjson）解析 JSON 列 -> 领域对象直接转字典 -> FastJSONResponse
+
+使用方法:
+    python scripts/bench_application_list.py [--count 1000] [--repeat 20]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from pydantic import TypeAdapter  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from src.adapters.application_adapter import ApplicationAdapter  # noqa: E402
+from src.infrastructure import json_codec  # noqa: E402
+from src.infrastructure.config.settings import Settings  # noqa: E402
+from src.infrastructure.json_codec import FastJSONResponse  # noqa: E402
+from src.routers.application_router import _application_to_dict, _icon_url  # noqa: E402
+from src.routers.schemas.application import (  # noqa: E402
+    AgentConfigItemResponse,
+    ApplicationResponse,
+    MicroAppResponse,
+    OntologyConfigItemResponse,
+    ReleaseConfigItemResponse,
+)
+
+
+class _FakeApp:
+    """提供 url_path_for 的最小应用对象，用于生成图标地址。"""
+
+    def url_path_for(self, name: str, **params) -> str:
+        return f"/api/dip-hub/v1/applications/{params['id']}/icon"
+
+
+class _FakeRequest:
+    """仅包含 app 属性的请求对象。"""
+
+    app = _FakeApp()
+
+
+def _make_rows(count: int) -> List[tuple]:
+    """生成与 _APPLICATION_COLUMNS 结构一致的数据库行。"""
+    base = datetime(2024, 1, 1)
+    rows = []
+    for i in range(1, count + 1):
+        rows.append((
+            i,
+            f"{i:032x}",
+            f"应用 {i}",
+            "用于基准测试的应用描述" * 4,
+            i % 2,
+            "1.2.3",
+            "DIP for ITOps",
+            json.dumps({"name": f"app_{i}", "entry": f"/app_{i}", "headless": False}),
+            json.dumps([{"name": f"release-{i}-{j}", "namespace": "dip"} for j in range(3)]),
+            json.dumps([{"id": str(j), "is_config": j % 2 == 0} for j in range(5)]),
+            json.dumps([{"id": str(j), "is_config": True} for j in range(5)]),
+            1,
+            "系统管理员",
+            "00000000-0000-0000-0000-000000000001",
+            base + timedelta(minutes=i),
+            "db_public",
+        ))
+    return rows
+
+
+def _legacy_response(app, request) -> ApplicationResponse:
+    """旧路径：逐字段构造响应模型。"""
+    micro_app = None
+    if app.micro_app is not None:
+        micro_app = MicroAppResponse(
+            name=app.micro_app.name, entry=app.micro_app.entry, headless=app.micro_app.headless
+        )
+    return ApplicationResponse(
+        id=app.id,
+        key=app.key,
+        name=app.name,
+        description=app.description,
+        icon=app.icon,
+        icon_url=_icon_url(request, app),
+        category=app.category,
+        version=app.version,
+        micro_app=micro_app,
+        release_config=[
+            ReleaseConfigItemResponse(name=item.name, namespace=item.namespace)
+            for item in app.release_config
+        ],
+        ontology_config=[
+            OntologyConfigItemResponse(id=item.id, is_config=item.is_config)
+            for item in app.ontology_config
+        ],
+        agent_config=[
+            AgentConfigItemResponse(id=item.id, is_config=item.is_config)
+            for item in app.agent_config
+        ],
+        is_config=app.is_config,
+        updated_by=app.updated_by,
+        updated_by_id=app.updated_by_id,
+        updated_at=app.updated_at,
+    )
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> float:
+    """执行 repeat 次并返回耗时中位数（毫秒）。"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="应用列表序列化基准测试")
+    parser.add_argument("--count", type=int, default=1000, help="应用数量")
+    parser.add_argument("--repeat", type=int, default=20, help="每项重复次数")
+    args = parser.parse_args()
+
+    adapter = ApplicationAdapter(Settings())
+    request = _FakeRequest()
+    rows = _make_rows(args.count)
+    list_adapter = TypeAdapter(List[ApplicationResponse])
+    apps = [adapter._row_to_application(row) for row in rows]
+    orjson_module = json_codec.orjson
+
+    def decode_legacy():
+        json_codec.orjson = None
+        try:
+            return [adapter._row_to_application(row) for row in rows]
+        finally:
+            json_codec.orjson = orjson_module
+
+    def decode_fast():
+        return [adapter._row_to_application(row) for row in rows]
+
+    def encode_legacy():
+        models = [_legacy_response(app, request) for app in apps]
+        validated = list_adapter.validate_python(models, from_attributes=True)
+        return JSONResponse(content=list_adapter.dump_python(validated, mode="json")).body
+
+    def encode_fast():
+        return FastJSONResponse(content=[_application_to_dict(app, request) for app in apps]).body
+
+    assert json.loads(encode_legacy()) == json.loads(encode_fast()), "两条路径的输出不一致"
+
+    results = [
+        ("JSON 列解析", _measure(decode_legacy, args.repeat), _measure(decode_fast, args.repeat)),
+        ("响应序列化", _measure(encode_legacy, args.repeat), _measure(encode_fast, args.repeat)),
+    ]
+    results.append((
+        "合计",
+        sum(legacy for _, legacy, _ in results),
+        sum(fast for _, _, fast in results),
+    ))
+
+    backend = "orjson" if orjson_module is not None else "json（未安装 orjson）"
+    print(f"应用数量: {args.count}，重复次数: {args.repeat}，新路径 JSON 实现: {backend}")
+    print(f"{'阶段':<12}{'旧路径(ms)':>12}{'新路径(ms)':>12}{'加速比':>10}")
+    for name, legacy, fast in results:
+        print(f"{name:<12}{legacy:>12.2f}{fast:>12.2f}{legacy / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,108 @@ import base64
 import json
 import logging
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
-import aiomysql
+from aiomysql import IntegrityError
 
-from src.domains.application import Application, MicroAppInfo, OntologyConfigItem, AgentConfigItem, ReleaseConfigItem
+from src.domains.application import (
+    Application, ApplicationChangeCursor, ApplicationChanges, ApplicationCursor, ApplicationPage,
+    ApplicationTombstone,
+    MicroAppInfo, OntologyConfigItem, AgentConfigItem, ReleaseConfigItem,
+)
 from src.ports.application_port import ApplicationPort
+from src.infrastructure import json_codec
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.pool import DatabasePool
 
 logger = logging.getLogger(__name__)
 
+# MariaDB 唯一键冲突错误码
+_ER_DUP_ENTRY = 1062
+
+# 应用查询列（与 _row_to_application 的行结构对应）
+# 图标列只返回是否存在，图标内容通过 get_application_icon 单独读取，避免每次查询都读取 BLOB
+_APPLICATION_COLUMNS = """id, `key`, name, description, (icon IS NOT NULL) AS has_icon,
+                              version, category, micro_app, release_config, ontology_ids,
+                              agent_ids, is_config,
+                              updated_by, updated_by_id, updated_at,
+                              COALESCE(business_domain, 'db_public') AS business_domain"""
+
+# 应用写入列（与 _application_values 的参数顺序对应）
+_WRITE_COLUMNS = (
+    "`key`", "name", "description", "icon", "version", "category", "micro_app",
+    "release_config", "ontology_ids", "agent_ids", "is_config",
+    "updated_by", "updated_by_id", "updated_at", "business_domain",
+)
+
+_INSERT_APPLICATION_SQL = (
+    f"INSERT INTO t_application ({', '.join(_WRITE_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_WRITE_COLUMNS))})"
+)
+
+# 带版本条件的覆盖写：
+# - id = LAST_INSERT_ID(id) 使覆盖已有行时 cursor.lastrowid 返回该行 ID，无需再次查询
+# - 各列仅在库中版本仍等于期望版本时更新（期望版本为 NULL 表示应用应不存在，条件恒不成立）
+# - ON DUPLICATE KEY UPDATE 按从左到右的顺序赋值，后面的表达式看到的是已更新的值，
+#   因此 version 必须最后赋值，前面各列的条件才能读到旧版本号
+_UPSERT_GUARD = "(%s IS NOT NULL AND version <=> %s)"
+_UPSERT_APPLICATION_SQL = (
+    _INSERT_APPLICATION_SQL
+    + " ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), "
+    + ", ".join(
+        f"{column} = IF({_UPSERT_GUARD}, VALUES({column}), {column})"
+        for column in [c for c in _WRITE_COLUMNS if c not in ("`key`", "version")] + ["version"]
+    )
+)
+_UPSERT_GUARD_COUNT = len(_WRITE_COLUMNS) - 1
+
+# 标记已配置时写回配置项（与 SELECT ... FOR UPDATE 在同一事务中执行，避免与其他写操作交错）
+_MARK_CONFIGURED_SQL = """UPDATE t_application
+                          SET ontology_ids = %s, agent_ids = %s,
+                              is_config = TRUE, updated_by = %s, updated_by_id = %s, updated_at = %s
+                          WHERE id = %s"""
+
+# 配置项中升级比对用的可选字段（来源文件和摘要），为空时不写入 JSON
+_FINGERPRINT_FIELDS = ("source", "digest")
+
+
+def _config_item_dict(item, *fields: str) -> dict:
+    """
+    将配置项序列化为字典，附带非空的来源文件和摘要字段。
+
+    参数:
+        item: Release、业务知识网络或智能体配置项
+        *fields: 必须写入的字段名
+
+    返回:
+        dict: 可 JSON 序列化的字典
+    """
+    data = {name: getattr(item, name) for name in fields}
+    for name in _FINGERPRINT_FIELDS:
+        value = getattr(item, name, None)
+        if value is not None:
+            data[name] = value
+    return data
+
+
+def _config_list_json(items, *fields: str) -> str:
+    """
+    将配置项列表序列化为 JSON 文本。
+
+    参数:
+        items: 配置项列表（可以为 None）
+        *fields: 必须写入的字段名
+
+    返回:
+        str: JSON 数组文本
+    """
+    return json.dumps([_config_item_dict(item, *fields) for item in (items or [])])
+
+
+# 应用目录版本号递增（目录版本表只有 id = 1 一行，不存在时自动创建）
+_BUMP_CATALOG_VERSION_SQL = """INSERT INTO t_application_version (id, version) VALUES (1, 1)
+                               ON DUPLICATE KEY UPDATE version = version + 1"""
+
 
 class ApplicationAdapter(ApplicationPort):
     """
@@ -27,43 +119,31 @@ class ApplicationAdapter(ApplicationPort):
     使用 aiomysql 进行异步数据库操作。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, pool: Optional[DatabasePool] = None):
         """
         初始化应用适配器。
 
         参数:
             settings: 应用配置
+            pool: 共享的数据库连接池，为 None 时由适配器自行创建并在 close() 时关闭
         """
         self._settings = settings
-        self._pool: Optional[aiomysql.Pool] = None
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else DatabasePool(settings)
 
-    async def _get_pool(self) -> aiomysql.Pool:
+    async def _get_pool(self) -> DatabasePool:
         """
         获取数据库连接池。
 
         返回:
-            aiomysql.Pool: 数据库连接池
-        """
-        if self._pool is None:
-            self._pool = await aiomysql.create_pool(
-                host=self._settings.db_host,
-                port=self._settings.db_port,
-                user=self._settings.db_user,
-                password=self._settings.db_password,
-                db=self._settings.db_name,
-                autocommit=True,
-                minsize=1,
-                maxsize=10,
-            )
-            logger.info(f"数据库连接池已创建: {self._settings.db_host}:{self._settings.db_port}/{self._settings.db_name}")
+            DatabasePool: 数据库连接池
+        """
         return self._pool
 
     async def close(self):
-        """关闭数据库连接池。"""
-        if self._pool is not None:
-            self._pool.close()
-            await self._pool.wait_closed()
-            logger.info("数据库连接池已关闭")
+        """关闭自行创建的数据库连接池，共享连接池由其持有者关闭。"""
+        if self._owns_pool:
+            await self._pool.close()
 
     def _parse_json_list(self, json_str: Optional[str], default: list = None) -> list:
         """
@@ -81,7 +161,7 @@ class ApplicationAdapter(ApplicationPort):
         if not json_str:
             return default
         try:
-            result = json.loads(json_str)
+            result = json_codec.loads(json_str)
             return result if isinstance(result, list) else default
         except json.JSONDecodeError:
             logger.warning(f"JSON 解析失败: {json_str}")
@@ -100,7 +180,7 @@ class ApplicationAdapter(ApplicationPort):
         if not json_str:
             return None
         try:
-            data = json.loads(json_str)
+            data = json_codec.loads(json_str)
             if isinstance(data, dict):
                 return MicroAppInfo(
                     name=data.get("name", ""),
@@ -125,7 +205,7 @@ class ApplicationAdapter(ApplicationPort):
         if not json_str:
             return []
         try:
-            data = json.loads(json_str)
+            data = json_codec.loads(json_str)
             if not isinstance(data, list):
                 return []
             
@@ -136,6 +216,8 @@ class ApplicationAdapter(ApplicationPort):
                     result.append(ReleaseConfigItem(
                         name=item.get("name", ""),
                         namespace=item.get("namespace", "default"),
+                        source=item.get("source"),
+                        digest=item.get("digest"),
                     ))
                 elif isinstance(item, str):
                     # 兼容旧格式：仅 release name，namespace 使用默认值
@@ -159,7 +241,7 @@ class ApplicationAdapter(ApplicationPort):
         if not json_str:
             return []
         try:
-            data = json.loads(json_str)
+            data = json_codec.loads(json_str)
             if not isinstance(data, list):
                 return []
             
@@ -170,11 +252,15 @@ class ApplicationAdapter(ApplicationPort):
                         result.append(OntologyConfigItem(
                             id=str(item.get("id", "")),
                             is_config=item.get("is_config", False),
+                            source=item.get("source"),
+                            digest=item.get("digest"),
                         ))
                     elif config_type == 'agent':
                         result.append(AgentConfigItem(
                             id=str(item.get("id", "")),
                             is_config=item.get("is_config", False),
+                            source=item.get("source"),
+                            digest=item.get("digest"),
                         ))
                 # 兼容旧格式：如果是整数或字符串，转换为配置项
                 elif isinstance(item, (int, str)):
@@ -195,14 +281,16 @@ class ApplicationAdapter(ApplicationPort):
             row: 数据库查询结果行
                 (id, key, name, description, icon, version, category, micro_app,
                  release_config, ontology_ids, agent_ids, is_config, updated_by, updated_by_id, updated_at)
-                或包含 business_domain 的扩展版本
+                或包含 business_domain 的扩展版本；icon 列可以是图标二进制数据，
+                也可以是仅表示图标是否存在的标记（见 _APPLICATION_COLUMNS）
 
         返回:
             Application: 应用领域模型
         """
         # 将二进制图标转换为 Base64 字符串
         icon_base64 = None
-        if row[4]:
+        icon_exists = bool(row[4])
+        if isinstance(row[4], (bytes, bytearray)) and row[4]:
             try:
                 icon_base64 = base64.b64encode(row[4]).decode('utf-8')
             except Exception as e:
@@ -251,6 +339,7 @@ class ApplicationAdapter(ApplicationPort):
             updated_by=row[12] or "",
             updated_by_id=updated_by_id,
             updated_at=updated_at,
+            icon_exists=icon_exists,
         )
 
     async def get_all_applications(self) -> List[Application]:
@@ -264,15 +353,151 @@ class ApplicationAdapter(ApplicationPort):
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """SELECT id, `key`, name, description, icon, version, category, micro_app,
-                              release_config, ontology_ids, agent_ids, is_config, 
-                              updated_by, updated_by_id, updated_at, COALESCE(business_domain, 'db_public') as business_domain
+                    f"""SELECT {_APPLICATION_COLUMNS}
                        FROM t_application 
                        ORDER BY updated_at DESC"""
                 )
                 rows = await cursor.fetchall()
                 return [self._row_to_application(row) for row in rows]
 
+    async def list_applications(
+        self,
+        limit: int,
+        cursor: Optional[ApplicationCursor] = None,
+        category: Optional[str] = None,
+        business_domain: Optional[str] = None,
+    ) -> ApplicationPage:
+        """
+        分页获取应用列表（按更新时间、ID 倒序的键集分页）。
+
+        排序与游标条件由 idx_updated_at（二级索引隐含主键 id）支撑；
+        按分组过滤时可使用 idx_category。多取一条用于判断是否还有下一页。
+
+        参数:
+            limit: 每页条数
+            cursor: 上一页返回的游标，为 None 时从第一页开始
+            category: 按应用分组过滤
+            business_domain: 按业务域过滤
+
+        返回:
+            ApplicationPage: 当前页应用列表及下一页游标
+        """
+        conditions = []
+        params: list = []
+        if cursor is not None:
+            conditions.append("(updated_at < %s OR (updated_at = %s AND id < %s))")
+            params.extend([cursor.updated_at, cursor.updated_at, cursor.id])
+        if category is not None:
+            conditions.append("category = %s")
+            params.append(category)
+        if business_domain is not None:
+            conditions.append("COALESCE(business_domain, 'db_public') = %s")
+            params.append(business_domain)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit + 1)
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"""SELECT {_APPLICATION_COLUMNS}
+                       FROM t_application
+                       {where}
+                       ORDER BY updated_at DESC, id DESC
+                       LIMIT %s""",
+                    tuple(params)
+                )
+                rows = await cur.fetchall()
+
+        items = [self._row_to_application(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and items:
+            last = items[-1]
+            next_cursor = ApplicationCursor(updated_at=last.updated_at, id=last.id)
+        return ApplicationPage(items=items, next_cursor=next_cursor)
+
+    async def list_application_changes(
+        self,
+        since: ApplicationChangeCursor,
+        limit: int,
+    ) -> ApplicationChanges:
+        """
+        获取游标之后的应用目录增量变更。
+
+        新增/更新的应用按 (updated_at, id) 正序读取，由 idx_updated_at 支撑；
+        删除记录按墓碑序号正序读取。最近 application_changes_settle_seconds 秒内的变更暂不返回，
+        避免同一秒内稍后提交的写操作落在已返回的游标之前而被漏掉。
+
+        参数:
+            since: 上次同步返回的游标
+            limit: 新增/更新应用和删除记录各自的最大条数
+
+        返回:
+            ApplicationChanges: 增量变更及下次同步使用的游标
+        """
+        settle_seconds = self._settings.application_changes_settle_seconds
+        settled_before = datetime.now() - timedelta(seconds=settle_seconds)
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    f"""SELECT {_APPLICATION_COLUMNS}
+                       FROM t_application
+                       WHERE (updated_at > %s OR (updated_at = %s AND id > %s))
+                         AND updated_at < %s
+                       ORDER BY updated_at ASC, id ASC
+                       LIMIT %s""",
+                    (since.updated_at, since.updated_at, since.id, settled_before, limit + 1)
+                )
+                rows = await cursor.fetchall()
+                await cursor.execute(
+                    """SELECT seq, app_id, `key`, deleted_at
+                       FROM t_application_tombstone
+                       WHERE seq > %s
+                       ORDER BY seq ASC
+                       LIMIT %s""",
+                    (since.tombstone_seq, limit + 1)
+                )
+                tombstone_rows = await cursor.fetchall()
+
+        # 墓碑按序号读取，只返回已稳定的连续前缀，保证游标之前不会再出现新的删除记录
+        tombstones = []
+        for row in tombstone_rows:
+            if row[3] is not None and row[3] >= settled_before:
+                break
+            tombstones.append(
+                ApplicationTombstone(seq=row[0], id=row[1], key=row[2], deleted_at=row[3])
+            )
+
+        items = [self._row_to_application(row) for row in rows[:limit]]
+        deleted = tombstones[:limit]
+        next_cursor = ApplicationChangeCursor(
+            updated_at=items[-1].updated_at if items else since.updated_at,
+            id=items[-1].id if items else since.id,
+            tombstone_seq=deleted[-1].seq if deleted else since.tombstone_seq,
+        )
+        return ApplicationChanges(
+            items=items,
+            deleted=deleted,
+            next_cursor=next_cursor,
+            has_more=len(rows) > limit or len(tombstones) > limit,
+        )
+
+    async def get_catalog_version(self) -> int:
+        """
+        获取应用目录版本号。
+
+        返回:
+            int: 当前目录版本号，尚未发生过写操作时为 0
+        """
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT version FROM t_application_version WHERE id = 1")
+                row = await cursor.fetchone()
+                return int(row[0]) if row else 0
+
     async def get_application_by_key(self, key: str) -> Application:
         """
         根据应用唯一标识获取应用信息。
@@ -290,9 +515,7 @@ class ApplicationAdapter(ApplicationPort):
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """SELECT id, `key`, name, description, icon, version, category, micro_app,
-                              release_config, ontology_ids, agent_ids, is_config,
-                              updated_by, updated_at, COALESCE(business_domain, 'db_public') as business_domain
+                    f"""SELECT {_APPLICATION_COLUMNS}
                        FROM t_application 
                        WHERE `key` = %s""",
                     (key,)
@@ -316,9 +539,7 @@ class ApplicationAdapter(ApplicationPort):
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """SELECT id, `key`, name, description, icon, version, category, micro_app,
-                              release_config, ontology_ids, agent_ids, is_config,
-                              updated_by, updated_at, COALESCE(business_domain, 'db_public') as business_domain
+                    f"""SELECT {_APPLICATION_COLUMNS}
                        FROM t_application 
                        WHERE `key` = %s""",
                     (key,)
@@ -345,9 +566,7 @@ class ApplicationAdapter(ApplicationPort):
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """SELECT id, `key`, name, description, icon, version, category, micro_app,
-                              release_config, ontology_ids, agent_ids, is_config,
-                              updated_by, updated_by_id, updated_at, COALESCE(business_domain, 'db_public') as business_domain
+                    f"""SELECT {_APPLICATION_COLUMNS}
                        FROM t_application 
                        WHERE id = %s""",
                     (app_id,)
@@ -357,6 +576,80 @@ class ApplicationAdapter(ApplicationPort):
                     raise ValueError(f"应用不存在: id={app_id}")
                 return self._row_to_application(row)
 
+    async def get_application_icon(self, app_id: int) -> Optional[bytes]:
+        """
+        根据应用主键 ID 获取应用图标原始数据。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            Optional[bytes]: 图标二进制数据，应用没有图标时返回 None
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    "SELECT icon FROM t_application WHERE id = %s",
+                    (app_id,)
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    raise ValueError(f"应用不存在: id={app_id}")
+                return row[0] or None
+
+    def _application_values(self, application: Application) -> tuple:
+        """
+        将应用实体转换为与 _WRITE_COLUMNS 对应的写入参数。
+
+        参数:
+            application: 应用实体
+
+        返回:
+            tuple: 写入参数
+        """
+        # 将 Base64 字符串转换为二进制数据
+        icon_binary = None
+        if application.icon:
+            try:
+                icon_binary = base64.b64decode(application.icon)
+            except Exception as e:
+                logger.warning(f"应用图标 Base64 解码失败: {e}")
+                icon_binary = None
+
+        # 序列化 JSON 字段
+        micro_app_json = None
+        if application.micro_app:
+            micro_app_json = json.dumps({
+                "name": application.micro_app.name,
+                "entry": application.micro_app.entry,
+                "headless": application.micro_app.headless,
+            })
+        release_config_json = _config_list_json(application.release_config, "name", "namespace")
+        ontology_config_json = _config_list_json(application.ontology_config, "id", "is_config")
+        agent_config_json = _config_list_json(application.agent_config, "id", "is_config")
+
+        return (
+            application.key,
+            application.name,
+            application.description,
+            icon_binary,
+            application.version,
+            application.category,
+            micro_app_json,
+            release_config_json,
+            ontology_config_json,
+            agent_config_json,
+            application.is_config,
+            application.updated_by,
+            application.updated_by_id,
+            application.updated_at or datetime.now(),
+            application.business_domain,
+        )
+
     async def create_application(self, application: Application) -> Application:
         """
         创建新应用。
@@ -373,73 +666,55 @@ class ApplicationAdapter(ApplicationPort):
         pool = await self._get_pool()
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
-                # 检查应用是否已存在
-                await cursor.execute(
-                    "SELECT COUNT(*) FROM t_application WHERE `key` = %s",
-                    (application.key,)
-                )
-                count = (await cursor.fetchone())[0]
-                if count > 0:
-                    raise ValueError(f"应用已存在: {application.key}")
+                # 由 key 唯一索引判断应用是否已存在，无需先查询
+                try:
+                    await cursor.execute(
+                        _INSERT_APPLICATION_SQL, self._application_values(application)
+                    )
+                except IntegrityError as e:
+                    if e.args and e.args[0] == _ER_DUP_ENTRY:
+                        raise ValueError(f"应用已存在: {application.key}") from e
+                    raise
 
-                # 将 Base64 字符串转换为二进制数据
-                icon_binary = None
-                if application.icon:
-                    try:
-                        icon_binary = base64.b64decode(application.icon)
-                    except Exception as e:
-                        logger.warning(f"应用图标 Base64 解码失败: {e}")
-                        icon_binary = None
+                # 获取插入的 ID
+                application.id = cursor.lastrowid
+                await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
+                return application
 
-                # 序列化 JSON 字段
-                micro_app_json = None
-                if application.micro_app:
-                    micro_app_json = json.dumps({
-                        "name": application.micro_app.name,
-                        "entry": application.micro_app.entry,
-                        "headless": application.micro_app.headless,
-                    })
-                release_config_json = json.dumps([
-                    {"name": item.name, "namespace": item.namespace}
-                    for item in (application.release_config or [])
-                ])
-                ontology_config_json = json.dumps([
-                    {"id": item.id, "is_config": item.is_config}
-                    for item in (application.ontology_config or [])
-                ])
-                agent_config_json = json.dumps([
-                    {"id": item.id, "is_config": item.is_config}
-                    for item in (application.agent_config or [])
-                ])
+    async def upsert_application(
+        self, application: Application, expected_version: Optional[str] = None
+    ) -> Application:
+        """
+        按 key 创建或覆盖应用（单条语句完成，无需先查询是否存在）。
 
-                # 插入新应用
+        参数:
+            application: 应用实体
+            expected_version: 校验时看到的已安装版本，None 表示校验时应用不存在
+
+        返回:
+            Application: 写入后的应用实体（包含应用 ID）
+
+        异常:
+            ValueError: 当应用已被其他写操作创建或修改时抛出
+        """
+        guard_params = (expected_version, expected_version) * _UPSERT_GUARD_COUNT
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """INSERT INTO t_application 
-                       (`key`, name, description, icon, version, category, micro_app,
-                        release_config, ontology_ids, agent_ids, is_config,
-                        updated_by, updated_by_id, updated_at, business_domain) 
-                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-                    (
-                        application.key,
-                        application.name,
-                        application.description,
-                        icon_binary,
-                        application.version,
-                        application.category,
-                        micro_app_json,
-                        release_config_json,
-                        ontology_config_json,
-                        agent_config_json,
-                        application.is_config,
-                        application.updated_by,
-                        application.updated_by_id,
-                        application.updated_at or datetime.now(),
-                        application.business_domain,
-                    )
+                    _UPSERT_APPLICATION_SQL,
+                    self._application_values(application) + guard_params,
                 )
+                # 受影响行数：1 为新建，2 为覆盖，0 为版本条件不成立未写入
+                if cursor.rowcount == 0:
+                    if expected_version is None:
+                        raise ValueError(f"应用已存在: {application.key}")
+                    raise ValueError(
+                        f"应用已被其他操作修改: {application.key}（期望版本 {expected_version}）"
+                    )
 
-                # 获取插入的 ID
                 application.id = cursor.lastrowid
+                await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
                 return application
 
     async def update_application(self, application: Application) -> Application:
@@ -476,15 +751,15 @@ class ApplicationAdapter(ApplicationPort):
                         "headless": application.micro_app.headless,
                     })
                 release_config_json = json.dumps([
-                    {"name": item.name, "namespace": item.namespace}
+                    _config_item_dict(item, "name", "namespace")
                     for item in (application.release_config or [])
                 ])
                 ontology_config_json = json.dumps([
-                    {"id": item.id, "is_config": item.is_config}
+                    _config_item_dict(item, "id", "is_config")
                     for item in (application.ontology_config or [])
                 ])
                 agent_config_json = json.dumps([
-                    {"id": item.id, "is_config": item.is_config}
+                    _config_item_dict(item, "id", "is_config")
                     for item in (application.agent_config or [])
                 ])
 
@@ -516,6 +791,7 @@ class ApplicationAdapter(ApplicationPort):
                 if cursor.rowcount == 0:
                     raise ValueError(f"应用不存在: {application.key}")
 
+                await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
                 return application
 
     async def update_application_config(
@@ -574,34 +850,85 @@ class ApplicationAdapter(ApplicationPort):
                 if cursor.rowcount == 0:
                     raise ValueError(f"应用不存在: {key}")
 
+                await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
+
                 # 返回更新后的应用
                 return await self.get_application_by_key(key)
 
-    async def delete_application(self, key: str) -> bool:
+    async def mark_application_configured(
+        self, app_id: int, updated_by: str, updated_by_id: str = ""
+    ) -> Application:
         """
-        删除应用。
+        将应用及其全部业务知识网络、智能体配置项标记为已配置（is_config = True）。
+
+        在一个事务中以 SELECT ... FOR UPDATE 锁定应用行，解析配置项后逐项置为已配置再写回，
+        避免与并发的安装或配置写入交错。
 
         参数:
-            key: 应用包唯一标识
+            app_id: 应用主键 ID
+            updated_by: 更新者用户显示名称
+            updated_by_id: 更新者用户ID
 
         返回:
-            bool: 是否删除成功
+            Application: 更新后的应用实体
 
         异常:
             ValueError: 当应用不存在时抛出
         """
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(
-                    "DELETE FROM t_application WHERE `key` = %s",
-                    (key,)
-                )
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        f"SELECT {_APPLICATION_COLUMNS} FROM t_application "
+                        "WHERE id = %s FOR UPDATE",
+                        (app_id,)
+                    )
+                    row = await cursor.fetchone()
+                    if row is None:
+                        raise ValueError(f"应用不存在: id={app_id}")
+                    application = self._row_to_application(row)
+
+                    for item in [*application.ontology_config, *application.agent_config]:
+                        item.is_config = True
+                    application.is_config = True
+                    application.updated_by = updated_by
+                    application.updated_by_id = updated_by_id
+                    application.updated_at = datetime.now()
+
+                    await cursor.execute(
+                        _MARK_CONFIGURED_SQL,
+                        (
+                            _config_list_json(application.ontology_config, "id", "is_config"),
+                            _config_list_json(application.agent_config, "id", "is_config"),
+                            updated_by,
+                            updated_by_id,
+                            application.updated_at,
+                            app_id,
+                        )
+                    )
+                    await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+            return application
 
-                if cursor.rowcount == 0:
-                    raise ValueError(f"应用不存在: {key}")
+    async def delete_application(self, key: str) -> bool:
+        """
+        删除应用。
+
+        参数:
+            key: 应用包唯一标识
 
-                return True
+        返回:
+            bool: 是否删除成功
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        return await self._delete_with_tombstone("`key` = %s", key, f"应用不存在: {key}")
 
     async def delete_application_by_id(self, app_id: int) -> bool:
         """
@@ -613,18 +940,47 @@ class ApplicationAdapter(ApplicationPort):
         返回:
             bool: 是否删除成功
 
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        return await self._delete_with_tombstone("id = %s", app_id, f"应用不存在: id={app_id}")
+
+    async def _delete_with_tombstone(self, condition: str, value, not_found_message: str) -> bool:
+        """
+        在同一事务中写入删除记录（墓碑）并删除应用。
+
+        参数:
+            condition: 定位应用的 WHERE 条件（包含一个占位符）
+            value: 条件参数
+            not_found_message: 应用不存在时的异常信息
+
+        返回:
+            bool: 是否删除成功
+
         异常:
             ValueError: 当应用不存在时抛出
         """
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(
-                    "DELETE FROM t_application WHERE id = %s",
-                    (app_id,)
-                )
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        f"""INSERT INTO t_application_tombstone (app_id, `key`, deleted_at)
+                           SELECT id, `key`, %s FROM t_application WHERE {condition}""",
+                        (datetime.now(), value)
+                    )
+                    await cursor.execute(
+                        f"DELETE FROM t_application WHERE {condition}",
+                        (value,)
+                    )
 
-                if cursor.rowcount == 0:
-                    raise ValueError(f"应用不存在: id={app_id}")
+                    if cursor.rowcount == 0:
+                        raise ValueError(not_found_message)
 
-                return True
+                    await cursor.execute(_BUMP_CATALOG_VERSION_SQL)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+            return True
@@ -0,0 +1,114 @@
+"""
+应用制品适配器
+
+实现 ApplicationArtifactPort 接口的数据库适配器。
+负责在 MariaDB 中记录各应用已推送的镜像和 Chart 的内容摘要。
+"""
+import logging
+from datetime import datetime
+from typing import List
+
+from src.domains.artifact import ApplicationArtifact, ArtifactKind
+from src.infrastructure import json_codec
+from src.infrastructure.database.pool import DatabasePool
+from src.ports.application_artifact_port import ApplicationArtifactPort
+
+logger = logging.getLogger(__name__)
+
+
+class ApplicationArtifactAdapter(ApplicationArtifactPort):
+    """
+    应用制品数据库适配器实现。
+
+    与应用适配器共享数据库连接池。
+    """
+
+    def __init__(self, pool: DatabasePool):
+        """
+        初始化应用制品适配器。
+
+        参数:
+            pool: 共享的数据库连接池
+        """
+        self._pool = pool
+
+    async def list_artifacts(self, app_key: str) -> List[ApplicationArtifact]:
+        """
+        获取应用已推送的制品记录。
+
+        参数:
+            app_key: 应用唯一标识
+
+        返回:
+            List[ApplicationArtifact]: 制品记录列表
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """SELECT app_key, kind, digest, size, path, chart_name, chart_version,
+                              chart_values, pushed_at
+                       FROM t_application_artifact WHERE app_key = %s""",
+                    (app_key,)
+                )
+                rows = await cursor.fetchall()
+        return [
+            ApplicationArtifact(
+                app_key=row[0],
+                kind=ArtifactKind(row[1]),
+                digest=row[2],
+                size=row[3] or 0,
+                path=row[4] or "",
+                chart_name=row[5],
+                chart_version=row[6],
+                chart_values=json_codec.loads(row[7]) if row[7] else None,
+                pushed_at=row[8],
+            )
+            for row in rows
+        ]
+
+    async def save_artifact(self, artifact: ApplicationArtifact) -> None:
+        """
+        保存制品推送记录，同一应用同类型同摘要的记录已存在时覆盖。
+
+        参数:
+            artifact: 制品记录
+        """
+        artifact.pushed_at = artifact.pushed_at or datetime.now()
+        chart_values = (
+            json_codec.dumps(artifact.chart_values).decode("utf-8")
+            if artifact.chart_values is not None
+            else None
+        )
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """INSERT INTO t_application_artifact
+                       (app_key, kind, digest, size, path, chart_name, chart_version, chart_values,
+                        pushed_at)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                       ON DUPLICATE KEY UPDATE size = VALUES(size), path = VALUES(path),
+                           chart_name = VALUES(chart_name), chart_version = VALUES(chart_version),
+                           chart_values = VALUES(chart_values), pushed_at = VALUES(pushed_at)""",
+                    (
+                        artifact.app_key, artifact.kind.value, artifact.digest, artifact.size,
+                        artifact.path, artifact.chart_name, artifact.chart_version,
+                        chart_values, artifact.pushed_at,
+                    )
+                )
+
+    async def delete_artifacts(self, app_key: str) -> int:
+        """
+        删除应用的全部制品记录。
+
+        参数:
+            app_key: 应用唯一标识
+
+        返回:
+            int: 删除的记录数
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    "DELETE FROM t_application_artifact WHERE app_key = %s", (app_key,)
+                )
+                return cursor.rowcount
@@ -0,0 +1,275 @@
+"""
+应用目录缓存适配器
+
+以装饰器方式包装 ApplicationPort 实现，为应用详情和列表提供进程内读缓存。
+写操作完成后显式失效本地缓存，并通过 Redis 发布/订阅通知其他进程。
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+from src.domains.application import (
+    AgentConfigItem,
+    Application,
+    ApplicationChangeCursor,
+    ApplicationChanges,
+    ApplicationCursor,
+    ApplicationPage,
+    OntologyConfigItem,
+)
+from src.infrastructure.cache import CacheInvalidationBus, SingleFlight, TTLCache
+from src.ports.application_port import ApplicationPort
+
+T = TypeVar("T")
+
+
+class CachedApplicationAdapter(ApplicationPort):
+    """
+    带读缓存的应用适配器。
+
+    按应用 ID、应用 key 缓存解析后的 Application 对象，按查询参数缓存列表结果；
+    应用图标不缓存（由图标接口的 HTTP 缓存负责）。
+    缓存中的对象在请求间共享，调用方不得原地修改。
+
+    失效规则：
+    - 任一写操作使全部列表缓存失效，并按 ID/key 失效对应详情缓存；
+      无法同时确定 ID 和 key 时失效全部详情缓存。
+    - 每次失效递增代数，失效前发起、失效后返回的查询结果不会写入缓存。
+    """
+
+    def __init__(
+        self,
+        delegate: ApplicationPort,
+        maxsize: int,
+        ttl: float,
+        invalidation_bus: Optional[CacheInvalidationBus] = None,
+    ):
+        """
+        初始化缓存适配器。
+
+        参数:
+            delegate: 实际访问数据存储的应用适配器
+            maxsize: 详情缓存和列表缓存各自的最大条目数
+            ttl: 缓存过期时间（秒）
+            invalidation_bus: 跨进程失效广播总线，为 None 时仅失效本进程缓存
+        """
+        self._delegate = delegate
+        self._entities = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lists = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._flight = SingleFlight()
+        self._bus = invalidation_bus
+        self._generation = 0
+        self._invalidations = 0
+
+    @property
+    def delegate(self) -> ApplicationPort:
+        """被包装的应用适配器。"""
+        return self._delegate
+
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        load: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        读取缓存，未命中时合并并发查询并写回缓存（单个应用同时按 ID 和 key 写入）。
+
+        参数:
+            cache: 目标缓存
+            key: 缓存键
+            load: 未命中时执行的查询
+
+        返回:
+            T: 查询结果
+        """
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        value = await self._flight.do((generation, key), load)
+        if value is not None and generation == self._generation:
+            if isinstance(value, Application):
+                self._remember(value)
+            else:
+                cache.set(key, value)
+        return value
+
+    def _remember(self, application: Application) -> None:
+        """将应用同时写入按 ID 和按 key 的详情缓存。"""
+        self._entities.set(("id", application.id), application)
+        self._entities.set(("key", application.key), application)
+
+    def invalidate_local(self, message: Dict[str, Any]) -> None:
+        """
+        按失效消息清理本进程缓存。
+
+        参数:
+            message: 失效消息，可包含 id、key；包含 all 或缺少 id/key 时清空全部详情缓存
+        """
+        self._generation += 1
+        self._invalidations += 1
+        self._lists.clear()
+        app_id = message.get("id")
+        key = message.get("key")
+        if message.get("all") or not app_id or not key:
+            self._entities.clear()
+            return
+        self._entities.pop(("id", app_id))
+        self._entities.pop(("key", key))
+
+    async def _invalidate(self, app_id: Optional[int] = None, key: Optional[str] = None) -> None:
+        """失效本进程缓存并广播给其他进程。"""
+        message = {"id": app_id, "key": key}
+        self.invalidate_local(message)
+        if self._bus is not None:
+            await self._bus.publish(message)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息。
+
+        返回:
+            Dict[str, Any]: 详情缓存、列表缓存统计及失效次数
+        """
+        return {
+            "entities": self._entities.stats(),
+            "lists": self._lists.stats(),
+            "invalidations": self._invalidations,
+        }
+
+    async def get_all_applications(self) -> List[Application]:
+        """获取所有已安装的应用列表（缓存）。"""
+        return await self._cached(self._lists, ("all",), self._delegate.get_all_applications)
+
+    async def list_applications(
+        self,
+        limit: int,
+        cursor: Optional[ApplicationCursor] = None,
+        category: Optional[str] = None,
+        business_domain: Optional[str] = None,
+    ) -> ApplicationPage:
+        """分页获取应用列表（缓存，按分页参数区分）。"""
+        cache_key = (
+            "page",
+            limit,
+            (cursor.updated_at, cursor.id) if cursor is not None else None,
+            category,
+            business_domain,
+        )
+        return await self._cached(
+            self._lists,
+            cache_key,
+            lambda: self._delegate.list_applications(
+                limit=limit, cursor=cursor, category=category, business_domain=business_domain
+            ),
+        )
+
+    async def list_application_changes(
+        self,
+        since: ApplicationChangeCursor,
+        limit: int,
+    ) -> ApplicationChanges:
+        """获取应用目录增量变更（不缓存，游标各不相同）。"""
+        return await self._delegate.list_application_changes(since=since, limit=limit)
+
+    async def get_catalog_version(self) -> int:
+        """获取应用目录版本号（缓存，随列表缓存一同失效）。"""
+        return await self._cached(self._lists, ("version",), self._delegate.get_catalog_version)
+
+    async def get_application_by_key(self, key: str) -> Application:
+        """根据应用唯一标识获取应用信息（缓存）。"""
+        application = await self.get_application_by_key_optional(key)
+        if application is None:
+            raise ValueError(f"应用不存在: {key}")
+        return application
+
+    async def get_application_by_key_optional(self, key: str) -> Optional[Application]:
+        """根据应用唯一标识获取应用信息（缓存，不缓存不存在的结果）。"""
+        return await self._cached(
+            self._entities,
+            ("key", key),
+            lambda: self._delegate.get_application_by_key_optional(key),
+        )
+
+    async def get_application_by_id(self, app_id: int) -> Application:
+        """根据应用主键 ID 获取应用信息（缓存）。"""
+        return await self._cached(
+            self._entities,
+            ("id", app_id),
+            lambda: self._delegate.get_application_by_id(app_id),
+        )
+
+    async def get_application_icon(self, app_id: int) -> Optional[bytes]:
+        """根据应用主键 ID 获取应用图标原始数据（不缓存）。"""
+        return await self._delegate.get_application_icon(app_id)
+
+    async def create_application(self, application: Application) -> Application:
+        """创建新应用，并失效相关缓存。"""
+        created = await self._delegate.create_application(application)
+        await self._invalidate(created.id, created.key)
+        return created
+
+    async def update_application(self, application: Application) -> Application:
+        """更新应用信息，并失效相关缓存。"""
+        try:
+            return await self._delegate.update_application(application)
+        finally:
+            await self._invalidate(application.id, application.key)
+
+    async def update_application_config(
+        self,
+        key: str,
+        ontology_config: List[OntologyConfigItem],
+        agent_config: List[AgentConfigItem],
+        updated_by: str,
+        updated_by_id: str = ""
+    ) -> Application:
+        """更新应用配置，并失效相关缓存。"""
+        try:
+            return await self._delegate.update_application_config(
+                key=key,
+                ontology_config=ontology_config,
+                agent_config=agent_config,
+                updated_by=updated_by,
+                updated_by_id=updated_by_id,
+            )
+        finally:
+            await self._invalidate(key=key)
+
+    async def upsert_application(
+        self, application: Application, expected_version: Optional[str] = None
+    ) -> Application:
+        """创建或覆盖应用，并失效相关缓存。"""
+        try:
+            return await self._delegate.upsert_application(application, expected_version)
+        finally:
+            await self._invalidate(application.id or None, application.key)
+
+    async def mark_application_configured(
+        self, app_id: int, updated_by: str, updated_by_id: str = ""
+    ) -> Application:
+        """将应用标记为已配置，并失效相关缓存。"""
+        try:
+            return await self._delegate.mark_application_configured(
+                app_id, updated_by, updated_by_id
+            )
+        finally:
+            await self._invalidate(app_id=app_id)
+
+    async def delete_application(self, key: str) -> bool:
+        """删除应用，并失效相关缓存。"""
+        try:
+            return await self._delegate.delete_application(key)
+        finally:
+            await self._invalidate(key=key)
+
+    async def delete_application_by_id(self, app_id: int) -> bool:
+        """根据应用主键 ID 删除应用，并失效相关缓存。"""
+        try:
+            return await self._delegate.delete_application_by_id(app_id)
+        finally:
+            await self._invalidate(app_id=app_id)
+
+    async def close(self):
+        """关闭被包装的适配器。"""
+        await self._delegate.close()
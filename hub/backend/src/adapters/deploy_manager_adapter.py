@@ -5,11 +5,13 @@ Deploy Manager 适配器
 负责与部署管理服务交互。
 """
 import logging
+from typing import Optional
 
 import httpx
 
 from src.ports.deploy_manager_port import DeployManagerPort, GetHostResponse
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.http_client import create_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +23,18 @@ class DeployManagerAdapter(DeployManagerPort):
     使用 HTTP 客户端与部署管理服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, client: Optional[httpx.AsyncClient] = None):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            client: 共享的 HTTP 客户端（由容器持有）；为 None 时创建适配器自有客户端
         """
         self._settings = settings
         self._base_url = settings.deploy_manager_url
         self._timeout = settings.deploy_manager_timeout
+        self._client = client or create_http_client(settings, timeout=self._timeout)
 
     async def get_host(self) -> GetHostResponse:
         """
@@ -44,15 +48,14 @@ class DeployManagerAdapter(DeployManagerPort):
         """
         url = f"{self._base_url}/api/deploy-manager/v1/access-addr/app"
         
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return GetHostResponse(
-                host=data.get("host", ""),
-                port=data.get("port", ""),
-                scheme=data.get("scheme", "https"),
-            )
+        response = await self._client.get(url)
+        response.raise_for_status()
+
+        data = response.json()
+
+        return GetHostResponse(
+            host=data.get("host", ""),
+            port=data.get("port", ""),
+            scheme=data.get("scheme", "https"),
+        )
 
@@ -6,9 +6,11 @@
 """
 import logging
 import asyncio
-from typing import List, BinaryIO, Optional
+import os
+import time
+from typing import AsyncIterator, List, BinaryIO, Optional
 import aiohttp
-from aiohttp import ClientError, ClientTimeout
+from aiohttp import ClientTimeout
 
 from src.ports.external_service_port import (
     DeployInstallerPort,
@@ -20,11 +22,16 @@ from src.ports.external_service_port import (
     ReleaseResult,
     AgentFactoryResult,
 )
+from src.infrastructure.concurrency import BlockingExecutor
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.context.token_context import get_auth_token
+from src.infrastructure.http_client import ClientSessionPool
 
 logger = logging.getLogger(__name__)
 
+# 镜像/Chart 流式上传的单个数据块大小
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _build_headers(
     auth_token: Optional[str] = None,
@@ -92,6 +99,128 @@ def _handle_http_error(
         raise
 
 
+class _UploadProgress:
+    """
+    流式上传进度。
+
+    记录最近一次成功发送数据块的时间，用于判断上传是否停滞。
+    """
+
+    def __init__(self):
+        self.sent = 0
+        self.finished = False
+        self.last_progress = time.monotonic()
+
+    def advance(self, size: int) -> None:
+        """记录一个数据块已发送。"""
+        self.sent += size
+        self.last_progress = time.monotonic()
+
+    def idle_for(self) -> float:
+        """返回距最近一次进展的秒数。"""
+        return time.monotonic() - self.last_progress
+
+
+async def _iter_file_chunks(
+    file: BinaryIO,
+    progress: _UploadProgress,
+    blocking_executor: BlockingExecutor,
+    chunk_size: int = _UPLOAD_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    按数据块异步读取文件，读取在有界线程池中执行，避免阻塞事件循环。
+
+    参数:
+        file: 已打开的二进制文件对象
+        progress: 上传进度，每个数据块发送后更新
+        blocking_executor: 执行文件读取的有界线程池
+        chunk_size: 数据块大小
+
+    返回:
+        AsyncIterator[bytes]: 数据块迭代器
+    """
+    while True:
+        chunk = await blocking_executor.run(file.read, chunk_size)
+        if not chunk:
+            break
+        yield chunk
+        # 生成器恢复执行说明上一个数据块已写入连接
+        progress.advance(len(chunk))
+    progress.finished = True
+
+
+async def _stream_upload(
+    session: aiohttp.ClientSession,
+    url: str,
+    file: BinaryIO,
+    headers: dict,
+    blocking_executor: BlockingExecutor,
+    idle_timeout: float,
+    response_timeout: float,
+) -> dict:
+    """
+    以流式请求体 PUT 上传文件并返回响应 JSON。
+
+    发送阶段按无进展时间判断超时：只要数据持续发出，慢速上传不会被中止；
+    数据发送完成后，等待服务端响应的时间不超过 response_timeout。
+
+    参数:
+        session: HTTP 会话
+        url: 上传地址
+        file: 已打开的二进制文件对象
+        headers: 请求头
+        blocking_executor: 执行文件读取的有界线程池
+        idle_timeout: 发送阶段无进展超时时间（秒）
+        response_timeout: 发送完成后等待响应的超时时间（秒）
+
+    返回:
+        dict: 响应 JSON
+
+    异常:
+        asyncio.TimeoutError: 上传停滞或等待响应超时时抛出
+    """
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    file.seek(0)
+    headers = {**headers, "Content-Length": str(file_size)}
+    progress = _UploadProgress()
+
+    async def _put() -> dict:
+        async with session.put(
+            url,
+            data=_iter_file_chunks(file, progress, blocking_executor),
+            headers=headers,
+            timeout=ClientTimeout(total=None, sock_connect=30.0),
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    task = asyncio.ensure_future(_put())
+    try:
+        finished_at = None
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=min(idle_timeout, 1.0))
+            if done:
+                return task.result()
+            if not progress.finished:
+                if progress.idle_for() >= idle_timeout:
+                    raise asyncio.TimeoutError(
+                        f"上传停滞超过 {idle_timeout}s，已发送 {progress.sent}/{file_size} bytes"
+                    )
+                continue
+            if finished_at is None:
+                finished_at = time.monotonic()
+            if time.monotonic() - finished_at >= response_timeout:
+                raise asyncio.TimeoutError(f"等待响应超过 {response_timeout}s")
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
 class DeployInstallerAdapter(DeployInstallerPort):
     """
     Deploy Installer 服务适配器。
@@ -99,16 +228,34 @@ class DeployInstallerAdapter(DeployInstallerPort):
     使用 HTTP 客户端与 Deploy Installer 服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        session_pool: Optional[ClientSessionPool] = None,
+        blocking_executor: Optional[BlockingExecutor] = None,
+    ):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            session_pool: 共享的 HTTP 会话池（由容器持有）；为 None 时创建适配器自有会话池
+            blocking_executor: 读取镜像/Chart 文件的有界线程池（由容器持有）；
+                为 None 时创建适配器自有线程池
         """
         self._settings = settings
         self._base_url = f"{settings.proton_url}/internal/api/deploy-installer/v1"
         self._timeout = settings.proton_timeout
+        self._upload_idle_timeout = settings.proton_upload_idle_timeout
+        self._upload_response_timeout = settings.proton_upload_response_timeout
+        self._session_pool = session_pool or ClientSessionPool(settings)
+        self._blocking_executor = blocking_executor or BlockingExecutor(
+            max_workers=settings.install_io_workers, thread_name_prefix="dip-hub-upload-io"
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取 Deploy Installer 服务专用的共享会话。"""
+        return self._session_pool.get("deploy-installer")
 
     async def upload_image(
         self,
@@ -129,32 +276,30 @@ class DeployInstallerAdapter(DeployInstallerPort):
         headers["Content-Type"] = "application/octet-stream"
 
         try:
-            # 确保文件指针在开头
-            image_data.seek(0)
-            # 读取文件内容
-            content = image_data.read()
-            file_size = len(content)
-            logger.info(f"[upload_image] 开始上传镜像到: {url}, 大小: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB), timeout={self._timeout}s")
-            
-            # 对于大文件，动态调整超时时间
-            calculated_timeout = max(self._timeout, 120 + (file_size // (1024 * 1024)) * 3)
-            timeout = ClientTimeout(total=calculated_timeout, connect=30.0)
+            image_data.seek(0, os.SEEK_END)
+            file_size = image_data.tell()
+            logger.info(
+                f"[upload_image] 开始上传镜像到: {url}, 大小: {file_size} bytes "
+                f"({file_size / 1024 / 1024:.2f} MB), idle_timeout={self._upload_idle_timeout}s"
+            )
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.put(
-                    url,
-                    data=content,
-                    headers=headers,
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            # 按数据块流式发送，内存占用与文件大小无关；超时按上传进展判断
+            data = await _stream_upload(
+                self._get_session(),
+                url,
+                image_data,
+                headers,
+                self._blocking_executor,
+                idle_timeout=self._upload_idle_timeout,
+                response_timeout=self._upload_response_timeout,
+            )
         except Exception as e:
             _handle_http_error(
                 "upload_image",
                 url,
                 e,
                 self._settings.proton_url,
-                self._timeout,
+                int(self._upload_idle_timeout),
             )
             raise  # 如果 _handle_http_error 没有抛出异常，这里确保抛出
         images = data.get("images", [])
@@ -186,32 +331,30 @@ class DeployInstallerAdapter(DeployInstallerPort):
         headers["Content-Type"] = "application/octet-stream"
 
         try:
-            # 确保文件指针在开头
-            chart_data.seek(0)
-            # 读取文件内容
-            content = chart_data.read()
-            file_size = len(content)
-            logger.info(f"[upload_chart] 开始上传 Chart 到: {url}, 大小: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB), timeout={self._timeout}s")
-            
-            # 对于大文件，动态调整超时时间
-            calculated_timeout = max(self._timeout, 120 + (file_size // (1024 * 1024)) * 3)
-            timeout = ClientTimeout(total=calculated_timeout, connect=30.0)
+            chart_data.seek(0, os.SEEK_END)
+            file_size = chart_data.tell()
+            logger.info(
+                f"[upload_chart] 开始上传 Chart 到: {url}, 大小: {file_size} bytes "
+                f"({file_size / 1024 / 1024:.2f} MB), idle_timeout={self._upload_idle_timeout}s"
+            )
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.put(
-                    url,
-                    data=content,
-                    headers=headers,
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            # 按数据块流式发送，内存占用与文件大小无关；超时按上传进展判断
+            data = await _stream_upload(
+                self._get_session(),
+                url,
+                chart_data,
+                headers,
+                self._blocking_executor,
+                idle_timeout=self._upload_idle_timeout,
+                response_timeout=self._upload_response_timeout,
+            )
         except Exception as e:
             _handle_http_error(
                 "upload_chart",
                 url,
                 e,
                 self._settings.proton_url,
-                self._timeout,
+                int(self._upload_idle_timeout),
             )
             raise
         chart_data = data.get("chart", {})
@@ -264,15 +407,16 @@ class DeployInstallerAdapter(DeployInstallerPort):
         try:
             logger.info(f"[install_release] 安装 Release: {url}, release_name={release_name}")
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url,
-                    params=params,
-                    json=body,
-                    headers=headers or None,
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            session = self._get_session()
+            async with session.post(
+                url,
+                params=params,
+                json=body,
+                headers=headers or None,
+                timeout=timeout,
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
         except Exception as e:
             _handle_http_error(
                 "install_release",
@@ -309,10 +453,12 @@ class DeployInstallerAdapter(DeployInstallerPort):
         try:
             logger.info(f"[delete_release] 删除 Release: {url}, release_name={release_name}")
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.delete(url, params=params, headers=headers or None) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            session = self._get_session()
+            async with session.delete(
+                url, params=params, headers=headers or None, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
         except Exception as e:
             _handle_http_error(
                 "delete_release",
@@ -333,16 +479,22 @@ class OntologyManagerAdapter(OntologyManagerPort):
     使用 HTTP 客户端与 Ontology Manager 服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, session_pool: Optional[ClientSessionPool] = None):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            session_pool: 共享的 HTTP 会话池（由容器持有）；为 None 时创建适配器自有会话池
         """
         self._settings = settings
         self._base_url = f"{settings.ontology_manager_url}/api/ontology-manager/v1"
         self._timeout = settings.ontology_manager_timeout
+        self._session_pool = session_pool or ClientSessionPool(settings)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取 Ontology Manager 服务专用的共享会话。"""
+        return self._session_pool.get("ontology-manager")
 
     async def get_knowledge_network(
         self,
@@ -370,13 +522,13 @@ class OntologyManagerAdapter(OntologyManagerPort):
 
         try:
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers or None) as response:
-                    if response.status == 404:
-                        raise ValueError(f"业务知识网络不存在: {kn_id}")
-                    
-                    response.raise_for_status()
-                    data = await response.json()
+            session = self._get_session()
+            async with session.get(url, headers=headers or None, timeout=timeout) as response:
+                if response.status == 404:
+                    raise ValueError(f"业务知识网络不存在: {kn_id}")
+
+                response.raise_for_status()
+                data = await response.json()
         except ValueError:
             raise
         except Exception as e:
@@ -414,10 +566,12 @@ class OntologyManagerAdapter(OntologyManagerPort):
 
         try:
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=data, headers=headers or None) as response:
-                    response.raise_for_status()
-                    result = await response.json()
+            session = self._get_session()
+            async with session.post(
+                url, json=data, headers=headers or None, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
         except Exception as e:
             _handle_http_error(
                 "create_knowledge_network",
@@ -433,7 +587,6 @@ class OntologyManagerAdapter(OntologyManagerPort):
             return result[0].get("id", "")
         return ""
 
-
 class AgentFactoryAdapter(AgentFactoryPort):
     """
     Agent Factory 服务适配器。
@@ -441,16 +594,22 @@ class AgentFactoryAdapter(AgentFactoryPort):
     使用 HTTP 客户端与 Agent Factory 服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, session_pool: Optional[ClientSessionPool] = None):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            session_pool: 共享的 HTTP 会话池（由容器持有）；为 None 时创建适配器自有会话池
         """
         self._settings = settings
         self._base_url = f"{settings.agent_factory_url}/api/agent-factory/v3"
         self._timeout = settings.agent_factory_timeout
+        self._session_pool = session_pool or ClientSessionPool(settings)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取 Agent Factory 服务专用的共享会话。"""
+        return self._session_pool.get("agent-factory")
 
     async def get_agent(
         self,
@@ -478,13 +637,13 @@ class AgentFactoryAdapter(AgentFactoryPort):
 
         try:
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers or None) as response:
-                    if response.status == 404:
-                        raise ValueError(f"智能体不存在: {agent_id}")
-                    
-                    response.raise_for_status()
-                    data = await response.json()
+            session = self._get_session()
+            async with session.get(url, headers=headers or None, timeout=timeout) as response:
+                if response.status == 404:
+                    raise ValueError(f"智能体不存在: {agent_id}")
+
+                response.raise_for_status()
+                data = await response.json()
         except ValueError:
             raise
         except Exception as e:
@@ -522,10 +681,12 @@ class AgentFactoryAdapter(AgentFactoryPort):
 
         try:
             timeout = ClientTimeout(total=self._timeout, connect=30.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=data, headers=headers or None) as response:
-                    response.raise_for_status()
-                    result = await response.json()
+            session = self._get_session()
+            async with session.post(
+                url, json=data, headers=headers or None, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
         except Exception as e:
             _handle_http_error(
                 "create_agent",
@@ -540,4 +701,3 @@ class AgentFactoryAdapter(AgentFactoryPort):
             id=result.get("id", ""),
             version=result.get("version", "v0"),
         )
-
@@ -15,6 +15,7 @@ from src.domains.health import (
 )
 from src.ports.health_port import HealthCheckPort
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.metrics import collect_metrics
 
 
 class HealthAdapter(HealthCheckPort):
@@ -97,3 +98,12 @@ class HealthAdapter(HealthCheckPort):
             "version": self._settings.app_version,
             "uptime_seconds": round(time.time() - self._start_time, 2),
         }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        获取运行指标。
+
+        返回:
+            Dict[str, Any]: 已注册组件的运行指标。
+        """
+        return collect_metrics()
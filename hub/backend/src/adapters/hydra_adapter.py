@@ -5,11 +5,13 @@ Hydra 适配器
 负责与 Hydra OAuth2/OIDC 服务交互。
 """
 import logging
+from typing import Optional
 
 import httpx
 
 from src.ports.hydra_port import HydraPort, IntrospectResponse
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.http_client import create_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +23,18 @@ class HydraAdapter(HydraPort):
     使用 HTTP 客户端与 Hydra OAuth2/OIDC 服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, client: Optional[httpx.AsyncClient] = None):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            client: 共享的 HTTP 客户端（由容器持有）；为 None 时创建适配器自有客户端
         """
         self._settings = settings
         self._base_url = settings.hydra_host
         self._timeout = settings.hydra_timeout
+        self._client = client or create_http_client(settings, timeout=self._timeout)
 
     async def introspect(self, token: str) -> IntrospectResponse:
         """
@@ -51,19 +55,19 @@ class HydraAdapter(HydraPort):
             "token": token,
         }
         
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            response.raise_for_status()
-            
-            introspect_data = response.json()
-            
-            return IntrospectResponse(
-                active=introspect_data.get("active", False),
-                visitor_id=introspect_data.get("sub") or introspect_data.get("visitor_id"),
-                visitor_typ=introspect_data.get("visitor_typ"),
-            )
+        response = await self._client.post(
+            url,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        response.raise_for_status()
+
+        introspect_data = response.json()
+
+        return IntrospectResponse(
+            active=introspect_data.get("active", False),
+            visitor_id=introspect_data.get("sub") or introspect_data.get("visitor_id"),
+            visitor_typ=introspect_data.get("visitor_typ"),
+            exp=introspect_data.get("exp"),
+        )
 
@@ -0,0 +1,232 @@
+"""
+安装任务适配器
+
+实现 InstallJobPort 接口的数据库适配器。
+负责在 MariaDB 中持久化安装任务的状态和进度。
+"""
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from src.domains.install_job import InstallJob, InstallJobStatus, InstallStage
+from src.infrastructure.database.pool import DatabasePool
+from src.ports.install_job_port import InstallJobPort
+
+logger = logging.getLogger(__name__)
+
+# 安装任务查询列（与 _row_to_job 的行结构对应）
+_JOB_COLUMNS = """id, status, stage, package_size, bytes_total, bytes_uploaded, app_id, app_key,
+                  error_code, error, updated_by, updated_by_id, created_at, updated_at, finished_at,
+                  package_sha256"""
+
+
+class InstallJobAdapter(InstallJobPort):
+    """
+    安装任务数据库适配器实现。
+
+    与应用适配器共享数据库连接池。
+    """
+
+    def __init__(self, pool: DatabasePool):
+        """
+        初始化安装任务适配器。
+
+        参数:
+            pool: 共享的数据库连接池
+        """
+        self._pool = pool
+
+    def _row_to_job(self, row: tuple) -> InstallJob:
+        """
+        将数据库行转换为安装任务。
+
+        参数:
+            row: 数据库行（列顺序与 _JOB_COLUMNS 一致）
+
+        返回:
+            InstallJob: 安装任务
+        """
+        return InstallJob(
+            id=row[0],
+            status=InstallJobStatus(row[1]),
+            stage=InstallStage(row[2]),
+            package_size=row[3] or 0,
+            bytes_total=row[4] or 0,
+            bytes_uploaded=row[5] or 0,
+            application_id=row[6],
+            application_key=row[7],
+            error_code=row[8],
+            error=row[9],
+            updated_by=row[10] or "",
+            updated_by_id=row[11] or "",
+            created_at=row[12],
+            updated_at=row[13],
+            finished_at=row[14],
+            package_sha256=row[15],
+        )
+
+    async def create_job(self, job: InstallJob) -> InstallJob:
+        """
+        创建安装任务。
+
+        参数:
+            job: 安装任务
+
+        返回:
+            InstallJob: 创建后的安装任务
+        """
+        now = datetime.now()
+        job.created_at = job.created_at or now
+        job.updated_at = now
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """INSERT INTO t_application_install_job
+                       (id, status, stage, package_size, package_sha256, bytes_total,
+                        bytes_uploaded, updated_by, updated_by_id, created_at, updated_at)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+                    (
+                        job.id, job.status.value, job.stage.value, job.package_size,
+                        job.package_sha256, job.bytes_total, job.bytes_uploaded, job.updated_by,
+                        job.updated_by_id, job.created_at, job.updated_at,
+                    )
+                )
+        return job
+
+    async def get_job(self, job_id: str) -> InstallJob:
+        """
+        根据任务 ID 获取安装任务。
+
+        参数:
+            job_id: 任务 ID
+
+        返回:
+            InstallJob: 安装任务
+
+        异常:
+            ValueError: 当任务不存在时抛出
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    f"SELECT {_JOB_COLUMNS} FROM t_application_install_job WHERE id = %s",
+                    (job_id,)
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    raise ValueError(f"安装任务不存在: {job_id}")
+                return self._row_to_job(row)
+
+    async def claim_job(self, job_id: str, stale_before: Optional[datetime] = None) -> bool:
+        """
+        将等待中的任务原子地置为执行中。
+
+        参数:
+            job_id: 任务 ID
+            stale_before: 提供时，更新时间早于该时间的执行中任务也可以被重新认领
+
+        返回:
+            bool: 是否认领成功
+        """
+        sql = """UPDATE t_application_install_job
+                 SET status = %s, updated_at = %s
+                 WHERE id = %s AND (status = %s"""
+        params = [
+            InstallJobStatus.RUNNING.value, datetime.now(), job_id, InstallJobStatus.PENDING.value
+        ]
+        if stale_before is not None:
+            sql += " OR (status = %s AND updated_at < %s)"
+            params += [InstallJobStatus.RUNNING.value, stale_before]
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(sql + ")", tuple(params))
+                return cursor.rowcount == 1
+
+    async def update_progress(self, job: InstallJob) -> None:
+        """
+        保存执行中任务的阶段、上传进度和应用标识，同时刷新更新时间。
+
+        参数:
+            job: 安装任务
+        """
+        job.updated_at = datetime.now()
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE t_application_install_job
+                       SET stage = %s, bytes_total = %s, bytes_uploaded = %s, app_key = %s,
+                           updated_at = %s
+                       WHERE id = %s""",
+                    (
+                        job.stage.value, job.bytes_total, job.bytes_uploaded,
+                        job.application_key, job.updated_at, job.id,
+                    )
+                )
+
+    async def finish_job(self, job: InstallJob) -> None:
+        """
+        保存任务的最终状态、进度和结果。
+
+        参数:
+            job: 安装任务
+        """
+        job.updated_at = datetime.now()
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE t_application_install_job
+                       SET status = %s, stage = %s, bytes_total = %s, bytes_uploaded = %s,
+                           app_id = %s, app_key = %s, error_code = %s, error = %s,
+                           updated_at = %s, finished_at = %s
+                       WHERE id = %s""",
+                    (
+                        job.status.value, job.stage.value, job.bytes_total, job.bytes_uploaded,
+                        job.application_id, job.application_key, job.error_code, job.error,
+                        job.updated_at, job.finished_at, job.id,
+                    )
+                )
+
+    async def touch_jobs(self, job_ids: List[str]) -> None:
+        """
+        刷新等待中任务的更新时间。
+
+        参数:
+            job_ids: 任务 ID 列表
+        """
+        if not job_ids:
+            return
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    f"""UPDATE t_application_install_job SET updated_at = %s
+                        WHERE id IN ({placeholders}) AND status = %s""",
+                    (datetime.now(), *job_ids, InstallJobStatus.PENDING.value)
+                )
+
+    async def fail_stale_jobs(self, stale_before: datetime, error: str) -> int:
+        """
+        将更新时间早于 stale_before 的未结束任务置为失败。
+
+        参数:
+            stale_before: 判定为中断的更新时间上限
+            error: 失败原因
+
+        返回:
+            int: 置为失败的任务数
+        """
+        now = datetime.now()
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE t_application_install_job
+                       SET status = %s, error_code = %s, error = %s, updated_at = %s,
+                           finished_at = %s
+                       WHERE status IN (%s, %s) AND updated_at < %s""",
+                    (
+                        InstallJobStatus.FAILED.value, "INSTALL_INTERRUPTED", error, now, now,
+                        InstallJobStatus.PENDING.value, InstallJobStatus.RUNNING.value,
+                        stale_before,
+                    )
+                )
+                return cursor.rowcount
@@ -0,0 +1,173 @@
+"""
+安装队列适配器
+
+基于 Redis Stream 消费组实现 InstallQueuePort 接口。
+"""
+import logging
+from typing import Dict, List, Optional
+
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import ResponseError
+except ImportError:
+    # 兼容旧版本的 redis 库
+    import aioredis as redis
+    from aioredis.exceptions import ResponseError
+
+from src.domains.install_job import QueuedInstall
+from src.infrastructure.config.settings import Settings
+from src.ports.install_queue_port import InstallQueuePort
+
+logger = logging.getLogger(__name__)
+
+
+class RedisInstallQueueAdapter(InstallQueuePort):
+    """
+    Redis Stream 安装队列适配器。
+
+    所有 worker 加入同一个消费组：XREADGROUP 读取新消息，XCLAIM 刷新执行中消息的空闲时间作为心跳，
+    XAUTOCLAIM 接管空闲时间过长的消息，XACK 确认后随即 XDEL 删除消息。
+    """
+
+    def __init__(self, settings: Settings):
+        """
+        初始化安装队列适配器。
+
+        参数:
+            settings: 应用配置
+        """
+        self._settings = settings
+        self._stream = settings.install_queue_stream
+        self._group = settings.install_queue_group
+        self._client: Optional[redis.Redis] = None
+        self._group_ready = False
+        host_port = settings.redis_host.split(":")
+        self._redis_host = host_port[0]
+        self._redis_port = int(host_port[1]) if len(host_port) > 1 else 6379
+
+    async def _get_client(self) -> redis.Redis:
+        """获取 Redis 客户端，首次使用时创建消费组（已存在时忽略）。"""
+        if self._client is None:
+            self._client = redis.Redis(
+                host=self._redis_host,
+                port=self._redis_port,
+                password=self._settings.redis_password,
+                db=self._settings.redis_db,
+                decode_responses=True,
+            )
+        if not self._group_ready:
+            try:
+                await self._client.xgroup_create(self._stream, self._group, id="0", mkstream=True)
+                logger.info(f"已创建安装队列消费组: {self._stream}/{self._group}")
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._group_ready = True
+        return self._client
+
+    @staticmethod
+    def _to_message(entry_id: str, fields: Dict[str, str], deliveries: int = 1) -> QueuedInstall:
+        """将 Stream 消息转换为安装任务消息。"""
+        return QueuedInstall(
+            entry_id=entry_id,
+            job_id=fields.get("job_id", ""),
+            deliveries=deliveries,
+        )
+
+    async def enqueue(self, job_id: str) -> str:
+        """
+        投递安装任务。
+
+        参数:
+            job_id: 安装任务 ID
+
+        返回:
+            str: 队列消息 ID
+        """
+        client = await self._get_client()
+        return await client.xadd(self._stream, {"job_id": job_id})
+
+    async def consume(self, consumer: str, count: int, block_ms: int) -> List[QueuedInstall]:
+        """
+        读取尚未投递过的安装任务。
+
+        参数:
+            consumer: 消费者（worker）名称
+            count: 最多读取条数
+            block_ms: 队列为空时最长等待时间（毫秒）
+
+        返回:
+            List[QueuedInstall]: 投递给该消费者的安装任务
+        """
+        client = await self._get_client()
+        response = await client.xreadgroup(
+            self._group, consumer, {self._stream: ">"}, count=count, block=block_ms
+        )
+        messages = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                messages.append(self._to_message(entry_id, fields))
+        return messages
+
+    async def claim_abandoned(
+        self, consumer: str, min_idle: float, count: int
+    ) -> List[QueuedInstall]:
+        """
+        接管超过 min_idle 秒没有心跳的已投递任务。
+
+        参数:
+            consumer: 消费者（worker）名称
+            min_idle: 判定为遗弃的无心跳时间（秒）
+            count: 最多接管条数
+
+        返回:
+            List[QueuedInstall]: 接管的安装任务，deliveries 为累计投递次数
+        """
+        client = await self._get_client()
+        response = await client.xautoclaim(
+            self._stream, self._group, consumer, int(min_idle * 1000), start_id="0-0", count=count
+        )
+        messages = []
+        for entry_id, fields in response[1]:
+            if not fields:
+                # 消息已被删除，只需从待确认列表中移除
+                await client.xack(self._stream, self._group, entry_id)
+                continue
+            pending = await client.xpending_range(
+                self._stream, self._group, min=entry_id, max=entry_id, count=1
+            )
+            deliveries = pending[0]["times_delivered"] if pending else 1
+            messages.append(self._to_message(entry_id, fields, deliveries))
+        return messages
+
+    async def touch(self, consumer: str, entry_ids: List[str]) -> None:
+        """
+        刷新执行中任务消息的心跳。
+
+        参数:
+            consumer: 消费者（worker）名称
+            entry_ids: 队列消息 ID 列表
+        """
+        if not entry_ids:
+            return
+        client = await self._get_client()
+        await client.xclaim(self._stream, self._group, consumer, 0, entry_ids, justid=True)
+
+    async def ack(self, entry_id: str) -> None:
+        """
+        确认任务已处理完成并删除消息。
+
+        参数:
+            entry_id: 队列消息 ID
+        """
+        client = await self._get_client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.xack(self._stream, self._group, entry_id)
+            pipe.xdel(self._stream, entry_id)
+            await pipe.execute()
+
+    async def close(self) -> None:
+        """关闭 Redis 客户端。"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
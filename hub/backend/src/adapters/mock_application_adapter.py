@@ -3,12 +3,24 @@ Mock 应用适配器
 
 用于本地开发和测试时模拟数据库操作。
 """
+import base64
 import logging
-from typing import List, Optional
-from datetime import datetime
 from copy import deepcopy
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional
 
-from src.domains.application import Application, MicroAppInfo, OntologyConfigItem, AgentConfigItem
+from src.domains.application import (
+    AgentConfigItem,
+    Application,
+    ApplicationChangeCursor,
+    ApplicationChanges,
+    ApplicationCursor,
+    ApplicationPage,
+    ApplicationTombstone,
+    MicroAppInfo,
+    OntologyConfigItem,
+)
 from src.ports.application_port import ApplicationPort
 
 logger = logging.getLogger(__name__)
@@ -25,6 +37,8 @@ class MockApplicationAdapter(ApplicationPort):
         """初始化 Mock 适配器。"""
         self._applications = {}
         self._next_id = 1
+        self._catalog_version = 0
+        self._tombstones: List[ApplicationTombstone] = []
         
         # 预置一些模拟数据
         self._add_sample_data()
@@ -94,6 +108,101 @@ class MockApplicationAdapter(ApplicationPort):
         logger.info(f"[Mock] 获取应用列表: {len(apps)} 个应用")
         return apps
 
+    async def list_applications(
+        self,
+        limit: int,
+        cursor: Optional[ApplicationCursor] = None,
+        category: Optional[str] = None,
+        business_domain: Optional[str] = None,
+    ) -> ApplicationPage:
+        """
+        分页获取应用列表（按更新时间、ID 倒序的键集分页）。
+
+        参数:
+            limit: 每页条数
+            cursor: 上一页返回的游标，为 None 时从第一页开始
+            category: 按应用分组过滤
+            business_domain: 按业务域过滤
+
+        返回:
+            ApplicationPage: 当前页应用列表及下一页游标
+        """
+        apps = [
+            app for app in self._applications.values()
+            if (category is None or app.category == category)
+            and (business_domain is None or app.business_domain == business_domain)
+        ]
+        apps.sort(key=lambda x: (x.updated_at or datetime.min, x.id), reverse=True)
+        if cursor is not None:
+            apps = [
+                app for app in apps
+                if (app.updated_at or datetime.min, app.id) < (cursor.updated_at, cursor.id)
+            ]
+
+        items = [deepcopy(app) for app in apps[:limit]]
+        next_cursor = None
+        if len(apps) > limit and items:
+            next_cursor = ApplicationCursor(updated_at=items[-1].updated_at, id=items[-1].id)
+        logger.info(f"[Mock] 分页获取应用列表: {len(items)} 个应用")
+        return ApplicationPage(items=items, next_cursor=next_cursor)
+
+    async def list_application_changes(
+        self,
+        since: ApplicationChangeCursor,
+        limit: int,
+    ) -> ApplicationChanges:
+        """
+        获取游标之后的应用目录增量变更。
+
+        参数:
+            since: 上次同步返回的游标
+            limit: 新增/更新应用和删除记录各自的最大条数
+
+        返回:
+            ApplicationChanges: 增量变更及下次同步使用的游标
+        """
+        apps = sorted(
+            (
+                app for app in self._applications.values()
+                if (app.updated_at or datetime.min, app.id) > (since.updated_at, since.id)
+            ),
+            key=lambda x: (x.updated_at or datetime.min, x.id),
+        )
+        tombstones = [t for t in self._tombstones if t.seq > since.tombstone_seq]
+
+        items = [deepcopy(app) for app in apps[:limit]]
+        deleted = [deepcopy(t) for t in tombstones[:limit]]
+        next_cursor = ApplicationChangeCursor(
+            updated_at=items[-1].updated_at if items else since.updated_at,
+            id=items[-1].id if items else since.id,
+            tombstone_seq=deleted[-1].seq if deleted else since.tombstone_seq,
+        )
+        logger.info(f"[Mock] 获取应用增量变更: {len(items)} 个更新, {len(deleted)} 个删除")
+        return ApplicationChanges(
+            items=items,
+            deleted=deleted,
+            next_cursor=next_cursor,
+            has_more=len(apps) > limit or len(tombstones) > limit,
+        )
+
+    def _add_tombstone(self, app: Application) -> None:
+        """记录应用删除（墓碑）。"""
+        self._tombstones.append(ApplicationTombstone(
+            seq=len(self._tombstones) + 1,
+            id=app.id,
+            key=app.key,
+            deleted_at=datetime.now(),
+        ))
+
+    async def get_catalog_version(self) -> int:
+        """
+        获取应用目录版本号。
+
+        返回:
+            int: 当前目录版本号
+        """
+        return self._catalog_version
+
     async def get_application_by_key(self, key: str) -> Application:
         """
         根据应用唯一标识获取应用信息。
@@ -128,6 +237,55 @@ class MockApplicationAdapter(ApplicationPort):
             return deepcopy(self._applications[key])
         return None
 
+    def _find_by_id(self, app_id: int) -> Application:
+        """
+        根据主键 ID 查找应用。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            Application: 应用实体（内部存储对象）
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        for app in self._applications.values():
+            if app.id == app_id:
+                return app
+        raise ValueError(f"应用不存在: id={app_id}")
+
+    async def get_application_by_id(self, app_id: int) -> Application:
+        """
+        根据应用主键 ID 获取应用信息。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            Application: 应用实体
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        return deepcopy(self._find_by_id(app_id))
+
+    async def get_application_icon(self, app_id: int) -> Optional[bytes]:
+        """
+        根据应用主键 ID 获取应用图标原始数据。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            Optional[bytes]: 图标二进制数据，应用没有图标时返回 None
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        app = self._find_by_id(app_id)
+        return base64.b64decode(app.icon) if app.icon else None
+
     async def create_application(self, application: Application) -> Application:
         """
         创建新应用。
@@ -149,6 +307,7 @@ class MockApplicationAdapter(ApplicationPort):
         application.updated_at = application.updated_at or datetime.now()
         
         self._applications[application.key] = deepcopy(application)
+        self._catalog_version += 1
         logger.info(f"[Mock] 创建应用: {application.key} (ID: {application.id})")
         
         return application
@@ -171,6 +330,7 @@ class MockApplicationAdapter(ApplicationPort):
         
         application.updated_at = application.updated_at or datetime.now()
         self._applications[application.key] = deepcopy(application)
+        self._catalog_version += 1
         logger.info(f"[Mock] 更新应用: {application.key}")
         
         return application
@@ -209,11 +369,66 @@ class MockApplicationAdapter(ApplicationPort):
         app.updated_by = updated_by
         app.updated_by_id = updated_by_id
         app.updated_at = datetime.now()
+        self._catalog_version += 1
         
         logger.info(f"[Mock] 更新应用配置: {key}, ontologies={[item.id for item in ontology_config]}, agents={[item.id for item in agent_config]}")
         
         return deepcopy(app)
 
+    async def upsert_application(
+        self, application: Application, expected_version: Optional[str] = None
+    ) -> Application:
+        """
+        按 key 创建或覆盖应用。
+
+        参数:
+            application: 应用实体
+            expected_version: 校验时看到的已安装版本，None 表示校验时应用不存在
+
+        返回:
+            Application: 写入后的应用实体（包含应用 ID）
+
+        异常:
+            ValueError: 当应用已被其他写操作创建或修改时抛出
+        """
+        existing = self._applications.get(application.key)
+        if existing is None:
+            return await self.create_application(application)
+        if expected_version is None:
+            raise ValueError(f"应用已存在: {application.key}")
+        if existing.version != expected_version:
+            raise ValueError(
+                f"应用已被其他操作修改: {application.key}（期望版本 {expected_version}）"
+            )
+        application.id = existing.id
+        return await self.update_application(application)
+
+    async def mark_application_configured(
+        self, app_id: int, updated_by: str, updated_by_id: str = ""
+    ) -> Application:
+        """
+        将应用及其全部业务知识网络、智能体配置项标记为已配置（is_config = True）。
+
+        参数:
+            app_id: 应用主键 ID
+            updated_by: 更新者用户显示名称
+            updated_by_id: 更新者用户ID
+
+        返回:
+            Application: 更新后的应用实体
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        app = await self.get_application_by_id(app_id)
+        return await self.update_application_config(
+            key=app.key,
+            ontology_config=[replace(item, is_config=True) for item in app.ontology_config],
+            agent_config=[replace(item, is_config=True) for item in app.agent_config],
+            updated_by=updated_by,
+            updated_by_id=updated_by_id,
+        )
+
     async def delete_application(self, key: str) -> bool:
         """
         删除应用。
@@ -230,11 +445,33 @@ class MockApplicationAdapter(ApplicationPort):
         if key not in self._applications:
             raise ValueError(f"应用不存在: {key}")
         
-        del self._applications[key]
+        self._add_tombstone(self._applications.pop(key))
+        self._catalog_version += 1
         logger.info(f"[Mock] 删除应用: {key}")
         
         return True
 
+    async def delete_application_by_id(self, app_id: int) -> bool:
+        """
+        根据应用主键 ID 删除应用。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            bool: 是否删除成功
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        app = self._find_by_id(app_id)
+        del self._applications[app.key]
+        self._add_tombstone(app)
+        self._catalog_version += 1
+        logger.info(f"[Mock] 删除应用: {app.key} (ID: {app_id})")
+
+        return True
+
     async def close(self):
         """关闭适配器（Mock 不需要实际关闭操作）。"""
         logger.info("[Mock] 应用适配器已关闭")
@@ -0,0 +1,50 @@
+"""
+Mock 应用制品适配器
+
+用于本地开发调试的内存存储实现，进程退出后制品记录丢失。
+"""
+import logging
+from copy import deepcopy
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from src.domains.artifact import ApplicationArtifact
+from src.ports.application_artifact_port import ApplicationArtifactPort
+
+logger = logging.getLogger(__name__)
+
+
+class MockApplicationArtifactAdapter(ApplicationArtifactPort):
+    """
+    Mock 应用制品适配器（内存存储）。
+    """
+
+    def __init__(self):
+        """初始化 Mock 应用制品适配器。"""
+        # (应用唯一标识, 制品类型, 摘要) -> 制品记录
+        self._artifacts: Dict[Tuple[str, str, str], ApplicationArtifact] = {}
+
+    async def list_artifacts(self, app_key: str) -> List[ApplicationArtifact]:
+        """获取应用已推送的制品记录。"""
+        return [
+            deepcopy(artifact)
+            for (key, _, _), artifact in self._artifacts.items()
+            if key == app_key
+        ]
+
+    async def save_artifact(self, artifact: ApplicationArtifact) -> None:
+        """保存制品推送记录。"""
+        stored = deepcopy(artifact)
+        stored.pushed_at = stored.pushed_at or datetime.now()
+        self._artifacts[(artifact.app_key, artifact.kind.value, artifact.digest)] = stored
+        logger.info(
+            f"[Mock] 记录已推送制品: {artifact.app_key} {artifact.kind.value} "
+            f"{artifact.digest[:12]}"
+        )
+
+    async def delete_artifacts(self, app_key: str) -> int:
+        """删除应用的全部制品记录。"""
+        keys = [key for key in self._artifacts if key[0] == app_key]
+        for key in keys:
+            del self._artifacts[key]
+        return len(keys)
@@ -0,0 +1,95 @@
+"""
+Mock 安装任务适配器
+
+用于本地开发调试的内存存储实现，进程退出后任务状态丢失。
+"""
+import logging
+from copy import deepcopy
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.domains.install_job import InstallJob, InstallJobStatus
+from src.ports.install_job_port import InstallJobPort
+
+logger = logging.getLogger(__name__)
+
+
+class MockInstallJobAdapter(InstallJobPort):
+    """
+    Mock 安装任务适配器（内存存储）。
+    """
+
+    def __init__(self):
+        """初始化 Mock 安装任务适配器。"""
+        self._jobs: Dict[str, InstallJob] = {}
+
+    async def create_job(self, job: InstallJob) -> InstallJob:
+        """创建安装任务。"""
+        now = datetime.now()
+        job.created_at = job.created_at or now
+        job.updated_at = now
+        self._jobs[job.id] = deepcopy(job)
+        logger.info(f"[Mock] 创建安装任务: {job.id}")
+        return job
+
+    async def get_job(self, job_id: str) -> InstallJob:
+        """根据任务 ID 获取安装任务，不存在时抛出 ValueError。"""
+        if job_id not in self._jobs:
+            raise ValueError(f"安装任务不存在: {job_id}")
+        return deepcopy(self._jobs[job_id])
+
+    async def claim_job(self, job_id: str, stale_before: Optional[datetime] = None) -> bool:
+        """将等待中（或执行方已退出）的任务置为执行中。"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        abandoned = (
+            stale_before is not None
+            and job.status == InstallJobStatus.RUNNING
+            and job.updated_at < stale_before
+        )
+        if job.status != InstallJobStatus.PENDING and not abandoned:
+            return False
+        job.status = InstallJobStatus.RUNNING
+        job.updated_at = datetime.now()
+        return True
+
+    async def update_progress(self, job: InstallJob) -> None:
+        """保存执行中任务的阶段、上传进度和应用标识，同时刷新更新时间。"""
+        stored = self._jobs.get(job.id)
+        if stored is None:
+            return
+        job.updated_at = datetime.now()
+        stored.stage = job.stage
+        stored.bytes_total = job.bytes_total
+        stored.bytes_uploaded = job.bytes_uploaded
+        stored.application_key = job.application_key
+        stored.updated_at = job.updated_at
+
+    async def finish_job(self, job: InstallJob) -> None:
+        """保存任务的最终状态、进度和结果。"""
+        job.updated_at = datetime.now()
+        if job.id in self._jobs:
+            self._jobs[job.id] = deepcopy(job)
+
+    async def touch_jobs(self, job_ids: List[str]) -> None:
+        """刷新等待中任务的更新时间。"""
+        now = datetime.now()
+        for job_id in job_ids:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status == InstallJobStatus.PENDING:
+                job.updated_at = now
+
+    async def fail_stale_jobs(self, stale_before: datetime, error: str) -> int:
+        """将更新时间早于 stale_before 的未结束任务置为失败。"""
+        count = 0
+        now = datetime.now()
+        for job in self._jobs.values():
+            if not job.is_finished() and job.updated_at < stale_before:
+                job.status = InstallJobStatus.FAILED
+                job.error_code = "INSTALL_INTERRUPTED"
+                job.error = error
+                job.updated_at = now
+                job.finished_at = now
+                count += 1
+        return count
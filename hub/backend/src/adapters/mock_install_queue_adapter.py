@@ -0,0 +1,87 @@
+"""
+Mock 安装队列适配器
+
+用于本地开发调试的内存队列实现，模拟 Redis Stream 消费组的投递、心跳、接管和确认语义。
+"""
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List
+
+from src.domains.install_job import QueuedInstall
+from src.ports.install_queue_port import InstallQueuePort
+
+logger = logging.getLogger(__name__)
+
+
+class MockInstallQueueAdapter(InstallQueuePort):
+    """
+    Mock 安装队列适配器（内存存储，仅在单进程内有效）。
+    """
+
+    def __init__(self):
+        """初始化 Mock 安装队列适配器。"""
+        self._ids = itertools.count(1)
+        self._entries: Dict[str, str] = {}
+        self._undelivered: List[str] = []
+        # 已投递未确认的消息：消息 ID -> [消费者, 最近一次投递或心跳时间, 投递次数]
+        self._pending: Dict[str, list] = {}
+        self._available = asyncio.Event()
+
+    async def enqueue(self, job_id: str) -> str:
+        """投递安装任务。"""
+        entry_id = f"{next(self._ids)}-0"
+        self._entries[entry_id] = job_id
+        self._undelivered.append(entry_id)
+        self._available.set()
+        logger.info(f"[Mock] 投递安装任务: {job_id}")
+        return entry_id
+
+    def _message(self, entry_id: str) -> QueuedInstall:
+        return QueuedInstall(
+            entry_id=entry_id,
+            job_id=self._entries[entry_id],
+            deliveries=self._pending[entry_id][2],
+        )
+
+    async def consume(self, consumer: str, count: int, block_ms: int) -> List[QueuedInstall]:
+        """读取尚未投递过的安装任务，队列为空时最多等待 block_ms 毫秒。"""
+        if not self._undelivered:
+            self._available.clear()
+            try:
+                await asyncio.wait_for(self._available.wait(), timeout=block_ms / 1000)
+            except asyncio.TimeoutError:
+                return []
+        entry_ids, self._undelivered = self._undelivered[:count], self._undelivered[count:]
+        now = time.monotonic()
+        for entry_id in entry_ids:
+            self._pending[entry_id] = [consumer, now, 1]
+        return [self._message(entry_id) for entry_id in entry_ids]
+
+    async def claim_abandoned(
+        self, consumer: str, min_idle: float, count: int
+    ) -> List[QueuedInstall]:
+        """接管超过 min_idle 秒没有心跳的已投递任务。"""
+        now = time.monotonic()
+        claimed = []
+        for entry_id, state in self._pending.items():
+            if len(claimed) >= count:
+                break
+            if now - state[1] >= min_idle:
+                state[0], state[1], state[2] = consumer, now, state[2] + 1
+                claimed.append(self._message(entry_id))
+        return claimed
+
+    async def touch(self, consumer: str, entry_ids: List[str]) -> None:
+        """刷新执行中任务消息的心跳。"""
+        now = time.monotonic()
+        for entry_id in entry_ids:
+            if entry_id in self._pending:
+                self._pending[entry_id][0] = consumer
+                self._pending[entry_id][1] = now
+
+    async def ack(self, entry_id: str) -> None:
+        """确认任务已处理完成并删除消息。"""
+        self._pending.pop(entry_id, None)
+        self._entries.pop(entry_id, None)
@@ -6,12 +6,19 @@ OAuth2 适配器
 """
 import base64
 import logging
+from typing import Optional
 from urllib.parse import quote
 
 import httpx
 
-from src.ports.oauth2_port import OAuth2Port, Code2TokenResponse, RefreshTokenResponse
+from src.ports.oauth2_port import (
+    OAuth2Port,
+    ClientCredentialsResponse,
+    Code2TokenResponse,
+    RefreshTokenResponse,
+)
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.http_client import create_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +30,18 @@ class OAuth2Adapter(OAuth2Port):
     使用 HTTP 客户端与 OAuth2 服务交互。
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, client: Optional[httpx.AsyncClient] = None):
         """
         初始化适配器。
 
         参数:
             settings: 应用配置
+            client: 共享的 HTTP 客户端（由容器持有，需关闭证书校验）；为 None 时创建适配器自有客户端
         """
         self._settings = settings
         self._timeout = 30
+        # 禁用 SSL 证书验证以避免 certificate_verify_failed
+        self._client = client or create_http_client(settings, timeout=self._timeout, verify=False)
 
     def _encode_authorization(self) -> str:
         """
@@ -100,23 +110,22 @@ class OAuth2Adapter(OAuth2Port):
         
         # 禁用 SSL 证书验证以避免 certificate_verify_failed
         try:
-            async with httpx.AsyncClient(timeout=self._timeout, verify=False) as client:
-                response = await client.post(
-                    token_url,
-                    data=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                
-                token_data = response.json()
-                
-                return Code2TokenResponse(
-                    access_token=token_data.get("access_token", ""),
-                    refresh_token=token_data.get("refresh_token"),
-                    id_token=token_data.get("id_token"),
-                    token_type=token_data.get("token_type", "Bearer"),
-                    expires_in=token_data.get("expires_in"),
-                )
+            response = await self._client.post(
+                token_url,
+                data=data,
+                headers=headers,
+            )
+            response.raise_for_status()
+
+            token_data = response.json()
+
+            return Code2TokenResponse(
+                access_token=token_data.get("access_token", ""),
+                refresh_token=token_data.get("refresh_token"),
+                id_token=token_data.get("id_token"),
+                token_type=token_data.get("token_type", "Bearer"),
+                expires_in=token_data.get("expires_in"),
+            )
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "[code2token] HTTPStatusError: %s\nResponse content: %s",
@@ -152,23 +161,22 @@ class OAuth2Adapter(OAuth2Port):
         
         logger.info(f"refresh_token request to {token_url}")
         
-        async with httpx.AsyncClient(timeout=self._timeout, verify=False) as client:
-            response = await client.post(
-                token_url,
-                data=data,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            
-            token_data = response.json()
-            
-            return RefreshTokenResponse(
-                access_token=token_data.get("access_token", ""),
-                refresh_token=token_data.get("refresh_token"),
-                id_token=token_data.get("id_token"),
-                token_type=token_data.get("token_type", "Bearer"),
-                expires_in=token_data.get("expires_in"),
-            )
+        response = await self._client.post(
+            token_url,
+            data=data,
+            headers=self._get_headers(),
+        )
+        response.raise_for_status()
+
+        token_data = response.json()
+
+        return RefreshTokenResponse(
+            access_token=token_data.get("access_token", ""),
+            refresh_token=token_data.get("refresh_token"),
+            id_token=token_data.get("id_token"),
+            token_type=token_data.get("token_type", "Bearer"),
+            expires_in=token_data.get("expires_in"),
+        )
 
     async def revoke_token(self, token: str) -> None:
         """
@@ -188,11 +196,44 @@ class OAuth2Adapter(OAuth2Port):
             "token": token,
         }
         
-        async with httpx.AsyncClient(timeout=self._timeout, verify=False) as client:
-            response = await client.post(
-                revoke_url,
-                data=data,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        response = await self._client.post(
+            revoke_url,
+            data=data,
+            headers=self._get_headers(),
+        )
+        response.raise_for_status()
+
+    async def client_credentials_token(self, scope: str = "") -> ClientCredentialsResponse:
+        """
+        以本服务的客户端凭据获取访问令牌（client_credentials 模式）。
+
+        参数:
+            scope: 申请的权限范围，为空时不指定
 
+        返回:
+            ClientCredentialsResponse: Token 响应
+
+        异常:
+            Exception: 当获取失败时抛出
+        """
+        # 使用 Hydra Public URL 作为 token 端点
+        token_url = f"{self._settings.hydra_public_url.rstrip('/')}/oauth2/token"
+
+        data = {"grant_type": "client_credentials"}
+        if scope:
+            data["scope"] = scope
+
+        response = await self._client.post(
+            token_url,
+            data=data,
+            headers=self._get_headers(),
+        )
+        response.raise_for_status()
+
+        token_data = response.json()
+
+        return ClientCredentialsResponse(
+            access_token=token_data.get("access_token", ""),
+            token_type=token_data.get("token_type", "Bearer"),
+            expires_in=token_data.get("expires_in"),
+        )
@@ -4,34 +4,96 @@
 应用层服务，负责编排应用管理操作。
 该服务使用端口（接口），不依赖任何基础设施细节。
 """
+import asyncio
 import base64
-import io
+import functools
+import hashlib
 import json
 import logging
 import os
+import posixpath
 import shutil
 import tempfile
 import zipfile
-from typing import List, Optional, BinaryIO
 from datetime import datetime
-from packaging import version as pkg_version
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import yaml
+from packaging import version as pkg_version
 
 from src.domains.application import (
-    Application, ManifestInfo, MicroAppInfo,
-    OntologyConfigItem, AgentConfigItem, ReleaseConfigItem
+    AgentConfigItem,
+    Application,
+    ApplicationChangeCursor,
+    ApplicationChanges,
+    ApplicationCursor,
+    ApplicationPage,
+    ManifestInfo,
+    MicroAppInfo,
+    OntologyConfigItem,
+    ReleaseConfigItem,
 )
+from src.domains.artifact import ApplicationArtifact, ArtifactKind
+from src.domains.install_job import InstallProgress, InstallStage
+from src.domains.upgrade_plan import PlanAction, PlanItem, PlanItemKind, UpgradePlan
+from src.infrastructure.concurrency import BlockingExecutor, bounded_map, gather_fail_fast
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.package_archive import PackageArchive
+from src.ports.application_artifact_port import ApplicationArtifactPort
 from src.ports.application_port import ApplicationPort
 from src.ports.external_service_port import (
+    AgentFactoryPort,
+    ChartInfo,
+    ChartUploadResult,
     DeployInstallerPort,
     OntologyManagerPort,
-    AgentFactoryPort,
 )
-from src.infrastructure.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# 校验已保存安装包摘要时每次读取的字节数
+_DIGEST_BLOCK_SIZE = 1024 * 1024
+
+# 接收安装包数据块流时累积到该字节数再交给线程池写盘，减少线程切换次数
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 未注入阻塞任务执行器且未提供配置时的线程数
+_DEFAULT_IO_WORKERS = 4
+_DEFAULT_DIGEST_WORKERS = 1
+
+
+class _ProgressReader:
+    """
+    统计读取字节数的文件对象代理。
+
+    上传适配器通过 read() 读取文件内容，读取的字节数累加到安装进度；
+    其余属性和方法（seek、tell、name 等）透传给原文件对象。
+    """
+
+    def __init__(self, file: BinaryIO, progress: InstallProgress):
+        self._file = file
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._progress.add_uploaded(len(data))
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
 
 class ApplicationService:
     """
@@ -47,6 +109,10 @@ class ApplicationService:
         ontology_manager_port: Optional[OntologyManagerPort] = None,
         agent_factory_port: Optional[AgentFactoryPort] = None,
         settings: Optional[Settings] = None,
+        blocking_executor: Optional[BlockingExecutor] = None,
+        artifact_port: Optional[ApplicationArtifactPort] = None,
+        digest_executor: Optional[BlockingExecutor] = None,
+        upload_executor: Optional[BlockingExecutor] = None,
     ):
         """
         初始化应用服务。
@@ -57,12 +123,58 @@ class ApplicationService:
             ontology_manager_port: Ontology Manager 端口（可选）
             agent_factory_port: Agent Factory 端口（可选）
             settings: 应用配置（可选）
+            blocking_executor: 执行安装包解压、文件读写等阻塞操作的有界线程池（可选，
+                未提供时创建服务自有的线程池）
+            artifact_port: 应用制品端口（可选，未提供时每次安装都推送全部镜像和 Chart）
+            digest_executor: 计算安装包、镜像和 Chart 摘要的有界线程池（可选，
+                未提供时创建服务自有的线程池）
+            upload_executor: 接收上传请求时写入安装包数据的有界线程池（可选，
+                未提供时创建服务自有的线程池）
         """
         self._application_port = application_port
         self._deploy_installer_port = deploy_installer_port
         self._ontology_manager_port = ontology_manager_port
         self._agent_factory_port = agent_factory_port
         self._settings = settings
+        self._blocking_executor = blocking_executor or BlockingExecutor(
+            max_workers=settings.install_io_workers if settings else _DEFAULT_IO_WORKERS,
+            thread_name_prefix="dip-hub-install-io",
+        )
+        self._digest_executor = digest_executor or BlockingExecutor(
+            max_workers=settings.install_digest_workers if settings else _DEFAULT_DIGEST_WORKERS,
+            thread_name_prefix="dip-hub-digest",
+        )
+        self._upload_executor = upload_executor or BlockingExecutor(
+            max_workers=settings.upload_io_workers if settings else _DEFAULT_IO_WORKERS,
+            thread_name_prefix="dip-hub-upload-io",
+        )
+        self._artifact_port = artifact_port
+
+    @property
+    def upload_executor(self) -> BlockingExecutor:
+        """接收上传请求时写盘的有界线程池，安装任务服务和上传服务共用。"""
+        return self._upload_executor
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        在线程池中执行阻塞函数，避免阻塞事件循环。
+
+        参数:
+            fn: 阻塞函数
+            *args: 位置参数
+
+        返回:
+            Any: 函数返回值
+        """
+        return await self._blocking_executor.run(fn, *args)
+
+    async def _run_digest(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """在摘要线程池中执行摘要计算，大文件摘要不占用文件读写线程。"""
+        return await self._digest_executor.run(fn, *args)
+
+    async def _run_upload_io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """在上传线程池中执行上传请求的写盘操作，不受安装任务的阻塞操作影响。"""
+        return await self._upload_executor.run(fn, *args)
 
     async def get_all_applications(self) -> List[Application]:
         """
@@ -73,6 +185,67 @@ class ApplicationService:
         """
         return await self._application_port.get_all_applications()
 
+    async def list_applications(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        category: Optional[str] = None,
+        business_domain: Optional[str] = None,
+    ) -> ApplicationPage:
+        """
+        分页获取应用列表，按更新时间倒序排列。
+
+        参数:
+            limit: 每页条数，为空时使用默认值，超过上限时按上限处理
+            cursor: 上一页返回的游标字符串，为空时从第一页开始
+            category: 按应用分组过滤
+            business_domain: 按业务域过滤
+
+        返回:
+            ApplicationPage: 当前页应用列表及下一页游标
+
+        异常:
+            ValueError: 游标格式无效时抛出
+        """
+        default_limit = self._settings.application_list_default_limit if self._settings else 100
+        max_limit = self._settings.application_list_max_limit if self._settings else 500
+        page_size = min(limit or default_limit, max_limit)
+        decoded_cursor = ApplicationCursor.decode(cursor) if cursor else None
+        return await self._application_port.list_applications(
+            limit=page_size,
+            cursor=decoded_cursor,
+            category=category,
+            business_domain=business_domain,
+        )
+
+    async def list_application_changes(
+        self,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> ApplicationChanges:
+        """
+        获取应用目录增量变更，供客户端同步本地副本。
+
+        参数:
+            since: 上次同步返回的游标字符串，为空时从头开始同步
+            limit: 新增/更新应用和删除记录各自的最大条数，为空时使用默认值，超过上限时按上限处理
+
+        返回:
+            ApplicationChanges: 增量变更及下次同步使用的游标
+
+        异常:
+            ValueError: 游标格式无效时抛出
+        """
+        default_limit = self._settings.application_list_default_limit if self._settings else 100
+        max_limit = self._settings.application_list_max_limit if self._settings else 500
+        cursor = (
+            ApplicationChangeCursor.decode(since) if since else ApplicationChangeCursor.initial()
+        )
+        return await self._application_port.list_application_changes(
+            since=cursor,
+            limit=min(limit or default_limit, max_limit),
+        )
+
     async def get_application_by_key(self, key: str) -> Application:
         """
         根据应用唯一标识获取应用信息。
@@ -118,6 +291,33 @@ class ApplicationService:
         """
         return await self._application_port.get_application_by_id(app_id)
 
+    async def get_application_icon(self, app_id: int) -> bytes:
+        """
+        获取应用图标原始数据。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            bytes: 图标二进制数据
+
+        异常:
+            ValueError: 当应用不存在或应用没有图标时抛出
+        """
+        icon = await self._application_port.get_application_icon(app_id)
+        if not icon:
+            raise ValueError(f"应用图标不存在: id={app_id}")
+        return icon
+
+    async def get_catalog_version(self) -> int:
+        """
+        获取应用目录版本号，用于生成目录读接口的 HTTP 缓存校验值。
+
+        返回:
+            int: 当前目录版本号
+        """
+        return await self._application_port.get_catalog_version()
+
     async def get_application_ontologies_by_id(
         self,
         app_id: int,
@@ -144,27 +344,21 @@ class ApplicationService:
         # 1. 通过 id 获取应用
         application = await self._application_port.get_application_by_id(app_id)
         
-        # 2. 遍历配置项，通过 id 调用外部接口查询详情
-        ontologies = []
-        for config_item in application.ontology_config:
-            try:
-                if self._ontology_manager_port:
-                    # 调用外部接口查询业务知识网络详情（返回原始数据）
-                    kn_data = await self._ontology_manager_port.get_knowledge_network(
-                        config_item.id,
-                        auth_token=auth_token,
-                        business_domain=application.business_domain,
-                    )
-                    ontologies.append(kn_data)
-                else:
-                    # 如果没有外部服务端口，返回基本信息
-                    ontologies.append({"id": config_item.id})
-            except Exception as e:
-                logger.warning(f"获取业务知识网络详情失败 (ID: {config_item.id}): {e}")
-                # 即使查询失败，也返回基本信息
-                ontologies.append({"id": config_item.id})
+        # 2. 并发通过 id 调用外部接口查询详情（返回原始数据）
+        if not self._ontology_manager_port:
+            # 如果没有外部服务端口，返回基本信息
+            return [{"id": item.id} for item in application.ontology_config]
+
+        async def _fetch(ontology_id: str) -> dict:
+            return await self._ontology_manager_port.get_knowledge_network(
+                ontology_id,
+                auth_token=auth_token,
+                business_domain=application.business_domain,
+            )
         
-        return ontologies
+        return await self._fetch_details(
+            [item.id for item in application.ontology_config], _fetch, "业务知识网络"
+        )
 
     async def get_application_agents_by_id(
         self,
@@ -192,27 +386,65 @@ class ApplicationService:
         # 1. 通过 id 获取应用
         application = await self._application_port.get_application_by_id(app_id)
         
-        # 2. 遍历配置项，通过 id 调用外部接口查询详情
-        agents = []
-        for config_item in application.agent_config:
+        # 2. 并发通过 id 调用外部接口查询详情（返回原始数据）
+        if not self._agent_factory_port:
+            # 如果没有外部服务端口，返回基本信息
+            return [{"id": item.id} for item in application.agent_config]
+
+        async def _fetch(agent_id: str) -> dict:
+            return await self._agent_factory_port.get_agent(
+                agent_id,
+                auth_token=auth_token,
+                business_domain=application.business_domain,
+            )
+
+        return await self._fetch_details(
+            [item.id for item in application.agent_config], _fetch, "智能体"
+        )
+
+    async def _fetch_details(
+        self,
+        item_ids: List[str],
+        fetch: Callable[[str], Awaitable[dict]],
+        label: str,
+    ) -> List[dict]:
+        """
+        以有限并发度查询详情，结果顺序与 item_ids 一致。
+
+        并发数受 application_detail_concurrency 限制，整体耗时不超过
+        application_detail_timeout；查询失败或超时的条目返回 {"id": ...} 基本信息。
+
+        参数:
+            item_ids: 待查询的 ID 列表
+            fetch: 按 ID 查询详情的异步函数
+            label: 资源名称（用于日志）
+
+        返回:
+            List[dict]: 详情列表
+        """
+        concurrency = self._settings.application_detail_concurrency if self._settings else 8
+        deadline = self._settings.application_detail_timeout if self._settings else 10.0
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + deadline
+
+        async def _guarded(item_id: str) -> dict:
+            async with semaphore:
+                return await fetch(item_id)
+
+        async def _fetch_one(item_id: str) -> dict:
             try:
-                if self._agent_factory_port:
-                    # 调用外部接口查询智能体详情（返回原始数据）
-                    agent_data = await self._agent_factory_port.get_agent(
-                        config_item.id,
-                        auth_token=auth_token,
-                        business_domain=application.business_domain,
-                    )
-                    agents.append(agent_data)
-                else:
-                    # 如果没有外部服务端口，返回基本信息
-                    agents.append({"id": config_item.id})
+                return await asyncio.wait_for(
+                    _guarded(item_id), timeout=max(0.0, deadline_at - loop.time())
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"获取{label}详情超时 (ID: {item_id}, 超时: {deadline}s)")
             except Exception as e:
-                logger.warning(f"获取智能体详情失败 (ID: {config_item.id}): {e}")
-                # 即使查询失败，也返回基本信息
-                agents.append({"id": config_item.id})
-        
-        return agents
+                logger.warning(f"获取{label}详情失败 (ID: {item_id}): {e}")
+            # 即使查询失败，也返回基本信息
+            return {"id": item_id}
+
+        return list(await asyncio.gather(*(_fetch_one(item_id) for item_id in item_ids)))
 
     async def configure_application(
         self,
@@ -223,8 +455,9 @@ class ApplicationService:
         """
         配置应用的业务知识网络和智能体。
 
-        根据应用当前在数据库中的业务知识网络配置 (ontology_config)
-        和智能体配置 (agent_config)，将每一项的 is_config 设置为 True。
+        将应用当前的业务知识网络配置 (ontology_config) 和智能体配置 (agent_config)
+        中每一项的 is_config 设置为 True。该操作由存储层单条语句完成，
+        不会覆盖读取与写回之间其他写操作的修改。
 
         参数:
             app_id: 应用主键 ID
@@ -237,51 +470,39 @@ class ApplicationService:
         异常:
             ValueError: 当应用不存在时抛出
         """
-        # 获取现有应用
-        application = await self._application_port.get_application_by_id(app_id)
-
-        # 基于现有配置，将 is_config 统一置为 True
-        new_ontology_config = [
-            OntologyConfigItem(id=item.id, is_config=True)
-            for item in application.ontology_config
-        ]
-        new_agent_config = [
-            AgentConfigItem(id=item.id, is_config=True)
-            for item in application.agent_config
-        ]
-
-        # 更新配置
-        return await self._application_port.update_application_config(
-            key=application.key,
-            ontology_config=new_ontology_config,
-            agent_config=new_agent_config,
+        return await self._application_port.mark_application_configured(
+            app_id=app_id,
             updated_by=updated_by,
             updated_by_id=updated_by_id,
         )
 
     async def install_application(
         self,
-        zip_data: BinaryIO,
+        zip_data: Union[str, BinaryIO, AsyncIterable[bytes]],
         updated_by: str = "",
         updated_by_id: str = "",
         auth_token: Optional[str] = None,
+        progress: Optional[InstallProgress] = None,
     ) -> Application:
         """
         安装应用。
 
         流程：
-        1. 将 zip 数据写入临时文件
-        2. 解压并校验安装包结构和 manifest.yaml
+        1. 将 zip 数据写入临时文件（异步数据块流逐块落盘并计算 SHA-256）
+        2. 读取 ZIP 中央目录建立成员索引（不解压），校验安装包结构和 manifest.yaml
         3. 解析 application.key，校验 version
-        4. 如果应用已存在，版本号必须大于已上传版本
-        5. 解压安装包，上传镜像和 Chart
-        6. 导入业务知识网络和 DataAgent 智能体
+        4. 如果应用已存在，版本号必须大于已上传版本，并对比已安装版本生成升级计划
+        5. 从安装包中流式读取镜像和 Chart 并上传（跳过该应用已推送过的相同摘要的制品），
+           安装有变化的 Release
+        6. 新建有变化的业务知识网络和 DataAgent 智能体
         7. 更新应用信息
 
         参数:
-            zip_data: ZIP 格式应用安装包数据
+            zip_data: ZIP 格式应用安装包数据，可以是已落盘的安装包路径、文件对象或异步字节块流
             updated_by: 更新者用户显示名称
             updated_by_id: 更新者用户ID
+            auth_token: 认证 Token
+            progress: 安装进度（可选），安装过程中更新当前阶段和上传字节数
 
         返回:
             Application: 安装后的应用
@@ -291,332 +512,57 @@ class ApplicationService:
         """
         logger.info(f"[install_application] 开始安装应用，updated_by: {updated_by}")
         temp_dir = None
+        package = None
         try:
-            # 创建临时目录
-            temp_base = self._settings.temp_dir if self._settings else "/tmp/dip-hub"
-            os.makedirs(temp_base, exist_ok=True)
-            temp_dir = tempfile.mkdtemp(dir=temp_base)
-            logger.info(f"[install_application] 创建临时目录: {temp_dir}")
-            
-            # 保存 zip 文件
-            zip_path = os.path.join(temp_dir, "package.zip")
-            with open(zip_path, "wb") as f:
-                shutil.copyfileobj(zip_data, f)
-            zip_size = os.path.getsize(zip_path)
-            logger.info(f"[install_application] ZIP 文件已保存: {zip_path}, 大小: {zip_size} bytes")
-            
-            # 解压 zip 文件
-            extract_dir = os.path.join(temp_dir, "extracted")
-            logger.info(f"[install_application] 开始解压 ZIP 文件到: {extract_dir}")
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    file_list = zip_ref.namelist()
-                    logger.info(f"[install_application] ZIP 文件包含 {len(file_list)} 个文件/目录")
-                    logger.debug(f"[install_application] ZIP 文件列表: {file_list[:10]}..." if len(file_list) > 10 else f"[install_application] ZIP 文件列表: {file_list}")
-                    zip_ref.extractall(extract_dir)
-                logger.info(f"[install_application] ZIP 文件解压完成")
-            except zipfile.BadZipFile as e:
-                logger.error(f"[install_application] ZIP 文件格式错误: {e}", exc_info=True)
-                raise ValueError(f"无效的 ZIP 文件格式: {str(e)}")
-            except Exception as e:
-                logger.error(f"[install_application] 解压 ZIP 文件失败: {e}", exc_info=True)
-                raise ValueError(f"解压 ZIP 文件失败: {str(e)}")
-            
-            # 查找 manifest.yaml（从解压目录逐层查找）
-            # 应用包结构：manifest.yaml 同层有 application.key、packages/、ontologies/、agents/
-            logger.info(f"[install_application] 开始逐层查找 manifest.yaml 文件")
-            manifest_path = self._find_file_bfs(extract_dir, ["manifest.yaml", "manifest.yml"])
-            
-            if not manifest_path:
-                logger.error(f"[install_application] 未找到 manifest.yaml 文件，解压目录内容: {os.listdir(extract_dir) if os.path.exists(extract_dir) else '目录不存在'}")
-                raise ValueError("安装包缺少 manifest.yaml 文件")
-            
-            logger.info(f"[install_application] 找到 manifest.yaml: {manifest_path}")
-            
-            # manifest.yaml 所在目录即为应用包根目录，同层包含 application.key、packages/、ontologies/、agents/
-            manifest_dir = os.path.dirname(manifest_path)
-            logger.info(f"[install_application] 应用包根目录: {manifest_dir}")
-            
-            # application.key 与 manifest.yaml 同层
-            app_key_path = os.path.join(manifest_dir, "application.key")
-            if not os.path.exists(app_key_path):
-                logger.error(f"[install_application] 未找到 application.key 文件，应在 manifest.yaml 同层目录: {manifest_dir}")
-                raise ValueError("安装包缺少 application.key 文件（应与 manifest.yaml 同层）")
-            
-            logger.info(f"[install_application] 找到 application.key: {app_key_path}")
-            try:
-                with open(app_key_path, "r", encoding="utf-8") as f:
-                    app_key = f.read().strip()
-                    if not app_key:
-                        raise ValueError("application.key 文件为空")
-                    logger.info(f"[install_application] 读取 application.key 成功: {app_key}")
-            except Exception as e:
-                logger.error(f"[install_application] 读取 application.key 失败: {e}", exc_info=True)
-                raise ValueError(f"读取 application.key 失败: {str(e)}")
-            
-            # 读取并解析 manifest.yaml
-            logger.info(f"[install_application] 开始读取 manifest.yaml")
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    manifest_content = f.read()
-                    logger.debug(f"[install_application] manifest.yaml 内容:\n{manifest_content}")
-                    manifest_data = yaml.safe_load(manifest_content)
-                    if not manifest_data:
-                        raise ValueError("manifest.yaml 文件为空或格式错误")
-            except yaml.YAMLError as e:
-                logger.error(f"[install_application] manifest.yaml 解析失败: {e}", exc_info=True)
-                raise ValueError(f"manifest.yaml 解析失败: {str(e)}")
-            except Exception as e:
-                logger.error(f"[install_application] 读取 manifest.yaml 失败: {e}", exc_info=True)
-                raise ValueError(f"读取 manifest.yaml 失败: {str(e)}")
+            # 创建临时目录并保存安装包
+            temp_dir = self._create_temp_dir()
+            if progress:
+                progress.set_stage(InstallStage.EXTRACTING)
+            zip_path = await self._stage_package(zip_data, temp_dir)
             
-            logger.info(f"[install_application] manifest.yaml 解析成功，开始解析 manifest 数据")
-            try:
-                manifest = self._parse_manifest(manifest_data, app_key=app_key)
-                logger.info(f"[install_application] manifest 解析成功: key={manifest.key}, name={manifest.name}, version={manifest.version}")
-            except Exception as e:
-                logger.error(f"[install_application] manifest 解析失败: {e}", exc_info=True)
-                raise
+            # 索引安装包并解析 manifest.yaml
+            manifest, package = await self._load_package(zip_path)
+            if progress:
+                progress.application_key = manifest.key
             
             # 校验版本
-            logger.info(f"[install_application] 开始校验版本，key: {manifest.key}, version: {manifest.version}")
-            existing_app = await self._application_port.get_application_by_key_optional(manifest.key)
-            if existing_app:
-                logger.info(f"[install_application] 应用已存在: key={manifest.key}, 当前版本={existing_app.version}, 新版本={manifest.version}")
-                if manifest.version == existing_app.version:
-                    error_msg = f"版本号冲突: 新版本 {manifest.version} 与已安装版本相同。请更新版本号或先卸载现有应用 (key: {manifest.key})"
-                    logger.error(f"[install_application] {error_msg}")
-                    raise ValueError(error_msg)
-                if not self._is_version_greater(manifest.version, existing_app.version):
-                    error_msg = f"版本号冲突: 新版本 {manifest.version} 必须大于已安装版本 {existing_app.version}。当前已安装版本: {existing_app.version} (key: {manifest.key})"
-                    logger.error(f"[install_application] {error_msg}")
-                    raise ValueError(error_msg)
-                logger.info(
-                    f"[install_application] 版本校验通过: 新版本 {manifest.version} > 已安装版本 {existing_app.version} (key: {manifest.key})"
-                )
-            else:
-                logger.info(f"[install_application] 应用不存在，将创建新应用: key={manifest.key}")
+            existing_app = await self._check_version(manifest)
+
+            # 对比已安装版本，生成升级计划：未变化的 Release 不再安装，
+            # 未变化的业务知识网络和智能体沿用已安装配置
+            plan = await self._plan_upgrade(manifest, package, existing_app)
             
             # 读取图标（从 assets/icons/ 目录自动发现）
             logger.info(f"[install_application] 开始读取图标")
-            icon_base64 = None
-            icon_path = None
-            
-            # 查找 assets/icons/ 目录下的图标文件
-            icons_dir = os.path.join(manifest_dir, "assets", "icons")
-            if os.path.exists(icons_dir) and os.path.isdir(icons_dir):
-                icon_files = [f for f in os.listdir(icons_dir) 
-                             if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico'))]
-                if icon_files:
-                    # 使用第一个找到的图标文件
-                    icon_path = os.path.join("assets", "icons", icon_files[0])
-                    logger.info(f"[install_application] 自动找到图标: {icon_path}")
-            
-            if icon_path:
-                icon_full_path = os.path.join(manifest_dir, icon_path)
-                logger.info(f"[install_application] 图标路径: {icon_path}")
-                logger.debug(f"[install_application] 图标完整路径: {icon_full_path}")
-                if os.path.exists(icon_full_path):
-                    try:
-                        with open(icon_full_path, "rb") as f:
-                            icon_data = f.read()
-                            icon_base64 = base64.b64encode(icon_data).decode("utf-8")
-                            logger.info(f"[install_application] 图标读取成功，大小: {len(icon_data)} bytes")
-                    except Exception as e:
-                        logger.warning(f"[install_application] 读取图标失败: {e}", exc_info=True)
-                else:
-                    logger.warning(f"[install_application] 图标文件不存在: {icon_full_path}")
-            else:
-                logger.info(f"[install_application] 未找到图标文件，跳过图标读取")
+            icon_base64 = await self._run_blocking(self._read_icon, package)
             
-            # 上传镜像（从 packages/images/ 目录自动发现）
+            # 上传镜像和 Chart 并安装 Release（从 packages/ 目录自动发现）
             release_configs = []
+            if progress:
+                progress.set_stage(InstallStage.UPLOADING)
             if self._deploy_installer_port:
-                # 自动查找 packages/images/ 目录下的镜像文件
-                image_paths = []
-                images_dir = os.path.join(manifest_dir, "packages", "images")
-                if os.path.exists(images_dir) and os.path.isdir(images_dir):
-                    image_files = [f for f in os.listdir(images_dir) 
-                                  if f.lower().endswith(('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz'))]
-                    # 构建相对路径
-                    image_paths = [os.path.join("packages", "images", f) for f in image_files]
-                    logger.info(f"[install_application] 自动找到 {len(image_paths)} 个镜像文件: {image_paths}")
-                
-                logger.info(f"[install_application] 开始处理镜像，镜像数量: {len(image_paths)}")
-                for idx, image_path in enumerate(image_paths, 1):
-                    image_full_path = os.path.join(manifest_dir, image_path)
-                    logger.info(f"[install_application] 处理镜像 [{idx}/{len(image_paths)}]: {image_path}")
-                    logger.debug(f"[install_application] 镜像完整路径: {image_full_path}")
-                    if os.path.exists(image_full_path):
-                        try:
-                            file_size = os.path.getsize(image_full_path)
-                            logger.info(f"[install_application] 开始上传镜像: {image_path}, 大小: {file_size} bytes")
-                            with open(image_full_path, "rb") as f:
-                                await self._deploy_installer_port.upload_image(f, auth_token=auth_token)
-                            logger.info(f"[install_application] 镜像上传成功: {image_path}")
-                        except Exception as e:
-                            logger.error(f"[install_application] 镜像上传失败 ({image_path}): {e}", exc_info=True)
-                            raise ValueError(f"镜像上传失败 ({image_path}): {str(e)}")
-                    else:
-                        logger.error(f"[install_application] 镜像文件不存在: {image_full_path}")
-                        raise ValueError(f"镜像文件不存在: {image_path}")
-                
-                # 上传 Chart 并安装（从 packages/charts/ 目录自动发现）
-                # 自动查找 packages/charts/ 目录下的 Chart 文件
-                chart_configs = []
-                charts_dir = os.path.join(manifest_dir, "packages", "charts")
-                if os.path.exists(charts_dir) and os.path.isdir(charts_dir):
-                    chart_files = [f for f in os.listdir(charts_dir) 
-                                  if f.lower().endswith(('.tgz', '.tar.gz'))]
-                    # 为每个 Chart 创建配置对象
-                    chart_configs = [{"path": os.path.join("packages", "charts", f)} for f in chart_files]
-                    logger.info(f"[install_application] 自动找到 {len(chart_configs)} 个 Chart 文件: {[c['path'] for c in chart_configs]}")
-                
-                logger.info(f"[install_application] 开始处理 Chart，Chart 数量: {len(chart_configs)}")
-                for idx, chart_config in enumerate(chart_configs, 1):
-                    chart_path = chart_config.get("path", "")
-                    if not chart_path:
-                        logger.warning(f"[install_application] Chart 配置缺少 path 字段，跳过: {chart_config}")
-                        continue
-                    
-                    logger.info(f"[install_application] 处理 Chart [{idx}/{len(chart_configs)}]: {chart_path}")
-                    chart_full_path = os.path.join(manifest_dir, chart_path)
-                    logger.debug(f"[install_application] Chart 完整路径: {chart_full_path}")
-                    if os.path.exists(chart_full_path):
-                        try:
-                            file_size = os.path.getsize(chart_full_path)
-                            logger.info(f"[install_application] 开始上传 Chart: {chart_path}, 大小: {file_size} bytes")
-                            with open(chart_full_path, "rb") as f:
-                                chart_result = await self._deploy_installer_port.upload_chart(f, auth_token=auth_token)
-                            logger.info(f"[install_application] Chart 上传成功: {chart_result.chart.name} v{chart_result.chart.version}")
-                            
-                            # 安装 release
-                            release_name = chart_config.get("release_name", chart_result.chart.name)
-                            # namespace 优先级：chart 配置 > manifest.release-config.namespace > 默认值
-                            namespace = chart_config.get("namespace") or manifest.release_config.get("namespace")
-                            values = chart_result.values
-                            values["namespace"] = namespace
-                            logger.info(f"[install_application] 开始安装 Release: name={release_name}, namespace={namespace}, chart={chart_result.chart.name} v{chart_result.chart.version}")
-                            
-                            await self._deploy_installer_port.install_release(
-                                release_name=release_name,
-                                namespace=namespace,
-                                chart_name=chart_result.chart.name,
-                                chart_version=chart_result.chart.version,
-                                values=values,
-                                auth_token=auth_token,
-                            )
-                            release_configs.append(ReleaseConfigItem(name=release_name, namespace=namespace))
-                            logger.info(f"[install_application] Release 安装成功: {release_name}, namespace: {namespace}")
-                        except Exception as e:
-                            logger.error(f"[install_application] Chart 处理失败 ({chart_path}): {e}", exc_info=True)
-                            raise ValueError(f"Chart 处理失败 ({chart_path}): {str(e)}")
-                    else:
-                        logger.error(f"[install_application] Chart 文件不存在: {chart_full_path}")
-                        raise ValueError(f"Chart 文件不存在: {chart_path}")
+                release_configs = await self._upload_artifacts(
+                    manifest, package, auth_token, progress, plan=plan
+                )
             else:
                 logger.warning(f"[install_application] Deploy Installer 端口未配置，跳过镜像和 Chart 上传")
             
-            # 导入业务知识网络（从 ontologies 目录读取 JSON 文件）
-            logger.info(f"[install_application] 开始导入业务知识网络，business_domain: {manifest.business_domain}")
-            ontology_config = []
-            if self._ontology_manager_port:
-                ontologies_dir = os.path.join(manifest_dir, "ontologies")
-                logger.debug(f"[install_application] 业务知识网络目录: {ontologies_dir}")
-                if os.path.exists(ontologies_dir) and os.path.isdir(ontologies_dir):
-                    files = os.listdir(ontologies_dir)
-                    logger.info(f"[install_application] ontologies 目录包含 {len(files)} 个文件: {files}")
-                    for filename in files:
-                        if filename.endswith(('.json', '.yaml', '.yml')):
-                            ontology_file_path = os.path.join(ontologies_dir, filename)
-                            logger.info(f"[install_application] 处理业务知识网络文件: {filename}")
-                            try:
-                                with open(ontology_file_path, "r", encoding="utf-8") as f:
-                                    if filename.endswith('.json'):
-                                        onto_config = json.load(f)
-                                    else:
-                                        onto_config = yaml.safe_load(f)
-                                
-                                logger.debug(f"[install_application] 业务知识网络配置内容: {onto_config}")
-                                logger.info(f"[install_application] 开始创建业务知识网络: {filename}")
-                                onto_id = await self._ontology_manager_port.create_knowledge_network(
-                                    onto_config,
-                                    auth_token=auth_token,
-                                    business_domain=manifest.business_domain,
-                                )
-                                if onto_id:
-                                    ontology_config.append(OntologyConfigItem(
-                                        id=str(onto_id),
-                                        is_config=False,  # 安装时默认为未配置
-                                    ))
-                                    logger.info(f"[install_application] 成功导入业务知识网络: {filename} -> ID: {onto_id}")
-                                else:
-                                    logger.warning(f"[install_application] 业务知识网络创建返回空 ID: {filename}")
-                            except json.JSONDecodeError as e:
-                                logger.error(f"[install_application] 业务知识网络 JSON 解析失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"业务知识网络配置文件格式错误 ({filename}): {str(e)}")
-                            except yaml.YAMLError as e:
-                                logger.error(f"[install_application] 业务知识网络 YAML 解析失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"业务知识网络配置文件格式错误 ({filename}): {str(e)}")
-                            except Exception as e:
-                                logger.error(f"[install_application] 导入业务知识网络失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"导入业务知识网络失败 ({filename}): {str(e)}")
-                else:
-                    logger.info(f"[install_application] ontologies 目录不存在或不是目录，跳过业务知识网络导入")
-            else:
-                logger.warning(f"[install_application] Ontology Manager 端口未配置，跳过业务知识网络导入")
-            
-            # 导入智能体（从 agents 目录读取 JSON 文件）
-            logger.info(f"[install_application] 开始导入智能体，business_domain: {manifest.business_domain}")
-            agent_config = []
-            if self._agent_factory_port:
-                agents_dir = os.path.join(manifest_dir, "agents")
-                logger.debug(f"[install_application] 智能体目录: {agents_dir}")
-                if os.path.exists(agents_dir) and os.path.isdir(agents_dir):
-                    files = os.listdir(agents_dir)
-                    logger.info(f"[install_application] agents 目录包含 {len(files)} 个文件: {files}")
-                    for filename in files:
-                        if filename.endswith(('.json', '.yaml', '.yml')):
-                            agent_file_path = os.path.join(agents_dir, filename)
-                            logger.info(f"[install_application] 处理智能体文件: {filename}")
-                            try:
-                                with open(agent_file_path, "r", encoding="utf-8") as f:
-                                    if filename.endswith('.json'):
-                                        agent_config_data = json.load(f)
-                                    else:
-                                        agent_config_data = yaml.safe_load(f)
-                                
-                                logger.debug(f"[install_application] 智能体配置内容: {agent_config_data}")
-                                logger.info(f"[install_application] 开始创建智能体: {filename}")
-                                agent_result = await self._agent_factory_port.create_agent(
-                                    agent_config_data,
-                                    auth_token=auth_token,
-                                    business_domain=manifest.business_domain,
-                                )
-                                if agent_result.id:
-                                    agent_config.append(AgentConfigItem(
-                                        id=str(agent_result.id),
-                                        is_config=False,  # 安装时默认为未配置
-                                    ))
-                                    logger.info(f"[install_application] 成功导入智能体: {filename} -> ID: {agent_result.id}, version: {agent_result.version}")
-                                else:
-                                    logger.warning(f"[install_application] 智能体创建返回空 ID: {filename}")
-                            except json.JSONDecodeError as e:
-                                logger.error(f"[install_application] 智能体 JSON 解析失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"智能体配置文件格式错误 ({filename}): {str(e)}")
-                            except yaml.YAMLError as e:
-                                logger.error(f"[install_application] 智能体 YAML 解析失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"智能体配置文件格式错误 ({filename}): {str(e)}")
-                            except Exception as e:
-                                logger.error(f"[install_application] 导入智能体失败 ({filename}): {e}", exc_info=True)
-                                raise ValueError(f"导入智能体失败 ({filename}): {str(e)}")
-                else:
-                    logger.info(f"[install_application] agents 目录不存在或不是目录，跳过智能体导入")
-            else:
-                logger.warning(f"[install_application] Agent Factory 端口未配置，跳过智能体导入")
+            # 并发导入业务知识网络和智能体（从 ontologies/、agents/ 目录读取配置文件）
+            logger.info(
+                "[install_application] 开始导入业务知识网络和智能体，business_domain: "
+                f"{manifest.business_domain}"
+            )
+            if progress:
+                progress.set_stage(InstallStage.IMPORTING)
+            ontology_config, agent_config = await gather_fail_fast([
+                self._import_ontologies(manifest, package, auth_token, plan=plan),
+                self._import_agents(manifest, package, auth_token, plan=plan),
+            ])
             
             # 创建或更新应用
             logger.info(f"[install_application] 开始创建/更新应用记录")
+            if progress:
+                progress.set_stage(InstallStage.SAVING)
             logger.info(f"[install_application] 应用信息: key={manifest.key}, name={manifest.name}, version={manifest.version}")
             logger.info(f"[install_application] 配置统计: releases={len(release_configs)}, ontologies={len(ontology_config)}, agents={len(agent_config)}")
             
@@ -640,16 +586,19 @@ class ApplicationService:
             )
             
             try:
-                if existing_app:
-                    # 更新现有应用
-                    logger.info(f"[install_application] 更新现有应用: key={manifest.key}")
-                    result = await self._application_port.update_application(application)
-                    logger.info(f"[install_application] 应用更新成功: id={result.id}, key={result.key}")
-                else:
-                    # 创建新应用
-                    logger.info(f"[install_application] 创建新应用: key={manifest.key}")
-                    result = await self._application_port.create_application(application)
-                    logger.info(f"[install_application] 应用创建成功: id={result.id}, key={result.key}")
+                # 单条语句创建或覆盖应用，并要求已安装版本仍为版本校验时看到的值，
+                # 避免并发安装同一应用时基于过期的校验结果互相覆盖
+                expected_version = existing_app.version if existing_app else None
+                logger.info(
+                    f"[install_application] 写入应用记录: key={manifest.key}, "
+                    f"期望已安装版本={expected_version}"
+                )
+                result = await self._application_port.upsert_application(
+                    application, expected_version=expected_version
+                )
+                logger.info(
+                    f"[install_application] 应用记录写入成功: id={result.id}, key={result.key}"
+                )
                 
                 logger.info(f"[install_application] 应用安装完成: key={manifest.key}, name={manifest.name}")
                 return result
@@ -666,157 +615,1262 @@ class ApplicationService:
             logger.error(f"[install_application] 应用安装失败 (未预期错误): {e}", exc_info=True)
             raise ValueError(f"应用安装失败: {str(e)}")
         finally:
-            # 清理临时目录
-            if temp_dir and os.path.exists(temp_dir):
-                logger.debug(f"[install_application] 清理临时目录: {temp_dir}")
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    logger.debug(f"[install_application] 临时目录清理完成")
-                except Exception as e:
-                    logger.warning(f"[install_application] 清理临时目录失败: {e}")
+            # 关闭安装包并清理临时目录
+            if package:
+                package.close()
+            if temp_dir:
+                await self._remove_temp_dir(temp_dir)
 
-    async def uninstall_application(
+    async def plan_install(
         self,
-        app_id: int,
-        auth_token: Optional[str] = None,
-    ) -> bool:
+        zip_data: Union[str, BinaryIO, AsyncIterable[bytes]],
+    ) -> UpgradePlan:
         """
-        卸载应用。
+        生成安装计划（预演），不上传制品、不调用外部服务，也不修改应用记录。
 
-        流程：
-        1. 获取应用信息
-        2. 调用 Deploy Installer 删除 Release
-        3. 删除数据库中的应用记录
+        与安装相同地索引安装包、解析 manifest.yaml 并校验版本，然后对比已安装版本，
+        返回需要安装的 Release、需要新建或更新的业务知识网络和智能体。
 
         参数:
-            app_id: 应用主键 ID
+            zip_data: ZIP 格式应用安装包数据，可以是已落盘的安装包路径、文件对象或异步字节块流
 
         返回:
-            bool: 是否卸载成功
+            UpgradePlan: 安装计划
 
         异常:
-            ValueError: 当应用不存在时抛出
+            ValueError: 当安装包格式错误或版本冲突时抛出
         """
-        # 获取应用信息
-        application = await self._application_port.get_application_by_id(app_id)
-        
-        # 删除 Release
-        if self._deploy_installer_port and application.release_config:
-            for release_item in application.release_config:
-                try:
-                    logger.info(f"[uninstall_application] 删除 Release: name={release_item.name}, namespace={release_item.namespace}")
-                    await self._deploy_installer_port.delete_release(
-                        release_name=release_item.name,
-                        namespace=release_item.namespace,
-                        auth_token=auth_token,
-                    )
-                    logger.info(f"[uninstall_application] Release 删除成功: {release_item.name}")
-                except Exception as e:
-                    logger.warning(f"[uninstall_application] 删除 Release 失败 ({release_item.name}): {e}")
-        
-        # 删除数据库记录
-        return await self._application_port.delete_application_by_id(app_id)
+        temp_dir = None
+        package = None
+        try:
+            temp_dir = self._create_temp_dir()
+            zip_path = await self._stage_package(zip_data, temp_dir)
+            manifest, package = await self._load_package(zip_path)
+            existing_app = await self._check_version(manifest)
+            return await self._plan_upgrade(manifest, package, existing_app)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"[plan_install] 生成安装计划失败 (未预期错误): {e}", exc_info=True)
+            raise ValueError(f"生成安装计划失败: {str(e)}")
+        finally:
+            if package:
+                package.close()
+            if temp_dir:
+                await self._remove_temp_dir(temp_dir)
 
-    async def create_application(self, application: Application) -> Application:
+    def _create_temp_dir(self) -> str:
         """
-        创建新应用。
+        在 temp_dir 下创建本次安装使用的临时目录。
+
+        返回:
+            str: 临时目录路径
+        """
+        temp_base = self._settings.temp_dir if self._settings else "/tmp/dip-hub"
+        os.makedirs(temp_base, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=temp_base)
+        logger.info(f"[install_application] 创建临时目录: {temp_dir}")
+        return temp_dir
+
+    async def _remove_temp_dir(self, temp_dir: str) -> None:
+        """
+        删除临时目录，失败时只记录日志。
 
         参数:
-            application: 应用实体
+            temp_dir: 临时目录路径
+        """
+        logger.debug(f"[install_application] 清理临时目录: {temp_dir}")
+        try:
+            await self._run_blocking(shutil.rmtree, temp_dir, True)
+            logger.debug("[install_application] 临时目录清理完成")
+        except Exception as e:
+            logger.warning(f"[install_application] 清理临时目录失败: {e}")
+
+    async def _stage_package(
+        self,
+        zip_data: Union[str, BinaryIO, AsyncIterable[bytes]],
+        temp_dir: str,
+    ) -> str:
+        """
+        将安装包保存到临时目录（已落盘的安装包直接使用，不再复制）。
+
+        参数:
+            zip_data: 已落盘的安装包路径、文件对象或异步字节块流
+            temp_dir: 临时目录
 
         返回:
-            Application: 创建后的应用实体
+            str: 安装包文件路径
 
         异常:
-            ValueError: 当应用 key 已存在时抛出
+            ValueError: 安装包超过大小上限时抛出
         """
-        return await self._application_port.create_application(application)
+        zip_path = os.path.join(temp_dir, "package.zip")
+        if isinstance(zip_data, str):
+            zip_path = zip_data
+            zip_size = await self._run_blocking(os.path.getsize, zip_path)
+            logger.info(
+                f"[install_application] 使用已保存的 ZIP 文件: {zip_path}, 大小: {zip_size} bytes"
+            )
+        elif hasattr(zip_data, "__aiter__"):
+            zip_size, zip_sha256 = await self._save_package_stream(zip_data, zip_path)
+            logger.info(
+                f"[install_application] ZIP 文件已保存: {zip_path}, 大小: {zip_size} bytes, "
+                f"SHA-256: {zip_sha256}"
+            )
+        else:
+            zip_size = await self._run_blocking(self._write_package_file, zip_data, zip_path)
+            logger.info(f"[install_application] ZIP 文件已保存: {zip_path}, 大小: {zip_size} bytes")
+        return zip_path
 
-    async def update_application(self, application: Application) -> Application:
+    async def _load_package(self, zip_path: str) -> Tuple[ManifestInfo, PackageArchive]:
         """
-        更新应用信息。
+        读取安装包的 ZIP 中央目录建立成员索引（不解压），
+        查找并解析 manifest.yaml 和 application.key。
 
         参数:
-            application: 应用实体
+            zip_path: 安装包文件路径
 
         返回:
-            Application: 更新后的应用实体
+            Tuple[ManifestInfo, PackageArchive]: (应用清单, 以 manifest.yaml 所在目录为根的安装包)，
+            调用方负责关闭安装包
 
         异常:
-            ValueError: 当应用不存在时抛出
+            ValueError: 安装包格式错误或缺少必需文件时抛出
         """
-        return await self._application_port.update_application(application)
+        logger.info(f"[install_application] 开始读取 ZIP 文件索引: {zip_path}")
+        try:
+            archive = await self._run_blocking(PackageArchive.load, zip_path)
+            logger.info(f"[install_application] ZIP 文件包含 {len(archive)} 个文件")
+        except zipfile.BadZipFile as e:
+            logger.error(f"[install_application] ZIP 文件格式错误: {e}", exc_info=True)
+            raise ValueError(f"无效的 ZIP 文件格式: {str(e)}")
+        except Exception as e:
+            logger.error(f"[install_application] 读取 ZIP 文件失败: {e}", exc_info=True)
+            raise ValueError(f"读取 ZIP 文件失败: {str(e)}")
 
-    async def delete_application(self, key: str) -> bool:
+        try:
+            return await self._read_package_manifest(archive)
+        except BaseException:
+            archive.close()
+            raise
+
+    async def _read_package_manifest(
+        self, archive: PackageArchive
+    ) -> Tuple[ManifestInfo, PackageArchive]:
         """
-        删除应用。
+        从安装包索引中逐层查找 manifest.yaml，读取同层的 application.key 并解析应用清单。
 
         参数:
-            key: 应用包唯一标识
+            archive: 安装包
 
         返回:
-            bool: 是否删除成功
+            Tuple[ManifestInfo, PackageArchive]: (应用清单, 以 manifest.yaml 所在目录为根的安装包)
 
         异常:
-            ValueError: 当应用不存在时抛出
+            ValueError: 安装包缺少必需文件或文件格式错误时抛出
         """
-        return await self._application_port.delete_application(key)
+        # 应用包结构：manifest.yaml 同层有 application.key、packages/、ontologies/、agents/
+        logger.info("[install_application] 开始逐层查找 manifest.yaml 文件")
+        manifest_path = archive.find(["manifest.yaml", "manifest.yml"])
+        if not manifest_path:
+            logger.error("[install_application] 未找到 manifest.yaml 文件")
+            raise ValueError("安装包缺少 manifest.yaml 文件")
+        logger.info(f"[install_application] 找到 manifest.yaml: {manifest_path}")
+
+        # manifest.yaml 所在目录即为应用包根目录
+        manifest_dir = posixpath.dirname(manifest_path)
+        package = archive.subdir(manifest_dir)
+        manifest_name = posixpath.basename(manifest_path)
+        logger.info(f"[install_application] 应用包根目录: {manifest_dir or '/'}")
+
+        # application.key 与 manifest.yaml 同层
+        if not package.exists("application.key"):
+            logger.error(
+                "[install_application] 未找到 application.key 文件，应在 manifest.yaml 同层目录: "
+                f"{manifest_dir or '/'}"
+            )
+            raise ValueError("安装包缺少 application.key 文件（应与 manifest.yaml 同层）")
+        try:
+            app_key = (await self._run_blocking(package.read_text, "application.key")).strip()
+            if not app_key:
+                raise ValueError("application.key 文件为空")
+            logger.info(f"[install_application] 读取 application.key 成功: {app_key}")
+        except Exception as e:
+            logger.error(f"[install_application] 读取 application.key 失败: {e}", exc_info=True)
+            raise ValueError(f"读取 application.key 失败: {str(e)}")
+
+        # 读取并解析 manifest.yaml
+        logger.info("[install_application] 开始读取 manifest.yaml")
+        try:
+            manifest_content = await self._run_blocking(package.read_text, manifest_name)
+            logger.debug(f"[install_application] manifest.yaml 内容:\n{manifest_content}")
+            manifest_data = await self._run_blocking(yaml.safe_load, manifest_content)
+            if not manifest_data:
+                raise ValueError("manifest.yaml 文件为空或格式错误")
+        except yaml.YAMLError as e:
+            logger.error(f"[install_application] manifest.yaml 解析失败: {e}", exc_info=True)
+            raise ValueError(f"manifest.yaml 解析失败: {str(e)}")
+        except Exception as e:
+            logger.error(f"[install_application] 读取 manifest.yaml 失败: {e}", exc_info=True)
+            raise ValueError(f"读取 manifest.yaml 失败: {str(e)}")
+
+        logger.info("[install_application] manifest.yaml 解析成功，开始解析 manifest 数据")
+        try:
+            manifest = self._parse_manifest(manifest_data, app_key=app_key)
+            logger.info(
+                f"[install_application] manifest 解析成功: key={manifest.key}, "
+                f"name={manifest.name}, version={manifest.version}"
+            )
+        except Exception as e:
+            logger.error(f"[install_application] manifest 解析失败: {e}", exc_info=True)
+            raise
+        return manifest, package
+
+    async def _check_version(self, manifest: ManifestInfo) -> Optional[Application]:
+        """
+        校验新版本号必须大于已安装版本。
 
-    def _find_file_bfs(self, root_dir: str, filenames: list) -> Optional[str]:
+        参数:
+            manifest: 应用清单
+
+        返回:
+            Optional[Application]: 已安装的应用，首次安装时为 None
+
+        异常:
+            ValueError: 版本号冲突时抛出
+        """
+        logger.info(
+            f"[install_application] 开始校验版本，key: {manifest.key}, version: {manifest.version}"
+        )
+        existing_app = await self._application_port.get_application_by_key_optional(manifest.key)
+        if existing_app:
+            logger.info(
+                f"[install_application] 应用已存在: key={manifest.key}, "
+                f"当前版本={existing_app.version}, 新版本={manifest.version}"
+            )
+            if manifest.version == existing_app.version:
+                error_msg = (
+                    f"版本号冲突: 新版本 {manifest.version} "
+                    f"与已安装版本相同。请更新版本号或先卸载现有应用 (key: {manifest.key})"
+                )
+                logger.error(f"[install_application] {error_msg}")
+                raise ValueError(error_msg)
+            if not self._is_version_greater(manifest.version, existing_app.version):
+                error_msg = (
+                    f"版本号冲突: 新版本 {manifest.version} 必须大于已安装版本 "
+                    f"{existing_app.version}。当前已安装版本: {existing_app.version} "
+                    f"(key: {manifest.key})"
+                )
+                logger.error(f"[install_application] {error_msg}")
+                raise ValueError(error_msg)
+            logger.info(
+                f"[install_application] 版本校验通过: 新版本 {manifest.version} > "
+                f"已安装版本 {existing_app.version} (key: {manifest.key})"
+            )
+        else:
+            logger.info(f"[install_application] 应用不存在，将创建新应用: key={manifest.key}")
+        return existing_app
+
+    async def _plan_upgrade(
+        self,
+        manifest: ManifestInfo,
+        package: PackageArchive,
+        existing_app: Optional[Application],
+    ) -> UpgradePlan:
         """
-        从指定目录逐层（广度优先）查找文件。
+        对比新安装包与已安装版本，生成升级计划。
+
+        - Release：按 Chart 文件路径匹配，Chart 文件、命名空间和安装包中的镜像均未变化时
+          不再上传和安装，否则安装（升级）；没有可比对的已安装 Release 时不预先计算镜像摘要，
+          指纹在镜像上传后计算
+        - 业务知识网络、智能体：按配置文件名匹配，定义和业务域均未变化时不做操作，有变化时重新新建
+          （记录新 ID，原资源保留不删除），没有匹配项时新建
+        - 已安装版本中有、新安装包中没有的项记为 REMOVED，只在计划中展示，不删除外部资源
+
+        未记录来源文件和指纹的已安装配置项（早期版本安装）无法匹配，按新建处理。
 
         参数:
-            root_dir: 搜索起始目录
-            filenames: 要查找的文件名列表（按优先级排序）
+            manifest: 应用清单
+            package: 安装包（以应用包根目录为根）
+            existing_app: 已安装的应用，首次安装时为 None
 
         返回:
-            Optional[str]: 找到的文件完整路径，未找到返回 None
+            UpgradePlan: 升级计划
         """
-        from collections import deque
-        
-        logger.info(f"[_find_file_bfs] 开始查找文件: {filenames}, 起始目录: {root_dir}")
-        
-        if not os.path.exists(root_dir):
-            logger.error(f"[_find_file_bfs] 起始目录不存在: {root_dir}")
-            return None
-        
-        if not os.path.isdir(root_dir):
-            logger.error(f"[_find_file_bfs] 起始路径不是目录: {root_dir}")
-            return None
-        
-        queue = deque([root_dir])
-        searched_dirs = []
-        
-        while queue:
-            current_dir = queue.popleft()
-            searched_dirs.append(current_dir)
-            
-            try:
-                entries = os.listdir(current_dir)
-                logger.debug(f"[_find_file_bfs] 搜索目录: {current_dir}, 内容: {entries}")
-            except (PermissionError, OSError) as e:
-                logger.warning(f"[_find_file_bfs] 无法读取目录 {current_dir}: {e}")
-                continue
-            
-            # 在当前目录查找目标文件
-            for filename in filenames:
-                if filename in entries:
-                    file_path = os.path.join(current_dir, filename)
-                    if os.path.isfile(file_path):
-                        logger.info(f"[_find_file_bfs] 找到文件: {file_path}")
-                        return file_path
-                    else:
-                        logger.debug(f"[_find_file_bfs] {filename} 存在但不是文件: {file_path}")
-            
-            # 将子目录加入队列（排序以保证一致性）
-            subdirs = sorted([e for e in entries if os.path.isdir(os.path.join(current_dir, e))])
-            for entry in subdirs:
-                entry_path = os.path.join(current_dir, entry)
-                queue.append(entry_path)
-        
-        logger.warning(f"[_find_file_bfs] 未找到文件 {filenames}，已搜索 {len(searched_dirs)} 个目录")
-        return None
+        plan = UpgradePlan(
+            key=manifest.key,
+            name=manifest.name,
+            version=manifest.version,
+            installed_version=existing_app.version if existing_app else None,
+        )
+
+        image_paths, chart_paths = self._discover_artifacts(package)
+        installed_releases = existing_app.release_config if existing_app else []
+        installed = {item.source: item for item in installed_releases if item.source}
+        comparable = any(installed.get(path) and installed[path].digest for path in chart_paths)
+        for chart_path in chart_paths:
+            previous = installed.pop(chart_path, None)
+            fingerprint = None
+            if comparable:
+                fingerprint = await self._compute_release_fingerprint(
+                    manifest, package, chart_path, image_paths
+                )
+            unchanged = (
+                fingerprint is not None and previous is not None and previous.digest == fingerprint
+            )
+            plan.items.append(PlanItem(
+                kind=PlanItemKind.RELEASE,
+                source=chart_path,
+                action=PlanAction.UNCHANGED if unchanged else PlanAction.INSTALL,
+                digest=fingerprint,
+                target_id=previous.name if previous else None,
+                installed=previous,
+            ))
+        plan.items.extend(
+            PlanItem(kind=PlanItemKind.RELEASE, source=source, action=PlanAction.REMOVED,
+                     digest=item.digest, target_id=item.name, installed=item)
+            for source, item in installed.items()
+        )
+
+        installed_ontologies = existing_app.ontology_config if existing_app else []
+        installed_agents = existing_app.agent_config if existing_app else []
+        for kind, directory, items in (
+            (PlanItemKind.ONTOLOGY, "ontologies", installed_ontologies),
+            (PlanItemKind.AGENT, "agents", installed_agents),
+        ):
+            plan.items.extend(await self._plan_config_items(
+                kind, package, directory, items, manifest.business_domain
+            ))
+
+        counts: Dict[str, int] = {}
+        for item in plan.items:
+            counts[item.action.value] = counts.get(item.action.value, 0) + 1
+        logger.info(
+            f"[install_application] 升级计划: key={plan.key}, "
+            f"{plan.installed_version} -> {plan.version}, {counts}"
+        )
+        return plan
+
+    async def _plan_config_items(
+        self,
+        kind: PlanItemKind,
+        package: PackageArchive,
+        directory: str,
+        installed_items: List[Any],
+        business_domain: Optional[str],
+    ) -> List[PlanItem]:
+        """
+        生成业务知识网络或智能体的计划项。
+
+        参数:
+            kind: 计划项类型
+            package: 安装包（以应用包根目录为根）
+            directory: 配置文件目录名（ontologies 或 agents）
+            installed_items: 已安装的配置项列表
+            business_domain: 导入的目标业务域
+
+        返回:
+            List[PlanItem]: 计划项列表，按文件名排序，REMOVED 项排在最后
+        """
+        files = self._list_config_files(package, directory)
+        installed = {item.source: item for item in installed_items if item.source}
+        items = []
+        for filename in files:
+            file_digest = await self._run_digest(
+                package.sha256, posixpath.join(directory, filename)
+            )
+            digest = self._config_fingerprint(file_digest, business_domain)
+            previous = installed.pop(filename, None)
+            if previous is None:
+                action = PlanAction.CREATE
+            elif previous.digest == digest:
+                action = PlanAction.UNCHANGED
+            else:
+                action = PlanAction.RECREATE
+            items.append(PlanItem(
+                kind=kind, source=filename, action=action, digest=digest,
+                target_id=previous.id if previous else None, installed=previous,
+            ))
+        items.extend(
+            PlanItem(kind=kind, source=source, action=PlanAction.REMOVED,
+                     digest=item.digest, target_id=item.id, installed=item)
+            for source, item in installed.items()
+        )
+        return items
+
+    @staticmethod
+    def _release_fingerprint(
+        chart_digest: str, namespace: Optional[str], image_digests: Sequence[str]
+    ) -> str:
+        """
+        计算 Release 指纹。Release 的 values 来自 Chart 包本身，Release 引用的镜像随安装包一起推送，
+        因此 Chart 文件、命名空间和安装包中的镜像均未变化时 Release 无需重新安装。
+
+        参数:
+            chart_digest: Chart 文件 SHA-256
+            namespace: Release 命名空间
+            image_digests: 安装包中全部镜像文件的 SHA-256
+
+        返回:
+            str: Release 指纹
+        """
+        images = ",".join(sorted(image_digests))
+        payload = f"{chart_digest}:{namespace or ''}:{images}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _compute_release_fingerprint(
+        self,
+        manifest: ManifestInfo,
+        package: PackageArchive,
+        chart_path: str,
+        image_paths: List[str],
+    ) -> str:
+        """
+        计算安装包中 Chart 对应的 Release 指纹（文件摘要按成员缓存，镜像上传后再计算时不重复读取）。
+
+        镜像逐个计算摘要，一次升级预演只占用一个摘要线程，不会占满摘要线程池。
+
+        参数:
+            manifest: 应用清单
+            package: 安装包（以应用包根目录为根）
+            chart_path: Chart 文件相对路径
+            image_paths: 镜像文件相对路径列表
+
+        返回:
+            str: Release 指纹
+        """
+        chart_digest = await self._run_digest(package.sha256, chart_path)
+        image_digests = [await self._run_digest(package.sha256, path) for path in image_paths]
+        return self._release_fingerprint(
+            chart_digest, manifest.release_config.get("namespace"), image_digests
+        )
+
+    @staticmethod
+    def _config_fingerprint(file_digest: str, business_domain: Optional[str]) -> str:
+        """
+        计算业务知识网络或智能体的指纹。配置项导入到清单指定的业务域，
+        因此定义文件与业务域均未变化时无需更新。
+
+        参数:
+            file_digest: 配置文件 SHA-256
+            business_domain: 导入的目标业务域
+
+        返回:
+            str: 配置项指纹
+        """
+        return hashlib.sha256(f"{file_digest}:{business_domain or ''}".encode("utf-8")).hexdigest()
+
+    async def _upload_artifacts(
+        self,
+        manifest: ManifestInfo,
+        package: PackageArchive,
+        auth_token: Optional[str] = None,
+        progress: Optional[InstallProgress] = None,
+        plan: Optional[UpgradePlan] = None,
+    ) -> List[ReleaseConfigItem]:
+        """
+        并发上传镜像和 Chart，并安装 Release。
+
+        镜像与 Chart 直接从安装包中流式读取上传，共用一个并发上限（install_upload_concurrency）；
+        每个 Chart 上传完成且全部镜像上传完成后立即安装对应 Release。
+        任一步骤失败时取消其余未完成的上传和安装。
+        该应用已成功推送过的相同摘要的制品不再上传，
+        跳过上传的 Chart 使用记录的 Chart 信息安装 Release；
+        镜像只有在已推送过相同大小的镜像时才预先计算摘要，否则在上传时顺带计算。
+        上传成功的制品立即记录，安装失败后重试时同样可以跳过。
+        升级计划中未变化的 Release 不上传 Chart 也不重新安装，沿用已安装的 Release 配置。
+
+        参数:
+            manifest: 应用清单
+            package: 安装包（以应用包根目录为根）
+            auth_token: 认证 Token
+            progress: 安装进度（可选），累加待上传和已上传字节数
+            plan: 升级计划（可选），未提供时安装全部 Release
+
+        返回:
+            List[ReleaseConfigItem]: Release 配置列表，顺序与 Chart 文件顺序一致
+
+        异常:
+            ValueError: 文件不存在或上传、安装失败时抛出
+        """
+        image_paths, chart_paths = self._discover_artifacts(package)
+
+        limit = self._settings.install_upload_concurrency if self._settings else 1
+        semaphore = asyncio.Semaphore(max(1, limit))
+        logger.info(
+            f"[install_application] 开始上传制品，镜像数量: {len(image_paths)}, "
+            f"Chart 数量: {len(chart_paths)}, 并发上限: {limit}"
+        )
+
+        pushed = await self._load_pushed_artifacts(manifest.key)
+        pushed_sizes = {(artifact.kind, artifact.size) for artifact in pushed.values()}
+
+        async def _upload_image(image_path: str) -> None:
+            size = package.size(image_path) if package.exists(image_path) else None
+            if (ArtifactKind.IMAGE, size) in pushed_sizes:
+                digest = await self._run_digest(package.sha256, image_path)
+                if (ArtifactKind.IMAGE, digest) in pushed:
+                    logger.info(
+                        f"[install_application] 镜像未变化，跳过上传: {image_path}, SHA-256: "
+                        f"{digest}"
+                    )
+                    return
+            async with semaphore:
+                digest = await self._upload_image_file(package, image_path, auth_token, progress)
+            if digest:
+                await self._record_artifact(ApplicationArtifact(
+                    app_key=manifest.key, kind=ArtifactKind.IMAGE, digest=digest, size=size,
+                    path=image_path,
+                ))
+
+        async def _install_chart(chart_path: str) -> ReleaseConfigItem:
+            item = plan.find(PlanItemKind.RELEASE, chart_path) if plan else None
+            if item is not None and item.action == PlanAction.UNCHANGED:
+                logger.info(
+                    f"[install_application] Release 未变化，跳过安装: {chart_path} -> "
+                    f"{item.target_id}"
+                )
+                return item.installed
+            if not package.exists(chart_path):
+                raise ValueError(f"Chart 文件不存在: {chart_path}")
+            # Chart 体积小，且生成升级计划时已计算过摘要（有缓存）；没有制品记录存储时不需要摘要
+            digest = None
+            if self._artifact_port:
+                digest = await self._run_digest(package.sha256, chart_path)
+            previous = pushed.get((ArtifactKind.CHART, digest)) if digest else None
+            if previous is not None and previous.chart_name:
+                logger.info(
+                    f"[install_application] Chart 未变化，跳过上传: {chart_path}, SHA-256: {digest}"
+                )
+                chart_result = ChartUploadResult(
+                    chart=ChartInfo(name=previous.chart_name, version=previous.chart_version),
+                    values=dict(previous.chart_values or {}),
+                )
+            else:
+                async with semaphore:
+                    chart_result = await self._upload_chart_file(
+                        package, chart_path, auth_token, progress
+                    )
+                if digest:
+                    await self._record_artifact(ApplicationArtifact(
+                        app_key=manifest.key, kind=ArtifactKind.CHART, digest=digest,
+                        size=package.size(chart_path), path=chart_path,
+                        chart_name=chart_result.chart.name,
+                        chart_version=chart_result.chart.version,
+                        chart_values=dict(chart_result.values or {}),
+                    ))
+            # Release 依赖镜像已推送到仓库，等待全部镜像上传完成后再安装
+            await asyncio.shield(images_task)
+            release = await self._install_chart_release(
+                manifest, chart_path, chart_result, auth_token
+            )
+            release.source = chart_path
+            if item is not None:
+                release.digest = item.digest or await self._compute_release_fingerprint(
+                    manifest, package, chart_path, image_paths
+                )
+            return release
+
+        images_task = asyncio.ensure_future(
+            gather_fail_fast(_upload_image(path) for path in image_paths)
+        )
+        results = await gather_fail_fast(
+            [images_task, *(_install_chart(path) for path in chart_paths)]
+        )
+        return results[1:]
+
+    async def _load_pushed_artifacts(
+        self, app_key: str
+    ) -> Dict[Tuple[ArtifactKind, str], ApplicationArtifact]:
+        """
+        获取应用已推送的制品记录，读取失败时按没有记录处理（推送全部制品）。
+
+        参数:
+            app_key: 应用唯一标识
+
+        返回:
+            Dict[Tuple[ArtifactKind, str], ApplicationArtifact]: (制品类型, 摘要) -> 制品记录
+        """
+        dedup_enabled = self._settings is not None and self._settings.install_artifact_dedup_enabled
+        if self._artifact_port is None or not dedup_enabled:
+            return {}
+        try:
+            artifacts = await self._artifact_port.list_artifacts(app_key)
+        except Exception as e:
+            logger.warning(f"[install_application] 读取已推送制品记录失败，将推送全部制品: {e}")
+            return {}
+        logger.info(f"[install_application] 应用 {app_key} 已推送制品记录: {len(artifacts)} 个")
+        return {(artifact.kind, artifact.digest): artifact for artifact in artifacts}
+
+    async def _record_artifact(self, artifact: ApplicationArtifact) -> None:
+        """
+        记录推送成功的制品。记录失败只影响下次安装能否跳过该制品，不中断安装。
+
+        参数:
+            artifact: 制品记录
+        """
+        if self._artifact_port is None:
+            return
+        try:
+            await self._artifact_port.save_artifact(artifact)
+        except Exception as e:
+            logger.warning(f"[install_application] 记录已推送制品失败 ({artifact.path}): {e}")
+
+    async def _upload_image_file(
+        self,
+        package: PackageArchive,
+        image_path: str,
+        auth_token: Optional[str] = None,
+        progress: Optional[InstallProgress] = None,
+    ) -> Optional[str]:
+        """
+        从安装包中流式读取并上传单个镜像文件。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+            image_path: 镜像文件相对路径
+            auth_token: 认证 Token
+            progress: 安装进度（可选）
+
+        返回:
+            Optional[str]: 上传时顺带计算的镜像 SHA-256，上传未从头完整读取文件时为 None
+
+        异常:
+            ValueError: 文件不存在或上传失败时抛出
+        """
+        if not package.exists(image_path):
+            logger.error(f"[install_application] 镜像文件不存在: {image_path}")
+            raise ValueError(f"镜像文件不存在: {image_path}")
+        try:
+            file_size = package.size(image_path)
+            logger.info(
+                f"[install_application] 开始上传镜像: {image_path}, 大小: {file_size} bytes"
+            )
+            if progress:
+                progress.add_total(file_size)
+            with await self._run_blocking(package.open, image_path) as f:
+                await self._deploy_installer_port.upload_image(
+                    _ProgressReader(f, progress) if progress else f, auth_token=auth_token
+                )
+            logger.info(f"[install_application] 镜像上传成功: {image_path}")
+        except asyncio.CancelledError:
+            logger.info(f"[install_application] 镜像上传已取消: {image_path}")
+            raise
+        except Exception as e:
+            logger.error(f"[install_application] 镜像上传失败 ({image_path}): {e}", exc_info=True)
+            raise ValueError(f"镜像上传失败 ({image_path}): {str(e)}")
+        if f.sha256:
+            package.remember_sha256(image_path, f.sha256)
+        return f.sha256
+
+    async def _upload_chart_file(
+        self,
+        package: PackageArchive,
+        chart_path: str,
+        auth_token: Optional[str] = None,
+        progress: Optional[InstallProgress] = None,
+    ) -> ChartUploadResult:
+        """
+        从安装包中流式读取并上传单个 Chart 文件。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+            chart_path: Chart 文件相对路径
+            auth_token: 认证 Token
+            progress: 安装进度（可选）
+
+        返回:
+            ChartUploadResult: Chart 上传结果
+
+        异常:
+            ValueError: 文件不存在或上传失败时抛出
+        """
+        if not package.exists(chart_path):
+            logger.error(f"[install_application] Chart 文件不存在: {chart_path}")
+            raise ValueError(f"Chart 文件不存在: {chart_path}")
+        try:
+            file_size = package.size(chart_path)
+            logger.info(
+                f"[install_application] 开始上传 Chart: {chart_path}, 大小: {file_size} bytes"
+            )
+            if progress:
+                progress.add_total(file_size)
+            with await self._run_blocking(package.open, chart_path) as f:
+                chart_result = await self._deploy_installer_port.upload_chart(
+                    _ProgressReader(f, progress) if progress else f, auth_token=auth_token
+                )
+            logger.info(
+                f"[install_application] Chart 上传成功: {chart_result.chart.name} "
+                f"v{chart_result.chart.version}"
+            )
+            return chart_result
+        except asyncio.CancelledError:
+            logger.info(f"[install_application] Chart 上传已取消: {chart_path}")
+            raise
+        except Exception as e:
+            logger.error(f"[install_application] Chart 处理失败 ({chart_path}): {e}", exc_info=True)
+            raise ValueError(f"Chart 处理失败 ({chart_path}): {str(e)}")
+
+    async def _install_chart_release(
+        self,
+        manifest: ManifestInfo,
+        chart_path: str,
+        chart_result: ChartUploadResult,
+        auth_token: Optional[str] = None,
+    ) -> ReleaseConfigItem:
+        """
+        使用已上传的 Chart 安装 Release。
+
+        参数:
+            manifest: 应用清单
+            chart_path: Chart 文件相对路径（用于错误信息）
+            chart_result: Chart 上传结果
+            auth_token: 认证 Token
+
+        返回:
+            ReleaseConfigItem: Release 配置
+
+        异常:
+            ValueError: 安装失败时抛出
+        """
+        release_name = chart_result.chart.name
+        # namespace 取 manifest.release-config.namespace
+        namespace = manifest.release_config.get("namespace")
+        values = chart_result.values
+        values["namespace"] = namespace
+        logger.info(
+            f"[install_application] 开始安装 Release: name={release_name}, namespace={namespace}, "
+            f"chart={chart_result.chart.name} v{chart_result.chart.version}"
+        )
+        try:
+            await self._deploy_installer_port.install_release(
+                release_name=release_name,
+                namespace=namespace,
+                chart_name=chart_result.chart.name,
+                chart_version=chart_result.chart.version,
+                values=values,
+                auth_token=auth_token,
+            )
+        except asyncio.CancelledError:
+            logger.info(f"[install_application] Release 安装已取消: {release_name}")
+            raise
+        except Exception as e:
+            logger.error(f"[install_application] Chart 处理失败 ({chart_path}): {e}", exc_info=True)
+            raise ValueError(f"Chart 处理失败 ({chart_path}): {str(e)}")
+        logger.info(
+            f"[install_application] Release 安装成功: {release_name}, namespace: {namespace}"
+        )
+        return ReleaseConfigItem(name=release_name, namespace=namespace)
+
+    def _write_package_file(self, zip_data: BinaryIO, zip_path: str) -> int:
+        """
+        将安装包文件对象写入磁盘（阻塞操作，在线程池中执行）。
+
+        参数:
+            zip_data: 安装包文件对象
+            zip_path: 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        """
+        with open(zip_path, "wb") as f:
+            shutil.copyfileobj(zip_data, f)
+        return os.path.getsize(zip_path)
+
+    def _append_chunk(self, f: BinaryIO, digest: Any, chunk: bytes) -> None:
+        """
+        更新摘要并写入一个数据块（阻塞操作，在线程池中执行）。
+
+        参数:
+            f: 目标文件
+            digest: SHA-256 摘要对象
+            chunk: 数据块
+        """
+        digest.update(chunk)
+        f.write(chunk)
+
+    def _read_icon(self, package: PackageArchive) -> Optional[str]:
+        """
+        从 assets/icons/ 目录查找并读取应用图标（阻塞操作，在线程池中执行）。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+
+        返回:
+            Optional[str]: Base64 编码的图标，未找到或读取失败时返回 None
+        """
+        icon_files = package.listdir(
+            "assets/icons", ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')
+        )
+        if not icon_files:
+            logger.info("[install_application] 未找到图标文件，跳过图标读取")
+            return None
+
+        # 使用第一个找到的图标文件
+        icon_path = posixpath.join("assets", "icons", icon_files[0])
+        logger.info(f"[install_application] 自动找到图标: {icon_path}")
+        try:
+            icon_data = package.read(icon_path)
+            logger.info(f"[install_application] 图标读取成功，大小: {len(icon_data)} bytes")
+            return base64.b64encode(icon_data).decode("utf-8")
+        except Exception as e:
+            logger.warning(f"[install_application] 读取图标失败: {e}", exc_info=True)
+            return None
+
+    def _discover_artifacts(self, package: PackageArchive) -> Tuple[List[str], List[str]]:
+        """
+        从安装包索引中查找 packages/images/ 下的镜像文件和 packages/charts/ 下的 Chart 文件。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+
+        返回:
+            Tuple[List[str], List[str]]: (镜像文件相对路径列表, Chart 文件相对路径列表)，
+                按文件名排序
+        """
+        image_files = package.listdir(
+            "packages/images", ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+        )
+        image_paths = [posixpath.join("packages", "images", f) for f in image_files]
+        if image_paths:
+            logger.info(
+                f"[install_application] 自动找到 {len(image_paths)} 个镜像文件: {image_paths}"
+            )
+
+        chart_files = package.listdir("packages/charts", ('.tgz', '.tar.gz'))
+        chart_paths = [posixpath.join("packages", "charts", f) for f in chart_files]
+        if chart_paths:
+            logger.info(
+                f"[install_application] 自动找到 {len(chart_paths)} 个 Chart 文件: {chart_paths}"
+            )
+        return image_paths, chart_paths
+
+    def _list_config_files(self, package: PackageArchive, directory: str) -> List[str]:
+        """
+        列出安装包目录下的 JSON/YAML 配置文件名，按文件名排序。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+            directory: 配置目录
+
+        返回:
+            List[str]: 配置文件名列表，目录不存在时返回空列表
+        """
+        return [f for f in package.listdir(directory) if f.endswith(('.json', '.yaml', '.yml'))]
+
+    def _read_config_file(self, package: PackageArchive, path: str):
+        """
+        读取安装包中的 JSON 或 YAML 配置文件（阻塞操作，在线程池中执行）。
+
+        参数:
+            package: 安装包（以应用包根目录为根）
+            path: 文件相对路径
+
+        返回:
+            解析后的配置内容
+
+        异常:
+            json.JSONDecodeError: JSON 格式错误时抛出
+            yaml.YAMLError: YAML 格式错误时抛出
+        """
+        content = package.read_text(path)
+        if path.endswith('.json'):
+            return json.loads(content)
+        return yaml.safe_load(content)
+
+    async def _import_ontologies(
+        self,
+        manifest: ManifestInfo,
+        package: PackageArchive,
+        auth_token: Optional[str] = None,
+        plan: Optional[UpgradePlan] = None,
+    ) -> List[OntologyConfigItem]:
+        """
+        并发导入业务知识网络。
+
+        并发数受 install_ontology_import_concurrency 限制，任一文件导入失败时取消其余导入。
+        按升级计划处理：未变化的沿用已安装配置，其余（包括有变化的）新建并记录新 ID。
+
+        参数:
+            manifest: 应用清单
+            package: 安装包（以应用包根目录为根）
+            auth_token: 认证 Token
+            plan: 升级计划（可选），未提供时全部新建
+
+        返回:
+            List[OntologyConfigItem]: 业务知识网络配置列表，顺序与文件名顺序一致
+
+        异常:
+            ValueError: 配置文件格式错误或导入失败时抛出
+        """
+        if not self._ontology_manager_port:
+            logger.warning(
+                "[install_application] Ontology Manager 端口未配置，跳过业务知识网络导入"
+            )
+            return []
+        files = self._list_config_files(package, "ontologies")
+        if not files:
+            logger.info(
+                "[install_application] ontologies 目录不存在或没有配置文件，跳过业务知识网络导入"
+            )
+            return []
+        limit = self._settings.install_ontology_import_concurrency if self._settings else 1
+        logger.info(
+            f"[install_application] 开始导入 {len(files)} 个业务知识网络，并发上限: {limit}"
+        )
+
+        async def _import(filename: str) -> Optional[OntologyConfigItem]:
+            logger.info(f"[install_application] 处理业务知识网络文件: {filename}")
+            item = plan.find(PlanItemKind.ONTOLOGY, filename) if plan else None
+            if item is not None and item.action == PlanAction.UNCHANGED:
+                logger.info(
+                    f"[install_application] 业务知识网络未变化，跳过导入: {filename} -> ID: "
+                    f"{item.target_id}"
+                )
+                return item.installed
+            try:
+                onto_config = await self._run_blocking(
+                    self._read_config_file, package, posixpath.join("ontologies", filename)
+                )
+                logger.debug(f"[install_application] 业务知识网络配置内容: {onto_config}")
+                onto_id = await self._ontology_manager_port.create_knowledge_network(
+                    onto_config,
+                    auth_token=auth_token,
+                    business_domain=manifest.business_domain,
+                )
+            except (json.JSONDecodeError, yaml.YAMLError) as e:
+                logger.error(
+                    f"[install_application] 业务知识网络配置解析失败 ({filename}): {e}",
+                    exc_info=True,
+                )
+                raise ValueError(f"业务知识网络配置文件格式错误 ({filename}): {str(e)}")
+            except asyncio.CancelledError:
+                logger.info(f"[install_application] 业务知识网络导入已取消: {filename}")
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[install_application] 导入业务知识网络失败 ({filename}): {e}",
+                    exc_info=True,
+                )
+                raise ValueError(f"导入业务知识网络失败 ({filename}): {str(e)}")
+            if not onto_id:
+                logger.warning(f"[install_application] 业务知识网络创建返回空 ID: {filename}")
+                return None
+            logger.info(f"[install_application] 成功导入业务知识网络: {filename} -> ID: {onto_id}")
+            # 安装时默认为未配置
+            return OntologyConfigItem(
+                id=str(onto_id), is_config=False, source=filename,
+                digest=item.digest if item else None,
+            )
+
+        results = await bounded_map(_import, files, limit)
+        return [item for item in results if item is not None]
+
+    async def _import_agents(
+        self,
+        manifest: ManifestInfo,
+        package: PackageArchive,
+        auth_token: Optional[str] = None,
+        plan: Optional[UpgradePlan] = None,
+    ) -> List[AgentConfigItem]:
+        """
+        并发导入智能体。
+
+        并发数受 install_agent_import_concurrency 限制，任一文件导入失败时取消其余导入。
+        按升级计划处理：未变化的沿用已安装配置，其余（包括有变化的）新建并记录新 ID。
+
+        参数:
+            manifest: 应用清单
+            package: 安装包（以应用包根目录为根）
+            auth_token: 认证 Token
+            plan: 升级计划（可选），未提供时全部新建
+
+        返回:
+            List[AgentConfigItem]: 智能体配置列表，顺序与文件名顺序一致
+
+        异常:
+            ValueError: 配置文件格式错误或导入失败时抛出
+        """
+        if not self._agent_factory_port:
+            logger.warning("[install_application] Agent Factory 端口未配置，跳过智能体导入")
+            return []
+        files = self._list_config_files(package, "agents")
+        if not files:
+            logger.info("[install_application] agents 目录不存在或没有配置文件，跳过智能体导入")
+            return []
+        limit = self._settings.install_agent_import_concurrency if self._settings else 1
+        logger.info(f"[install_application] 开始导入 {len(files)} 个智能体，并发上限: {limit}")
+
+        async def _import(filename: str) -> Optional[AgentConfigItem]:
+            logger.info(f"[install_application] 处理智能体文件: {filename}")
+            item = plan.find(PlanItemKind.AGENT, filename) if plan else None
+            if item is not None and item.action == PlanAction.UNCHANGED:
+                logger.info(
+                    f"[install_application] 智能体未变化，跳过导入: {filename} -> ID: "
+                    f"{item.target_id}"
+                )
+                return item.installed
+            try:
+                agent_config_data = await self._run_blocking(
+                    self._read_config_file, package, posixpath.join("agents", filename)
+                )
+                logger.debug(f"[install_application] 智能体配置内容: {agent_config_data}")
+                agent_result = await self._agent_factory_port.create_agent(
+                    agent_config_data,
+                    auth_token=auth_token,
+                    business_domain=manifest.business_domain,
+                )
+            except (json.JSONDecodeError, yaml.YAMLError) as e:
+                logger.error(
+                    f"[install_application] 智能体配置解析失败 ({filename}): {e}",
+                    exc_info=True,
+                )
+                raise ValueError(f"智能体配置文件格式错误 ({filename}): {str(e)}")
+            except asyncio.CancelledError:
+                logger.info(f"[install_application] 智能体导入已取消: {filename}")
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[install_application] 导入智能体失败 ({filename}): {e}",
+                    exc_info=True,
+                )
+                raise ValueError(f"导入智能体失败 ({filename}): {str(e)}")
+            if not agent_result.id:
+                logger.warning(f"[install_application] 智能体创建返回空 ID: {filename}")
+                return None
+            logger.info(
+                f"[install_application] 成功导入智能体: {filename} -> ID: {agent_result.id}, "
+                f"version: {agent_result.version}"
+            )
+            # 安装时默认为未配置
+            return AgentConfigItem(
+                id=str(agent_result.id), is_config=False, source=filename,
+                digest=item.digest if item else None,
+            )
+
+        results = await bounded_map(_import, files, limit)
+        return [item for item in results if item is not None]
+
+    async def _save_package_stream(
+        self, chunks: AsyncIterable[bytes], zip_path: str
+    ) -> Tuple[int, str]:
+        """
+        将安装包数据块流写入文件，同时计算 SHA-256 并校验大小上限。
+
+        数据块累积到 _WRITE_BUFFER_SIZE 后再交给线程池计算摘要和写盘，避免每个小数据块切换一次线程。
+
+        参数:
+            chunks: 安装包异步字节块流
+            zip_path: 目标文件路径
+
+        返回:
+            Tuple[int, str]: (安装包字节数, SHA-256 十六进制摘要)
+
+        异常:
+            ValueError: 安装包为空或超过大小上限时抛出
+        """
+        max_size = self._settings.install_package_max_size if self._settings else None
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        f = await self._run_upload_io(open, zip_path, "wb")
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise ValueError(f"安装包大小超过上限: {max_size} bytes")
+                buffer += chunk
+                if len(buffer) >= _WRITE_BUFFER_SIZE:
+                    # 摘要计算和写盘都在线程池中执行（hashlib 处理大块数据时释放 GIL）
+                    pending, buffer = buffer, bytearray()
+                    await self._run_upload_io(self._append_chunk, f, digest, pending)
+            if buffer:
+                await self._run_upload_io(self._append_chunk, f, digest, buffer)
+        finally:
+            await self._run_upload_io(f.close)
+        if size == 0:
+            raise ValueError("安装包为空")
+        return size, digest.hexdigest()
+
+    async def save_package(
+        self, chunks: AsyncIterable[bytes], zip_path: str
+    ) -> Tuple[int, str]:
+        """
+        接收安装包数据块流并保存到指定路径，供异步安装任务稍后执行安装。
+
+        保存失败（安装包为空、超过大小上限或数据流中断）时删除已写入的部分文件。
+
+        参数:
+            chunks: 安装包异步字节块流
+            zip_path: 目标文件路径
+
+        返回:
+            Tuple[int, str]: (安装包字节数, SHA-256 十六进制摘要)
+
+        异常:
+            ValueError: 安装包为空或超过大小上限时抛出
+        """
+        await self._run_upload_io(
+            functools.partial(os.makedirs, os.path.dirname(zip_path), exist_ok=True)
+        )
+        try:
+            return await self._save_package_stream(chunks, zip_path)
+        except BaseException:
+            await self.discard_package(zip_path)
+            raise
+
+    async def discard_package(self, zip_path: str) -> None:
+        """
+        删除已保存的安装包，文件不存在时忽略。
+
+        参数:
+            zip_path: 安装包路径
+        """
+        await self._run_blocking(self._remove_file, zip_path)
+
+    async def verify_package(self, zip_path: str, sha256: str) -> None:
+        """
+        校验已保存安装包的 SHA-256（在线程池中分块读取，供安装任务执行前调用）。
+
+        参数:
+            zip_path: 安装包路径
+            sha256: 期望的 SHA-256 十六进制摘要
+
+        异常:
+            ValueError: 摘要不一致时抛出
+        """
+        actual = await self._run_digest(self._file_sha256, zip_path)
+        if actual != sha256.lower():
+            raise ValueError("安装包 SHA-256 不一致，请重新上传")
+
+    def _file_sha256(self, file_path: str) -> str:
+        """
+        计算文件 SHA-256（阻塞操作，在线程池中执行）。
+
+        参数:
+            file_path: 文件路径
+
+        返回:
+            str: SHA-256 十六进制摘要
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_DIGEST_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _remove_file(self, file_path: str) -> None:
+        """
+        删除文件，文件不存在时忽略（阻塞操作，在线程池中执行）。
+
+        参数:
+            file_path: 文件路径
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    async def uninstall_application(
+        self,
+        app_id: int,
+        auth_token: Optional[str] = None,
+    ) -> bool:
+        """
+        卸载应用。
+
+        流程：
+        1. 获取应用信息
+        2. 调用 Deploy Installer 删除 Release
+        3. 删除数据库中的应用记录和制品推送记录
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            bool: 是否卸载成功
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        # 获取应用信息
+        application = await self._application_port.get_application_by_id(app_id)
+
+        # 删除 Release
+        if self._deploy_installer_port and application.release_config:
+            for release_item in application.release_config:
+                try:
+                    logger.info(
+                        f"[uninstall_application] 删除 Release: name={release_item.name}, "
+                        f"namespace={release_item.namespace}"
+                    )
+                    await self._deploy_installer_port.delete_release(
+                        release_name=release_item.name,
+                        namespace=release_item.namespace,
+                        auth_token=auth_token,
+                    )
+                    logger.info(f"[uninstall_application] Release 删除成功: {release_item.name}")
+                except Exception as e:
+                    logger.warning(
+                        f"[uninstall_application] 删除 Release 失败 ({release_item.name}): {e}"
+                    )
+
+        # 删除数据库记录
+        deleted = await self._application_port.delete_application_by_id(app_id)
+        # 删除制品记录，重新安装时推送全部制品
+        if self._artifact_port is not None:
+            try:
+                await self._artifact_port.delete_artifacts(application.key)
+            except Exception as e:
+                logger.warning(f"[uninstall_application] 删除制品记录失败 ({application.key}): {e}")
+        return deleted
+
+    async def create_application(self, application: Application) -> Application:
+        """
+        创建新应用。
+
+        参数:
+            application: 应用实体
+
+        返回:
+            Application: 创建后的应用实体
+
+        异常:
+            ValueError: 当应用 key 已存在时抛出
+        """
+        return await self._application_port.create_application(application)
+
+    async def update_application(self, application: Application) -> Application:
+        """
+        更新应用信息。
+
+        参数:
+            application: 应用实体
+
+        返回:
+            Application: 更新后的应用实体
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        return await self._application_port.update_application(application)
+
+    async def delete_application(self, key: str) -> bool:
+        """
+        删除应用。
+
+        参数:
+            key: 应用包唯一标识
+
+        返回:
+            bool: 是否删除成功
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        return await self._application_port.delete_application(key)
 
     def _parse_manifest(self, data: dict, app_key: str) -> ManifestInfo:
         """
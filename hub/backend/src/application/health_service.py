@@ -50,3 +50,12 @@ class HealthService:
             dict: 服务信息。
         """
         return self._health_port.get_service_info()
+
+    def get_metrics(self) -> dict:
+        """
+        获取运行指标。
+
+        返回:
+            dict: 运行指标。
+        """
+        return self._health_port.get_metrics()
@@ -0,0 +1,486 @@
+"""
+安装任务服务
+
+应用层服务，负责接收安装包并在后台执行安装任务。
+安装请求只需等待安装包落盘即可返回任务 ID，解压、上传和导入在后台执行
+（本进程内执行，或启用安装队列时投递给独立的安装 worker 执行），
+任务状态和阶段进度持久化到任务存储，供任意服务实例查询。
+"""
+import asyncio
+import functools
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.application.application_service import ApplicationService
+from src.domains.install_job import InstallJob, InstallJobStatus, InstallProgress, InstallStage
+from src.infrastructure.concurrency import BlockingExecutor
+from src.infrastructure.config.settings import Settings
+from src.ports.install_job_port import InstallJobPort
+from src.ports.install_queue_port import InstallQueuePort
+
+logger = logging.getLogger(__name__)
+
+# 进程退出或服务关闭导致任务中断时的错误信息
+_INTERRUPTED_ERROR = "安装任务被中断（服务重启或关闭），请重新提交安装"
+
+
+def install_error_code(error: Exception) -> str:
+    """
+    根据安装异常确定任务错误码（与同步安装接口的错误映射一致）。
+
+    参数:
+        error: 安装异常
+
+    返回:
+        str: 错误码
+    """
+    if isinstance(error, ValueError):
+        return "VERSION_CONFLICT" if "版本" in str(error) else "INVALID_PACKAGE"
+    return "INTERNAL_ERROR"
+
+
+class InstallJobService:
+    """
+    安装任务服务。
+
+    同时执行的任务数受 install_job_concurrency 限制，超出的任务保持等待状态排队。
+    执行中的任务按 install_job_heartbeat_interval 持久化进度（同时作为心跳），
+    超过 install_job_stale_timeout 没有心跳的未结束任务视为所在进程已退出，置为失败。
+
+    提供安装队列时，任务投递到队列由安装 worker 执行，本进程不执行安装；
+    被遗弃的任务由 worker 接管重试，因此不再按心跳超时置为失败。
+    """
+
+    def __init__(
+        self,
+        application_service: ApplicationService,
+        install_job_port: InstallJobPort,
+        settings: Settings,
+        install_queue_port: Optional[InstallQueuePort] = None,
+        blocking_executor: Optional[BlockingExecutor] = None,
+    ):
+        """
+        初始化安装任务服务。
+
+        参数:
+            application_service: 应用服务（执行安装流程）
+            install_job_port: 安装任务端口实现（注入的适配器）
+            settings: 应用配置
+            install_queue_port: 安装队列端口实现（可选，提供时任务交给安装 worker 执行）
+            blocking_executor: 执行文件移动、目录扫描等阻塞操作的有界线程池（可选，
+                未提供时使用应用服务的上传线程池）
+        """
+        self._application_service = application_service
+        self._install_job_port = install_job_port
+        self._install_queue_port = install_queue_port
+        self._settings = settings
+        self._blocking_executor = blocking_executor or application_service.upload_executor
+        self._semaphore = asyncio.Semaphore(max(1, settings.install_job_concurrency))
+        self._jobs_dir = settings.install_job_package_dir or os.path.join(
+            settings.temp_dir, "install-jobs"
+        )
+        # 本进程持有的未结束任务：任务 ID -> (任务, 安装进度)，进度为 None 表示仍在排队
+        self._active: Dict[str, Tuple[InstallJob, Optional[InstallProgress]]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    @property
+    def blocking_executor(self) -> BlockingExecutor:
+        """执行阻塞操作的有界线程池。"""
+        return self._blocking_executor
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """在线程池中执行阻塞函数，避免阻塞事件循环。"""
+        return await self._blocking_executor.run(fn, *args)
+
+    def package_path(self, job_id: str) -> str:
+        """
+        获取任务安装包的保存路径。
+
+        参数:
+            job_id: 任务 ID
+
+        返回:
+            str: 安装包路径
+        """
+        return os.path.join(self._jobs_dir, f"{job_id}.zip")
+
+    async def discard_package(self, job_id: str) -> None:
+        """
+        删除任务安装包，文件不存在时忽略。
+
+        参数:
+            job_id: 任务 ID
+        """
+        await self._application_service.discard_package(self.package_path(job_id))
+
+    async def package_exists(self, job_id: str) -> bool:
+        """
+        任务安装包是否存在。
+
+        参数:
+            job_id: 任务 ID
+
+        返回:
+            bool: 安装包存在时返回 True
+        """
+        return await self._run_blocking(os.path.exists, self.package_path(job_id))
+
+    async def submit_install(
+        self,
+        chunks: AsyncIterable[bytes],
+        updated_by: str = "",
+        updated_by_id: str = "",
+        auth_token: Optional[str] = None,
+    ) -> InstallJob:
+        """
+        接收安装包并提交后台安装任务。
+
+        安装包落盘、任务记录创建后立即返回，安装流程在后台执行。
+
+        参数:
+            chunks: 安装包异步字节块流
+            updated_by: 提交者用户显示名称
+            updated_by_id: 提交者用户ID
+            auth_token: 认证 Token（仅在本进程执行安装时用于调用外部服务，不写入任务存储和安装队列；
+                启用安装队列时由安装 worker 使用自身的服务凭据调用外部服务）
+
+        返回:
+            InstallJob: 等待执行的安装任务
+
+        异常:
+            ValueError: 安装包为空或超过大小上限时抛出
+        """
+        job_id = uuid.uuid4().hex
+        zip_path = self.package_path(job_id)
+        package_size, package_sha256 = await self._application_service.save_package(
+            chunks, zip_path
+        )
+        logger.info(
+            f"[install_job] 安装包已接收: job={job_id}, 大小: {package_size} bytes, "
+            f"SHA-256: {package_sha256}"
+        )
+        return await self._submit(
+            job_id, zip_path, package_size, updated_by, updated_by_id, auth_token
+        )
+
+    async def submit_package(
+        self,
+        package_file: str,
+        updated_by: str = "",
+        updated_by_id: str = "",
+        auth_token: Optional[str] = None,
+        package_sha256: Optional[str] = None,
+    ) -> InstallJob:
+        """
+        将已接收完成的安装包文件（例如断点续传上传的文件）移入任务目录并提交后台安装任务。
+
+        提供 package_sha256 时记录到任务中，由安装任务在执行安装前校验，
+        不在提交请求中读取整个安装包。
+
+        参数:
+            package_file: 安装包文件路径，提交后该文件被移走
+            updated_by: 提交者用户显示名称
+            updated_by_id: 提交者用户ID
+            auth_token: 认证 Token（仅在本进程执行安装时用于调用外部服务，不写入任务存储和安装队列；
+                启用安装队列时由安装 worker 使用自身的服务凭据调用外部服务）
+            package_sha256: 提交者声明的安装包 SHA-256（可选）
+
+        返回:
+            InstallJob: 等待执行的安装任务
+        """
+        job_id = uuid.uuid4().hex
+        zip_path = self.package_path(job_id)
+        await self._run_blocking(functools.partial(os.makedirs, self._jobs_dir, exist_ok=True))
+        await self._run_blocking(shutil.move, package_file, zip_path)
+        package_size = await self._run_blocking(os.path.getsize, zip_path)
+        logger.info(f"[install_job] 安装包已接收: job={job_id}, 大小: {package_size} bytes")
+        return await self._submit(
+            job_id, zip_path, package_size, updated_by, updated_by_id, auth_token, package_sha256
+        )
+
+    async def _submit(
+        self,
+        job_id: str,
+        zip_path: str,
+        package_size: int,
+        updated_by: str,
+        updated_by_id: str,
+        auth_token: Optional[str],
+        package_sha256: Optional[str] = None,
+    ) -> InstallJob:
+        """
+        创建任务记录，并投递到安装队列或在本进程后台执行。
+
+        认证 Token 只保存在本进程的后台任务中，投递到安装队列的消息只包含任务 ID。
+        """
+        job = InstallJob(
+            id=job_id,
+            package_size=package_size,
+            package_sha256=package_sha256,
+            updated_by=updated_by,
+            updated_by_id=updated_by_id,
+        )
+        try:
+            job = await self._install_job_port.create_job(job)
+        except BaseException:
+            await self._application_service.discard_package(zip_path)
+            raise
+
+        if self._install_queue_port is not None:
+            try:
+                await self._install_queue_port.enqueue(job.id)
+            except BaseException as e:
+                await self.fail_job(job, "INTERNAL_ERROR", f"投递安装任务失败: {e}")
+                await self._application_service.discard_package(zip_path)
+                raise
+            logger.info(f"[install_job] 安装任务已投递到安装队列: {job.id}")
+            return job
+
+        self._active[job.id] = (job, None)
+        task = asyncio.create_task(self._run(job, zip_path, auth_token))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def get_job(self, job_id: str) -> InstallJob:
+        """
+        获取安装任务。
+
+        未使用安装队列时，未结束的任务超过心跳超时时间没有更新，先将其置为失败再返回。
+
+        参数:
+            job_id: 任务 ID
+
+        返回:
+            InstallJob: 安装任务
+
+        异常:
+            ValueError: 当任务不存在时抛出
+        """
+        job = await self._install_job_port.get_job(job_id)
+        if self._install_queue_port is not None:
+            return job
+        if not job.is_finished() and job.updated_at and job.updated_at < self._stale_before():
+            await self._fail_stale_jobs()
+            job = await self._install_job_port.get_job(job_id)
+        return job
+
+    async def _run(self, job: InstallJob, zip_path: str, auth_token: Optional[str]) -> None:
+        """
+        排队等待执行名额，认领并执行安装任务，结束后删除安装包。
+
+        参数:
+            job: 安装任务
+            zip_path: 安装包路径
+            auth_token: 认证 Token
+        """
+        try:
+            async with self._semaphore:
+                if not await self._install_job_port.claim_job(job.id):
+                    logger.warning(f"[install_job] 任务已被认领或已结束，跳过执行: {job.id}")
+                    return
+                job.status = InstallJobStatus.RUNNING
+                await self.execute(job, zip_path, auth_token)
+        except asyncio.CancelledError:
+            if job.status == InstallJobStatus.PENDING:
+                logger.info(f"[install_job] 排队中的任务已取消: {job.id}")
+                await self._finish(
+                    job, None, error_code="INSTALL_INTERRUPTED", error=_INTERRUPTED_ERROR
+                )
+            raise
+        finally:
+            self._active.pop(job.id, None)
+            await self._application_service.discard_package(zip_path)
+
+    async def execute(
+        self, job: InstallJob, zip_path: str, auth_token: Optional[str] = None
+    ) -> InstallJob:
+        """
+        执行已认领的安装任务并保存结果。
+
+        参数:
+            job: 已置为执行中的安装任务
+            zip_path: 安装包路径
+            auth_token: 认证 Token
+
+        返回:
+            InstallJob: 已结束的安装任务（成功或失败）
+        """
+        progress = InstallProgress()
+        self._active[job.id] = (job, progress)
+        logger.info(f"[install_job] 开始执行安装任务: {job.id}")
+        try:
+            return await self._execute(job, zip_path, auth_token, progress)
+        finally:
+            self._active.pop(job.id, None)
+
+    async def _execute(
+        self,
+        job: InstallJob,
+        zip_path: str,
+        auth_token: Optional[str],
+        progress: InstallProgress,
+    ) -> InstallJob:
+        """执行安装流程并保存结果，任务记录了安装包 SHA-256 时先校验安装包。"""
+        try:
+            if job.package_sha256:
+                await self._application_service.verify_package(zip_path, job.package_sha256)
+            application = await self._application_service.install_application(
+                zip_path,
+                updated_by=job.updated_by,
+                updated_by_id=job.updated_by_id,
+                auth_token=auth_token,
+                progress=progress,
+            )
+        except asyncio.CancelledError:
+            logger.warning(f"[install_job] 安装任务被中断: {job.id}")
+            await self._finish(
+                job, progress, error_code="INSTALL_INTERRUPTED", error=_INTERRUPTED_ERROR
+            )
+            raise
+        except Exception as e:
+            logger.error(f"[install_job] 安装任务失败: {job.id}, {e}")
+            await self._finish(job, progress, error_code=install_error_code(e), error=str(e))
+            return job
+        job.application_id = application.id
+        job.application_key = application.key
+        progress.set_stage(InstallStage.DONE)
+        await self._finish(job, progress)
+        logger.info(f"[install_job] 安装任务完成: {job.id}, 应用: {application.key}")
+        return job
+
+    async def fail_job(self, job: InstallJob, error_code: str, error: str) -> None:
+        """
+        将未执行的任务置为失败。
+
+        参数:
+            job: 安装任务
+            error_code: 错误码
+            error: 失败原因
+        """
+        await self._finish(job, None, error_code=error_code, error=error)
+
+    async def _finish(
+        self,
+        job: InstallJob,
+        progress: Optional[InstallProgress],
+        error_code: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        保存任务的最终状态。保存失败时只记录日志，任务将在心跳超时后被置为失败。
+
+        参数:
+            job: 安装任务
+            progress: 安装进度（任务未开始执行时为 None）
+            error_code: 失败时的错误码，为 None 表示成功
+            error: 失败原因
+        """
+        if progress is not None:
+            self._apply_progress(job, progress)
+        job.status = InstallJobStatus.FAILED if error_code else InstallJobStatus.SUCCEEDED
+        job.error_code = error_code
+        job.error = error
+        job.finished_at = datetime.now()
+        try:
+            await self._install_job_port.finish_job(job)
+        except Exception as e:
+            logger.error(f"[install_job] 保存任务结果失败: {job.id}, {e}", exc_info=True)
+
+    @staticmethod
+    def _apply_progress(job: InstallJob, progress: InstallProgress) -> None:
+        """将安装进度同步到任务。"""
+        job.stage = progress.stage
+        job.bytes_total = progress.bytes_total
+        job.bytes_uploaded = progress.bytes_uploaded
+        if progress.application_key:
+            job.application_key = progress.application_key
+
+    def _stale_before(self) -> datetime:
+        """获取心跳超时判定时间点。"""
+        return datetime.now() - timedelta(seconds=self._settings.install_job_stale_timeout)
+
+    async def _fail_stale_jobs(self) -> int:
+        """将超过心跳超时时间的未结束任务置为失败。"""
+        count = await self._install_job_port.fail_stale_jobs(
+            self._stale_before(), _INTERRUPTED_ERROR
+        )
+        if count:
+            logger.warning(f"[install_job] {count} 个安装任务心跳超时，已置为失败")
+        return count
+
+    async def _heartbeat(self) -> None:
+        """持久化本进程执行中任务的进度，并刷新排队任务的心跳。"""
+        pending_ids: List[str] = []
+        for job, progress in list(self._active.values()):
+            if progress is None:
+                pending_ids.append(job.id)
+                continue
+            self._apply_progress(job, progress)
+            await self._install_job_port.update_progress(job)
+        await self._install_job_port.touch_jobs(pending_ids)
+
+    async def _heartbeat_loop(self) -> None:
+        """后台心跳循环。"""
+        while True:
+            await asyncio.sleep(self._settings.install_job_heartbeat_interval)
+            try:
+                await self._heartbeat()
+            except Exception as e:
+                logger.warning(f"[install_job] 持久化安装任务进度失败: {e}")
+
+    async def _remove_orphan_packages(self) -> None:
+        """删除已结束或不存在的任务遗留的安装包（例如进程退出前未清理的文件）。"""
+        try:
+            filenames = await self._run_blocking(os.listdir, self._jobs_dir)
+        except FileNotFoundError:
+            return
+        for filename in filenames:
+            job_id, ext = os.path.splitext(filename)
+            if ext != ".zip" or job_id in self._active:
+                continue
+            try:
+                job = await self._install_job_port.get_job(job_id)
+            except ValueError:
+                job = None
+            if job is None or job.is_finished():
+                logger.info(f"[install_job] 删除遗留安装包: {filename}")
+                await self._application_service.discard_package(
+                    os.path.join(self._jobs_dir, filename)
+                )
+
+    async def start(self) -> None:
+        """
+        启动安装任务服务。
+
+        将心跳超时的未结束任务置为失败（未使用安装队列时）、清理遗留安装包，并启动后台心跳循环。
+        """
+        try:
+            if self._install_queue_port is None:
+                await self._fail_stale_jobs()
+            await self._remove_orphan_packages()
+        except Exception as e:
+            logger.warning(f"[install_job] 恢复安装任务状态失败: {e}")
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def close(self) -> None:
+        """
+        关闭安装任务服务。
+
+        停止心跳循环，取消本进程未结束的任务并将其置为中断失败。
+        """
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
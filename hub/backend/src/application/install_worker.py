@@ -0,0 +1,252 @@
+"""
+安装 worker
+
+应用层服务，从安装队列读取安装任务并执行，供独立的 worker 进程（dip-hub worker）使用。
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from src.application.install_job_service import InstallJobService
+from src.domains.install_job import InstallJobStatus, QueuedInstall
+from src.infrastructure.config.settings import Settings
+from src.ports.install_job_port import InstallJobPort
+from src.ports.install_queue_port import InstallQueuePort
+from src.ports.oauth2_port import OAuth2Port
+
+logger = logging.getLogger(__name__)
+
+# 读取队列时的最长阻塞时间（毫秒），决定收到停止信号后的响应延迟
+_CONSUME_BLOCK_MS = 1000
+
+# 服务 Token 提前刷新的时间（秒），避免任务执行过程中 Token 过期
+_SERVICE_TOKEN_REFRESH_MARGIN = 300
+
+
+class InstallWorker:
+    """
+    安装 worker。
+
+    同时执行的任务数不超过 install_job_concurrency，只在有空闲名额时读取队列，
+    未读取的任务留在队列中由其他 worker 处理。执行中的任务按 install_job_heartbeat_interval
+    刷新队列心跳；worker 退出后，超过 install_queue_claim_idle 没有心跳的任务由其他 worker
+    接管重试，累计投递超过 install_queue_max_deliveries 次的任务置为失败。
+
+    队列消息不含提交者的认证 Token：worker 以本服务的客户端凭据申请服务 Token 调用外部服务，
+    每次执行任务前检查有效期，接管重试的任务也不会使用已过期的 Token。
+    """
+
+    def __init__(
+        self,
+        install_job_service: InstallJobService,
+        install_job_port: InstallJobPort,
+        install_queue_port: InstallQueuePort,
+        settings: Settings,
+        consumer: Optional[str] = None,
+        oauth2_port: Optional[OAuth2Port] = None,
+    ):
+        """
+        初始化安装 worker。
+
+        参数:
+            install_job_service: 安装任务服务（执行安装并保存结果）
+            install_job_port: 安装任务端口实现（注入的适配器）
+            install_queue_port: 安装队列端口实现（注入的适配器）
+            settings: 应用配置
+            consumer: 消费者名称，默认使用主机名和进程号
+            oauth2_port: OAuth2 端口实现（可选，用于申请服务 Token；
+                为 None 时调用外部服务不带 Token）
+        """
+        self._install_job_service = install_job_service
+        self._install_job_port = install_job_port
+        self._install_queue_port = install_queue_port
+        self._oauth2_port = oauth2_port
+        self._settings = settings
+        # 服务 Token 缓存：(Token, 需要刷新的时间点)
+        self._service_token: Optional[Tuple[str, float]] = None
+        self._consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._concurrency = max(1, settings.install_job_concurrency)
+        # 执行中的任务：队列消息 ID -> 执行任务
+        self._running: Dict[str, asyncio.Task] = {}
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        持续读取并执行安装任务，直到收到停止信号。
+
+        停止后不再读取新任务，等待执行中的任务完成后返回。
+
+        参数:
+            stop: 停止信号
+        """
+        logger.info(
+            f"[install_worker] 安装 worker 已启动: {self._consumer}, 并发上限: {self._concurrency}"
+        )
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        reclaim_interval = self._settings.install_queue_claim_idle / 2
+        next_reclaim = 0.0
+        backoff = 1.0
+        try:
+            while not stop.is_set():
+                free = self._concurrency - len(self._running)
+                if free <= 0:
+                    await self._wait_any(stop)
+                    continue
+                try:
+                    messages = []
+                    if time.monotonic() >= next_reclaim:
+                        messages = await self._install_queue_port.claim_abandoned(
+                            self._consumer, self._settings.install_queue_claim_idle, free
+                        )
+                        next_reclaim = time.monotonic() + reclaim_interval
+                    if not messages:
+                        messages = await self._install_queue_port.consume(
+                            self._consumer, free, _CONSUME_BLOCK_MS
+                        )
+                    backoff = 1.0
+                except Exception as e:
+                    logger.warning(
+                        f"[install_worker] 读取安装队列失败，{backoff:.0f} 秒后重试: {e}"
+                    )
+                    try:
+                        await asyncio.wait_for(stop.wait(), timeout=backoff)
+                    except asyncio.TimeoutError:
+                        pass
+                    backoff = min(backoff * 2, 30.0)
+                    continue
+                for message in messages:
+                    self._running[message.entry_id] = asyncio.create_task(self._process(message))
+
+            if self._running:
+                logger.info(f"[install_worker] 等待 {len(self._running)} 个执行中的安装任务完成")
+                await asyncio.gather(*self._running.values(), return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        logger.info(f"[install_worker] 安装 worker 已停止: {self._consumer}")
+
+    async def _wait_any(self, stop: asyncio.Event) -> None:
+        """等待任一执行中的任务结束或收到停止信号。"""
+        stop_waiter = asyncio.create_task(stop.wait())
+        try:
+            await asyncio.wait(
+                [stop_waiter, *self._running.values()], return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stop_waiter.cancel()
+
+    async def _process(self, message: QueuedInstall) -> None:
+        """
+        处理一条安装任务消息。处理出错时不确认消息，由 worker 稍后接管重试。
+
+        参数:
+            message: 安装任务消息
+        """
+        try:
+            await self._handle(message)
+        except Exception as e:
+            logger.error(
+                f"[install_worker] 处理安装任务失败，稍后重试: job={message.job_id}, {e}",
+                exc_info=True,
+            )
+        finally:
+            self._running.pop(message.entry_id, None)
+
+    async def _handle(self, message: QueuedInstall) -> None:
+        """
+        认领并执行安装任务，结束后确认消息并删除安装包。
+
+        参数:
+            message: 安装任务消息
+        """
+        try:
+            job = await self._install_job_port.get_job(message.job_id)
+        except ValueError:
+            logger.warning(f"[install_worker] 安装任务不存在，丢弃消息: {message.job_id}")
+            await self._install_queue_port.ack(message.entry_id)
+            return
+        if job.is_finished():
+            await self._complete(message)
+            return
+
+        max_deliveries = self._settings.install_queue_max_deliveries
+        if message.deliveries > max_deliveries:
+            logger.error(f"[install_worker] 安装任务投递次数超过上限，置为失败: {job.id}")
+            await self._install_job_service.fail_job(
+                job,
+                "INSTALL_RETRY_EXHAUSTED",
+                f"安装任务执行中断 {max_deliveries} 次，不再重试，请重新提交安装",
+            )
+            await self._complete(message)
+            return
+
+        # 先申请服务 Token，申请失败时任务保持未认领，消息稍后重试
+        auth_token = await self._get_service_token()
+
+        # 重新投递的任务可能仍处于执行中状态（原 worker 已退出），心跳超时后才能重新认领
+        stale_before = None
+        if message.deliveries > 1:
+            claim_idle = self._settings.install_queue_claim_idle
+            stale_before = datetime.now() - timedelta(seconds=claim_idle)
+        if not await self._install_job_port.claim_job(job.id, stale_before=stale_before):
+            logger.info(f"[install_worker] 安装任务仍由其他 worker 执行，跳过: {job.id}")
+            return
+        job.status = InstallJobStatus.RUNNING
+
+        zip_path = self._install_job_service.package_path(job.id)
+        if not await self._install_job_service.package_exists(job.id):
+            logger.error(f"[install_worker] 安装包不存在: {zip_path}")
+            await self._install_job_service.fail_job(
+                job,
+                "PACKAGE_NOT_FOUND",
+                "安装包不存在，请确认安装包目录为 API 服务与安装 worker 共享的存储",
+            )
+            await self._install_queue_port.ack(message.entry_id)
+            return
+
+        if message.deliveries > 1:
+            logger.warning(
+                f"[install_worker] 重试被遗弃的安装任务: {job.id}, 第 {message.deliveries} 次投递"
+            )
+        await self._install_job_service.execute(job, zip_path, auth_token)
+        await self._complete(message)
+
+    async def _get_service_token(self) -> Optional[str]:
+        """
+        获取调用外部服务使用的服务 Token，缓存至过期前 _SERVICE_TOKEN_REFRESH_MARGIN 秒。
+
+        返回:
+            Optional[str]: 服务 Token，未提供 OAuth2 端口时返回 None
+
+        异常:
+            Exception: 申请 Token 失败时抛出（任务消息不确认，稍后重试）
+        """
+        if self._oauth2_port is None:
+            return None
+        if self._service_token is not None and time.monotonic() < self._service_token[1]:
+            return self._service_token[0]
+        response = await self._oauth2_port.client_credentials_token(
+            self._settings.install_worker_token_scope
+        )
+        lifetime = max(0, (response.expires_in or 0) - _SERVICE_TOKEN_REFRESH_MARGIN)
+        self._service_token = (response.access_token, time.monotonic() + lifetime)
+        return response.access_token
+
+    async def _complete(self, message: QueuedInstall) -> None:
+        """确认消息并删除任务安装包。"""
+        await self._install_queue_port.ack(message.entry_id)
+        await self._install_job_service.discard_package(message.job_id)
+
+    async def _heartbeat_loop(self) -> None:
+        """刷新执行中任务的队列心跳。"""
+        while True:
+            await asyncio.sleep(self._settings.install_job_heartbeat_interval)
+            if not self._running:
+                continue
+            try:
+                await self._install_queue_port.touch(self._consumer, list(self._running))
+            except Exception as e:
+                logger.warning(f"[install_worker] 刷新安装队列心跳失败: {e}")
@@ -7,6 +7,7 @@ import logging
 from typing import Optional
 
 from src.domains.session import SessionInfo
+from src.infrastructure.cache import TTLCache, token_cache_key
 from src.ports.session_port import SessionPort
 from src.ports.oauth2_port import OAuth2Port
 from src.ports.deploy_manager_port import DeployManagerPort
@@ -29,6 +30,7 @@ class LogoutService:
         session_port: SessionPort,
         oauth2_port: OAuth2Port,
         deploy_manager_port: DeployManagerPort,
+        introspection_cache: Optional[TTLCache] = None,
     ):
         """
         初始化登出服务。
@@ -37,10 +39,12 @@ class LogoutService:
             session_port: Session 端口
             oauth2_port: OAuth2 端口
             deploy_manager_port: 部署管理端口
+            introspection_cache: Token 内省缓存，登出时从中移除该 Session 的 Access Token
         """
         self._session_port = session_port
         self._oauth2_port = oauth2_port
         self._deploy_manager_port = deploy_manager_port
+        self._introspection_cache = introspection_cache
 
     async def get_session(self, session_id: str) -> Optional[SessionInfo]:
         """
@@ -60,10 +64,15 @@ class LogoutService:
         """
         撤销 Token 并删除 Session。
 
+        同时从本进程的内省缓存中移除 Access Token，使其不再凭缓存通过认证。
+
         参数:
             session_info: Session 信息
             session_id: Session ID
         """
+        if self._introspection_cache is not None and session_info.token:
+            self._introspection_cache.pop(token_cache_key(session_info.token))
+
         try:
             # 撤销 Refresh Token
             if session_info.refresh_token:
@@ -0,0 +1,484 @@
+"""
+安装包上传服务
+
+应用层服务，负责安装包的断点续传上传。
+客户端先创建上传会话，再按顺序上传带校验和的分片，中断后查询已接收字节数从断点继续，
+全部接收后提交到安装任务流程。
+"""
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterable, BinaryIO, Callable, Dict, List, Optional
+
+from src.application.install_job_service import InstallJobService
+from src.domains.install_job import InstallJob
+from src.domains.upload import (
+    UploadBusyError,
+    UploadOffsetMismatchError,
+    UploadSession,
+    UploadSessionNotFoundError,
+)
+from src.infrastructure.concurrency import BlockingExecutor
+from src.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# 会话 ID 格式（uuid4 十六进制），同时防止路径穿越
+_SESSION_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# 分片数据块累积到该字节数再交给线程池写盘，减少线程切换次数
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class PackageUploadService:
+    """
+    安装包断点续传上传服务。
+
+    每个会话在 temp_dir/uploads 下对应两个文件：
+    {id}.part 保存已接收的数据（文件大小即已接收字节数），
+    {id}.json 保存会话元数据。分片逐块追加写入磁盘，不在内存中整体缓存；
+    分片数据不完整或校验和不一致时截断回分片起始位置。
+    写入分片、完成上传和取消上传时对数据文件加排他锁，同一会话同时只允许一个请求操作（跨进程有效）。
+    完成上传时在持有锁的情况下将数据文件原子地重命名为 {id}.claimed，
+    并发的完成、取消和过期清理请求随即找不到数据文件，同一会话只会提交一次。
+    """
+
+    def __init__(
+        self,
+        install_job_service: InstallJobService,
+        settings: Settings,
+        blocking_executor: Optional[BlockingExecutor] = None,
+    ):
+        """
+        初始化上传服务。
+
+        参数:
+            install_job_service: 安装任务服务（上传完成后提交安装）
+            settings: 应用配置
+            blocking_executor: 执行文件读写的有界线程池（可选，未提供时使用安装任务服务的线程池）
+        """
+        self._install_job_service = install_job_service
+        self._settings = settings
+        self._blocking_executor = blocking_executor or install_job_service.blocking_executor
+        self._dir = os.path.join(settings.temp_dir, "uploads")
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """在线程池中执行阻塞函数，避免阻塞事件循环。"""
+        return await self._blocking_executor.run(fn, *args)
+
+    def _part_path(self, upload_id: str) -> str:
+        return os.path.join(self._dir, f"{upload_id}.part")
+
+    def _meta_path(self, upload_id: str) -> str:
+        return os.path.join(self._dir, f"{upload_id}.json")
+
+    def _claimed_path(self, upload_id: str) -> str:
+        return os.path.join(self._dir, f"{upload_id}.claimed")
+
+    async def create_session(
+        self,
+        size: int,
+        created_by_id: str = "",
+        sha256: Optional[str] = None,
+    ) -> UploadSession:
+        """
+        创建上传会话。
+
+        参数:
+            size: 安装包总字节数
+            created_by_id: 创建者用户ID
+            sha256: 安装包 SHA-256（可选，安装任务执行前校验）
+
+        返回:
+            UploadSession: 上传会话
+
+        异常:
+            ValueError: 安装包大小无效或超过上限时抛出
+        """
+        if size <= 0:
+            raise ValueError("安装包大小必须大于 0")
+        max_size = self._settings.install_package_max_size
+        if size > max_size:
+            raise ValueError(f"安装包大小超过上限: {max_size} bytes")
+        upload_id = uuid.uuid4().hex
+        meta = {
+            "size": size,
+            "sha256": sha256.lower() if sha256 else None,
+            "created_by_id": created_by_id,
+            "created_at": datetime.now().isoformat(),
+        }
+        await self._run_blocking(self._create_files, upload_id, meta)
+        logger.info(f"[upload] 创建上传会话: {upload_id}, 大小: {size} bytes")
+        return await self.get_session(upload_id, created_by_id)
+
+    async def get_session(self, upload_id: str, created_by_id: str = "") -> UploadSession:
+        """
+        获取上传会话及已接收字节数。
+
+        参数:
+            upload_id: 会话 ID
+            created_by_id: 当前用户ID，只能访问自己创建的会话
+
+        返回:
+            UploadSession: 上传会话
+
+        异常:
+            UploadSessionNotFoundError: 会话不存在、已过期或不属于当前用户时抛出
+        """
+        session = None
+        if _SESSION_ID_PATTERN.match(upload_id):
+            session = await self._run_blocking(self._load_session, upload_id)
+        if session is None or session.created_by_id != created_by_id:
+            raise UploadSessionNotFoundError(f"上传会话不存在或已过期: {upload_id}")
+        if session.expires_at <= datetime.now():
+            await self._run_blocking(self._remove_session_files, upload_id)
+            raise UploadSessionNotFoundError(f"上传会话不存在或已过期: {upload_id}")
+        return session
+
+    async def write_chunk(
+        self,
+        upload_id: str,
+        start: int,
+        length: int,
+        checksum: str,
+        chunks: AsyncIterable[bytes],
+        created_by_id: str = "",
+    ) -> UploadSession:
+        """
+        写入一个分片。
+
+        参数:
+            upload_id: 会话 ID
+            start: 分片起始位置，必须等于已接收字节数
+            length: 分片字节数
+            checksum: 分片 SHA-256 十六进制摘要
+            chunks: 分片数据的异步字节块流
+            created_by_id: 当前用户ID
+
+        返回:
+            UploadSession: 写入后的上传会话
+
+        异常:
+            UploadSessionNotFoundError: 会话不存在或已过期时抛出
+            UploadOffsetMismatchError: 起始位置与已接收字节数不一致时抛出
+            UploadBusyError: 会话正在被其他请求写入时抛出
+            ValueError: 分片范围无效、数据不完整或校验和不一致时抛出
+        """
+        session = await self.get_session(upload_id, created_by_id)
+        if start != session.offset:
+            raise UploadOffsetMismatchError(
+                f"分片起始位置 {start} 与已接收字节数 {session.offset} 不一致", session.offset
+            )
+        if length <= 0 or start + length > session.size:
+            raise ValueError(f"分片范围无效: {start}+{length}，安装包大小 {session.size} bytes")
+        max_chunk = self._settings.install_upload_chunk_max_size
+        if length > max_chunk:
+            raise ValueError(f"分片大小超过上限: {max_chunk} bytes")
+
+        f = await self._run_blocking(self._open_at, upload_id, start)
+        digest = hashlib.sha256()
+        written = 0
+        buffer = bytearray()
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                written += len(chunk)
+                if written > length:
+                    raise ValueError(f"分片数据超过声明的长度: {length} bytes")
+                buffer += chunk
+                if len(buffer) >= _WRITE_BUFFER_SIZE:
+                    pending, buffer = buffer, bytearray()
+                    await self._run_blocking(self._append_chunk, f, digest, pending)
+            if buffer:
+                await self._run_blocking(self._append_chunk, f, digest, buffer)
+            if written != length:
+                raise ValueError(f"分片数据不完整: 已接收 {written}/{length} bytes")
+            if digest.hexdigest() != checksum.lower():
+                raise ValueError("分片校验和不一致")
+            await self._run_blocking(self._sync, f)
+        except BaseException:
+            # 丢弃未完整写入或校验失败的分片，客户端从 start 重新上传
+            await self._run_blocking(self._truncate, f, start)
+            raise
+        finally:
+            await self._run_blocking(f.close)
+        session.offset = start + length
+        ttl = self._settings.install_upload_session_ttl
+        session.expires_at = datetime.now() + timedelta(seconds=ttl)
+        return session
+
+    async def complete(
+        self,
+        upload_id: str,
+        updated_by: str = "",
+        updated_by_id: str = "",
+        auth_token: Optional[str] = None,
+    ) -> InstallJob:
+        """
+        完成上传并提交安装任务。
+
+        创建会话时提供的 SHA-256 记录到安装任务中，由任务在执行安装前校验，
+        不在本请求中读取整个安装包。提交失败时恢复数据文件，客户端可以重试。
+
+        参数:
+            upload_id: 会话 ID
+            updated_by: 提交者用户显示名称
+            updated_by_id: 提交者用户ID
+            auth_token: 认证 Token
+
+        返回:
+            InstallJob: 等待执行的安装任务
+
+        异常:
+            UploadSessionNotFoundError: 会话不存在、已过期或已被其他请求完成或取消时抛出
+            UploadOffsetMismatchError: 安装包尚未全部接收时抛出
+            UploadBusyError: 会话正在被其他请求写入或完成时抛出
+        """
+        session = await self.get_session(upload_id, updated_by_id)
+        if not session.is_complete():
+            raise UploadOffsetMismatchError(
+                f"安装包尚未上传完成: 已接收 {session.offset}/{session.size} bytes", session.offset
+            )
+        claimed = await self._run_blocking(self._claim, upload_id, session.size)
+        try:
+            job = await self._install_job_service.submit_package(
+                claimed,
+                updated_by=updated_by,
+                updated_by_id=updated_by_id,
+                auth_token=auth_token,
+                package_sha256=session.sha256,
+            )
+        except BaseException:
+            await self._run_blocking(self._unclaim, upload_id)
+            raise
+        await self._run_blocking(self._remove_session_files, upload_id)
+        logger.info(f"[upload] 上传会话已完成: {upload_id} -> 安装任务 {job.id}")
+        return job
+
+    async def abort(self, upload_id: str, created_by_id: str = "") -> None:
+        """
+        取消上传会话并删除已接收的数据。
+
+        参数:
+            upload_id: 会话 ID
+            created_by_id: 当前用户ID
+
+        异常:
+            UploadSessionNotFoundError: 会话不存在、已过期或已被其他请求完成时抛出
+            UploadBusyError: 会话正在被其他请求写入或完成时抛出
+        """
+        await self.get_session(upload_id, created_by_id)
+        await self._run_blocking(self._remove_locked, upload_id)
+        logger.info(f"[upload] 上传会话已取消: {upload_id}")
+
+    async def purge_expired(self) -> int:
+        """
+        删除过期的上传会话。
+
+        返回:
+            int: 删除的会话数
+        """
+        count = await self._run_blocking(self._purge_expired)
+        if count:
+            logger.info(f"[upload] 已删除 {count} 个过期上传会话")
+        return count
+
+    async def _cleanup_loop(self) -> None:
+        """定期删除过期的上传会话。"""
+        while True:
+            try:
+                await self.purge_expired()
+            except Exception as e:
+                logger.warning(f"[upload] 清理过期上传会话失败: {e}")
+            await asyncio.sleep(self._settings.install_upload_cleanup_interval)
+
+    def start(self) -> None:
+        """启动过期会话清理任务（重复调用无副作用）。"""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def close(self) -> None:
+        """停止过期会话清理任务。"""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            await asyncio.gather(self._cleanup_task, return_exceptions=True)
+            self._cleanup_task = None
+
+    # ============ 阻塞文件操作（在线程池中执行） ============
+
+    def _create_files(self, upload_id: str, meta: Dict[str, Any]) -> None:
+        """创建会话数据文件和元数据文件。"""
+        os.makedirs(self._dir, exist_ok=True)
+        with open(self._part_path(upload_id), "xb"):
+            pass
+        with open(self._meta_path(upload_id), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def _load_session(self, upload_id: str) -> Optional[UploadSession]:
+        """读取会话元数据和已接收字节数，会话不存在时返回 None。"""
+        try:
+            with open(self._meta_path(upload_id), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            stat = os.stat(self._part_path(upload_id))
+        except (FileNotFoundError, ValueError):
+            return None
+        ttl = timedelta(seconds=self._settings.install_upload_session_ttl)
+        return UploadSession(
+            id=upload_id,
+            size=meta["size"],
+            offset=stat.st_size,
+            sha256=meta.get("sha256"),
+            created_by_id=meta.get("created_by_id", ""),
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            expires_at=datetime.fromtimestamp(stat.st_mtime) + ttl,
+        )
+
+    def _open_locked(self, upload_id: str, mode: str) -> BinaryIO:
+        """
+        打开会话数据文件并加排他锁（不等待）。
+
+        异常:
+            UploadSessionNotFoundError: 数据文件不存在时抛出
+            UploadBusyError: 其他请求正持有锁时抛出
+        """
+        try:
+            f = open(self._part_path(upload_id), mode)
+        except FileNotFoundError:
+            raise UploadSessionNotFoundError(f"上传会话不存在或已过期: {upload_id}")
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            raise UploadBusyError(f"上传会话正在被其他请求处理: {upload_id}")
+        return f
+
+    def _claim(self, upload_id: str, size: int) -> str:
+        """
+        持有数据文件锁时校验大小，并将数据文件原子地重命名为已认领文件。
+
+        加锁前数据文件可能已被其他请求重命名或删除（锁住的是旧文件），此时重命名失败，按会话不存在处理。
+
+        返回:
+            str: 已认领文件路径
+
+        异常:
+            UploadSessionNotFoundError: 数据文件不存在（已被完成、取消或清理）时抛出
+            UploadBusyError: 其他请求正持有锁时抛出
+            UploadOffsetMismatchError: 数据文件大小与安装包大小不一致时抛出
+        """
+        claimed = self._claimed_path(upload_id)
+        with self._open_locked(upload_id, "rb") as f:
+            received = os.fstat(f.fileno()).st_size
+            if received != size:
+                raise UploadOffsetMismatchError(
+                    f"安装包尚未上传完成: 已接收 {received}/{size} bytes", received
+                )
+            try:
+                os.rename(self._part_path(upload_id), claimed)
+            except FileNotFoundError:
+                raise UploadSessionNotFoundError(f"上传会话不存在或已过期: {upload_id}")
+            # 以认领时间作为已认领文件的修改时间，避免提交期间被过期清理删除
+            os.utime(claimed)
+        return claimed
+
+    def _unclaim(self, upload_id: str) -> None:
+        """提交失败时将已认领文件恢复为数据文件（文件已被移走时忽略）。"""
+        try:
+            os.rename(self._claimed_path(upload_id), self._part_path(upload_id))
+        except FileNotFoundError:
+            pass
+
+    def _remove_locked(self, upload_id: str) -> None:
+        """
+        持有数据文件锁时删除会话文件。
+
+        异常:
+            UploadSessionNotFoundError: 数据文件不存在时抛出
+            UploadBusyError: 其他请求正持有锁时抛出
+        """
+        with self._open_locked(upload_id, "rb"):
+            self._remove_session_files(upload_id)
+
+    def _open_at(self, upload_id: str, start: int) -> BinaryIO:
+        """
+        打开会话数据文件并加排他锁，定位到分片起始位置。
+
+        异常:
+            UploadSessionNotFoundError: 数据文件不存在时抛出
+            UploadBusyError: 其他请求正在写入时抛出
+            UploadOffsetMismatchError: 加锁后发现已接收字节数已变化时抛出
+        """
+        f = self._open_locked(upload_id, "r+b")
+        size = os.fstat(f.fileno()).st_size
+        if size != start:
+            f.close()
+            raise UploadOffsetMismatchError(
+                f"分片起始位置 {start} 与已接收字节数 {size} 不一致", size
+            )
+        f.seek(start)
+        return f
+
+    def _append_chunk(self, f: BinaryIO, digest: Any, chunk: bytes) -> None:
+        """更新分片摘要并写入数据块。"""
+        digest.update(chunk)
+        f.write(chunk)
+
+    def _sync(self, f: BinaryIO) -> None:
+        """将分片数据刷到磁盘，保证进程重启后已确认的字节数仍然有效。"""
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _truncate(self, f: BinaryIO, size: int) -> None:
+        """将数据文件截断到指定大小。"""
+        f.flush()
+        f.truncate(size)
+
+    def _remove_session_files(self, upload_id: str) -> None:
+        """删除会话数据文件、已认领文件和元数据文件。"""
+        paths = (
+            self._part_path(upload_id), self._claimed_path(upload_id), self._meta_path(upload_id)
+        )
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _purge_expired(self) -> int:
+        """
+        删除过期会话（以数据文件最近一次写入时间计算）及残缺的会话文件。
+
+        正在提交的会话（存在已认领文件）只在认领时间超过会话保留时间后删除（提交进程已退出的遗留文件）。
+        """
+        try:
+            filenames = os.listdir(self._dir)
+        except FileNotFoundError:
+            return 0
+        deadline = datetime.now().timestamp() - self._settings.install_upload_session_ttl
+        upload_ids: List[str] = sorted({os.path.splitext(name)[0] for name in filenames})
+        count = 0
+        for upload_id in upload_ids:
+            if not _SESSION_ID_PATTERN.match(upload_id):
+                continue
+            try:
+                mtime = os.stat(self._part_path(upload_id)).st_mtime
+            except FileNotFoundError:
+                mtime = None
+            # 数据文件先于已认领文件检查：两次检查之间被认领时，仍能看到新的已认领文件
+            try:
+                if os.stat(self._claimed_path(upload_id)).st_mtime >= deadline:
+                    continue
+            except FileNotFoundError:
+                pass
+            if mtime is None or not os.path.exists(self._meta_path(upload_id)) or mtime < deadline:
+                self._remove_session_files(upload_id)
+                count += 1
+        return count
@@ -3,9 +3,11 @@
 
 定义应用相关的领域模型和实体。
 """
+import base64
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import List, Optional
 
 
 @dataclass
@@ -31,9 +33,13 @@ class OntologyConfigItem:
     属性:
         id: 业务知识网络 ID
         is_config: 是否已配置
+        source: 来源配置文件名（ontologies/ 下），升级时据此匹配已安装的业务知识网络
+        digest: 来源配置文件 SHA-256，升级时据此判断定义是否变化
     """
     id: str
     is_config: bool = False
+    source: Optional[str] = None
+    digest: Optional[str] = None
 
 
 @dataclass
@@ -44,9 +50,13 @@ class AgentConfigItem:
     属性:
         id: 智能体 ID
         is_config: 是否已配置
+        source: 来源配置文件名（agents/ 下），升级时据此匹配已安装的智能体
+        digest: 来源配置文件 SHA-256，升级时据此判断定义是否变化
     """
     id: str
     is_config: bool = False
+    source: Optional[str] = None
+    digest: Optional[str] = None
 
 
 @dataclass
@@ -57,9 +67,13 @@ class ReleaseConfigItem:
     属性:
         name: Release 名称
         namespace: Release 所在命名空间
+        source: 来源 Chart 文件在应用包内的相对路径
+        digest: Release 指纹（Chart 文件 SHA-256 与命名空间的摘要），升级时据此判断是否需要重新安装
     """
     name: str
     namespace: str
+    source: Optional[str] = None
+    digest: Optional[str] = None
 
 
 @dataclass
@@ -84,6 +98,7 @@ class Application:
         updated_by: 更新者用户显示名称
         updated_by_id: 更新者用户ID
         updated_at: 更新时间
+        icon_exists: 是否存在图标（查询时不读取图标内容，仅标记图标是否存在）
     """
     id: int
     key: str
@@ -101,6 +116,7 @@ class Application:
     updated_by: str = ""
     updated_by_id: str = ""
     updated_at: Optional[datetime] = None
+    icon_exists: bool = False
 
     def has_icon(self) -> bool:
         """
@@ -109,7 +125,7 @@ class Application:
         返回:
             bool: 是否有图标
         """
-        return self.icon is not None and len(self.icon) > 0
+        return self.icon_exists or (self.icon is not None and len(self.icon) > 0)
 
     def is_configured(self) -> bool:
         """
@@ -139,6 +155,168 @@ class Application:
         return len(self.agent_config) > 0
 
 
+@dataclass
+class ApplicationCursor:
+    """
+    应用列表分页游标。
+
+    应用列表按 (updated_at, id) 倒序排列，游标记录上一页最后一条记录的位置，
+    下一页从该位置之后开始查询（键集分页）。
+
+    属性:
+        updated_at: 上一页最后一条记录的更新时间
+        id: 上一页最后一条记录的主键 ID
+    """
+    updated_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        """
+        编码为不透明的游标字符串。
+
+        返回:
+            str: URL 安全的 Base64 游标字符串
+        """
+        payload = json.dumps(
+            {"u": self.updated_at.isoformat(), "i": self.id}, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "ApplicationCursor":
+        """
+        从游标字符串解析游标。
+
+        参数:
+            value: 游标字符串
+
+        返回:
+            ApplicationCursor: 分页游标
+
+        异常:
+            ValueError: 游标格式无效时抛出
+        """
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(updated_at=datetime.fromisoformat(payload["u"]), id=int(payload["i"]))
+        except (ValueError, TypeError, KeyError, UnicodeError) as e:
+            raise ValueError(f"无效的分页游标: {value}") from e
+
+
+@dataclass
+class ApplicationPage:
+    """
+    应用列表分页结果。
+
+    属性:
+        items: 当前页应用列表
+        next_cursor: 下一页游标，没有更多数据时为 None
+    """
+    items: List[Application] = field(default_factory=list)
+    next_cursor: Optional[ApplicationCursor] = None
+
+
+@dataclass
+class ApplicationChangeCursor:
+    """
+    应用目录增量同步游标。
+
+    新增/更新的应用按 (updated_at, id) 正序读取，删除记录按墓碑序号正序读取，
+    游标分别记录两者已读取到的位置。
+
+    属性:
+        updated_at: 已同步的最后一条应用记录的更新时间
+        id: 已同步的最后一条应用记录的主键 ID
+        tombstone_seq: 已同步的最后一条删除记录的序号
+    """
+    updated_at: datetime
+    id: int
+    tombstone_seq: int
+
+    @classmethod
+    def initial(cls) -> "ApplicationChangeCursor":
+        """
+        创建从头开始同步的游标。
+
+        返回:
+            ApplicationChangeCursor: 初始游标
+        """
+        return cls(updated_at=datetime(1970, 1, 1), id=0, tombstone_seq=0)
+
+    def encode(self) -> str:
+        """
+        编码为不透明的游标字符串。
+
+        返回:
+            str: URL 安全的 Base64 游标字符串
+        """
+        payload = json.dumps(
+            {"u": self.updated_at.isoformat(), "i": self.id, "t": self.tombstone_seq},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "ApplicationChangeCursor":
+        """
+        从游标字符串解析游标。
+
+        参数:
+            value: 游标字符串
+
+        返回:
+            ApplicationChangeCursor: 同步游标
+
+        异常:
+            ValueError: 游标格式无效时抛出
+        """
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(
+                updated_at=datetime.fromisoformat(payload["u"]),
+                id=int(payload["i"]),
+                tombstone_seq=int(payload["t"]),
+            )
+        except (ValueError, TypeError, KeyError, UnicodeError) as e:
+            raise ValueError(f"无效的同步游标: {value}") from e
+
+
+@dataclass
+class ApplicationTombstone:
+    """
+    应用删除记录（墓碑）。
+
+    属性:
+        seq: 删除记录序号（单调递增）
+        id: 被删除应用的主键 ID
+        key: 被删除应用的唯一标识
+        deleted_at: 删除时间
+    """
+    seq: int
+    id: int
+    key: str
+    deleted_at: Optional[datetime] = None
+
+
+@dataclass
+class ApplicationChanges:
+    """
+    应用目录增量变更。
+
+    属性:
+        items: 游标之后新增或更新的应用
+        deleted: 游标之后删除的应用
+        next_cursor: 下次同步使用的游标
+        has_more: 是否还有未返回的变更（为 True 时应立即使用 next_cursor 继续读取）
+    """
+    items: List[Application] = field(default_factory=list)
+    deleted: List[ApplicationTombstone] = field(default_factory=list)
+    next_cursor: ApplicationChangeCursor = field(default_factory=ApplicationChangeCursor.initial)
+    has_more: bool = False
+
+
 @dataclass
 class OntologyInfo:
     """
@@ -0,0 +1,44 @@
+"""
+应用制品领域模型
+
+定义已推送到 Deploy Installer 的镜像和 Chart 制品记录，用于升级时跳过内容未变化的制品。
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class ArtifactKind(str, Enum):
+    """制品类型枚举。"""
+    IMAGE = "image"
+    CHART = "chart"
+
+
+@dataclass
+class ApplicationArtifact:
+    """
+    已推送的应用制品。
+
+    制品以内容摘要（SHA-256）标识，同一应用再次安装时摘要相同的制品无需重复推送。
+
+    属性:
+        app_key: 应用唯一标识
+        kind: 制品类型
+        digest: 制品文件 SHA-256 十六进制摘要
+        size: 制品文件字节数
+        path: 制品在应用包内的相对路径（仅用于排查问题）
+        chart_name: Chart 名称（仅 Chart）
+        chart_version: Chart 版本（仅 Chart）
+        chart_values: Chart 上传时返回的默认 values（仅 Chart，跳过上传时用于安装 Release）
+        pushed_at: 推送成功时间
+    """
+    app_key: str
+    kind: ArtifactKind
+    digest: str
+    size: int = 0
+    path: str = ""
+    chart_name: Optional[str] = None
+    chart_version: Optional[str] = None
+    chart_values: Optional[dict] = None
+    pushed_at: Optional[datetime] = None
@@ -0,0 +1,135 @@
+"""
+安装任务领域模型
+
+定义异步安装任务及其进度的领域模型。
+"""
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class InstallJobStatus(str, Enum):
+    """安装任务状态枚举。"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class InstallStage(str, Enum):
+    """安装阶段枚举（按执行顺序）。"""
+    QUEUED = "queued"
+    EXTRACTING = "extracting"
+    UPLOADING = "uploading"
+    IMPORTING = "importing"
+    SAVING = "saving"
+    DONE = "done"
+
+
+@dataclass
+class InstallJob:
+    """
+    安装任务。
+
+    属性:
+        id: 任务 ID
+        status: 任务状态
+        stage: 当前安装阶段
+        package_size: 安装包字节数
+        package_sha256: 提交者声明的安装包 SHA-256（可选，执行安装前校验）
+        bytes_total: 需要上传的镜像和 Chart 总字节数（进入上传阶段后可知）
+        bytes_uploaded: 已上传的镜像和 Chart 字节数
+        application_id: 安装成功后的应用 ID
+        application_key: 应用唯一标识（解析 application.key 后可知）
+        error_code: 失败时的错误码
+        error: 失败原因
+        updated_by: 提交者用户显示名称
+        updated_by_id: 提交者用户ID
+        created_at: 创建时间
+        updated_at: 最近一次状态或进度更新时间
+        finished_at: 结束时间
+    """
+    id: str
+    status: InstallJobStatus = InstallJobStatus.PENDING
+    stage: InstallStage = InstallStage.QUEUED
+    package_size: int = 0
+    package_sha256: Optional[str] = None
+    bytes_total: int = 0
+    bytes_uploaded: int = 0
+    application_id: Optional[int] = None
+    application_key: Optional[str] = None
+    error_code: Optional[str] = None
+    error: Optional[str] = None
+    updated_by: str = ""
+    updated_by_id: str = ""
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def is_finished(self) -> bool:
+        """检查任务是否已结束（成功或失败）。"""
+        return self.status in (InstallJobStatus.SUCCEEDED, InstallJobStatus.FAILED)
+
+
+@dataclass
+class QueuedInstall:
+    """
+    安装队列中的一条安装任务消息。
+
+    消息不含提交者的认证 Token，worker 使用自身的服务凭据调用外部服务。
+
+    属性:
+        entry_id: 队列消息 ID
+        job_id: 安装任务 ID
+        deliveries: 消息已投递次数（首次投递为 1）
+    """
+    entry_id: str
+    job_id: str
+    deliveries: int = 1
+
+
+class InstallProgress:
+    """
+    安装进度。
+
+    由安装流程更新、由任务执行方定期读取并持久化。
+    上传字节数在线程池中读取文件时累加，因此使用锁保护。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage = InstallStage.QUEUED
+        self.application_key: Optional[str] = None
+        self.bytes_total = 0
+        self.bytes_uploaded = 0
+
+    def set_stage(self, stage: InstallStage) -> None:
+        """
+        进入新的安装阶段。
+
+        参数:
+            stage: 安装阶段
+        """
+        self.stage = stage
+
+    def add_total(self, size: int) -> None:
+        """
+        累加需要上传的字节数。
+
+        参数:
+            size: 字节数
+        """
+        with self._lock:
+            self.bytes_total += size
+
+    def add_uploaded(self, size: int) -> None:
+        """
+        累加已上传的字节数。
+
+        参数:
+            size: 字节数
+        """
+        with self._lock:
+            self.bytes_uploaded += size
@@ -0,0 +1,86 @@
+"""
+升级计划领域模型
+
+定义安装前对比新安装包与已安装版本得到的最小操作计划。
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, List, Optional
+
+
+class PlanItemKind(str, Enum):
+    """计划项类型枚举。"""
+    RELEASE = "release"
+    ONTOLOGY = "ontology"
+    AGENT = "agent"
+
+
+class PlanAction(str, Enum):
+    """计划操作枚举。"""
+    # 安装或升级 Release（Chart 或 values 有变化）
+    INSTALL = "install"
+    # 新建业务知识网络或智能体
+    CREATE = "create"
+    # 定义有变化：依赖服务没有覆盖完整定义的接口，因此新建并在应用配置中记录新 ID，原资源保留不删除
+    RECREATE = "recreate"
+    # 定义未变化，不做任何操作
+    UNCHANGED = "unchanged"
+    # 新版本不再包含，原资源保留不删除，也不再记录在应用配置中
+    REMOVED = "removed"
+
+
+@dataclass
+class PlanItem:
+    """
+    升级计划项。
+
+    属性:
+        kind: 计划项类型
+        source: 来源文件（Chart 为应用包内相对路径，业务知识网络和智能体为配置文件名）
+        action: 计划操作
+        digest: 新版本的指纹（Release 为 Chart 摘要与命名空间的摘要，其余为配置文件 SHA-256）
+        target_id: 操作对象（Release 名称、业务知识网络 ID 或智能体 ID），新建时为空
+        installed: 已安装版本中匹配的配置项
+            （ReleaseConfigItem、OntologyConfigItem 或 AgentConfigItem）
+    """
+    kind: PlanItemKind
+    source: str
+    action: PlanAction
+    digest: Optional[str] = None
+    target_id: Optional[str] = None
+    installed: Optional[Any] = None
+
+
+@dataclass
+class UpgradePlan:
+    """
+    安装（升级）计划。
+
+    属性:
+        key: 应用唯一标识
+        name: 应用名称
+        version: 新版本号
+        installed_version: 已安装版本号，首次安装时为空
+        items: 计划项列表（Release、业务知识网络、智能体依次排列，各自按文件名排序）
+    """
+    key: str
+    name: str
+    version: str
+    installed_version: Optional[str] = None
+    items: List[PlanItem] = field(default_factory=list)
+
+    def find(self, kind: PlanItemKind, source: str) -> Optional[PlanItem]:
+        """
+        查找指定来源文件的计划项。
+
+        参数:
+            kind: 计划项类型
+            source: 来源文件
+
+        返回:
+            Optional[PlanItem]: 计划项，不存在时返回 None
+        """
+        for item in self.items:
+            if item.kind == kind and item.source == source and item.action != PlanAction.REMOVED:
+                return item
+        return None
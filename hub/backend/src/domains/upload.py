@@ -0,0 +1,56 @@
+"""
+安装包上传会话领域模型
+
+定义断点续传上传会话及相关异常。
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class UploadSession:
+    """
+    安装包断点续传上传会话。
+
+    属性:
+        id: 会话 ID
+        size: 安装包总字节数
+        offset: 已接收的字节数（下一个分片的起始位置）
+        sha256: 安装包 SHA-256（可选，完成上传时校验）
+        created_by_id: 创建者用户ID
+        created_at: 创建时间
+        expires_at: 过期时间（最近一次写入时间加会话保留时间）
+    """
+    id: str
+    size: int
+    offset: int = 0
+    sha256: Optional[str] = None
+    created_by_id: str = ""
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    def is_complete(self) -> bool:
+        """检查安装包是否已全部接收。"""
+        return self.offset >= self.size
+
+
+class UploadSessionNotFoundError(ValueError):
+    """上传会话不存在或已过期。"""
+
+
+class UploadOffsetMismatchError(ValueError):
+    """
+    分片起始位置与已接收字节数不一致（或安装包尚未上传完成）。
+
+    属性:
+        offset: 服务端已接收的字节数，客户端应从该位置继续上传
+    """
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(message)
+        self.offset = offset
+
+
+class UploadBusyError(ValueError):
+    """上传会话正在被其他请求写入。"""
@@ -0,0 +1,10 @@
+"""
+缓存模块
+
+提供进程内缓存组件及跨进程的缓存失效广播。
+"""
+from src.infrastructure.cache.invalidation import CacheInvalidationBus
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.cache.ttl_cache import TTLCache, token_cache_key
+
+__all__ = ["CacheInvalidationBus", "SingleFlight", "TTLCache", "token_cache_key"]
@@ -0,0 +1,162 @@
+"""
+缓存失效广播
+
+基于 Redis 发布/订阅，在多个 worker 进程和副本之间广播缓存失效消息。
+"""
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    # 兼容旧版本的 redis 库
+    import aioredis as redis
+
+from src.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# 重新订阅成功后投递给处理函数的消息，表示期间可能丢失了失效消息，需要全部失效
+RESYNC_MESSAGE: Dict[str, Any] = {"all": True}
+
+
+class CacheInvalidationBus:
+    """
+    缓存失效广播总线。
+
+    每个进程持有一个实例：publish() 将失效消息发布到 Redis 频道，
+    start() 启动后台订阅任务，把其他进程发布的消息交给处理函数。
+    本进程发布的消息会被忽略（发布方已在本地完成失效）。
+    Redis 不可用时只记录日志，缓存的 TTL 作为失效的兜底。
+    """
+
+    def __init__(self, settings: Settings, channel: str):
+        """
+        初始化广播总线。
+
+        参数:
+            settings: 应用配置
+            channel: Redis 发布/订阅频道名
+        """
+        self._settings = settings
+        self._channel = channel
+        self._origin = uuid.uuid4().hex
+        self._client: Optional[redis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._published = 0
+        self._received = 0
+        self._errors = 0
+        host_port = settings.redis_host.split(":")
+        self._redis_host = host_port[0]
+        self._redis_port = int(host_port[1]) if len(host_port) > 1 else 6379
+
+    def _create_client(self) -> redis.Redis:
+        """创建 Redis 客户端。"""
+        return redis.Redis(
+            host=self._redis_host,
+            port=self._redis_port,
+            password=self._settings.redis_password,
+            db=self._settings.redis_db,
+            decode_responses=True,
+        )
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        """
+        发布失效消息。发布失败时只记录日志，不向调用方抛出异常。
+
+        参数:
+            message: 失效消息内容（需可 JSON 序列化）
+        """
+        payload = json.dumps({**message, "origin": self._origin})
+        try:
+            if self._client is None:
+                self._client = self._create_client()
+            await self._client.publish(self._channel, payload)
+            self._published += 1
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"发布缓存失效消息失败，将依赖缓存过期: {e}")
+
+    def start(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        启动后台订阅任务（重复调用无副作用）。
+
+        参数:
+            handler: 失效消息处理函数；订阅（重新）建立后会收到 RESYNC_MESSAGE
+        """
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(handler))
+
+    async def _listen(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """订阅频道并分发消息，连接断开后按指数退避重连。"""
+        backoff = 1.0
+        while True:
+            client = self._create_client()
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                logger.info(f"已订阅缓存失效频道: {self._channel}")
+                backoff = 1.0
+                handler(RESYNC_MESSAGE)
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    self._dispatch(raw.get("data"), handler)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"缓存失效订阅中断，{backoff:.0f} 秒后重连: {e}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _dispatch(self, data: Any, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """解析一条失效消息并交给处理函数，忽略本进程发布的消息。"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"忽略无法解析的缓存失效消息: {data!r}")
+            return
+        if not isinstance(message, dict) or message.get("origin") == self._origin:
+            return
+        self._received += 1
+        try:
+            handler(message)
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"处理缓存失效消息失败: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取广播统计信息。
+
+        返回:
+            Dict[str, int]: 包含 published、received、errors
+        """
+        return {
+            "published": self._published,
+            "received": self._received,
+            "errors": self._errors,
+        }
+
+    async def close(self) -> None:
+        """停止订阅任务并关闭 Redis 客户端。"""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                logger.warning(f"关闭 Redis 客户端失败: {e}")
+            self._client = None
@@ -0,0 +1,66 @@
+"""
+单飞（Single-flight）请求合并
+
+同一键的并发调用共享一次正在进行的执行结果，避免对下游服务的重复请求。
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    单飞请求合并器。
+
+    首个调用者启动实际执行，执行期间到达的同键调用者等待同一个任务。
+    执行在独立任务中进行，个别调用者被取消不会影响其他等待者。
+    """
+
+    def __init__(self):
+        """初始化合并器。"""
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行或加入同键的进行中调用。
+
+        参数:
+            key: 合并键
+            fn: 实际执行的协程函数
+
+        返回:
+            T: 执行结果（异常同样会传播给所有等待者）
+        """
+        self._calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+        else:
+            self._shared += 1
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """任务完成后移除进行中记录，并标记异常已读取以免产生告警。"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取合并统计信息。
+
+        返回:
+            Dict[str, int]: calls（总调用数）、shared（合并到已有调用的次数）、
+                inflight（进行中数量）
+        """
+        return {
+            "calls": self._calls,
+            "shared": self._shared,
+            "inflight": len(self._inflight),
+        }
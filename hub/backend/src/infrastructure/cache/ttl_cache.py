@@ -0,0 +1,145 @@
+"""
+TTL 缓存
+
+提供带过期时间和 LRU 淘汰的进程内缓存，并统计命中/未命中次数。
+仅在单个事件循环内使用，不做线程同步。
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def token_cache_key(token: str) -> str:
+    """
+    计算 token 的缓存键，避免在内存中以明文作为键保存 token。
+
+    参数:
+        token: 访问令牌
+
+    返回:
+        str: token 的 SHA-256 十六进制摘要
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """
+    带 TTL 的 LRU 缓存。
+
+    每个条目拥有独立的过期时间；超过容量上限时淘汰最久未使用的条目。
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初始化缓存。
+
+        参数:
+            maxsize: 最大条目数
+            ttl: 默认过期时间（秒），同时作为单个条目过期时间的上限
+            clock: 单调时钟函数（便于测试替换）
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize 必须大于 0")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def maxsize(self) -> int:
+        """最大条目数。"""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float:
+        """默认过期时间（秒）。"""
+        return self._ttl
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        获取缓存值。
+
+        参数:
+            key: 缓存键
+
+        返回:
+            Optional[Any]: 缓存值，不存在或已过期时返回 None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        写入缓存值。
+
+        参数:
+            key: 缓存键
+            value: 缓存值
+            ttl: 过期时间（秒），为 None 时使用默认值；不会超过默认值
+        """
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+
+        self._data[key] = (value, self._clock() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """
+        删除缓存条目。
+
+        参数:
+            key: 缓存键
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空缓存（不重置统计计数）。"""
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息。
+
+        返回:
+            Dict[str, Any]: 包含 size、maxsize、hits、misses、evictions、expirations、hit_ratio
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,115 @@
+"""
+并发编排工具
+
+提供保持结果顺序、失败即取消的并发执行辅助函数，以及在有界线程池中执行阻塞操作的执行器。
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_fail_fast(aws: Iterable[Awaitable[Any]]) -> List[Any]:
+    """
+    并发执行多个可等待对象，结果按输入顺序返回。
+
+    任一任务失败时立即取消其余未完成的任务，并抛出该异常；
+    多个任务同时失败时抛出输入顺序最靠前的异常。
+    调用方被取消时同样取消全部任务。
+
+    参数:
+        aws: 可等待对象列表
+
+    返回:
+        List[Any]: 与输入顺序一致的结果列表
+
+    异常:
+        Exception: 第一个失败任务的异常
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def bounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int,
+) -> List[R]:
+    """
+    以有限并发度对每个元素执行异步函数，结果按输入顺序返回，失败即取消。
+
+    参数:
+        fn: 异步处理函数
+        items: 待处理元素
+        limit: 最大并发数（小于 1 时按 1 处理）
+
+    返回:
+        List[R]: 与输入顺序一致的结果列表
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return await gather_fail_fast(_run(item) for item in items)
+
+
+class BlockingExecutor:
+    """
+    有界阻塞任务执行器。
+
+    在固定大小的线程池中执行文件读写、解压、扫描目录、解析配置等阻塞操作，
+    使事件循环在处理大安装包期间仍能响应其他请求。线程数即同时执行的阻塞任务上限，
+    超出的任务在线程池队列中排队，不会占满事件循环默认线程池。
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "dip-hub-blocking"):
+        """
+        初始化执行器。
+
+        参数:
+            max_workers: 线程数上限（小于 1 时按 1 处理）
+            thread_name_prefix: 线程名前缀
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix=thread_name_prefix
+        )
+
+    async def run(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        在线程池中执行阻塞函数并等待结果。
+
+        参数:
+            fn: 阻塞函数
+            *args: 位置参数
+            **kwargs: 关键字参数
+
+        返回:
+            R: 函数返回值
+
+        异常:
+            Exception: 函数抛出的异常原样抛出
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """关闭线程池，取消尚未开始的任务，不等待正在执行的任务。"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
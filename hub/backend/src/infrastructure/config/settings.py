@@ -80,16 +80,154 @@ class Settings(BaseSettings):
     # 临时文件配置
     temp_dir: str = Field(default="/tmp/dip-hub", description="临时文件目录")
 
+    # 安装包上传配置
+    install_package_max_size: int = Field(
+        default=10 * 1024 * 1024 * 1024,
+        description="安装包最大字节数，上传超过该大小时拒绝安装",
+    )
+    install_upload_concurrency: int = Field(
+        default=4, description="安装时镜像和 Chart 并发上传数上限"
+    )
+    install_artifact_dedup_enabled: bool = Field(
+        default=True,
+        description="安装时跳过该应用已成功推送过的相同内容（SHA-256 一致）的镜像和 Chart；"
+        "镜像仓库被清理后可关闭以重新推送全部制品",
+    )
+    install_ontology_import_concurrency: int = Field(
+        default=4, description="安装时业务知识网络并发导入数上限"
+    )
+    install_agent_import_concurrency: int = Field(
+        default=4, description="安装时智能体并发导入数上限"
+    )
+    install_io_workers: int = Field(
+        default=4,
+        description="安装时执行解压、文件读写和配置解析等阻塞操作的线程数上限"
+    )
+    install_digest_workers: int = Field(
+        default=1,
+        description=(
+            "计算安装包、镜像和 Chart 摘要的线程数上限"
+            "（独立线程池，大文件摘要不占用文件读写线程）"
+        )
+    )
+    upload_io_workers: int = Field(
+        default=4,
+        description="接收安装包上传请求时写盘的线程数上限（独立线程池，不受安装任务的阻塞操作影响）"
+    )
+    install_job_concurrency: int = Field(
+        default=2, description="后台同时执行的安装任务数上限，超出的任务排队等待"
+    )
+    install_job_heartbeat_interval: float = Field(
+        default=5.0, description="安装任务进度持久化和心跳间隔（秒）"
+    )
+    install_job_stale_timeout: float = Field(
+        default=60.0,
+        description="未结束的安装任务超过该时间（秒）没有心跳时视为进程已退出，置为失败",
+    )
+    install_job_package_dir: str = Field(
+        default="",
+        description="安装任务安装包保存目录，为空时使用临时文件目录下的 install-jobs；"
+        "启用安装队列时须为 API 服务与安装 worker 共享的存储",
+    )
+
+    # 断点续传上传配置
+    install_upload_session_ttl: float = Field(
+        default=24 * 3600.0,
+        description="断点续传上传会话在最近一次写入后的保留时间（秒），过期后自动删除",
+    )
+    install_upload_chunk_max_size: int = Field(
+        default=64 * 1024 * 1024, description="断点续传单个分片的最大字节数"
+    )
+    install_upload_cleanup_interval: float = Field(
+        default=600.0, description="过期上传会话的清理间隔（秒）"
+    )
+
+    # 安装队列配置（独立安装 worker）
+    install_queue_enabled: bool = Field(
+        default=False,
+        description=(
+            "是否将安装任务投递到 Redis Stream，由独立的安装 worker 进程（dip-hub worker）执行"
+        ),
+    )
+    install_queue_stream: str = Field(
+        default="dip-hub:install-jobs", description="安装队列 Redis Stream 键名"
+    )
+    install_queue_group: str = Field(
+        default="dip-hub-install-workers", description="安装 worker 消费组名称"
+    )
+    install_queue_claim_idle: float = Field(
+        default=60.0,
+        description=(
+            "已投递的安装任务超过该时间（秒）没有 worker 心跳时视为被遗弃，"
+            "由其他 worker 接管重试"
+        ),
+    )
+    install_queue_max_deliveries: int = Field(
+        default=3, description="被遗弃的安装任务最多投递次数，超过后任务置为失败"
+    )
+    install_worker_token_scope: str = Field(
+        default="",
+        description="安装 worker 以客户端凭据模式申请服务 Token 时的权限范围，为空时不指定",
+    )
+
+    # 应用列表分页配置
+    application_list_default_limit: int = Field(
+        default=100, description="应用列表默认每页条数"
+    )
+    application_list_max_limit: int = Field(
+        default=500, description="应用列表每页条数上限"
+    )
+    application_changes_settle_seconds: int = Field(
+        default=2,
+        description="增量同步接口暂不返回最近多少秒内的变更（秒），用于规避同一秒内的并发写入和节点时钟偏差"
+    )
+
+    # 应用详情查询配置
+    application_detail_concurrency: int = Field(
+        default=8, description="查询应用业务知识网络/智能体详情时的并发数上限"
+    )
+    application_detail_timeout: float = Field(
+        default=10.0,
+        description="查询应用业务知识网络/智能体详情的整体超时时间（秒），超时条目返回基本信息",
+    )
+
     # 数据库配置
     db_host: str = Field(default="localhost", description="数据库主机")
     db_port: int = Field(default=3306, description="数据库端口")
     db_name: str = Field(default="dip", description="数据库名称")
     db_user: str = Field(default="root", description="数据库用户名")
     db_password: str = Field(default="", description="数据库密码")
+    db_pool_min_size: int = Field(
+        default=2, description="数据库连接池最小连接数，服务启动时预先建立"
+    )
+    db_pool_max_size: int = Field(default=10, description="数据库连接池最大连接数")
+    db_connect_timeout: int = Field(default=10, description="数据库建立连接超时时间（秒）")
+    db_pool_recycle: int = Field(
+        default=3600,
+        description="数据库连接最长复用时间（秒），超过后在下次获取时重建，-1 表示不回收"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=False,
+        description=(
+            "获取数据库连接时是否先执行存活检测，断开时自动重连；"
+            "默认依靠 db_pool_recycle 回收长期复用的连接"
+        )
+    )
+    db_pool_pre_ping_idle: float = Field(
+        default=30.0,
+        description="开启存活检测时只检测空闲超过该时间（秒）的连接，0 表示每次获取都检测"
+    )
 
     # Proton 部署服务配置
     proton_url: str = Field(default="http://localhost", description="Proton 服务地址")
     proton_timeout: int = Field(default=300, description="Proton 请求超时时间（秒）")
+    proton_upload_idle_timeout: float = Field(
+        default=120.0,
+        description="镜像/Chart 上传无进展超时时间（秒），期间未发送任何数据则中止上传",
+    )
+    proton_upload_response_timeout: float = Field(
+        default=1800.0, description="镜像/Chart 数据发送完成后等待服务端响应的超时时间（秒）"
+    )
 
     # Ontology Manager 服务配置
     ontology_manager_url: str = Field(
@@ -111,6 +249,38 @@ class Settings(BaseSettings):
         description="Agent Factory 请求超时时间（秒）"
     )
 
+    # HTTP 连接池配置（Hydra、OAuth2、User Management、Deploy Manager 客户端）
+    http_pool_max_connections: int = Field(
+        default=100,
+        description="单个 HTTP 客户端的最大连接数"
+    )
+    http_pool_max_keepalive_connections: int = Field(
+        default=20,
+        description="单个 HTTP 客户端保持的最大空闲 keep-alive 连接数"
+    )
+    http_pool_keepalive_expiry: float = Field(
+        default=30.0,
+        description="空闲 keep-alive 连接的过期时间（秒）"
+    )
+
+    # 外部服务 HTTP 会话配置（Deploy Installer、Ontology Manager、Agent Factory）
+    external_http_limit: int = Field(
+        default=100,
+        description="单个外部服务会话的最大连接数"
+    )
+    external_http_limit_per_host: int = Field(
+        default=20,
+        description="单个外部服务会话对同一主机的最大连接数"
+    )
+    external_http_dns_cache_ttl: int = Field(
+        default=300,
+        description="外部服务会话的 DNS 缓存时间（秒）"
+    )
+    external_http_keepalive_timeout: float = Field(
+        default=30.0,
+        description="外部服务会话空闲 keep-alive 连接的保持时间（秒）"
+    )
+
     # Mock 模式配置
     use_mock_services: bool = Field(
         default=False, 
@@ -156,6 +326,52 @@ class Settings(BaseSettings):
     )
     hydra_timeout: int = Field(default=30, description="Hydra 请求超时时间（秒）")
 
+    # Token 内省缓存配置
+    introspection_cache_enabled: bool = Field(
+        default=True,
+        description="是否启用 Token 内省结果的进程内缓存"
+    )
+    introspection_cache_max_size: int = Field(
+        default=10000,
+        description="Token 内省缓存最大条目数（LRU 淘汰）"
+    )
+    introspection_cache_ttl: int = Field(
+        default=60,
+        description="Token 内省缓存过期时间上限（秒），实际过期时间不晚于 Token 的 exp"
+    )
+
+    # 用户信息缓存配置
+    user_info_cache_enabled: bool = Field(
+        default=True,
+        description="是否启用按用户 ID 的用户信息进程内缓存"
+    )
+    user_info_cache_max_size: int = Field(
+        default=10000,
+        description="用户信息缓存最大条目数（LRU 淘汰）"
+    )
+    user_info_cache_ttl: int = Field(
+        default=30,
+        description="用户信息缓存过期时间（秒）"
+    )
+
+    # 应用目录缓存配置
+    application_cache_enabled: bool = Field(
+        default=True,
+        description="是否启用应用目录（详情与列表）的进程内读缓存"
+    )
+    application_cache_max_size: int = Field(
+        default=2000,
+        description="应用目录缓存最大条目数（LRU 淘汰，详情与列表分别计数）"
+    )
+    application_cache_ttl: int = Field(
+        default=300,
+        description="应用目录缓存过期时间（秒），作为失效广播丢失时的兜底"
+    )
+    application_cache_channel: str = Field(
+        default="dip-hub:application-cache:invalidate",
+        description="应用目录缓存失效广播使用的 Redis 频道"
+    )
+
     # User Management 服务配置
     user_management_url: str = Field(
         default="http://user-management",
@@ -5,15 +5,25 @@
 在这里实例化适配器并注入到应用服务中。
 """
 import logging
+from typing import List, Optional
+
+import httpx
 
 from src.application.health_service import HealthService
 from src.application.application_service import ApplicationService
+from src.application.install_job_service import InstallJobService
+from src.application.install_worker import InstallWorker
+from src.application.upload_service import PackageUploadService
 from src.application.login_service import LoginService
 from src.application.logout_service import LogoutService
 from src.application.refresh_token_service import RefreshTokenService
 from src.application.user_info_service import UserInfoService
 from src.adapters.health_adapter import HealthAdapter
 from src.adapters.application_adapter import ApplicationAdapter
+from src.adapters.cached_application_adapter import CachedApplicationAdapter
+from src.adapters.install_job_adapter import InstallJobAdapter
+from src.adapters.application_artifact_adapter import ApplicationArtifactAdapter
+from src.adapters.install_queue_adapter import RedisInstallQueueAdapter
 from src.adapters.session_adapter import SessionAdapter
 from src.adapters.oauth2_adapter import OAuth2Adapter
 from src.adapters.hydra_adapter import HydraAdapter
@@ -30,7 +40,15 @@ from src.adapters.mock_external_service_adapter import (
     MockAgentFactoryAdapter,
 )
 from src.adapters.mock_application_adapter import MockApplicationAdapter
+from src.adapters.mock_install_job_adapter import MockInstallJobAdapter
+from src.adapters.mock_application_artifact_adapter import MockApplicationArtifactAdapter
+from src.adapters.mock_install_queue_adapter import MockInstallQueueAdapter
+from src.infrastructure.cache import CacheInvalidationBus, SingleFlight, TTLCache
+from src.infrastructure.concurrency import BlockingExecutor
 from src.infrastructure.config.settings import Settings, get_settings
+from src.infrastructure.database.pool import DatabasePool
+from src.infrastructure.http_client import ClientSessionPool, create_http_client
+from src.infrastructure.metrics import register_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +70,18 @@ class Container:
         self._settings = settings or get_settings()
         self._health_adapter = None
         self._health_service = None
+        self._database_pool: Optional[DatabasePool] = None
         self._application_adapter = None
         self._application_service = None
+        self._install_executor: Optional[BlockingExecutor] = None
+        self._digest_executor: Optional[BlockingExecutor] = None
+        self._upload_executor: Optional[BlockingExecutor] = None
+        self._install_job_adapter = None
+        self._application_artifact_adapter = None
+        self._install_job_service: Optional[InstallJobService] = None
+        self._install_queue_adapter = None
+        self._install_worker: Optional[InstallWorker] = None
+        self._upload_service: Optional[PackageUploadService] = None
         self._deploy_installer_adapter = None
         self._ontology_manager_adapter = None
         self._agent_factory_adapter = None
@@ -66,12 +94,40 @@ class Container:
         self._logout_service = None
         self._refresh_token_service = None
         self._user_info_service = None
+        self._introspection_cache = None
+        self._user_info_cache = None
+        self._single_flight = None
+        self._application_cache_bus: Optional[CacheInvalidationBus] = None
+        self._http_clients: List[httpx.AsyncClient] = []
+        self._http_session_pool: Optional[ClientSessionPool] = None
     
     @property
     def settings(self) -> Settings:
         """获取应用配置。"""
         return self._settings
+
+    def _create_http_client(self, timeout: float, verify: bool = True) -> httpx.AsyncClient:
+        """
+        创建由容器持有的共享 HTTP 客户端，在 close() 时统一关闭。
+
+        参数:
+            timeout: 默认请求超时时间（秒）
+            verify: 是否校验 TLS 证书
+
+        返回:
+            httpx.AsyncClient: 带连接池的异步 HTTP 客户端
+        """
+        client = create_http_client(self._settings, timeout=timeout, verify=verify)
+        self._http_clients.append(client)
+        return client
     
+    @property
+    def http_session_pool(self) -> ClientSessionPool:
+        """获取外部服务共享 HTTP 会话池（单例）。"""
+        if self._http_session_pool is None:
+            self._http_session_pool = ClientSessionPool(self._settings)
+        return self._http_session_pool
+
     @property
     def health_adapter(self) -> HealthAdapter:
         """获取健康适配器实例（单例）。"""
@@ -86,6 +142,14 @@ class Container:
             self._health_service = HealthService(self.health_adapter)
         return self._health_service
 
+    @property
+    def database_pool(self) -> DatabasePool:
+        """获取 MariaDB 连接池实例（单例）。"""
+        if self._database_pool is None:
+            self._database_pool = DatabasePool(self._settings)
+            register_metrics("database_pool", self._database_pool.stats)
+        return self._database_pool
+
     @property
     def application_adapter(self):
         """获取应用适配器实例（单例）。"""
@@ -93,8 +157,22 @@ class Container:
             if self._settings.use_mock_services:
                 logger.info("使用 Mock 应用适配器（内存存储）")
                 self._application_adapter = MockApplicationAdapter()
+            elif self._settings.application_cache_enabled:
+                self._application_cache_bus = CacheInvalidationBus(
+                    self._settings, channel=self._settings.application_cache_channel
+                )
+                self._application_adapter = CachedApplicationAdapter(
+                    ApplicationAdapter(self._settings, pool=self.database_pool),
+                    maxsize=self._settings.application_cache_max_size,
+                    ttl=self._settings.application_cache_ttl,
+                    invalidation_bus=self._application_cache_bus,
+                )
+                register_metrics("application_cache", self._application_adapter.stats)
+                register_metrics("application_cache_bus", self._application_cache_bus.stats)
             else:
-                self._application_adapter = ApplicationAdapter(self._settings)
+                self._application_adapter = ApplicationAdapter(
+                    self._settings, pool=self.database_pool
+                )
         return self._application_adapter
 
     @property
@@ -105,7 +183,11 @@ class Container:
                 logger.info("使用 Mock Deploy Installer 适配器")
                 self._deploy_installer_adapter = MockDeployInstallerAdapter()
             else:
-                self._deploy_installer_adapter = DeployInstallerAdapter(self._settings)
+                self._deploy_installer_adapter = DeployInstallerAdapter(
+                    self._settings,
+                    session_pool=self.http_session_pool,
+                    blocking_executor=self.install_executor,
+                )
         return self._deploy_installer_adapter
 
     @property
@@ -116,7 +198,9 @@ class Container:
                 logger.info("使用 Mock Ontology Manager 适配器")
                 self._ontology_manager_adapter = MockOntologyManagerAdapter()
             else:
-                self._ontology_manager_adapter = OntologyManagerAdapter(self._settings)
+                self._ontology_manager_adapter = OntologyManagerAdapter(
+                    self._settings, session_pool=self.http_session_pool
+                )
         return self._ontology_manager_adapter
 
     @property
@@ -127,7 +211,9 @@ class Container:
                 logger.info("使用 Mock Agent Factory 适配器")
                 self._agent_factory_adapter = MockAgentFactoryAdapter()
             else:
-                self._agent_factory_adapter = AgentFactoryAdapter(self._settings)
+                self._agent_factory_adapter = AgentFactoryAdapter(
+                    self._settings, session_pool=self.http_session_pool
+                )
         return self._agent_factory_adapter
 
     @property
@@ -141,30 +227,76 @@ class Container:
     def oauth2_adapter(self):
         """获取 OAuth2 适配器实例（单例）。"""
         if self._oauth2_adapter is None:
-            self._oauth2_adapter = OAuth2Adapter(self._settings)
+            self._oauth2_adapter = OAuth2Adapter(
+                self._settings,
+                client=self._create_http_client(timeout=30, verify=False),
+            )
         return self._oauth2_adapter
 
     @property
     def hydra_adapter(self):
         """获取 Hydra 适配器实例（单例）。"""
         if self._hydra_adapter is None:
-            self._hydra_adapter = HydraAdapter(self._settings)
+            self._hydra_adapter = HydraAdapter(
+                self._settings,
+                client=self._create_http_client(timeout=self._settings.hydra_timeout),
+            )
         return self._hydra_adapter
 
     @property
     def user_management_adapter(self):
         """获取 User Management 适配器实例（单例）。"""
         if self._user_management_adapter is None:
-            self._user_management_adapter = UserManagementAdapter(self._settings)
+            self._user_management_adapter = UserManagementAdapter(
+                self._settings,
+                client=self._create_http_client(timeout=self._settings.user_management_timeout),
+            )
         return self._user_management_adapter
 
     @property
     def deploy_manager_adapter(self):
         """获取 Deploy Manager 适配器实例（单例）。"""
         if self._deploy_manager_adapter is None:
-            self._deploy_manager_adapter = DeployManagerAdapter(self._settings)
+            self._deploy_manager_adapter = DeployManagerAdapter(
+                self._settings,
+                client=self._create_http_client(timeout=self._settings.deploy_manager_timeout),
+            )
         return self._deploy_manager_adapter
 
+    @property
+    def introspection_cache(self) -> Optional[TTLCache]:
+        """获取 Token 内省缓存实例（单例），未启用时返回 None。"""
+        if not self._settings.introspection_cache_enabled:
+            return None
+        if self._introspection_cache is None:
+            self._introspection_cache = TTLCache(
+                maxsize=self._settings.introspection_cache_max_size,
+                ttl=self._settings.introspection_cache_ttl,
+            )
+            register_metrics("introspection_cache", self._introspection_cache.stats)
+        return self._introspection_cache
+
+    @property
+    def user_info_cache(self) -> Optional[TTLCache]:
+        """获取用户信息缓存实例（单例，按用户 ID 缓存），未启用时返回 None。"""
+        if not self._settings.user_info_cache_enabled:
+            return None
+        if self._user_info_cache is None:
+            self._user_info_cache = TTLCache(
+                maxsize=self._settings.user_info_cache_max_size,
+                ttl=self._settings.user_info_cache_ttl,
+            )
+            register_metrics("user_info_cache", self._user_info_cache.stats)
+        return self._user_info_cache
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """获取认证链路的单飞请求合并器（单例）。"""
+        if self._single_flight is None:
+            self._single_flight = SingleFlight()
+            register_metrics("auth_single_flight", self._single_flight.stats)
+        return self._single_flight
+
     @property
     def login_service(self) -> LoginService:
         """获取登录服务实例（单例）。"""
@@ -186,6 +318,7 @@ class Container:
                 session_port=self.session_adapter,
                 oauth2_port=self.oauth2_adapter,
                 deploy_manager_port=self.deploy_manager_adapter,
+                introspection_cache=self.introspection_cache,
             )
         return self._logout_service
 
@@ -209,6 +342,36 @@ class Container:
             )
         return self._user_info_service
 
+    @property
+    def install_executor(self) -> BlockingExecutor:
+        """获取执行安装包解压、文件读写等阻塞操作的有界线程池（单例）。"""
+        if self._install_executor is None:
+            self._install_executor = BlockingExecutor(
+                max_workers=self._settings.install_io_workers,
+                thread_name_prefix="dip-hub-install-io",
+            )
+        return self._install_executor
+
+    @property
+    def digest_executor(self) -> BlockingExecutor:
+        """获取计算安装包、镜像和 Chart 摘要的有界线程池（单例）。"""
+        if self._digest_executor is None:
+            self._digest_executor = BlockingExecutor(
+                max_workers=self._settings.install_digest_workers,
+                thread_name_prefix="dip-hub-digest",
+            )
+        return self._digest_executor
+
+    @property
+    def upload_executor(self) -> BlockingExecutor:
+        """获取上传请求写入安装包数据的有界线程池（单例）。"""
+        if self._upload_executor is None:
+            self._upload_executor = BlockingExecutor(
+                max_workers=self._settings.upload_io_workers,
+                thread_name_prefix="dip-hub-upload-io",
+            )
+        return self._upload_executor
+
     @property
     def application_service(self) -> ApplicationService:
         """获取应用服务实例（单例）。"""
@@ -219,9 +382,109 @@ class Container:
                 ontology_manager_port=self.ontology_manager_adapter,
                 agent_factory_port=self.agent_factory_adapter,
                 settings=self._settings,
+                blocking_executor=self.install_executor,
+                artifact_port=self.application_artifact_adapter,
+                digest_executor=self.digest_executor,
+                upload_executor=self.upload_executor,
             )
         return self._application_service
 
+    @property
+    def application_artifact_adapter(self):
+        """获取应用制品适配器实例（单例）。"""
+        if self._application_artifact_adapter is None:
+            if self._settings.use_mock_services:
+                logger.info("使用 Mock 应用制品适配器（内存存储）")
+                self._application_artifact_adapter = MockApplicationArtifactAdapter()
+            else:
+                self._application_artifact_adapter = ApplicationArtifactAdapter(self.database_pool)
+        return self._application_artifact_adapter
+
+    @property
+    def install_job_adapter(self):
+        """获取安装任务适配器实例（单例）。"""
+        if self._install_job_adapter is None:
+            if self._settings.use_mock_services:
+                logger.info("使用 Mock 安装任务适配器（内存存储）")
+                self._install_job_adapter = MockInstallJobAdapter()
+            else:
+                self._install_job_adapter = InstallJobAdapter(self.database_pool)
+        return self._install_job_adapter
+
+    @property
+    def install_queue_adapter(self):
+        """获取安装队列适配器实例（单例），未启用安装队列时返回 None。"""
+        if self._install_queue_adapter is None and self._settings.install_queue_enabled:
+            if self._settings.use_mock_services:
+                logger.info("使用 Mock 安装队列适配器（内存存储）")
+                self._install_queue_adapter = MockInstallQueueAdapter()
+            else:
+                self._install_queue_adapter = RedisInstallQueueAdapter(self._settings)
+        return self._install_queue_adapter
+
+    @property
+    def install_job_service(self) -> InstallJobService:
+        """获取安装任务服务实例（单例）。"""
+        if self._install_job_service is None:
+            self._install_job_service = InstallJobService(
+                application_service=self.application_service,
+                install_job_port=self.install_job_adapter,
+                settings=self._settings,
+                install_queue_port=self.install_queue_adapter,
+                blocking_executor=self.upload_executor,
+            )
+        return self._install_job_service
+
+    @property
+    def install_worker(self) -> InstallWorker:
+        """
+        获取安装 worker 实例（单例）。
+
+        异常:
+            RuntimeError: 未启用安装队列时抛出
+        """
+        if self._install_worker is None:
+            if self.install_queue_adapter is None:
+                raise RuntimeError("未启用安装队列，请设置 DIP_HUB_INSTALL_QUEUE_ENABLED=true")
+            self._install_worker = InstallWorker(
+                install_job_service=self.install_job_service,
+                install_job_port=self.install_job_adapter,
+                install_queue_port=self.install_queue_adapter,
+                settings=self._settings,
+                oauth2_port=self.oauth2_adapter,
+            )
+        return self._install_worker
+
+    @property
+    def upload_service(self) -> PackageUploadService:
+        """获取安装包断点续传上传服务实例（单例）。"""
+        if self._upload_service is None:
+            self._upload_service = PackageUploadService(
+                install_job_service=self.install_job_service,
+                settings=self._settings,
+                blocking_executor=self.upload_executor,
+            )
+        return self._upload_service
+
+    async def start(self) -> None:
+        """
+        启动容器持有的资源和后台任务。
+
+        预热数据库连接池（非 Mock 模式），启动应用目录缓存的失效订阅任务（仅在启用缓存时）、
+        安装任务服务和过期上传会话清理任务。连接池预热失败时只记录日志，首次查询时会再次尝试建立连接。
+        """
+        adapter = self.application_adapter
+        if not self._settings.use_mock_services:
+            try:
+                await self.database_pool.open()
+            except Exception as e:
+                logger.warning(f"数据库连接池预热失败，将在首次查询时重试: {e}")
+        cache_bus = self._application_cache_bus
+        if isinstance(adapter, CachedApplicationAdapter) and cache_bus is not None:
+            cache_bus.start(adapter.invalidate_local)
+        await self.install_job_service.start()
+        self.upload_service.start()
+
     def set_ready(self, ready: bool = True) -> None:
         """
         设置服务就绪状态。
@@ -235,12 +498,34 @@ class Container:
         """
         关闭容器，释放资源。
 
-        关闭数据库连接池等资源。
+        关闭上传会话清理任务、安装任务服务、安装队列、缓存失效订阅、数据库连接池、
+        Redis 客户端、共享 HTTP 客户端和会话池等资源。
         """
+        if self._upload_service is not None:
+            await self._upload_service.close()
+        if self._install_job_service is not None:
+            await self._install_job_service.close()
+        if self._install_queue_adapter is not None:
+            await self._install_queue_adapter.close()
+        if self._application_cache_bus is not None:
+            await self._application_cache_bus.close()
         if self._application_adapter is not None:
             await self._application_adapter.close()
+        if self._database_pool is not None:
+            await self._database_pool.close()
         if self._session_adapter is not None:
             await self._session_adapter.close()
+        if self._http_session_pool is not None:
+            await self._http_session_pool.close()
+        for client in self._http_clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"关闭 HTTP 客户端失败: {e}")
+        self._http_clients.clear()
+        for executor in (self._install_executor, self._digest_executor, self._upload_executor):
+            if executor is not None:
+                executor.shutdown()
 
 
 # 全局容器实例
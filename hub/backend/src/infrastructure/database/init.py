@@ -111,6 +111,88 @@ async def ensure_tables_exist(settings: Settings) -> None:
                 """
             )
             
+            # 检查并创建应用目录版本表（每次应用写操作递增，用于 HTTP 缓存校验）
+            await _ensure_table_exists(
+                cursor,
+                settings.db_name,
+                "t_application_version",
+                """
+                CREATE TABLE IF NOT EXISTS `t_application_version` (
+                    `id` TINYINT NOT NULL COMMENT '主键ID（固定为 1）',
+                    `version` BIGINT NOT NULL DEFAULT 0 COMMENT '应用目录版本号',
+                    PRIMARY KEY (`id`)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='应用目录版本表'
+                """
+            )
+
+            # 检查并创建应用删除记录表（墓碑，供增量同步接口返回已删除的应用）
+            await _ensure_table_exists(
+                cursor,
+                settings.db_name,
+                "t_application_tombstone",
+                """
+                CREATE TABLE IF NOT EXISTS `t_application_tombstone` (
+                    `seq` BIGINT NOT NULL AUTO_INCREMENT COMMENT '删除记录序号',
+                    `app_id` BIGINT NOT NULL COMMENT '被删除应用的主键ID',
+                    `key` CHAR(32) NOT NULL COMMENT '被删除应用的唯一标识',
+                    `deleted_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '删除时间',
+                    PRIMARY KEY (`seq`)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='应用删除记录表'
+                """
+            )
+
+            # 检查并创建应用安装任务表
+            await _ensure_table_exists(
+                cursor,
+                settings.db_name,
+                "t_application_install_job",
+                """
+                CREATE TABLE IF NOT EXISTS `t_application_install_job` (
+                    `id` CHAR(32) NOT NULL COMMENT '任务ID',
+                    `status` VARCHAR(16) NOT NULL
+                        COMMENT '任务状态（pending/running/succeeded/failed）',
+                    `stage` VARCHAR(32) NOT NULL COMMENT '当前安装阶段',
+                    `package_size` BIGINT NOT NULL DEFAULT 0 COMMENT '安装包字节数',
+                    `package_sha256` CHAR(64) NULL
+                        COMMENT '提交者声明的安装包SHA-256（执行安装前校验）',
+                    `bytes_total` BIGINT NOT NULL DEFAULT 0 COMMENT '需要上传的镜像和Chart总字节数',
+                    `bytes_uploaded` BIGINT NOT NULL DEFAULT 0 COMMENT '已上传的镜像和Chart字节数',
+                    `app_id` BIGINT NULL COMMENT '安装成功后的应用主键ID',
+                    `app_key` CHAR(32) NULL COMMENT '应用唯一标识',
+                    `error_code` VARCHAR(64) NULL COMMENT '错误码',
+                    `error` TEXT NULL COMMENT '失败原因',
+                    `updated_by` VARCHAR(128) NOT NULL COMMENT '提交者用户显示名称',
+                    `updated_by_id` CHAR(36) NULL COMMENT '提交者用户ID',
+                    `created_at` DATETIME(3) NOT NULL COMMENT '创建时间',
+                    `updated_at` DATETIME(3) NOT NULL COMMENT '最近一次状态或进度更新时间',
+                    `finished_at` DATETIME(3) NULL COMMENT '结束时间',
+                    PRIMARY KEY (`id`),
+                    INDEX `idx_status_updated_at` (`status`, `updated_at`)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='应用安装任务表'
+                """
+            )
+
+            # 检查并创建应用制品表（已推送镜像和 Chart 的内容摘要，升级时跳过未变化的制品）
+            await _ensure_table_exists(
+                cursor,
+                settings.db_name,
+                "t_application_artifact",
+                """
+                CREATE TABLE IF NOT EXISTS `t_application_artifact` (
+                    `app_key` CHAR(32) NOT NULL COMMENT '应用唯一标识（对应 t_application.key）',
+                    `kind` VARCHAR(16) NOT NULL COMMENT '制品类型（image/chart）',
+                    `digest` CHAR(64) NOT NULL COMMENT '制品文件SHA-256摘要',
+                    `size` BIGINT NOT NULL DEFAULT 0 COMMENT '制品文件字节数',
+                    `path` VARCHAR(512) NOT NULL DEFAULT '' COMMENT '制品在应用包内的相对路径',
+                    `chart_name` VARCHAR(128) NULL COMMENT 'Chart名称',
+                    `chart_version` VARCHAR(128) NULL COMMENT 'Chart版本',
+                    `chart_values` MEDIUMTEXT NULL COMMENT 'Chart默认values（JSON对象）',
+                    `pushed_at` DATETIME(3) NOT NULL COMMENT '推送成功时间',
+                    PRIMARY KEY (`app_key`, `kind`, `digest`)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='应用制品表'
+                """
+            )
+
             # 检查并添加 business_domain 字段（如果表已存在但字段不存在）
             await _ensure_column_exists(
                 cursor,
@@ -129,6 +211,16 @@ async def ensure_tables_exist(settings: Settings) -> None:
                 "ALTER TABLE `t_application` ADD COLUMN `updated_by_id` CHAR(36) NULL COMMENT '更新者用户ID' AFTER `updated_by`"
             )
             
+            # 检查并添加 package_sha256 字段（如果安装任务表已存在但字段不存在）
+            await _ensure_column_exists(
+                cursor,
+                settings.db_name,
+                "t_application_install_job",
+                "package_sha256",
+                "ALTER TABLE `t_application_install_job` ADD COLUMN `package_sha256` CHAR(64) NULL "
+                "COMMENT '提交者声明的安装包SHA-256（执行安装前校验）' AFTER `package_size`"
+            )
+
             # 修改 updated_by 字段类型（如果表已存在且字段类型为 CHAR(36)）
             await _ensure_column_type_updated(
                 cursor,
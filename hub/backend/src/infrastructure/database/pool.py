@@ -0,0 +1,165 @@
+"""
+数据库连接池
+
+封装 aiomysql 连接池：连接池参数来自配置，服务启动时预先建立最小连接数，
+获取空闲较久的连接时可选地执行存活检测，并统计连接占用和排队等待情况供 /metrics 输出。
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiomysql
+
+from src.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class DatabasePool:
+    """
+    MariaDB 连接池。
+
+    open() 在服务启动阶段调用以预热连接；未调用时在第一次获取连接时创建。
+    """
+
+    def __init__(self, settings: Settings):
+        """
+        初始化连接池（不建立连接）。
+
+        参数:
+            settings: 应用配置
+        """
+        self._settings = settings
+        self._pool: Optional[aiomysql.Pool] = None
+        self._open_lock = asyncio.Lock()
+        self._acquired = 0
+        self._waiting = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._ping_failures = 0
+
+    async def open(self) -> aiomysql.Pool:
+        """
+        创建连接池并建立 db_pool_min_size 个连接，已创建时直接返回。
+
+        返回:
+            aiomysql.Pool: 底层连接池
+
+        异常:
+            Exception: 数据库不可达时抛出连接异常
+        """
+        if self._pool is not None:
+            return self._pool
+        async with self._open_lock:
+            if self._pool is None:
+                settings = self._settings
+                self._pool = await aiomysql.create_pool(
+                    host=settings.db_host,
+                    port=settings.db_port,
+                    user=settings.db_user,
+                    password=settings.db_password,
+                    db=settings.db_name,
+                    autocommit=True,
+                    minsize=settings.db_pool_min_size,
+                    maxsize=settings.db_pool_max_size,
+                    connect_timeout=settings.db_connect_timeout,
+                    pool_recycle=settings.db_pool_recycle,
+                )
+                logger.info(
+                    f"数据库连接池已创建: {settings.db_host}:{settings.db_port}/{settings.db_name} "
+                    f"(min={settings.db_pool_min_size}, max={settings.db_pool_max_size})"
+                )
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """
+        从连接池获取连接，退出上下文时归还。
+
+        返回:
+            AsyncIterator[aiomysql.Connection]: 数据库连接
+
+        异常:
+            Exception: 建立连接或存活检测失败时抛出
+        """
+        pool = await self.open()
+        must_wait = pool.freesize == 0 and pool.size >= pool.maxsize
+        self._waiting += 1
+        started = time.perf_counter()
+        try:
+            conn = await pool.acquire()
+        finally:
+            self._waiting -= 1
+        if must_wait:
+            waited = time.perf_counter() - started
+            self._waits += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        self._acquired += 1
+        try:
+            if self._needs_ping(conn):
+                await self._ping(conn)
+            yield conn
+        finally:
+            pool.release(conn)
+
+    def _needs_ping(self, conn: aiomysql.Connection) -> bool:
+        """开启存活检测且连接空闲超过 db_pool_pre_ping_idle 时需要检测（刚用过的连接不检测）。"""
+        if not self._settings.db_pool_pre_ping:
+            return False
+        idle_threshold = self._settings.db_pool_pre_ping_idle
+        if idle_threshold <= 0:
+            return True
+        return asyncio.get_running_loop().time() - conn.last_usage >= idle_threshold
+
+    async def _ping(self, conn: aiomysql.Connection) -> None:
+        """
+        检测连接是否存活，断开时尝试重连一次；重连失败时关闭连接并抛出异常。
+
+        参数:
+            conn: 数据库连接
+        """
+        try:
+            await conn.ping(reconnect=True)
+        except Exception:
+            self._ping_failures += 1
+            conn.close()
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        返回连接池指标。
+
+        返回:
+            Dict[str, Any]: 连接数（总数/使用中/空闲）、排队中的请求数、
+            需要等待的获取次数及等待耗时（毫秒）、存活检测失败次数
+        """
+        pool = self._pool
+        size = pool.size if pool is not None else 0
+        idle = pool.freesize if pool is not None else 0
+        return {
+            "open": pool is not None,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "min_size": self._settings.db_pool_min_size,
+            "max_size": self._settings.db_pool_max_size,
+            "waiting": self._waiting,
+            "acquired": self._acquired,
+            "waits": self._waits,
+            "wait_ms_total": round(self._wait_total * 1000, 3),
+            "wait_ms_max": round(self._wait_max * 1000, 3),
+            "ping_failures": self._ping_failures,
+        }
+
+    async def close(self) -> None:
+        """关闭连接池。"""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.close()
+            await pool.wait_closed()
+            logger.info("数据库连接池已关闭")
@@ -0,0 +1,97 @@
+"""
+HTTP 客户端工厂
+
+创建长生命周期、带连接池的 HTTP 客户端，供适配器复用 TCP/TLS 连接。
+客户端由依赖注入容器持有，并在服务关闭时统一释放。
+
+- httpx 客户端：Hydra、OAuth2、User Management、Deploy Manager 适配器
+- aiohttp 会话池：Deploy Installer、Ontology Manager、Agent Factory 适配器
+"""
+import logging
+from typing import Dict
+
+import aiohttp
+import httpx
+
+from src.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_http_client(
+    settings: Settings,
+    timeout: float,
+    verify: bool = True,
+) -> httpx.AsyncClient:
+    """
+    创建带连接池配置的 httpx 异步客户端。
+
+    参数:
+        settings: 应用配置（读取连接池上限和 keep-alive 过期时间）
+        timeout: 默认请求超时时间（秒）
+        verify: 是否校验 TLS 证书
+
+    返回:
+        httpx.AsyncClient: 异步 HTTP 客户端
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_pool_max_connections,
+        max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+        keepalive_expiry=settings.http_pool_keepalive_expiry,
+    )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, verify=verify)
+
+
+class ClientSessionPool:
+    """
+    aiohttp 会话池。
+
+    每个下游服务持有一个 ClientSession 及其独立的 TCPConnector，
+    复用连接和 DNS 缓存。会话不设置默认超时，超时由每个请求单独指定。
+    会话在首次使用时（事件循环内）创建。
+    """
+
+    def __init__(self, settings: Settings):
+        """
+        初始化会话池。
+
+        参数:
+            settings: 应用配置（读取连接上限、DNS 缓存和 keep-alive 配置）
+        """
+        self._settings = settings
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    def get(self, service: str) -> aiohttp.ClientSession:
+        """
+        获取指定下游服务的会话，不存在或已关闭时创建。
+
+        参数:
+            service: 下游服务名称（如 deploy-installer）
+
+        返回:
+            aiohttp.ClientSession: 该服务专用的会话
+        """
+        session = self._sessions.get(service)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._settings.external_http_limit,
+                limit_per_host=self._settings.external_http_limit_per_host,
+                ttl_dns_cache=self._settings.external_http_dns_cache_ttl,
+                keepalive_timeout=self._settings.external_http_keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+            self._sessions[service] = session
+            logger.info(f"HTTP 会话已创建: {service}")
+        return session
+
+    async def close(self) -> None:
+        """关闭所有会话及其连接器。"""
+        for service, session in list(self._sessions.items()):
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"关闭 HTTP 会话失败 ({service}): {e}")
+        self._sessions.clear()
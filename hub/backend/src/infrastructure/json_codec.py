@@ -0,0 +1,69 @@
+"""
+JSON 编解码
+
+优先使用 orjson 进行 JSON 编解码，未安装时回退到标准库 json。
+解析失败时抛出的异常均为 json.JSONDecodeError（orjson.JSONDecodeError 是其子类）。
+"""
+import json
+from datetime import datetime
+from typing import Any, Union
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 未安装 orjson 时使用标准库
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """标准库编码时处理 datetime 等非原生类型。"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"无法序列化的类型: {type(value).__name__}")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    解析 JSON。
+
+    参数:
+        data: JSON 文本或字节
+
+    返回:
+        Any: 解析结果
+
+    异常:
+        json.JSONDecodeError: JSON 格式无效时抛出
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    将对象编码为 UTF-8 JSON 字节（紧凑格式，不转义非 ASCII 字符，datetime 输出 ISO 8601）。
+
+    参数:
+        value: 待编码对象
+
+    返回:
+        bytes: JSON 字节
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    使用 json_codec 序列化的 JSON 响应。
+
+    路由直接返回由领域对象构造的字典时使用，跳过响应模型的二次校验和逐字段编码。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
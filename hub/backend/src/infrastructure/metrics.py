@@ -0,0 +1,49 @@
+"""
+运行指标注册
+
+提供进程内指标的注册与汇总，供内部 /metrics 端点输出。
+各组件在创建时注册一个返回字典的采集函数。
+"""
+import logging
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_metrics(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """
+    注册指标采集函数。
+
+    参数:
+        name: 指标分组名称（同名注册会覆盖）
+        provider: 返回指标字典的无参函数
+    """
+    _providers[name] = provider
+
+
+def unregister_metrics(name: str) -> None:
+    """
+    注销指标采集函数。
+
+    参数:
+        name: 指标分组名称
+    """
+    _providers.pop(name, None)
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """
+    汇总所有已注册的指标。
+
+    返回:
+        Dict[str, Any]: 以分组名称为键的指标字典
+    """
+    result = {}
+    for name, provider in list(_providers.items()):
+        try:
+            result[name] = provider()
+        except Exception as e:
+            logger.warning(f"采集指标失败 ({name}): {e}")
+    return result
@@ -4,15 +4,24 @@
 统一从请求头提取认证token并存储到request.state和TokenContext中，供后续处理使用。
 同时进行token内省，获取用户信息并存储到上下文中。
 对于需要认证的路径（如 /applications），如果没有token则拒绝访问。
+Token 内省结果按 token 哈希缓存在进程内，过期时间不晚于 token 的 exp；
+用户信息按用户 ID 单独短期缓存，并发的相同查询合并为一次下游请求。
+中间件直接实现 ASGI 接口，不包装请求体与响应体，流式上传与下载原样透传。
 """
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+import re
+import time
+from typing import Optional
 
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.cache import token_cache_key
 from src.infrastructure.context.token_context import TokenContext, UserContext
 from src.infrastructure.container import get_container
 from src.infrastructure.exceptions import UnauthorizedError
+from src.ports.hydra_port import IntrospectResponse
+from src.ports.user_management_port import UserInfo
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +39,24 @@ PUBLIC_PATHS = [
     "/openapi.json",
 ]
 
+# 不需要认证的 API 路由（相对于 API 前缀的完整路径正则，须整体匹配）
+PUBLIC_ROUTES = [
+    # 应用图标，供 <img> 直接引用并由浏览器和网关缓存
+    r"/applications/\d+/icon",
+]
+
+# 公开路径匹配规则（启动时预编译）：
+# 1. 以公开路径结尾，可带结尾斜杠（如 /healthz、/api/dip-hub/v1/healthz）
+# 2. 以公开路径开头后接子路径或查询串（如 /docs/oauth2-redirect）
+_PUBLIC_PATH_ALTERNATION = "|".join(
+    re.escape(p) for p in sorted(PUBLIC_PATHS, key=len, reverse=True)
+)
+_PUBLIC_PATH_PATTERN = re.compile(
+    rf"(?:{_PUBLIC_PATH_ALTERNATION})/?$|^(?:{_PUBLIC_PATH_ALTERNATION})[/?]"
+)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+class AuthMiddleware:
     """
     认证中间件。
     
@@ -43,6 +68,19 @@ class AuthMiddleware(BaseHTTPMiddleware):
     对于需要认证的路径（如 /applications），如果没有token或token无效，则拒绝访问。
     """
     
+    def __init__(self, app: ASGIApp, api_prefix: str = ""):
+        """
+        初始化认证中间件。
+
+        参数:
+            app: 下游 ASGI 应用
+            api_prefix: API 前缀，PUBLIC_ROUTES 中的路由须位于该前缀下
+        """
+        self.app = app
+        self._public_route_pattern = re.compile(
+            rf"{re.escape(api_prefix)}(?:{'|'.join(PUBLIC_ROUTES)})"
+        )
+
     def _is_public_path(self, path: str) -> bool:
         """
         判断路径是否为公开路径（不需要认证）。
@@ -53,55 +91,129 @@ class AuthMiddleware(BaseHTTPMiddleware):
         返回:
             bool: 如果是公开路径返回True，否则返回False
         """
-        # 检查路径是否以公开路径前缀开头
-        # 支持两种情况：
-        # 1. 直接路径：/healthz, /docs 等
-        # 2. 带API前缀的路径：/api/dip-hub/v1/healthz 等
-        for public_path in PUBLIC_PATHS:
-            # 直接匹配（如 /healthz）
-            if path == public_path:
-                return True
-            # 匹配以公开路径结尾的路径（如 /api/dip-hub/v1/healthz）
-            if path.endswith(public_path) or path.endswith(public_path + "/"):
-                return True
-            # 匹配以公开路径开头的路径（如 /docs, /redoc）
-            if path.startswith(public_path + "/") or path.startswith(public_path + "?"):
-                return True
-        return False
+        return (
+            _PUBLIC_PATH_PATTERN.search(path) is not None
+            or self._public_route_pattern.fullmatch(path) is not None
+        )
+
+    async def _introspect(self, container, token: str) -> IntrospectResponse:
+        """
+        内省 token，优先使用进程内缓存。
+
+        仅缓存有效的内省结果，缓存过期时间取 token 剩余有效期与配置上限中的较小值。
+        同一 token 的并发内省合并为一次 Hydra 请求。
+
+        参数:
+            container: 依赖注入容器
+            token: 访问令牌
+
+        返回:
+            IntrospectResponse: 内省结果
+        """
+        cache_key = token_cache_key(token)
+        cache = container.introspection_cache
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async def _load() -> IntrospectResponse:
+            introspect = await container.hydra_adapter.introspect(token)
+            if cache is not None and introspect.active and introspect.visitor_id:
+                ttl = None
+                if introspect.exp:
+                    ttl = introspect.exp - time.time()
+                cache.set(cache_key, introspect, ttl)
+            return introspect
+
+        return await container.single_flight.do(("introspect", cache_key), _load)
+
+    async def _get_user_info(self, container, user_id: str) -> Optional[UserInfo]:
+        """
+        获取用户信息，优先使用按用户 ID 的进程内缓存。
+
+        同一用户的并发查询合并为一次用户管理服务请求；查询不到的用户不缓存。
+
+        参数:
+            container: 依赖注入容器
+            user_id: 用户 ID
+
+        返回:
+            Optional[UserInfo]: 用户信息，不存在时返回 None
+        """
+        cache = container.user_info_cache
+        if cache is not None:
+            cached = cache.get(user_id)
+            if cached is not None:
+                return cached
+
+        async def _load() -> Optional[UserInfo]:
+            user_infos = await container.user_management_adapter.batch_get_user_info_by_id(
+                [user_id]
+            )
+            user_info = user_infos.get(user_id)
+            if cache is not None and user_info is not None:
+                cache.set(user_id, user_info)
+            return user_info
+
+        return await container.single_flight.do(("user_info", user_id), _load)
     
-    async def dispatch(self, request: Request, call_next):
+    async def _reject(
+        self, scope: Scope, receive: Receive, send: Send, description: str
+    ) -> None:
+        """
+        返回 401 未认证响应。
+
+        参数:
+            scope: ASGI 连接范围
+            receive: ASGI 接收通道
+            send: ASGI 发送通道
+            description: 错误描述
+        """
+        TokenContext.clear_token()
+        error = UnauthorizedError(
+            description=description,
+            solution="请使用有效的token重新登录",
+        )
+        await error.to_response()(scope, receive, send)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         处理请求，提取认证token，进行内省并获取用户信息。
+
+        非 HTTP 连接（如 lifespan）直接透传给下游应用。
         
         参数:
-            request: 请求对象
-            call_next: 下一个中间件或路由处理函数
-        
-        返回:
-            Response: HTTP响应
+            scope: ASGI 连接范围
+            receive: ASGI 接收通道
+            send: ASGI 发送通道
         """
-        # 获取请求路径（去除API前缀）
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         
         # 如果是公开路径，直接放行
         if self._is_public_path(path):
             try:
-                response = await call_next(request)
-                return response
+                await self.app(scope, receive, send)
             finally:
                 # 清除上下文
                 TokenContext.clear_token()
                 UserContext.clear_user_info()
+            return
         
         # 从请求头提取Authorization token
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("Authorization")
         if not auth_header:
             logger.warning(f"请求路径 {path} 需要认证，但未提供token")
             error = UnauthorizedError(
                 description="访问此资源需要认证",
                 solution="请在请求头中提供有效的Authorization token",
             )
-            return error.to_response()
+            await error.to_response()(scope, receive, send)
+            return
         
         # 提取纯token（去除 "Bearer " 前缀）
         if auth_header.startswith("Bearer "):
@@ -116,10 +228,11 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 description="访问此资源需要认证",
                 solution="请在请求头中提供有效的Authorization token",
             )
-            return error.to_response()
+            await error.to_response()(scope, receive, send)
+            return
         
         # 存储完整的Authorization header到request.state中，供路由层使用
-        request.state.auth_token = auth_header
+        scope.setdefault("state", {})["auth_token"] = auth_header
         
         # 存储纯token到TokenContext中，供适配器层统一获取
         TokenContext.set_token(auth_token)
@@ -131,49 +244,35 @@ class AuthMiddleware(BaseHTTPMiddleware):
             container = get_container()
             
             # 内省token获取用户ID（使用纯token）
-            introspect = await container.hydra_adapter.introspect(auth_token)
+            introspect = await self._introspect(container, auth_token)
             if introspect.active and introspect.visitor_id:
                 # 获取用户详细信息
-                user_infos = await container.user_management_adapter.batch_get_user_info_by_id(
-                    [introspect.visitor_id]
-                )
-                if introspect.visitor_id in user_infos:
-                    user_info = user_infos[introspect.visitor_id]
+                user_info = await self._get_user_info(container, introspect.visitor_id)
+                if user_info is not None:
                     logger.debug(f"用户信息已获取: {user_info.id} ({user_info.vision_name})")
                 else:
                     logger.warning(f"无法获取用户信息: {introspect.visitor_id}")
                     # 对于需要认证的路径，如果无法获取用户信息则拒绝访问
-                    error = UnauthorizedError(
-                        description="无法获取用户信息",
-                        solution="请使用有效的token重新登录",
-                    )
-                    return error.to_response()
+                    await self._reject(scope, receive, send, "无法获取用户信息")
+                    return
             else:
                 logger.warning("Token 内省结果：token 无效或无法获取用户ID")
                 # 对于需要认证的路径，如果token无效则拒绝访问
-                error = UnauthorizedError(
-                    description="Token无效或已过期",
-                    solution="请使用有效的token重新登录",
-                )
-                return error.to_response()
+                await self._reject(scope, receive, send, "Token无效或已过期")
+                return
         except Exception as e:
             # 内省失败，对于需要认证的路径则拒绝访问
             logger.error(f"Token 内省失败: {e}", exc_info=True)
-            error = UnauthorizedError(
-                description="Token验证失败",
-                solution="请使用有效的token重新登录",
-            )
-            return error.to_response()
+            await self._reject(scope, receive, send, "Token验证失败")
+            return
         
         # 存储用户信息到UserContext中，供应用层统一获取
         UserContext.set_user_info(user_info)
         
         try:
             # 继续处理请求
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
         finally:
             # 请求处理完成后清除上下文，避免上下文污染
             TokenContext.clear_token()
             UserContext.clear_user_info()
-
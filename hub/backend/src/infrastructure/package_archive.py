@@ -0,0 +1,269 @@
+"""
+应用安装包（ZIP）读取
+
+一次读取 ZIP 中央目录建立成员索引，之后按路径直接读取成员，不解压到磁盘。
+所有方法均为阻塞操作，调用方应在线程池中执行。
+"""
+import hashlib
+import io
+import posixpath
+import zipfile
+from typing import BinaryIO, Dict, List, Optional, Sequence
+
+# 读取成员数据时每次读取的字节数
+_READ_BLOCK_SIZE = 1024 * 1024
+
+
+def normalize_member_name(name: str) -> Optional[str]:
+    """
+    规范化 ZIP 成员名：统一分隔符，去掉盘符、空段、"." 和 ".."
+    （与 zipfile.ZipFile.extractall 的处理一致）。
+
+    参数:
+        name: ZIP 成员名
+
+    返回:
+        Optional[str]: 以 "/" 分隔的相对路径，成员名不含有效路径段时返回 None
+    """
+    name = name.replace("\\", "/")
+    if len(name) >= 2 and name[1] == ":":
+        name = name[2:]
+    parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+    if not parts:
+        return None
+    return "/".join(parts)
+
+
+class ArchiveMemberReader:
+    """
+    ZIP 成员的只读文件对象。
+
+    seek 只记录位置，读取时才定位到解压流，因此上传适配器通过 seek(0, SEEK_END) / tell()
+    获取大小时不会解压整个成员；从头顺序读完时同时得到成员的 SHA-256。
+    """
+
+    def __init__(self, file: BinaryIO, name: str, size: int):
+        self._file = file
+        self.name = name
+        self.size = size
+        self._pos = 0
+        self._sha256 = hashlib.sha256()
+        self._hashed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file.tell() != self._pos:
+            self._file.seek(self._pos)
+        data = self._file.read(size)
+        if self._hashed == self._pos:
+            self._sha256.update(data)
+            self._hashed += len(data)
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._pos = min(max(0, offset), self.size)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seekable(self) -> bool:
+        return True
+
+    @property
+    def sha256(self) -> Optional[str]:
+        """从头顺序读完时返回成员的 SHA-256，否则返回 None。"""
+        if self._hashed != self.size:
+            return None
+        return self._sha256.hexdigest()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveMemberReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PackageArchive:
+    """
+    已建立成员索引的应用安装包。
+
+    路径均为以 "/" 分隔、相对于安装包根目录（root）的成员路径；
+    通过 subdir() 得到以某个目录为根的视图，视图与原安装包共享 ZIP 文件句柄和摘要缓存。
+    多个线程可以同时读取不同成员（zipfile 对共享文件句柄的读取加锁）。
+    """
+
+    def __init__(
+        self,
+        zip_file: zipfile.ZipFile,
+        members: Dict[str, zipfile.ZipInfo],
+        root: str = "",
+        digests: Optional[Dict[str, str]] = None,
+    ):
+        self._zip = zip_file
+        self._members = members
+        self.root = root
+        self._digests = digests if digests is not None else {}
+
+    @classmethod
+    def load(cls, zip_path: str) -> "PackageArchive":
+        """
+        打开安装包并读取中央目录建立成员索引（只索引文件，忽略目录项）。
+
+        参数:
+            zip_path: 安装包路径
+
+        返回:
+            PackageArchive: 安装包
+
+        异常:
+            zipfile.BadZipFile: 安装包不是有效的 ZIP 文件时抛出
+        """
+        zip_file = zipfile.ZipFile(zip_path, "r")
+        members: Dict[str, zipfile.ZipInfo] = {}
+        for info in zip_file.infolist():
+            name = normalize_member_name(info.filename)
+            if name is not None and not info.is_dir():
+                members[name] = info
+        return cls(zip_file, members)
+
+    def close(self) -> None:
+        """关闭 ZIP 文件句柄（已打开的成员读取器关闭后才真正释放）。"""
+        self._zip.close()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def subdir(self, directory: str) -> "PackageArchive":
+        """
+        返回以指定目录为根的视图。
+
+        参数:
+            directory: 相对于当前根目录的目录路径，空字符串表示当前根目录
+
+        返回:
+            PackageArchive: 安装包视图
+        """
+        return PackageArchive(self._zip, self._members, self._path(directory), self._digests)
+
+    def _path(self, path: str) -> str:
+        return posixpath.join(self.root, path) if self.root and path else (path or self.root)
+
+    def _info(self, path: str) -> zipfile.ZipInfo:
+        info = self._members.get(self._path(path))
+        if info is None:
+            raise FileNotFoundError(f"安装包中不存在文件: {path}")
+        return info
+
+    def exists(self, path: str) -> bool:
+        """文件是否存在。"""
+        return self._path(path) in self._members
+
+    def size(self, path: str) -> int:
+        """
+        文件解压后的字节数（取自中央目录，不读取数据）。
+
+        异常:
+            FileNotFoundError: 文件不存在时抛出
+        """
+        return self._info(path).file_size
+
+    def listdir(self, directory: str, suffixes: Sequence[str] = ()) -> List[str]:
+        """
+        列出目录下（不含子目录）的文件名，按文件名排序。
+
+        参数:
+            directory: 目录路径
+            suffixes: 文件扩展名过滤（不区分大小写），为空时不过滤
+
+        返回:
+            List[str]: 文件名列表，目录不存在时返回空列表
+        """
+        base = self._path(directory).rstrip("/")
+        prefix = base + "/" if base else ""
+        names = []
+        for name in self._members:
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            if "/" in rest:
+                continue
+            if suffixes and not rest.lower().endswith(tuple(suffixes)):
+                continue
+            names.append(rest)
+        return sorted(names)
+
+    def find(self, filenames: Sequence[str]) -> Optional[str]:
+        """
+        逐层（广度优先）查找文件：层级最浅者优先，同一层级按目录路径排序，
+        同一目录下按 filenames 顺序优先。
+
+        参数:
+            filenames: 要查找的文件名列表（按优先级排序）
+
+        返回:
+            Optional[str]: 找到的文件路径（相对于根目录），未找到返回 None
+        """
+        prefix = self.root + "/" if self.root else ""
+        best = None
+        for name in self._members:
+            if not name.startswith(prefix):
+                continue
+            parts = name[len(prefix):].split("/")
+            if parts[-1] not in filenames:
+                continue
+            key = (len(parts), parts[:-1], list(filenames).index(parts[-1]))
+            if best is None or key < best[0]:
+                best = (key, "/".join(parts))
+        return best[1] if best else None
+
+    def read(self, path: str) -> bytes:
+        """
+        读取整个文件（用于清单、配置、图标等小文件）。
+
+        异常:
+            FileNotFoundError: 文件不存在时抛出
+        """
+        return self._zip.read(self._info(path))
+
+    def read_text(self, path: str) -> str:
+        """读取 UTF-8 文本文件。"""
+        return self.read(path).decode("utf-8")
+
+    def open(self, path: str) -> ArchiveMemberReader:
+        """
+        打开文件用于流式读取。
+
+        异常:
+            FileNotFoundError: 文件不存在时抛出
+        """
+        info = self._info(path)
+        return ArchiveMemberReader(self._zip.open(info), info.filename, info.file_size)
+
+    def sha256(self, path: str) -> str:
+        """
+        计算文件 SHA-256（流式读取，不落盘），结果按成员缓存。
+
+        异常:
+            FileNotFoundError: 文件不存在时抛出
+        """
+        cached = self._digests.get(self._path(path))
+        if cached is not None:
+            return cached
+        digest = hashlib.sha256()
+        with self._zip.open(self._info(path)) as f:
+            for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+                digest.update(block)
+        return self.remember_sha256(path, digest.hexdigest())
+
+    def remember_sha256(self, path: str, digest: str) -> str:
+        """记录读取过程中得到的文件 SHA-256，供后续 sha256() 直接使用。"""
+        self._digests[self._path(path)] = digest
+        return digest
@@ -69,6 +69,9 @@ def create_app(settings: Settings = None) -> FastAPI:
             # 这里选择继续启动，但记录错误
             logger.warning("服务将在数据库表可能不完整的情况下启动")
 
+        # 预热数据库连接池并启动后台任务（应用目录缓存失效订阅等）
+        await container.start()
+
         # 初始化完成后标记服务为就绪状态
         container.set_ready(True)
         logger.info("服务已准备好接受请求")
@@ -95,7 +98,7 @@ def create_app(settings: Settings = None) -> FastAPI:
     )
     
     # 添加认证中间件（最先添加，确保token在请求处理前被提取）
-    app.add_middleware(AuthMiddleware)
+    app.add_middleware(AuthMiddleware, api_prefix=settings.api_prefix)
     
     # 添加 CORS 中间件
     app.add_middleware(
@@ -104,6 +107,7 @@ def create_app(settings: Settings = None) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
     
     # 注册全局异常处理器
@@ -140,7 +144,9 @@ def create_app(settings: Settings = None) -> FastAPI:
     health_router = create_health_router(container.health_service)
     app.include_router(health_router, prefix=settings.api_prefix)
 
-    application_router = create_application_router(container.application_service)
+    application_router = create_application_router(
+        container.application_service, container.install_job_service, container.upload_service
+    )
     app.include_router(application_router, prefix=settings.api_prefix)
 
     login_router = create_login_router(container.login_service, settings)
@@ -163,7 +169,15 @@ app = create_app()
 
 
 def main():
-    """使用 uvicorn 运行应用程序。"""
+    """
+    使用 uvicorn 运行应用程序。
+
+    第一个命令行参数为 worker 时改为运行安装 worker（dip-hub worker）。
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        from src.worker import main as worker_main
+        return worker_main()
+
     settings = get_settings()
     
     uvicorn.run(
@@ -0,0 +1,53 @@
+"""
+应用制品端口
+
+定义已推送制品记录持久化操作的抽象接口。
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domains.artifact import ApplicationArtifact
+
+
+class ApplicationArtifactPort(ABC):
+    """
+    应用制品端口接口。
+
+    按应用记录已成功推送到 Deploy Installer 的镜像和 Chart 的内容摘要。
+    """
+
+    @abstractmethod
+    async def list_artifacts(self, app_key: str) -> List[ApplicationArtifact]:
+        """
+        获取应用已推送的制品记录。
+
+        参数:
+            app_key: 应用唯一标识
+
+        返回:
+            List[ApplicationArtifact]: 制品记录列表
+        """
+        pass
+
+    @abstractmethod
+    async def save_artifact(self, artifact: ApplicationArtifact) -> None:
+        """
+        保存制品推送记录，同一应用同类型同摘要的记录已存在时覆盖。
+
+        参数:
+            artifact: 制品记录
+        """
+        pass
+
+    @abstractmethod
+    async def delete_artifacts(self, app_key: str) -> int:
+        """
+        删除应用的全部制品记录。
+
+        参数:
+            app_key: 应用唯一标识
+
+        返回:
+            int: 删除的记录数
+        """
+        pass
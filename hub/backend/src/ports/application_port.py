@@ -7,7 +7,10 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from src.domains.application import Application, OntologyConfigItem, AgentConfigItem
+from src.domains.application import (
+    Application, ApplicationChangeCursor, ApplicationChanges, ApplicationCursor, ApplicationPage,
+    OntologyConfigItem, AgentConfigItem,
+)
 
 
 class ApplicationPort(ABC):
@@ -27,6 +30,58 @@ class ApplicationPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_applications(
+        self,
+        limit: int,
+        cursor: Optional[ApplicationCursor] = None,
+        category: Optional[str] = None,
+        business_domain: Optional[str] = None,
+    ) -> ApplicationPage:
+        """
+        分页获取应用列表（按更新时间、ID 倒序的键集分页）。
+
+        参数:
+            limit: 每页条数
+            cursor: 上一页返回的游标，为 None 时从第一页开始
+            category: 按应用分组过滤
+            business_domain: 按业务域过滤
+
+        返回:
+            ApplicationPage: 当前页应用列表及下一页游标
+        """
+        pass
+
+    @abstractmethod
+    async def list_application_changes(
+        self,
+        since: ApplicationChangeCursor,
+        limit: int,
+    ) -> ApplicationChanges:
+        """
+        获取游标之后的应用目录增量变更（新增/更新的应用及删除记录）。
+
+        参数:
+            since: 上次同步返回的游标
+            limit: 新增/更新应用和删除记录各自的最大条数
+
+        返回:
+            ApplicationChanges: 增量变更及下次同步使用的游标
+        """
+        pass
+
+    @abstractmethod
+    async def get_catalog_version(self) -> int:
+        """
+        获取应用目录版本号。
+
+        每次创建、更新、配置或删除应用后版本号递增，用于生成 HTTP 缓存校验值。
+
+        返回:
+            int: 当前目录版本号
+        """
+        pass
+
     @abstractmethod
     async def get_application_by_key(self, key: str) -> Application:
         """
@@ -72,6 +127,22 @@ class ApplicationPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_application_icon(self, app_id: int) -> Optional[bytes]:
+        """
+        根据应用主键 ID 获取应用图标原始数据。
+
+        参数:
+            app_id: 应用主键 ID
+
+        返回:
+            Optional[bytes]: 图标二进制数据，应用没有图标时返回 None
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        pass
+
     @abstractmethod
     async def create_application(self, application: Application) -> Application:
         """
@@ -131,6 +202,49 @@ class ApplicationPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upsert_application(
+        self, application: Application, expected_version: Optional[str] = None
+    ) -> Application:
+        """
+        按 key 创建或覆盖应用（单条语句完成，无需先查询是否存在）。
+
+        仅当库中该 key 的当前状态与 expected_version 一致时写入：
+        expected_version 为 None 表示应用应不存在，否则表示已安装版本应仍为该值。
+        用于防止多个安装任务基于过期的校验结果互相覆盖。
+
+        参数:
+            application: 应用实体
+            expected_version: 校验时看到的已安装版本，None 表示校验时应用不存在
+
+        返回:
+            Application: 写入后的应用实体（包含应用 ID）
+
+        异常:
+            ValueError: 当应用已被其他写操作创建或修改时抛出
+        """
+        pass
+
+    @abstractmethod
+    async def mark_application_configured(
+        self, app_id: int, updated_by: str, updated_by_id: str = ""
+    ) -> Application:
+        """
+        将应用及其全部业务知识网络、智能体配置项标记为已配置（is_config = True）。
+
+        参数:
+            app_id: 应用主键 ID
+            updated_by: 更新者用户显示名称
+            updated_by_id: 更新者用户ID
+
+        返回:
+            Application: 更新后的应用实体
+
+        异常:
+            ValueError: 当应用不存在时抛出
+        """
+        pass
+
     @abstractmethod
     async def delete_application(self, key: str) -> bool:
         """
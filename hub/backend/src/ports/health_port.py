@@ -46,3 +46,13 @@ class HealthCheckPort(ABC):
             Dict[str, Any]: 服务信息，包括版本、名称等。
         """
         pass
+
+    @abstractmethod
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        获取运行指标。
+
+        返回:
+            Dict[str, Any]: 运行指标，按组件分组。
+        """
+        pass
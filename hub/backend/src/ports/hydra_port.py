@@ -14,6 +14,7 @@ class IntrospectResponse:
     active: bool
     visitor_id: Optional[str] = None
     visitor_typ: Optional[str] = None
+    exp: Optional[int] = None  # Token 过期时间（Unix 时间戳，秒）
 
 
 class HydraPort(ABC):
@@ -0,0 +1,105 @@
+"""
+安装任务端口
+
+定义安装任务持久化操作的抽象接口。
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from src.domains.install_job import InstallJob
+
+
+class InstallJobPort(ABC):
+    """
+    安装任务端口接口。
+
+    任务状态持久化后，任意服务实例都能查询进度，进程重启后状态也不会丢失。
+    """
+
+    @abstractmethod
+    async def create_job(self, job: InstallJob) -> InstallJob:
+        """
+        创建安装任务。
+
+        参数:
+            job: 安装任务
+
+        返回:
+            InstallJob: 创建后的安装任务
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> InstallJob:
+        """
+        根据任务 ID 获取安装任务。
+
+        参数:
+            job_id: 任务 ID
+
+        返回:
+            InstallJob: 安装任务
+
+        异常:
+            ValueError: 当任务不存在时抛出
+        """
+        pass
+
+    @abstractmethod
+    async def claim_job(self, job_id: str, stale_before: Optional[datetime] = None) -> bool:
+        """
+        将等待中的任务原子地置为执行中，保证同一任务只被执行一次。
+
+        参数:
+            job_id: 任务 ID
+            stale_before: 提供时，更新时间早于该时间的执行中任务（执行方已退出）也可以被重新认领
+
+        返回:
+            bool: 是否认领成功（任务已被认领或不存在时返回 False）
+        """
+        pass
+
+    @abstractmethod
+    async def update_progress(self, job: InstallJob) -> None:
+        """
+        保存执行中任务的阶段、上传进度和应用标识，同时刷新更新时间（作为心跳）。
+
+        参数:
+            job: 安装任务
+        """
+        pass
+
+    @abstractmethod
+    async def finish_job(self, job: InstallJob) -> None:
+        """
+        保存任务的最终状态、进度和结果。
+
+        参数:
+            job: 安装任务
+        """
+        pass
+
+    @abstractmethod
+    async def touch_jobs(self, job_ids: List[str]) -> None:
+        """
+        刷新等待中任务的更新时间（心跳），表示持有任务的进程仍然存活。
+
+        参数:
+            job_ids: 任务 ID 列表
+        """
+        pass
+
+    @abstractmethod
+    async def fail_stale_jobs(self, stale_before: datetime, error: str) -> int:
+        """
+        将更新时间早于 stale_before 的未结束任务置为失败（持有任务的进程已退出）。
+
+        参数:
+            stale_before: 判定为中断的更新时间上限
+            error: 失败原因
+
+        返回:
+            int: 置为失败的任务数
+        """
+        pass
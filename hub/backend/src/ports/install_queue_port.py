@@ -0,0 +1,88 @@
+"""
+安装队列端口
+
+定义 API 服务与安装 worker 之间传递安装任务的队列抽象接口。
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domains.install_job import QueuedInstall
+
+
+class InstallQueuePort(ABC):
+    """
+    安装队列端口接口。
+
+    消息投递给某个 worker 后，在确认（ack）之前一直归该 worker 所有；
+    worker 退出导致消息长时间无心跳时，其他 worker 可以接管并重试。
+    """
+
+    @abstractmethod
+    async def enqueue(self, job_id: str) -> str:
+        """
+        投递安装任务（消息只包含任务 ID，不包含提交者的认证 Token）。
+
+        参数:
+            job_id: 安装任务 ID
+
+        返回:
+            str: 队列消息 ID
+        """
+        pass
+
+    @abstractmethod
+    async def consume(self, consumer: str, count: int, block_ms: int) -> List[QueuedInstall]:
+        """
+        读取尚未投递过的安装任务。
+
+        参数:
+            consumer: 消费者（worker）名称
+            count: 最多读取条数
+            block_ms: 队列为空时最长等待时间（毫秒）
+
+        返回:
+            List[QueuedInstall]: 投递给该消费者的安装任务
+        """
+        pass
+
+    @abstractmethod
+    async def claim_abandoned(
+        self, consumer: str, min_idle: float, count: int
+    ) -> List[QueuedInstall]:
+        """
+        接管超过 min_idle 秒没有心跳的已投递任务（原 worker 已退出）。
+
+        参数:
+            consumer: 消费者（worker）名称
+            min_idle: 判定为遗弃的无心跳时间（秒）
+            count: 最多接管条数
+
+        返回:
+            List[QueuedInstall]: 接管的安装任务，deliveries 为累计投递次数
+        """
+        pass
+
+    @abstractmethod
+    async def touch(self, consumer: str, entry_ids: List[str]) -> None:
+        """
+        刷新执行中任务消息的心跳，避免被其他 worker 接管。
+
+        参数:
+            consumer: 消费者（worker）名称
+            entry_ids: 队列消息 ID 列表
+        """
+        pass
+
+    @abstractmethod
+    async def ack(self, entry_id: str) -> None:
+        """
+        确认任务已处理完成，并从队列中删除消息。
+
+        参数:
+            entry_id: 队列消息 ID
+        """
+        pass
+
+    async def close(self) -> None:
+        """关闭队列连接。"""
+        pass
@@ -28,6 +28,14 @@ class RefreshTokenResponse:
     expires_in: Optional[int] = None
 
 
+@dataclass
+class ClientCredentialsResponse:
+    """OAuth2 客户端凭据模式 Token 响应"""
+    access_token: str
+    token_type: str = "Bearer"
+    expires_in: Optional[int] = None
+
+
 class OAuth2Port(ABC):
     """
     OAuth2 端口接口。
@@ -81,3 +89,18 @@ class OAuth2Port(ABC):
         """
         pass
 
+    @abstractmethod
+    async def client_credentials_token(self, scope: str = "") -> ClientCredentialsResponse:
+        """
+        以本服务的客户端凭据获取访问令牌（client_credentials 模式），供后台任务调用外部服务。
+
+        参数:
+            scope: 申请的权限范围，为空时不指定
+
+        返回:
+            ClientCredentialsResponse: Token 响应
+
+        异常:
+            Exception: 当获取失败时抛出
+        """
+        pass
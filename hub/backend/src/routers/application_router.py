@@ -4,36 +4,363 @@
 应用管理端点的 FastAPI 路由。
 这是处理 HTTP 请求并委托给应用层的接口适配器。
 """
-import io
+import hashlib
 import logging
-from fastapi import APIRouter, Query, Path, Request, status
+import re
+from typing import List, Optional
+
+from fastapi import APIRouter, Path, Query, Request, status
 from fastapi.responses import Response
-from typing import List
 
 from src.application.application_service import ApplicationService
+from src.application.install_job_service import InstallJobService, install_error_code
+from src.application.upload_service import PackageUploadService
+from src.domains.upload import (
+    UploadBusyError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+)
 from src.infrastructure.context.token_context import get_user_info
 from src.infrastructure.exceptions import (
-    ValidationError, NotFoundError, ConflictError, InternalError, UnauthorizedError
+    ConflictError,
+    InternalError,
+    NotFoundError,
+    UnauthorizedError,
+    ValidationError,
 )
+from src.infrastructure.json_codec import FastJSONResponse
 from src.routers.schemas.application import (
-    ApplicationResponse,
+    AgentConfigItemResponse,
     ApplicationBasicInfoResponse,
+    ApplicationChangesResponse,
+    ApplicationResponse,
+    ErrorResponse,
+    InstallJobResponse,
     MicroAppResponse,
     OntologyConfigItemResponse,
-    AgentConfigItemResponse,
+    PlanItemResponse,
     ReleaseConfigItemResponse,
-    ErrorResponse,
+    UpgradePlanResponse,
+    UploadSessionCreateRequest,
+    UploadSessionResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# 应用列表下一页游标响应头
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 图标地址的版本参数与应用当前更新时间一致时，内容变化时地址随之变化，因此可以长期缓存
+_ICON_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 图标地址不带版本参数或版本不是当前版本时，同一地址的内容会随重新安装变化，
+# 每次使用前须携带 If-None-Match 重新校验
+_ICON_REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# 目录读接口允许客户端缓存，但每次使用前须携带 If-None-Match 重新校验
+_CATALOG_CACHE_CONTROL = "private, no-cache"
+
+# 断点续传分片的 SHA-256 请求头
+CHUNK_SHA256_HEADER = "X-Chunk-SHA256"
+
+# 分片范围请求头格式：bytes <start>-<end>/<total>
+_CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+def _detect_icon_media_type(data: bytes) -> str:
+    """
+    根据文件头识别图标的媒体类型。
+
+    参数:
+        data: 图标二进制数据
+
+    返回:
+        str: 媒体类型，无法识别时返回 application/octet-stream
+    """
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if data.startswith(b"\x00\x00\x01\x00"):
+        return "image/x-icon"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    head = data[:512].lstrip().lower()
+    if head.startswith(b"<svg") or (head.startswith(b"<?xml") and b"<svg" in head):
+        return "image/svg+xml"
+    return "application/octet-stream"
+
+
+def _icon_version(app) -> Optional[str]:
+    """
+    生成图标地址的版本参数（应用更新时间的秒级时间戳）。
+
+    参数:
+        app: 应用领域模型
+
+    返回:
+        Optional[str]: 版本参数，应用没有更新时间时返回 None
+    """
+    if app.updated_at is None:
+        return None
+    return str(int(app.updated_at.timestamp()))
+
+
+def _icon_url(request: Request, app) -> Optional[str]:
+    """
+    生成应用图标地址。
+
+    参数:
+        request: 请求对象
+        app: 应用领域模型
+
+    返回:
+        Optional[str]: 图标地址，应用没有图标时返回 None
+    """
+    if not app.has_icon():
+        return None
+    url = str(request.app.url_path_for("get_application_icon", id=str(app.id)))
+    version = _icon_version(app)
+    if version is not None:
+        url += f"?v={version}"
+    return url
+
 
-def create_application_router(application_service: ApplicationService) -> APIRouter:
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    判断请求的 If-None-Match 是否与 ETag 匹配（弱比较）。
+
+    参数:
+        request: 请求对象
+        etag: 当前资源的 ETag
+
+    返回:
+        bool: 是否匹配
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _catalog_etag(version: int) -> str:
+    """
+    根据应用目录版本号生成弱 ETag。
+
+    参数:
+        version: 应用目录版本号
+
+    返回:
+        str: 弱 ETag
+    """
+    return f'W/"catalog-{version}"'
+
+
+def _not_modified(etag: str) -> Response:
+    """生成目录读接口的 304 响应。"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": _CATALOG_CACHE_CONTROL},
+    )
+
+
+def _json_with_etag(request: Request, content) -> Response:
+    """
+    序列化响应内容并按内容摘要生成 ETag，If-None-Match 命中时返回 304。
+
+    用于内容来自外部服务、无法由目录版本号判断是否变化的接口。
+
+    参数:
+        request: 请求对象
+        content: 可 JSON 序列化的响应内容
+
+    返回:
+        Response: JSON 响应或 304 响应
+    """
+    response = FastJSONResponse(content=content)
+    etag = f'W/"{hashlib.sha256(response.body).hexdigest()[:32]}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CATALOG_CACHE_CONTROL
+    return response
+
+
+def _application_to_dict(app, request: Request) -> dict:
+    """
+    将应用领域模型直接转换为可 JSON 序列化的字典（字段与 ApplicationResponse 一致）。
+
+    用于列表等高频读接口，配合 FastJSONResponse 跳过响应模型的构造与二次校验。
+
+    参数:
+        app: 应用领域模型
+        request: 请求对象
+
+    返回:
+        dict: 应用响应字典
+    """
+    micro_app = app.micro_app
+    return {
+        "id": app.id,
+        "key": app.key,
+        "name": app.name,
+        "description": app.description,
+        "icon": app.icon,
+        "icon_url": _icon_url(request, app),
+        "category": app.category,
+        "version": app.version,
+        "micro_app": None if micro_app is None else {
+            "name": micro_app.name,
+            "entry": micro_app.entry,
+            "headless": micro_app.headless,
+        },
+        "release_config": [
+            {"name": item.name, "namespace": item.namespace}
+            for item in (app.release_config or [])
+        ],
+        "ontology_config": [
+            {"id": item.id, "is_config": item.is_config}
+            for item in (app.ontology_config or [])
+        ],
+        "agent_config": [
+            {"id": item.id, "is_config": item.is_config}
+            for item in (app.agent_config or [])
+        ],
+        "is_config": app.is_config,
+        "updated_by": app.updated_by,
+        "updated_by_id": app.updated_by_id,
+        "updated_at": app.updated_at,
+    }
+
+
+def _install_job_to_response(job) -> InstallJobResponse:
+    """将安装任务领域模型转换为响应模型。"""
+    return InstallJobResponse(
+        id=job.id,
+        status=job.status.value,
+        stage=job.stage.value,
+        package_size=job.package_size,
+        bytes_total=job.bytes_total,
+        bytes_uploaded=job.bytes_uploaded,
+        application_id=job.application_id,
+        application_key=job.application_key,
+        error_code=job.error_code,
+        error=job.error,
+        updated_by=job.updated_by,
+        updated_by_id=job.updated_by_id,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
+    )
+
+
+def _upload_session_to_response(session) -> UploadSessionResponse:
+    """将上传会话领域模型转换为响应模型。"""
+    return UploadSessionResponse(
+        id=session.id,
+        size=session.size,
+        offset=session.offset,
+        created_at=session.created_at,
+        expires_at=session.expires_at,
+    )
+
+
+def _upgrade_plan_to_response(plan) -> UpgradePlanResponse:
+    """将升级计划领域模型转换为响应模型。"""
+    return UpgradePlanResponse(
+        key=plan.key,
+        name=plan.name,
+        version=plan.version,
+        installed_version=plan.installed_version,
+        items=[
+            PlanItemResponse(
+                kind=item.kind.value,
+                source=item.source,
+                action=item.action.value,
+                target_id=item.target_id,
+            )
+            for item in plan.items
+        ],
+    )
+
+
+def _parse_content_range(value: Optional[str]) -> tuple:
+    """
+    解析分片的 Content-Range 请求头。
+
+    参数:
+        value: 请求头值，格式为 bytes <start>-<end>/<total>
+
+    返回:
+        tuple: (起始位置, 分片字节数, 安装包总字节数)
+
+    异常:
+        ValidationError: 请求头缺失或格式无效时抛出
+    """
+    match = _CONTENT_RANGE_PATTERN.match((value or "").strip())
+    if not match or int(match.group(2)) < int(match.group(1)):
+        raise ValidationError(
+            code="INVALID_CONTENT_RANGE",
+            description="Content-Range 请求头缺失或格式无效",
+            solution="请使用 bytes <start>-<end>/<total> 格式声明分片范围（end 含本字节）",
+        )
+    start, end, total = (int(group) for group in match.groups())
+    return start, end - start + 1, total
+
+
+def _current_user():
+    """
+    获取当前用户信息（由中间件通过 token 内省获取）。
+
+    异常:
+        UnauthorizedError: 无法获取用户信息时抛出
+    """
+    user_info = get_user_info()
+    if not user_info:
+        raise UnauthorizedError(
+            description="无法获取用户信息",
+            solution="请使用有效的token重新登录",
+        )
+    return user_info
+
+
+def _upload_error(e: ValueError):
+    """将上传服务的异常转换为业务异常。"""
+    if isinstance(e, UploadSessionNotFoundError):
+        return NotFoundError(
+            code="UPLOAD_NOT_FOUND", description=str(e), solution="请重新创建上传会话"
+        )
+    if isinstance(e, UploadOffsetMismatchError):
+        return ConflictError(
+            code="UPLOAD_OFFSET_MISMATCH",
+            description=str(e),
+            solution="请查询上传会话，从 detail.offset 处继续上传",
+            detail={"offset": e.offset},
+        )
+    if isinstance(e, UploadBusyError):
+        return ConflictError(
+            code="UPLOAD_BUSY", description=str(e), solution="请等待当前请求结束后重试"
+        )
+    return ValidationError(code="INVALID_UPLOAD", description=str(e))
+
+
+def create_application_router(
+    application_service: ApplicationService,
+    install_job_service: InstallJobService,
+    upload_service: PackageUploadService,
+) -> APIRouter:
     """
     创建应用路由。
 
     参数:
         application_service: 应用服务实例
+        install_job_service: 安装任务服务实例
+        upload_service: 安装包断点续传上传服务实例
 
     返回:
         APIRouter: 配置完成的路由
@@ -50,7 +377,7 @@ def create_application_router(application_service: ApplicationService) -> APIRou
             headless=micro_app.headless,
         )
 
-    def _application_to_response(app) -> ApplicationResponse:
+    def _application_to_response(app, request: Request) -> ApplicationResponse:
         """将应用领域模型转换为响应模型。"""
         return ApplicationResponse(
             id=app.id,
@@ -58,6 +385,7 @@ def create_application_router(application_service: ApplicationService) -> APIRou
             name=app.name,
             description=app.description,
             icon=app.icon,
+            icon_url=_icon_url(request, app),
             category=app.category,
             version=app.version,
             micro_app=_micro_app_to_response(app.micro_app),
@@ -83,40 +411,33 @@ def create_application_router(application_service: ApplicationService) -> APIRou
     @router.post(
         "/applications",
         summary="安装应用",
-        description="上传 zip 格式安装包进行安装（流式上传）",
-        response_model=ApplicationResponse,
+        description="上传 zip 格式安装包（流式上传），安装包接收完成后返回安装任务，安装在后台执行",
+        response_model=InstallJobResponse,
+        status_code=status.HTTP_202_ACCEPTED,
         responses={
-            200: {"description": "安装成功"},
+            202: {"description": "安装包已接收，安装任务已提交"},
             400: {"description": "请求参数错误", "model": ErrorResponse},
-            409: {"description": "版本冲突", "model": ErrorResponse},
             500: {"description": "服务器内部错误", "model": ErrorResponse},
         }
     )
-    async def install_application(request: Request) -> ApplicationResponse:
+    async def install_application(request: Request, response: Response) -> InstallJobResponse:
         """
         安装应用。
 
-        接收 zip 格式安装包（流式上传），解析并安装应用。
-
-        流程：
-        1. 上传 zip 格式安装包（流式上传）
-        2. 校验应用安装包结构和 manifest.yaml
-        3. 解析 application.key，校验 version
-        4. 如果应用已存在，版本号必须大于已上传版本
-        5. 解压安装包，上传镜像和 Chart
-        6. 导入业务知识网络和 DataAgent 智能体
-        7. 更新应用信息
+        接收 zip 格式安装包（流式上传），请求体逐块写入临时目录，不在内存中整体缓存。
+        安装包落盘后立即返回 202 和安装任务，Location 响应头为任务查询地址；
+        校验、上传镜像和 Chart、导入配置等步骤在后台执行，结果通过安装任务查询。
 
         返回:
-            ApplicationResponse: 安装后的应用信息
+            InstallJobResponse: 已提交的安装任务
         """
         try:
             logger.info("[install_application] 收到应用安装请求")
-            # 读取请求体（流式上传的 zip 数据）
-            body = await request.body()
-            logger.info(f"[install_application] 请求体大小: {len(body)} bytes")
+            # 请求体按数据块流式传给应用服务，长度以 Content-Length 为准（分块传输时未知）
+            content_length = request.headers.get("content-length")
+            logger.info(f"[install_application] 请求体大小: {content_length or '未知'} bytes")
             
-            if not body:
+            if content_length == "0":
                 logger.error("[install_application] 请求体为空")
                 raise ValidationError(
                     code="INVALID_REQUEST",
@@ -135,77 +456,456 @@ def create_application_router(application_service: ApplicationService) -> APIRou
             updated_by = user_info.vision_name
             updated_by_id = user_info.id
             logger.info(f"[install_application] 更新者: {updated_by} (ID: {updated_by_id})")
-            # 认证 Token 已由中间件统一提取并存储到 request.state 和 TokenContext
-            # 适配器层会从 TokenContext 统一获取，这里可以不再传递
+            # 后台任务在请求结束后执行，认证 Token 需显式传给任务
             auth_token = getattr(request.state, "auth_token", None)
             logger.debug(f"[install_application] 认证 Token: {'已提供' if auth_token else '未提供'}")
             
-            # 调用服务安装应用
-            logger.info("[install_application] 开始调用应用服务安装应用")
-            zip_data = io.BytesIO(body)
-            application = await application_service.install_application(
-                zip_data=zip_data,
+            job = await install_job_service.submit_install(
+                request.stream(),
                 updated_by=updated_by,
                 updated_by_id=updated_by_id,
-                auth_token=auth_token,  # 保留参数以保持兼容性
+                auth_token=auth_token,
             )
-            
-            logger.info(f"[install_application] 应用安装成功: key={application.key}, id={application.id}")
-            return _application_to_response(application)
+            logger.info(f"[install_application] 安装任务已提交: job={job.id}")
+            response.headers["Location"] = str(
+                request.app.url_path_for("get_install_job", id=job.id)
+            )
+            return _install_job_to_response(job)
         
-        except (ValidationError, ConflictError, InternalError):
-            # 重新抛出业务异常
+        except (ValidationError, UnauthorizedError):
             raise
         except ValueError as e:
             error_msg = str(e)
-            logger.error(f"[install_application] 应用安装失败 (ValueError): {error_msg}", exc_info=True)
-            if "版本" in error_msg:
+            logger.error(f"[install_application] 接收安装包失败: {error_msg}")
+            raise ValidationError(
+                code="INVALID_PACKAGE",
+                description=error_msg,
+                solution="请检查应用安装包格式是否正确",
+            )
+        except Exception as e:
+            logger.error(f"[install_application] 提交安装任务失败 (未预期错误): {e}", exc_info=True)
+            raise InternalError(
+                description=f"应用安装失败: {str(e)}",
+                solution="请稍后重试或联系管理员",
+            )
+
+    # ============ 1.1、查询安装任务 ============
+    @router.get(
+        "/applications/jobs/{id}",
+        summary="查询安装任务",
+        description="查询安装任务的状态、当前阶段、上传进度和失败原因",
+        response_model=InstallJobResponse,
+        responses={
+            200: {"description": "获取安装任务成功"},
+            404: {"description": "安装任务不存在", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def get_install_job(
+        id: str = Path(..., description="安装任务 ID"),
+    ) -> InstallJobResponse:
+        """
+        查询安装任务。
+
+        参数:
+            id: 安装任务 ID
+
+        返回:
+            InstallJobResponse: 安装任务
+        """
+        try:
+            job = await install_job_service.get_job(id)
+            return _install_job_to_response(job)
+        except ValueError as e:
+            raise NotFoundError(description=str(e))
+        except Exception as e:
+            logger.exception(f"查询安装任务失败: {e}")
+            raise InternalError(description=f"查询安装任务失败: {str(e)}")
+
+    # ============ 1.2、预演安装 ============
+    @router.post(
+        "/applications/plan",
+        summary="预演安装",
+        description=(
+            "上传 zip 格式安装包（流式上传），返回与已安装版本对比得到的安装计划，不执行安装"
+        ),
+        response_model=UpgradePlanResponse,
+        responses={
+            200: {"description": "生成安装计划成功"},
+            400: {"description": "安装包格式错误", "model": ErrorResponse},
+            409: {"description": "版本冲突", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def plan_install(request: Request) -> UpgradePlanResponse:
+        """
+        预演安装。
+
+        解析安装包并与已安装版本对比，返回需要安装的 Release、需要新建或更新的业务知识网络和智能体；
+        不上传制品、不调用外部服务，也不修改应用记录。
+
+        返回:
+            UpgradePlanResponse: 安装计划
+        """
+        _current_user()
+        if request.headers.get("content-length") == "0":
+            raise ValidationError(
+                code="INVALID_REQUEST",
+                description="请求体不能为空",
+                solution="请上传有效的应用安装包（ZIP格式）",
+            )
+        try:
+            plan = await application_service.plan_install(request.stream())
+        except ValueError as e:
+            if install_error_code(e) == "VERSION_CONFLICT":
                 raise ConflictError(
                     code="VERSION_CONFLICT",
-                    description=error_msg,
-                    solution="请使用更高版本的应用包或先卸载现有应用",
+                    description=str(e),
+                    solution="请更新安装包版本号",
                 )
             raise ValidationError(
                 code="INVALID_PACKAGE",
-                description=error_msg,
+                description=str(e),
                 solution="请检查应用安装包格式是否正确",
             )
         except Exception as e:
-            logger.error(f"[install_application] 应用安装失败 (未预期错误): {e}", exc_info=True)
+            logger.error(f"[plan_install] 生成安装计划失败 (未预期错误): {e}", exc_info=True)
             raise InternalError(
-                description=f"应用安装失败: {str(e)}",
+                description=f"生成安装计划失败: {str(e)}",
                 solution="请稍后重试或联系管理员",
             )
+        return _upgrade_plan_to_response(plan)
+
+    # ============ 1.3、断点续传上传安装包 ============
+    @router.post(
+        "/applications/uploads",
+        summary="创建上传会话",
+        description="创建安装包断点续传上传会话，之后按顺序上传分片，全部接收后提交安装",
+        response_model=UploadSessionResponse,
+        status_code=status.HTTP_201_CREATED,
+        responses={
+            201: {"description": "上传会话已创建"},
+            400: {"description": "请求参数错误", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def create_upload(
+        body: UploadSessionCreateRequest, request: Request, response: Response
+    ) -> UploadSessionResponse:
+        """
+        创建上传会话。
+
+        返回:
+            UploadSessionResponse: 上传会话，Location 响应头为会话地址
+        """
+        user_info = _current_user()
+        try:
+            session = await upload_service.create_session(
+                body.size, created_by_id=user_info.id, sha256=body.sha256
+            )
+        except ValueError as e:
+            raise ValidationError(code="INVALID_UPLOAD", description=str(e))
+        except Exception as e:
+            logger.exception(f"创建上传会话失败: {e}")
+            raise InternalError(description=f"创建上传会话失败: {str(e)}")
+        response.headers["Location"] = str(request.app.url_path_for("get_upload", id=session.id))
+        return _upload_session_to_response(session)
+
+    @router.put(
+        "/applications/uploads/{id}",
+        summary="上传分片",
+        description="上传一个分片，Content-Range 声明分片范围，X-Chunk-SHA256 为分片 SHA-256；"
+                    "分片起始位置须等于已接收字节数，数据不完整或校验失败时整片丢弃",
+        response_model=UploadSessionResponse,
+        responses={
+            200: {"description": "分片已接收"},
+            400: {"description": "分片范围、长度或校验和无效", "model": ErrorResponse},
+            404: {"description": "上传会话不存在或已过期", "model": ErrorResponse},
+            409: {
+                "description": "分片起始位置与已接收字节数不一致，或会话正在写入",
+                "model": ErrorResponse,
+            },
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def upload_chunk(
+        request: Request,
+        id: str = Path(..., description="上传会话 ID"),
+    ) -> UploadSessionResponse:
+        """
+        上传分片。
+
+        请求体逐块追加写入会话文件，不在内存中整体缓存。
+
+        参数:
+            id: 上传会话 ID
+
+        返回:
+            UploadSessionResponse: 写入后的上传会话
+        """
+        user_info = _current_user()
+        start, length, total = _parse_content_range(request.headers.get("content-range"))
+        checksum = request.headers.get(CHUNK_SHA256_HEADER)
+        if not checksum:
+            raise ValidationError(
+                code="INVALID_CHECKSUM",
+                description=f"缺少 {CHUNK_SHA256_HEADER} 请求头",
+                solution="请提供分片数据的 SHA-256 十六进制摘要",
+            )
+        try:
+            session = await upload_service.get_session(id, user_info.id)
+            if total != session.size:
+                raise ValueError(
+                    f"Content-Range 声明的总大小 {total} 与上传会话大小 {session.size} 不一致"
+                )
+            session = await upload_service.write_chunk(
+                id, start, length, checksum, request.stream(), created_by_id=user_info.id
+            )
+        except ValueError as e:
+            logger.warning(f"[upload_chunk] 分片上传失败: {id}, {e}")
+            raise _upload_error(e)
+        except Exception as e:
+            logger.exception(f"上传分片失败: {e}")
+            raise InternalError(description=f"上传分片失败: {str(e)}")
+        return _upload_session_to_response(session)
+
+    @router.get(
+        "/applications/uploads/{id}",
+        summary="查询上传会话",
+        description="查询上传会话已接收的字节数，中断后从该位置继续上传",
+        response_model=UploadSessionResponse,
+        responses={
+            200: {"description": "获取上传会话成功"},
+            404: {"description": "上传会话不存在或已过期", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def get_upload(
+        id: str = Path(..., description="上传会话 ID"),
+    ) -> UploadSessionResponse:
+        """
+        查询上传会话。
+
+        参数:
+            id: 上传会话 ID
+
+        返回:
+            UploadSessionResponse: 上传会话
+        """
+        user_info = _current_user()
+        try:
+            session = await upload_service.get_session(id, user_info.id)
+        except ValueError as e:
+            raise _upload_error(e)
+        except Exception as e:
+            logger.exception(f"查询上传会话失败: {e}")
+            raise InternalError(description=f"查询上传会话失败: {str(e)}")
+        return _upload_session_to_response(session)
+
+    @router.post(
+        "/applications/uploads/{id}/complete",
+        summary="完成上传并安装",
+        description=(
+            "安装包全部接收后提交安装任务，返回安装任务，安装在后台执行；"
+            "安装包 SHA-256 由安装任务校验"
+        ),
+        response_model=InstallJobResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        responses={
+            202: {"description": "安装任务已提交"},
+            400: {"description": "请求参数无效", "model": ErrorResponse},
+            404: {
+                "description": "上传会话不存在、已过期或已被其他请求完成",
+                "model": ErrorResponse,
+            },
+            409: {
+                "description": "安装包尚未上传完成或会话正在被其他请求处理",
+                "model": ErrorResponse,
+            },
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def complete_upload(
+        request: Request,
+        response: Response,
+        id: str = Path(..., description="上传会话 ID"),
+    ) -> InstallJobResponse:
+        """
+        完成上传并提交安装任务。
+
+        参数:
+            id: 上传会话 ID
+
+        返回:
+            InstallJobResponse: 已提交的安装任务，Location 响应头为任务查询地址
+        """
+        user_info = _current_user()
+        try:
+            job = await upload_service.complete(
+                id,
+                updated_by=user_info.vision_name,
+                updated_by_id=user_info.id,
+                auth_token=getattr(request.state, "auth_token", None),
+            )
+        except ValueError as e:
+            raise _upload_error(e)
+        except Exception as e:
+            logger.exception(f"提交安装任务失败: {e}")
+            raise InternalError(description=f"提交安装任务失败: {str(e)}")
+        logger.info(f"[complete_upload] 安装任务已提交: upload={id}, job={job.id}")
+        response.headers["Location"] = str(request.app.url_path_for("get_install_job", id=job.id))
+        return _install_job_to_response(job)
+
+    @router.delete(
+        "/applications/uploads/{id}",
+        summary="取消上传",
+        description="取消上传会话并删除已接收的数据",
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            204: {"description": "上传会话已删除"},
+            404: {"description": "上传会话不存在或已过期", "model": ErrorResponse},
+            409: {"description": "上传会话正在被其他请求处理", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def abort_upload(
+        id: str = Path(..., description="上传会话 ID"),
+    ) -> Response:
+        """
+        取消上传会话。
+
+        参数:
+            id: 上传会话 ID
+        """
+        user_info = _current_user()
+        try:
+            await upload_service.abort(id, user_info.id)
+        except ValueError as e:
+            raise _upload_error(e)
+        except Exception as e:
+            logger.exception(f"取消上传会话失败: {e}")
+            raise InternalError(description=f"取消上传会话失败: {str(e)}")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     # ============ 2、获取应用列表 ============
     @router.get(
         "/applications",
         summary="获取已安装应用列表",
+        description=(
+            "分页获取已安装应用列表，按更新时间倒序排列；"
+            "还有下一页时通过 X-Next-Cursor 响应头返回游标。支持 ETag 协商缓存"
+        ),
         response_model=List[ApplicationResponse],
         responses={
             200: {"description": "成功获取应用列表"},
+            304: {"description": "应用目录未变化"},
+            400: {"description": "请求参数错误", "model": ErrorResponse},
             500: {"description": "服务器内部错误", "model": ErrorResponse},
         }
     )
-    async def get_applications() -> List[ApplicationResponse]:
+    async def get_applications(
+        request: Request,
+        limit: Optional[int] = Query(None, description="每页条数，缺省时使用服务默认值", ge=1),
+        cursor: Optional[str] = Query(None, description="上一页响应头 X-Next-Cursor 返回的游标"),
+        category: Optional[str] = Query(None, description="按应用分组过滤"),
+        business_domain: Optional[str] = Query(None, description="按业务域过滤"),
+    ) -> List[ApplicationResponse]:
         """
         获取已安装应用列表。
 
-        返回所有已安装的应用信息，按更新时间倒序排列。
+        按 (更新时间, ID) 倒序进行键集分页，支持按分组和业务域过滤。
+        ETag 由应用目录版本号生成，If-None-Match 命中时不查询列表直接返回 304。
 
         返回:
-            List[ApplicationResponse]: 应用列表
+            List[ApplicationResponse]: 当前页应用列表
         """
         try:
-            applications = await application_service.get_all_applications()
-            return [_application_to_response(app) for app in applications]
+            etag = _catalog_etag(await application_service.get_catalog_version())
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+
+            page = await application_service.list_applications(
+                limit=limit,
+                cursor=cursor,
+                category=category,
+                business_domain=business_domain,
+            )
+            headers = {"ETag": etag, "Cache-Control": _CATALOG_CACHE_CONTROL}
+            if page.next_cursor is not None:
+                headers[NEXT_CURSOR_HEADER] = page.next_cursor.encode()
+            return FastJSONResponse(
+                content=[_application_to_dict(app, request) for app in page.items],
+                headers=headers,
+            )
 
+        except ValueError as e:
+            raise ValidationError(
+                code="INVALID_CURSOR",
+                description=str(e),
+                solution="请使用上一页响应头 X-Next-Cursor 返回的游标",
+            )
         except Exception as e:
             logger.exception(f"获取应用列表失败: {e}")
             raise InternalError(
                 description=f"获取应用列表失败: {str(e)}",
             )
 
+    # ============ 2.1、获取应用增量变更 ============
+    @router.get(
+        "/applications/changes",
+        summary="获取应用增量变更",
+        description="返回游标之后新增/更新的应用和已删除的应用，供客户端增量同步本地应用目录",
+        response_model=ApplicationChangesResponse,
+        responses={
+            200: {"description": "成功获取增量变更"},
+            400: {"description": "请求参数错误", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def get_application_changes(
+        request: Request,
+        since: Optional[str] = Query(
+            None, description="上次同步返回的 next_cursor，缺省时从头开始同步"
+        ),
+        limit: Optional[int] = Query(
+            None,
+            description="新增/更新应用和删除记录各自的最大条数，缺省时使用服务默认值",
+            ge=1,
+        ),
+    ) -> ApplicationChangesResponse:
+        """
+        获取应用增量变更。
+
+        客户端保存 next_cursor 并在下次轮询时作为 since 传入；has_more 为 true 时应立即继续读取。
+        最近几秒内的变更会在稍后的轮询中返回。
+
+        返回:
+            ApplicationChangesResponse: 增量变更及下次同步使用的游标
+        """
+        try:
+            changes = await application_service.list_application_changes(since=since, limit=limit)
+            return FastJSONResponse(content={
+                "items": [_application_to_dict(app, request) for app in changes.items],
+                "deleted": [
+                    {"id": item.id, "key": item.key, "deleted_at": item.deleted_at}
+                    for item in changes.deleted
+                ],
+                "next_cursor": changes.next_cursor.encode(),
+                "has_more": changes.has_more,
+            })
+
+        except ValueError as e:
+            raise ValidationError(
+                code="INVALID_CURSOR",
+                description=str(e),
+                solution="请使用上次同步返回的 next_cursor",
+            )
+        except Exception as e:
+            logger.exception(f"获取应用增量变更失败: {e}")
+            raise InternalError(
+                description=f"获取应用增量变更失败: {str(e)}",
+            )
+
     # ============ 3、应用配置 ============
     @router.put(
         "/applications/config",
@@ -254,7 +954,7 @@ def create_application_router(application_service: ApplicationService) -> APIRou
                 updated_by_id=updated_by_id,
             )
             
-            return _application_to_response(application)
+            return _application_to_response(application, request)
         
         except ValueError as e:
             raise NotFoundError(description=str(e))
@@ -266,21 +966,26 @@ def create_application_router(application_service: ApplicationService) -> APIRou
     @router.get(
         "/applications/basic-info",
         summary="查看应用基础信息",
-        description="查看应用的基本信息，包括名称、描述、版本、是否配置视图",
+        description="查看应用的基本信息，包括名称、描述、版本、是否配置视图。支持 ETag 协商缓存",
         response_model=ApplicationBasicInfoResponse,
         responses={
             200: {"description": "获取基础信息成功"},
+            304: {"description": "应用目录未变化"},
             400: {"description": "请求参数错误", "model": ErrorResponse},
             404: {"description": "应用不存在", "model": ErrorResponse},
             500: {"description": "服务器内部错误", "model": ErrorResponse},
         }
     )
     async def get_application_basic_info(
+        request: Request,
+        response: Response,
         id: int = Query(..., description="应用主键 ID", ge=1),
     ) -> ApplicationBasicInfoResponse:
         """
         查看应用基础信息。
 
+        ETag 由应用目录版本号生成，If-None-Match 命中时直接返回 304。
+
         参数:
             id: 应用主键 ID
 
@@ -288,8 +993,14 @@ def create_application_router(application_service: ApplicationService) -> APIRou
             ApplicationBasicInfoResponse: 应用基础信息
         """
         try:
+            etag = _catalog_etag(await application_service.get_catalog_version())
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+
             application = await application_service.get_application_basic_info(id)
-            
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = _CATALOG_CACHE_CONTROL
+
             return ApplicationBasicInfoResponse(
                 id=application.id,
                 key=application.key,
@@ -297,6 +1008,7 @@ def create_application_router(application_service: ApplicationService) -> APIRou
                 description=application.description,
                 version=application.version,
                 icon=application.icon,
+                icon_url=_icon_url(request, application),
                 category=application.category,
                 micro_app=_micro_app_to_response(application.micro_app),
                 is_config=application.is_config,
@@ -315,9 +1027,10 @@ def create_application_router(application_service: ApplicationService) -> APIRou
     @router.get(
         "/applications/ontologies",
         summary="查看业务知识网络配置",
-        description="查看应用的业务知识网络配置情况",
+        description="查看应用的业务知识网络配置情况，支持 ETag 协商缓存",
         responses={
             200: {"description": "获取业务知识网络配置成功"},
+            304: {"description": "业务知识网络配置未变化"},
             400: {"description": "请求参数错误", "model": ErrorResponse},
             404: {"description": "应用不存在", "model": ErrorResponse},
             500: {"description": "服务器内部错误", "model": ErrorResponse},
@@ -333,7 +1046,8 @@ def create_application_router(application_service: ApplicationService) -> APIRou
         流程：
         1. 通过 id 获取应用的业务知识网络配置项（ontology_config）
         2. 遍历配置项，通过 id 调用外部接口查询业务知识网络详情
-        3. 返回业务知识网络详情列表（原始数据）
+        3. 返回业务知识网络详情列表（原始数据）；详情来自外部服务，
+           ETag 按响应内容摘要生成，If-None-Match 命中时返回 304
 
         参数:
             id: 应用主键 ID
@@ -353,8 +1067,8 @@ def create_application_router(application_service: ApplicationService) -> APIRou
                 app_id=id,
                 auth_token=auth_token,
             )
-            
-            return ontologies
+
+            return _json_with_etag(request, ontologies)
         
         except ValueError as e:
             raise NotFoundError(description=str(e))
@@ -366,9 +1080,10 @@ def create_application_router(application_service: ApplicationService) -> APIRou
     @router.get(
         "/applications/agents",
         summary="查看智能体配置",
-        description="查看应用的 Data Agent 智能体配置情况",
+        description="查看应用的 Data Agent 智能体配置情况，支持 ETag 协商缓存",
         responses={
             200: {"description": "获取智能体配置成功"},
+            304: {"description": "智能体配置未变化"},
             400: {"description": "请求参数错误", "model": ErrorResponse},
             404: {"description": "应用不存在", "model": ErrorResponse},
             500: {"description": "服务器内部错误", "model": ErrorResponse},
@@ -384,7 +1099,8 @@ def create_application_router(application_service: ApplicationService) -> APIRou
         流程：
         1. 通过 id 获取应用的智能体配置项（agent_config）
         2. 遍历配置项，通过 id 调用外部接口查询智能体详情
-        3. 返回智能体详情列表（原始数据）
+        3. 返回智能体详情列表（原始数据）；详情来自外部服务，
+           ETag 按响应内容摘要生成，If-None-Match 命中时返回 304
 
         参数:
             id: 应用主键 ID
@@ -404,8 +1120,8 @@ def create_application_router(application_service: ApplicationService) -> APIRou
                 app_id=id,
                 auth_token=auth_token,
             )
-            
-            return agents
+
+            return _json_with_etag(request, agents)
         
         except ValueError as e:
             raise NotFoundError(description=str(e))
@@ -413,6 +1129,56 @@ def create_application_router(application_service: ApplicationService) -> APIRou
             logger.exception(f"获取智能体配置失败: {e}")
             raise InternalError(description=f"获取智能体配置失败: {str(e)}")
 
+    # ============ 4.4、获取应用图标 ============
+    @router.get(
+        "/applications/{id}/icon",
+        name="get_application_icon",
+        summary="获取应用图标",
+        description="返回应用图标原始图片数据，支持 ETag 协商缓存",
+        response_class=Response,
+        responses={
+            200: {"description": "图标数据"},
+            304: {"description": "图标未变化"},
+            404: {"description": "应用或图标不存在", "model": ErrorResponse},
+            500: {"description": "服务器内部错误", "model": ErrorResponse},
+        }
+    )
+    async def get_application_icon(
+        request: Request,
+        id: int = Path(..., description="应用主键 ID", ge=1),
+        v: Optional[str] = Query(
+            None, description="图标版本（应用更新时间），与当前版本一致时响应可长期缓存"
+        ),
+    ) -> Response:
+        """
+        获取应用图标。
+
+        参数:
+            id: 应用主键 ID
+            v: 图标版本，与应用当前更新时间一致时返回长期缓存头，其他值按不带版本处理
+
+        返回:
+            Response: 图标图片数据；If-None-Match 命中时返回 304
+        """
+        try:
+            icon = await application_service.get_application_icon(id)
+            current = False
+            if v:
+                app = await application_service.get_application_by_id(id)
+                current = v == _icon_version(app)
+        except ValueError as e:
+            raise NotFoundError(description=str(e))
+        except Exception as e:
+            logger.exception(f"获取应用图标失败: {e}")
+            raise InternalError(description=f"获取应用图标失败: {str(e)}")
+
+        etag = f'"{hashlib.sha256(icon).hexdigest()}"'
+        cache_control = _ICON_CACHE_CONTROL if current else _ICON_REVALIDATE_CACHE_CONTROL
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=icon, media_type=_detect_icon_media_type(icon), headers=headers)
+
     # ============ 5、卸载应用 ============
     @router.delete(
         "/applications/{id}",
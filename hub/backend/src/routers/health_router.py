@@ -64,4 +64,19 @@ def create_health_router(health_service: HealthService) -> APIRouter:
 
         return Response(status_code=status.HTTP_200_OK)
 
+    @router.get(
+        "/metrics",
+        summary="运行指标",
+        responses={
+            200: {"description": "运行指标（缓存命中率、连接池状态等）"},
+        }
+    )
+    async def metrics() -> dict:
+        """
+        运行指标端点。
+
+        返回进程内各组件的运行指标，用于容量评估和监控采集。
+        """
+        return health_service.get_metrics()
+
     return router
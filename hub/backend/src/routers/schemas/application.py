@@ -59,7 +59,10 @@ class ApplicationResponse(BaseModel):
     key: str = Field(..., description="应用包唯一标识", max_length=32)
     name: str = Field(..., description="应用名称", max_length=128)
     description: Optional[str] = Field(None, description="应用描述", max_length=800)
-    icon: Optional[str] = Field(None, description="应用图标，Base64 编码")
+    icon: Optional[str] = Field(
+        None, description="应用图标，Base64 编码（仅安装接口返回，查询接口通过 icon_url 获取）"
+    )
+    icon_url: Optional[str] = Field(None, description="应用图标地址，应用没有图标时为空")
     category: Optional[str] = Field(None, description="应用所属分组", max_length=128)
     version: Optional[str] = Field(None, description="应用版本号", max_length=128)
     micro_app: Optional[MicroAppResponse] = Field(None, description="微应用配置")
@@ -87,7 +90,8 @@ class ApplicationBasicInfoResponse(BaseModel):
     name: str = Field(..., description="应用名称")
     description: Optional[str] = Field(None, description="应用描述")
     version: Optional[str] = Field(None, description="应用版本号")
-    icon: Optional[str] = Field(None, description="应用图标")
+    icon: Optional[str] = Field(None, description="应用图标（已废弃，请通过 icon_url 获取）")
+    icon_url: Optional[str] = Field(None, description="应用图标地址，应用没有图标时为空")
     category: Optional[str] = Field(None, description="应用所属分组")
     micro_app: Optional[MicroAppResponse] = Field(None, description="微应用配置")
     is_config: bool = Field(..., description="是否完成配置")
@@ -98,6 +102,122 @@ class ApplicationBasicInfoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ============ 应用增量变更响应 ============
+
+class ApplicationTombstoneResponse(BaseModel):
+    """
+    已删除应用响应模型。
+
+    对应 OpenAPI 中的 ApplicationTombstone schema。
+    """
+    id: int = Field(..., description="被删除应用的主键 ID")
+    key: str = Field(..., description="被删除应用的唯一标识")
+    deleted_at: Optional[datetime] = Field(None, description="删除时间")
+
+
+class ApplicationChangesResponse(BaseModel):
+    """
+    应用目录增量变更响应模型。
+
+    对应 OpenAPI 中的 ApplicationChanges schema。
+    """
+    items: List[ApplicationResponse] = Field(
+        default_factory=list, description="游标之后新增或更新的应用"
+    )
+    deleted: List[ApplicationTombstoneResponse] = Field(
+        default_factory=list, description="游标之后删除的应用"
+    )
+    next_cursor: str = Field(..., description="下次同步使用的游标")
+    has_more: bool = Field(
+        False, description="是否还有未返回的变更，为 true 时应立即使用 next_cursor 继续读取"
+    )
+
+
+# ============ 安装任务响应 ============
+
+class InstallJobResponse(BaseModel):
+    """
+    安装任务响应模型。
+
+    对应 OpenAPI 中的 InstallJob schema。
+    """
+    id: str = Field(..., description="安装任务 ID")
+    status: str = Field(..., description="任务状态：pending、running、succeeded、failed")
+    stage: str = Field(
+        ..., description="当前阶段：queued、extracting、uploading、importing、saving、done"
+    )
+    package_size: int = Field(0, description="安装包字节数")
+    bytes_total: int = Field(0, description="需要上传的镜像和 Chart 总字节数")
+    bytes_uploaded: int = Field(0, description="已上传的镜像和 Chart 字节数")
+    application_id: Optional[int] = Field(None, description="安装成功后的应用主键 ID")
+    application_key: Optional[str] = Field(None, description="应用唯一标识")
+    error_code: Optional[str] = Field(None, description="失败时的错误码")
+    error: Optional[str] = Field(None, description="失败原因")
+    updated_by: str = Field("", description="提交者用户显示名称")
+    updated_by_id: str = Field("", description="提交者用户ID")
+    created_at: Optional[datetime] = Field(None, description="创建时间")
+    updated_at: Optional[datetime] = Field(None, description="最近一次状态或进度更新时间")
+    finished_at: Optional[datetime] = Field(None, description="结束时间")
+
+
+# ============ 断点续传上传 ============
+
+class UploadSessionCreateRequest(BaseModel):
+    """
+    创建上传会话请求模型。
+
+    对应 OpenAPI 中的 UploadSessionCreateRequest schema。
+    """
+    size: int = Field(..., ge=1, description="安装包总字节数")
+    sha256: Optional[str] = Field(
+        None, pattern=r"^[0-9a-fA-F]{64}$", description="安装包 SHA-256（可选，完成上传时校验）"
+    )
+
+
+class UploadSessionResponse(BaseModel):
+    """
+    上传会话响应模型。
+
+    对应 OpenAPI 中的 UploadSession schema。
+    """
+    id: str = Field(..., description="上传会话 ID")
+    size: int = Field(..., description="安装包总字节数")
+    offset: int = Field(..., description="已接收的字节数，即下一个分片的起始位置")
+    created_at: Optional[datetime] = Field(None, description="创建时间")
+    expires_at: Optional[datetime] = Field(None, description="过期时间，每次写入分片后顺延")
+
+
+# ============ 安装计划（预演） ============
+
+class PlanItemResponse(BaseModel):
+    """
+    安装计划项响应模型。
+
+    对应 OpenAPI 中的 PlanItem schema。
+    """
+    kind: str = Field(..., description="类型：release、ontology、agent")
+    source: str = Field(
+        ..., description="来源文件（Chart 为应用包内相对路径，业务知识网络和智能体为配置文件名）"
+    )
+    action: str = Field(..., description="操作：install、create、update、unchanged、removed")
+    target_id: Optional[str] = Field(
+        None, description="操作对象（Release 名称、业务知识网络 ID 或智能体 ID），新建时为空"
+    )
+
+
+class UpgradePlanResponse(BaseModel):
+    """
+    安装计划响应模型。
+
+    对应 OpenAPI 中的 UpgradePlan schema。
+    """
+    key: str = Field(..., description="应用唯一标识")
+    name: str = Field(..., description="应用名称")
+    version: str = Field(..., description="安装包版本号")
+    installed_version: Optional[str] = Field(None, description="已安装版本号，首次安装时为空")
+    items: List[PlanItemResponse] = Field(default_factory=list, description="计划项列表")
+
+
 # ============ 业务知识网络配置响应 ============
 
 class OntologyInfoResponse(BaseModel):
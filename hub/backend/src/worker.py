@@ -0,0 +1,63 @@
+"""
+DIP Hub 安装 worker 入口
+
+独立于 Web 服务运行的安装 worker 进程（dip-hub worker）。
+复用依赖注入容器组装的应用服务，从 Redis Stream 安装队列读取并执行安装任务，
+使安装负载与登录、应用目录等在线请求隔离，并可单独扩缩容。
+"""
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+# 将项目根目录添加到 Python 路径，以便模块导入
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.config.settings import Settings, get_settings  # noqa: E402
+from src.infrastructure.container import init_container  # noqa: E402
+from src.infrastructure.database.init import ensure_tables_exist  # noqa: E402
+from src.infrastructure.logging.logger import setup_logging  # noqa: E402
+
+
+async def run_worker(settings: Settings) -> None:
+    """
+    运行安装 worker，收到 SIGTERM 或 SIGINT 后停止读取新任务，等待执行中的任务完成后退出。
+
+    参数:
+        settings: 应用配置
+    """
+    logger = setup_logging(settings)
+    if not settings.install_queue_enabled:
+        raise SystemExit(
+            "未启用安装队列，请设置 DIP_HUB_INSTALL_QUEUE_ENABLED=true 后再启动安装 worker"
+        )
+
+    container = init_container(settings)
+    logger.info(f"启动 {settings.app_name} 安装 worker v{settings.app_version}")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        try:
+            await ensure_tables_exist(settings)
+        except Exception as e:
+            logger.error(f"数据库表初始化失败: {e}", exc_info=True)
+        await container.start()
+        await container.install_worker.run(stop)
+    finally:
+        await container.close()
+        logger.info("安装 worker 资源已释放")
+
+
+def main():
+    """运行安装 worker。"""
+    asyncio.run(run_worker(get_settings()))
+
+
+if __name__ == "__main__":
+    main()
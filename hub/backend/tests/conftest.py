@@ -0,0 +1,50 @@
+"""
+Shared Test Fixtures
+
+Fixtures and helpers used by several test modules: authenticated requests
+against the protected routes and in-memory package chunk streams.
+"""
+import hashlib
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+async def chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    """生成安装包数据块流。"""
+    for part in parts:
+        yield part
+
+
+def sha256_hex(data: bytes) -> str:
+    """计算数据的 SHA-256 十六进制摘要。"""
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def authenticated():
+    """
+    模拟认证中间件的 token 内省与用户查询，使受保护接口可以直接访问。
+
+    返回:
+        dict: 携带 Authorization 的请求头
+    """
+    from src.infrastructure.cache import SingleFlight
+    from src.ports.hydra_port import IntrospectResponse
+    from src.ports.user_management_port import UserInfo
+
+    container = MagicMock()
+    container.introspection_cache = None
+    container.user_info_cache = None
+    container.single_flight = SingleFlight()
+    container.hydra_adapter.introspect = AsyncMock(
+        return_value=IntrospectResponse(active=True, visitor_id="u1")
+    )
+    container.user_management_adapter.batch_get_user_info_by_id = AsyncMock(
+        return_value={"u1": UserInfo(id="u1", account="u1", vision_name="User 1")}
+    )
+    with patch(
+        "src.infrastructure.middleware.auth_middleware.get_container", return_value=container
+    ):
+        yield {"Authorization": "Bearer test-token"}
@@ -3,21 +3,32 @@ Application Tests
 
 Unit tests and integration tests for application management functionality.
 """
+import asyncio
+import hashlib
 import io
-import pytest
+import json
+import os
 import zipfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 from fastapi.testclient import TestClient
 
-from src.main import create_app
-from src.infrastructure.config.settings import Settings
+from src.adapters.application_adapter import ApplicationAdapter
+from src.application.application_service import ApplicationService
 from src.domains.application import (
-    Application, OntologyInfo, AgentInfo, ManifestInfo, MicroAppInfo,
-    OntologyConfigItem, AgentConfigItem
+    AgentConfigItem,
+    AgentInfo,
+    Application,
+    ManifestInfo,
+    MicroAppInfo,
+    OntologyConfigItem,
+    OntologyInfo,
 )
-from src.application.application_service import ApplicationService
-from src.adapters.application_adapter import ApplicationAdapter
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.package_archive import PackageArchive
+from src.main import create_app
 
 
 @pytest.fixture
@@ -248,6 +259,45 @@ class TestApplicationService:
         assert len(result) == 1
         assert result[0].id == 1
 
+    @pytest.mark.asyncio
+    async def test_get_application_agents_by_id_fans_out_with_deadline(
+        self, sample_application: Application, test_settings: Settings
+    ):
+        """测试智能体详情并发查询，超时或失败的条目返回基本信息且顺序不变。"""
+        test_settings.application_detail_timeout = 0.2
+        sample_application.agent_config = [
+            AgentConfigItem(id=str(i), is_config=False) for i in range(5)
+        ]
+
+        async def get_agent(agent_id, auth_token=None, business_domain=None):
+            if agent_id == "1":
+                await asyncio.sleep(10)
+            if agent_id == "3":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.05)
+            return {"id": agent_id, "name": f"agent-{agent_id}"}
+
+        mock_port = AsyncMock()
+        mock_port.get_application_by_id.return_value = sample_application
+        agent_port = AsyncMock()
+        agent_port.get_agent.side_effect = get_agent
+        service = ApplicationService(
+            mock_port, agent_factory_port=agent_port, settings=test_settings
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await service.get_application_agents_by_id(1)
+
+        assert loop.time() - started < 1
+        assert result == [
+            {"id": "0", "name": "agent-0"},
+            {"id": "1"},
+            {"id": "2", "name": "agent-2"},
+            {"id": "3"},
+            {"id": "4", "name": "agent-4"},
+        ]
+
     @pytest.mark.asyncio
     async def test_configure_application_updates_config(self, sample_application: Application):
         """测试 configure_application 更新配置。"""
@@ -384,6 +434,386 @@ class TestApplicationService:
         assert service._is_version_greater("1.0.0", None) is True
         assert service._is_version_greater("1.0.0", "") is True
 
+    @pytest.mark.asyncio
+    async def test_save_package_stream_writes_chunks_and_digest(
+        self, test_settings: Settings, tmp_path
+    ):
+        """测试安装包数据块流逐块落盘并计算 SHA-256。"""
+
+        chunks = [b"a" * 1024, b"", b"b" * 10]
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        service = ApplicationService(AsyncMock(), settings=test_settings)
+        zip_path = str(tmp_path / "package.zip")
+
+        size, digest = await service._save_package_stream(stream(), zip_path)
+
+        data = b"".join(chunks)
+        assert size == len(data)
+        assert digest == hashlib.sha256(data).hexdigest()
+        with open(zip_path, "rb") as f:
+            assert f.read() == data
+
+    @pytest.mark.asyncio
+    async def test_save_package_stream_buffers_small_chunks(
+        self, test_settings: Settings, tmp_path
+    ):
+        """测试小数据块累积到 1 MiB 再写盘，不为每个数据块切换一次线程。"""
+
+        async def stream():
+            for _ in range(64):
+                yield b"x" * 32768
+
+        service = ApplicationService(AsyncMock(), settings=test_settings)
+        appended = []
+        append_chunk = service._append_chunk
+        service._append_chunk = (
+            lambda f, digest, chunk: appended.append(len(chunk)) or append_chunk(f, digest, chunk)
+        )
+
+        size, _ = await service._save_package_stream(stream(), str(tmp_path / "package.zip"))
+
+        assert size == 64 * 32768
+        assert appended == [1024 * 1024, 1024 * 1024]
+
+    @pytest.mark.asyncio
+    async def test_save_package_stream_rejects_oversized_package(
+        self, test_settings: Settings, tmp_path
+    ):
+        """测试安装包超过大小上限时停止读取并抛出 ValueError。"""
+        test_settings.install_package_max_size = 100
+        consumed = []
+
+        async def stream():
+            for i in range(10):
+                consumed.append(i)
+                yield b"x" * 60
+
+        service = ApplicationService(AsyncMock(), settings=test_settings)
+
+        with pytest.raises(ValueError, match="安装包大小超过上限"):
+            await service._save_package_stream(stream(), str(tmp_path / "package.zip"))
+        assert len(consumed) == 2
+
+    def _package(self, tmp_path, images, charts):
+        """创建包含镜像和 Chart 文件的安装包并建立索引（文件内容为文件名）。"""
+        zip_path = str(tmp_path / "package.zip")
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for sub, names in (("images", images), ("charts", charts)):
+                for name in names:
+                    zf.writestr(f"app/packages/{sub}/{name}", name.encode())
+        return PackageArchive.load(zip_path).subdir("app")
+
+    @pytest.mark.asyncio
+    async def test_upload_artifacts_runs_concurrently_in_order(
+        self, test_settings: Settings, tmp_path
+    ):
+        """测试制品并发上传受上限约束，Release 在全部镜像上传后安装且结果顺序稳定。"""
+        from src.ports.external_service_port import ChartInfo, ChartUploadResult
+
+        test_settings.install_upload_concurrency = 2
+        package = self._package(
+            tmp_path, ["a.tar", "b.tar", "c.tar"], ["z-chart.tgz", "a-chart.tgz"]
+        )
+        running = 0
+        peak = 0
+        images_done = 0
+        events = []
+
+        async def upload_image(f, auth_token=None):
+            nonlocal running, peak, images_done
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            images_done += 1
+
+        async def upload_chart(f, auth_token=None):
+            name = os.path.basename(f.name).split(".")[0]
+            return ChartUploadResult(chart=ChartInfo(name=name, version="1.0.0"), values={})
+
+        async def install_release(release_name, namespace, **kwargs):
+            events.append((release_name, images_done))
+
+        deploy_port = AsyncMock()
+        deploy_port.upload_image.side_effect = upload_image
+        deploy_port.upload_chart.side_effect = upload_chart
+        deploy_port.install_release.side_effect = install_release
+        service = ApplicationService(
+            AsyncMock(), deploy_installer_port=deploy_port, settings=test_settings
+        )
+        manifest = ManifestInfo(
+            key="k", name="n", version="1.0.0", release_config={"namespace": "ns"}
+        )
+
+        releases = await service._upload_artifacts(manifest, package)
+
+        assert [r.name for r in releases] == ["a-chart", "z-chart"]
+        assert all(r.namespace == "ns" for r in releases)
+        assert peak <= 2
+        assert all(done == 3 for _, done in events)
+
+    @pytest.mark.asyncio
+    async def test_upload_artifacts_fails_fast(self, test_settings: Settings, tmp_path):
+        """测试任一镜像上传失败时取消其余上传且不安装 Release。"""
+        package = self._package(tmp_path, ["bad.tar", "slow.tar"], ["chart.tgz"])
+        cancelled = asyncio.Event()
+
+        async def upload_image(f, auth_token=None):
+            if f.name.endswith("bad.tar"):
+                raise RuntimeError("push failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        deploy_port = AsyncMock()
+        deploy_port.upload_image.side_effect = upload_image
+        service = ApplicationService(
+            AsyncMock(), deploy_installer_port=deploy_port, settings=test_settings
+        )
+        manifest = ManifestInfo(key="k", name="n", version="1.0.0")
+
+        with pytest.raises(ValueError, match="镜像上传失败"):
+            await asyncio.wait_for(service._upload_artifacts(manifest, package), timeout=2)
+        assert cancelled.is_set()
+        deploy_port.install_release.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upload_artifacts_skips_already_pushed_digests(
+        self, test_settings: Settings, tmp_path
+    ):
+        """
+        测试该应用已推送过的相同摘要的镜像和 Chart 跳过上传，
+        Release 使用记录的 Chart 信息安装，新制品上传时计算摘要并记录。
+        """
+        from src.adapters.mock_application_artifact_adapter import MockApplicationArtifactAdapter
+        from src.domains.artifact import ApplicationArtifact, ArtifactKind
+        from src.ports.external_service_port import ChartInfo, ChartUploadResult
+
+        package = self._package(tmp_path, ["old.tar", "new.tar"], ["chart.tgz"])
+        artifact_port = MockApplicationArtifactAdapter()
+        await artifact_port.save_artifact(ApplicationArtifact(
+            app_key="k", kind=ArtifactKind.IMAGE, digest=hashlib.sha256(b"old.tar").hexdigest(),
+            size=7,
+        ))
+        await artifact_port.save_artifact(ApplicationArtifact(
+            app_key="k", kind=ArtifactKind.CHART, digest=hashlib.sha256(b"chart.tgz").hexdigest(),
+            chart_name="chart", chart_version="1.0.0", chart_values={"replicas": 1},
+        ))
+        uploaded = []
+
+        async def upload_image(f, auth_token=None):
+            uploaded.append(os.path.basename(f.name))
+            f.read()
+
+        deploy_port = AsyncMock()
+        deploy_port.upload_image.side_effect = upload_image
+        deploy_port.upload_chart.return_value = ChartUploadResult(
+            chart=ChartInfo(name="x", version="9"), values={}
+        )
+        service = ApplicationService(
+            AsyncMock(),
+            deploy_installer_port=deploy_port,
+            settings=test_settings,
+            artifact_port=artifact_port,
+        )
+        manifest = ManifestInfo(
+            key="k", name="n", version="1.0.1", release_config={"namespace": "ns"}
+        )
+
+        releases = await service._upload_artifacts(manifest, package)
+
+        assert uploaded == ["new.tar"]
+        deploy_port.upload_chart.assert_not_called()
+        deploy_port.install_release.assert_awaited_once()
+        kwargs = deploy_port.install_release.await_args.kwargs
+        assert (kwargs["chart_name"], kwargs["chart_version"]) == ("chart", "1.0.0")
+        assert kwargs["values"] == {"replicas": 1, "namespace": "ns"}
+        assert [r.name for r in releases] == ["chart"]
+
+        recorded = {a.digest for a in await artifact_port.list_artifacts("k")}
+        assert hashlib.sha256(b"new.tar").hexdigest() in recorded
+
+    @pytest.mark.asyncio
+    async def test_artifact_adapter_round_trips_chart_values(self):
+        """测试制品适配器读写 Chart values 都使用 json_codec（紧凑格式，不转义非 ASCII 字符）。"""
+        from src.adapters.application_artifact_adapter import ApplicationArtifactAdapter
+        from src.domains.artifact import ApplicationArtifact, ArtifactKind
+
+        values = {"名称": "应用", "replicas": 2}
+        cursor = AsyncMock()
+        adapter = ApplicationArtifactAdapter(_fake_pool(cursor))
+
+        await adapter.save_artifact(ApplicationArtifact(
+            app_key="k", kind=ArtifactKind.CHART, digest="d", chart_values=values
+        ))
+        stored = cursor.execute.await_args.args[1][7]
+        cursor.fetchall.return_value = [("k", "chart", "d", 0, "", None, None, stored, None)]
+
+        assert stored == '{"名称":"应用","replicas":2}'
+        assert (await adapter.list_artifacts("k"))[0].chart_values == values
+
+    @pytest.mark.asyncio
+    async def test_import_agents_bounded_and_ordered(self, test_settings: Settings, tmp_path):
+        """测试智能体按并发上限导入，结果顺序与文件名顺序一致。"""
+        import json
+
+        from src.ports.external_service_port import AgentFactoryResult
+
+        test_settings.install_agent_import_concurrency = 2
+        zip_path = str(tmp_path / "package.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for index, name in enumerate(["c", "a", "b", "d"]):
+                config = {"name": name, "delay": 0.01 * (4 - index)}
+                zf.writestr(f"agents/{name}.json", json.dumps(config))
+        running = 0
+        peak = 0
+
+        async def create_agent(config, auth_token=None, business_domain=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(config["delay"])
+            running -= 1
+            return AgentFactoryResult(id=f"agent-{config['name']}", version="v1")
+
+        agent_port = AsyncMock()
+        agent_port.create_agent.side_effect = create_agent
+        service = ApplicationService(
+            AsyncMock(), agent_factory_port=agent_port, settings=test_settings
+        )
+        manifest = ManifestInfo(key="k", name="n", version="1.0.0")
+
+        items = await service._import_agents(manifest, PackageArchive.load(zip_path))
+
+        assert [item.id for item in items] == ["agent-a", "agent-b", "agent-c", "agent-d"]
+        assert peak == 2
+
+
+class LoopLagMonitor:
+    """
+    事件循环延迟监测器。
+
+    后台任务以固定间隔休眠，记录实际唤醒时间相对预期的最大延迟；
+    事件循环被同步代码阻塞时，延迟约等于阻塞时长。
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_lag = 0.0
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.max_lag = max(self.max_lag, loop.time() - started - self.interval)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class TestInstallDoesNotBlockLoop:
+    """安装流程不阻塞事件循环的防护测试。"""
+
+    # 每次阻塞调用人为增加的耗时，以及允许的最大事件循环延迟
+    BLOCK_SECONDS = 0.1
+    MAX_LAG_SECONDS = 0.05
+
+    def _package(self) -> io.BytesIO:
+        """创建包含 application.key、图标和业务知识网络/智能体配置的安装包。"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(
+                "pkg/manifest.yaml",
+                "name: 测试应用\nversion: 1.0.0\nrelease-config:\n  namespace: ns\n",
+            )
+            zf.writestr("pkg/application.key", "k")
+            zf.writestr("pkg/assets/icons/icon.png", b"\x89PNG")
+            zf.writestr("pkg/ontologies/o.json", '{"name": "o"}')
+            zf.writestr("pkg/agents/a.json", '{"name": "a"}')
+        buffer.seek(0)
+        return buffer
+
+    @pytest.mark.asyncio
+    async def test_install_keeps_event_loop_responsive(self, test_settings: Settings):
+        """测试文件读写、安装包索引和成员读取、配置解析均不在事件循环线程中执行。"""
+        import builtins
+        import json
+        import shutil
+        import time
+
+        import yaml
+
+        from src.application import application_service as service_module
+        from src.infrastructure.concurrency import BlockingExecutor
+        from src.ports.external_service_port import AgentFactoryResult
+
+        calls = {}
+
+        def slowed(name, fn):
+            def wrapper(*args, **kwargs):
+                # 人为拖慢阻塞调用：若在事件循环线程中执行，监测到的延迟会超过上限
+                calls[name] = calls.get(name, 0) + 1
+                time.sleep(self.BLOCK_SECONDS)
+                return fn(*args, **kwargs)
+            return wrapper
+
+        application_port = AsyncMock()
+        application_port.get_application_by_key_optional.return_value = None
+        application_port.upsert_application.side_effect = lambda app, expected_version=None: app
+        ontology_port = AsyncMock()
+        ontology_port.create_knowledge_network.return_value = "o-1"
+        agent_port = AsyncMock()
+        agent_port.create_agent.return_value = AgentFactoryResult(id="a-1", version="v1")
+        executor = BlockingExecutor(max_workers=2)
+        service = ApplicationService(
+            application_port,
+            deploy_installer_port=AsyncMock(),
+            ontology_manager_port=ontology_port,
+            agent_factory_port=agent_port,
+            settings=test_settings,
+            blocking_executor=executor,
+        )
+
+        package = self._package()
+        try:
+            with (
+                patch.object(shutil, "copyfileobj", slowed("copyfileobj", shutil.copyfileobj)),
+                patch.object(zipfile.ZipFile, "open", slowed("zip.open", zipfile.ZipFile.open)),
+                patch.object(PackageArchive, "load", slowed("archive.load", PackageArchive.load)),
+                patch.object(yaml, "safe_load", slowed("safe_load", yaml.safe_load)),
+                patch.object(json, "loads", slowed("json.loads", json.loads)),
+                patch.object(service_module, "open", slowed("open", builtins.open), create=True),
+            ):
+                async with LoopLagMonitor() as monitor:
+                    result = await service.install_application(package)
+        finally:
+            executor.shutdown()
+
+        assert result.key == "k"
+        assert result.icon is not None
+        assert [item.id for item in result.ontology_config] == ["o-1"]
+        assert [item.id for item in result.agent_config] == ["a-1"]
+        assert set(calls) == {
+            "copyfileobj", "zip.open", "archive.load", "safe_load", "json.loads", "open"
+        }
+        assert monitor.max_lag < self.MAX_LAG_SECONDS, (
+            f"事件循环被阻塞 {monitor.max_lag:.3f}s，安装流程中存在未卸载到线程池的阻塞操作"
+        )
+
 
 class TestApplicationAdapter:
     """应用适配器测试。"""
@@ -659,6 +1089,577 @@ class TestApplicationRouter:
             assert response.status_code == 404
 
 
+@pytest.fixture
+def catalog_version():
+    """固定应用目录版本号，避免路由测试访问数据库。"""
+    with patch.object(ApplicationAdapter, "get_catalog_version") as mock_version:
+        mock_version.return_value = 1
+        yield mock_version
+
+
+class TestApplicationIcon:
+    """应用图标接口测试。"""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + b"icon-bytes"
+
+    def test_row_with_icon_flag_does_not_carry_icon_data(self, test_settings: Settings):
+        """测试查询行只携带图标存在标记时，不返回图标内容但标记存在图标。"""
+        adapter = ApplicationAdapter(test_settings)
+        row = (
+            1, "app", "应用", None, 1, "1.0.0", None, None, None, None, None,
+            False, "user-001", "u1", datetime(2024, 1, 1), "db_public",
+        )
+
+        app = adapter._row_to_application(row)
+
+        assert app.icon is None
+        assert app.has_icon() is True
+
+    def _get_icon(self, test_settings: Settings, headers: dict, version: str):
+        """请求带版本参数的图标，应用更新时间对应的版本为 1700000000。"""
+        app = Application(
+            id=1, key="app", name="应用", updated_at=datetime.fromtimestamp(1700000000)
+        )
+        with patch(
+            'src.adapters.application_adapter.ApplicationAdapter.get_application_icon'
+        ) as mock_icon, patch(
+            'src.adapters.application_adapter.ApplicationAdapter.get_application_by_id'
+        ) as mock_app:
+            mock_icon.return_value = self.PNG
+            mock_app.return_value = app
+            client = TestClient(create_app(test_settings))
+
+            return client.get(
+                f"{test_settings.api_prefix}/applications/1/icon",
+                params={"v": version},
+                headers=headers,
+            )
+
+    def test_icon_endpoint_returns_image_with_cache_headers(
+        self, test_settings: Settings, authenticated
+    ):
+        """测试版本参数为当前版本的图标请求返回原始图片数据及强 ETag 和长期缓存头。"""
+        response = self._get_icon(test_settings, authenticated, "1700000000")
+
+        assert response.status_code == 200
+        assert response.content == self.PNG
+        assert response.headers["content-type"] == "image/png"
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith('W/')
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_icon_endpoint_with_stale_version_requires_revalidation(
+        self, test_settings: Settings, authenticated
+    ):
+        """测试版本参数不是当前版本时不返回长期缓存头，避免任意版本号把旧图标缓存一年。"""
+        response = self._get_icon(test_settings, authenticated, "anything")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, no-cache"
+
+    def test_icon_endpoint_without_version_requires_revalidation(self, test_settings: Settings):
+        """测试不带版本参数的图标请求无需认证，且只允许在重新校验 ETag 后使用缓存。"""
+        with patch.object(ApplicationAdapter, "get_application_icon") as mock_icon:
+            mock_icon.return_value = self.PNG
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(f"{test_settings.api_prefix}/applications/1/icon")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, no-cache"
+        assert "etag" in response.headers
+
+    def test_icon_endpoint_returns_304_when_etag_matches(
+        self, test_settings: Settings, authenticated
+    ):
+        """测试 If-None-Match 命中时返回 304 且不带响应体。"""
+        with patch.object(ApplicationAdapter, "get_application_icon") as mock_icon:
+            mock_icon.return_value = self.PNG
+            client = TestClient(create_app(test_settings))
+            url = f"{test_settings.api_prefix}/applications/1/icon"
+            etag = client.get(url, headers=authenticated).headers["etag"]
+
+            response = client.get(url, headers={**authenticated, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_icon_endpoint_returns_404_when_no_icon(self, test_settings: Settings, authenticated):
+        """测试应用没有图标时返回 404。"""
+        with patch.object(ApplicationAdapter, "get_application_icon") as mock_icon:
+            mock_icon.return_value = None
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(
+                f"{test_settings.api_prefix}/applications/1/icon", headers=authenticated
+            )
+
+        assert response.status_code == 404
+
+
+class TestApplicationPagination:
+    """应用列表键集分页测试。"""
+
+    def _adapter(self):
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        adapter = MockApplicationAdapter()
+        adapter._applications.clear()
+        for i in range(1, 8):
+            adapter._applications[f"app-{i}"] = Application(
+                id=i,
+                key=f"app-{i}",
+                name=f"应用{i}",
+                category="A" if i % 2 else "B",
+                # 部分应用更新时间相同，由 id 决定先后
+                updated_at=datetime(2024, 1, 1 + i // 2),
+            )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_in_order(self):
+        """测试逐页读取覆盖全部数据，顺序为 (updated_at, id) 倒序且无重复。"""
+        service = ApplicationService(self._adapter())
+        ids = []
+        cursor = None
+        while True:
+            page = await service.list_applications(limit=3, cursor=cursor)
+            ids.extend(app.id for app in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor.encode()
+
+        assert ids == [7, 6, 5, 4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_category_filter(self):
+        """测试按分组过滤。"""
+        service = ApplicationService(self._adapter())
+
+        page = await service.list_applications(limit=10, category="B")
+
+        assert [app.id for app in page.items] == [6, 4, 2]
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self):
+        """测试无效游标抛出 ValueError。"""
+        service = ApplicationService(self._adapter())
+
+        with pytest.raises(ValueError, match="无效的分页游标"):
+            await service.list_applications(cursor="not-a-cursor")
+
+    def test_router_returns_next_cursor_header(
+        self, test_settings: Settings, authenticated, catalog_version
+    ):
+        """测试列表接口在还有下一页时返回 X-Next-Cursor 响应头。"""
+        from src.domains.application import ApplicationCursor, ApplicationPage
+
+        page = ApplicationPage(
+            items=[Application(id=2, key="k", name="n", updated_at=datetime(2024, 1, 2))],
+            next_cursor=ApplicationCursor(updated_at=datetime(2024, 1, 2), id=2),
+        )
+        with patch.object(ApplicationAdapter, "list_applications") as mock_list:
+            mock_list.return_value = page
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(
+                f"{test_settings.api_prefix}/applications",
+                params={"limit": 1, "category": "A"},
+                headers=authenticated,
+            )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [2]
+        assert response.headers["x-next-cursor"] == page.next_cursor.encode()
+        assert mock_list.call_args.kwargs["category"] == "A"
+
+    def test_router_rejects_invalid_cursor(
+        self, test_settings: Settings, authenticated, catalog_version
+    ):
+        """测试列表接口收到无效游标时返回 400。"""
+        client = TestClient(create_app(test_settings))
+
+        response = client.get(
+            f"{test_settings.api_prefix}/applications",
+            params={"cursor": "bad"},
+            headers=authenticated,
+        )
+
+        assert response.status_code == 400
+
+
+class TestApplicationChanges:
+    """应用目录增量同步测试。"""
+
+    @pytest.mark.asyncio
+    async def test_sync_returns_updates_and_tombstones(self):
+        """测试按游标增量同步，返回之后的更新和删除，且不重复返回。"""
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        adapter = MockApplicationAdapter()
+        service = ApplicationService(adapter)
+        initial = await service.list_application_changes()
+        cursor = initial.next_cursor.encode()
+
+        app = await adapter.get_application_by_id(1)
+        await adapter.update_application_config(
+            key=app.key, ontology_config=[], agent_config=[], updated_by="u"
+        )
+        await adapter.delete_application_by_id(2)
+        changes = await service.list_application_changes(since=cursor)
+        again = await service.list_application_changes(since=changes.next_cursor.encode())
+
+        assert {item.id for item in initial.items} == {1, 2}
+        assert [item.id for item in changes.items] == [1]
+        assert [(item.id, item.key) for item in changes.deleted] == [(2, "security-monitor")]
+        assert again.items == [] and again.deleted == []
+
+    @pytest.mark.asyncio
+    async def test_limit_sets_has_more(self):
+        """测试变更超过条数上限时 has_more 为 True，继续读取可取完。"""
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        service = ApplicationService(MockApplicationAdapter())
+
+        first = await service.list_application_changes(limit=1)
+        second = await service.list_application_changes(since=first.next_cursor.encode(), limit=1)
+
+        assert first.has_more is True
+        assert len(first.items) == len(second.items) == 1
+        assert first.items[0].id != second.items[0].id
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self):
+        """测试无效游标抛出 ValueError。"""
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        service = ApplicationService(MockApplicationAdapter())
+
+        with pytest.raises(ValueError, match="无效的同步游标"):
+            await service.list_application_changes(since="bad")
+
+    @pytest.mark.asyncio
+    async def test_adapter_stops_at_unsettled_tombstone(self, test_settings: Settings):
+        """测试删除记录只返回已稳定的连续前缀，未稳定记录之后的记录留待下次返回。"""
+        from src.domains.application import ApplicationChangeCursor
+
+        now = datetime.now()
+        tombstone_rows = [
+            (1, 10, "a", now - timedelta(minutes=1)),
+            (2, 11, "b", now),
+            (3, 12, "c", now - timedelta(minutes=1)),
+        ]
+        cursor = AsyncMock()
+        cursor.fetchall.side_effect = [[], tombstone_rows]
+        conn = MagicMock()
+        conn.cursor.return_value.__aenter__.return_value = cursor
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = conn
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = pool
+
+        changes = await adapter.list_application_changes(
+            ApplicationChangeCursor.initial(), limit=10
+        )
+
+        assert [item.seq for item in changes.deleted] == [1]
+        assert changes.next_cursor.tombstone_seq == 1
+
+    def test_router_returns_changes(self, test_settings: Settings, authenticated):
+        """测试增量同步接口返回更新、删除记录和下次同步游标。"""
+        from src.domains.application import (
+            ApplicationChangeCursor,
+            ApplicationChanges,
+            ApplicationTombstone,
+        )
+
+        changes = ApplicationChanges(
+            items=[Application(id=3, key="k3", name="n", updated_at=datetime(2024, 1, 3))],
+            deleted=[ApplicationTombstone(seq=5, id=2, key="k2", deleted_at=datetime(2024, 1, 2))],
+            next_cursor=ApplicationChangeCursor(
+                updated_at=datetime(2024, 1, 3), id=3, tombstone_seq=5
+            ),
+        )
+        with patch.object(ApplicationAdapter, "list_application_changes") as mock_changes:
+            mock_changes.return_value = changes
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(
+                f"{test_settings.api_prefix}/applications/changes",
+                params={"limit": 10},
+                headers=authenticated,
+            )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["id"] for item in body["items"]] == [3]
+        assert body["deleted"] == [{"id": 2, "key": "k2", "deleted_at": "2024-01-02T00:00:00"}]
+        assert ApplicationChangeCursor.decode(body["next_cursor"]) == changes.next_cursor
+        assert body["has_more"] is False
+        assert mock_changes.call_args.kwargs["limit"] == 10
+
+
+def _fake_pool(cursor):
+    """返回 acquire() 得到的连接使用给定游标的连接池替身。"""
+    conn = MagicMock()
+    conn.cursor.return_value.__aenter__.return_value = cursor
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool
+
+
+class TestApplicationUpsert:
+    """安装覆盖写和配置标记写入测试。"""
+
+    @pytest.mark.asyncio
+    async def test_upsert_reads_back_id_without_query(self, test_settings: Settings):
+        """测试覆盖写通过 lastrowid 读回已有行 ID，并把期望版本作为条件参数。"""
+        cursor = AsyncMock()
+        cursor.rowcount = 2
+        cursor.lastrowid = 42
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = _fake_pool(cursor)
+
+        result = await adapter.upsert_application(
+            Application(id=0, key="k", name="n", version="2.0.0"), expected_version="1.0.0"
+        )
+
+        assert result.id == 42
+        sql, params = cursor.execute.await_args_list[0].args
+        assert "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)" in sql
+        assert sql.rstrip().endswith(
+            "version = IF((%s IS NOT NULL AND version <=> %s), VALUES(version), version)"
+        )
+        assert sql.count("%s") == len(params)
+        assert params[-1] == "1.0.0"
+        assert cursor.fetchone.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_upsert_rejects_stale_version(self, test_settings: Settings):
+        """测试版本条件不成立（受影响行数为 0）时抛出 ValueError 且不递增目录版本号。"""
+        cursor = AsyncMock()
+        cursor.rowcount = 0
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = _fake_pool(cursor)
+
+        with pytest.raises(ValueError, match="已被其他操作修改"):
+            await adapter.upsert_application(
+                Application(id=0, key="k", name="n", version="2.0.0"), expected_version="1.0.0"
+            )
+
+        assert cursor.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_relies_on_unique_key(self, test_settings: Settings):
+        """测试创建应用不再预先查询，key 冲突时转换为 ValueError。"""
+        from aiomysql import IntegrityError
+
+        cursor = AsyncMock()
+        cursor.execute.side_effect = IntegrityError(1062, "Duplicate entry 'k' for key 'idx_key'")
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = _fake_pool(cursor)
+
+        with pytest.raises(ValueError, match="应用已存在"):
+            await adapter.create_application(Application(id=0, key="k", name="n"))
+
+        assert cursor.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mock_upsert_checks_expected_version(self):
+        """测试内存适配器的覆盖写同样校验期望版本。"""
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        adapter = MockApplicationAdapter()
+        existing = await adapter.get_application_by_id(1)
+        new = Application(id=0, key=existing.key, name="n", version="9.9.9")
+
+        with pytest.raises(ValueError, match="应用已存在"):
+            await adapter.upsert_application(new, expected_version=None)
+        with pytest.raises(ValueError, match="已被其他操作修改"):
+            await adapter.upsert_application(new, expected_version="0.0.0")
+        result = await adapter.upsert_application(new, expected_version=existing.version)
+
+        assert result.id == existing.id
+        assert (await adapter.get_application_by_id(1)).version == "9.9.9"
+
+    @pytest.mark.asyncio
+    async def test_mark_configured_locks_row_and_rewrites_items(self, test_settings: Settings):
+        """测试标记已配置在事务中锁定应用行，逐项置为已配置并保留来源文件和摘要。"""
+        cursor = AsyncMock()
+        cursor.fetchone.return_value = (
+            1, "k", "n", None, 0, "1.0.0", None, None, "[]",
+            '[{"id": "kn-1", "is_config": false, "source": "a.json", "digest": "d1"}]',
+            '[{"id": "agent-1", "is_config": true}]',
+            0, "", "", datetime(2024, 1, 1), "db_public",
+        )
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = _fake_pool(cursor)
+        conn = adapter._pool.acquire.return_value.__aenter__.return_value
+        conn.begin, conn.commit, conn.rollback = AsyncMock(), AsyncMock(), AsyncMock()
+
+        result = await adapter.mark_application_configured(1, "u", "u1")
+
+        select_sql = cursor.execute.await_args_list[0].args[0]
+        update_params = cursor.execute.await_args_list[1].args[1]
+        assert select_sql.rstrip().endswith("FOR UPDATE")
+        assert json.loads(update_params[0]) == [
+            {"id": "kn-1", "is_config": True, "source": "a.json", "digest": "d1"}
+        ]
+        assert json.loads(update_params[1]) == [{"id": "agent-1", "is_config": True}]
+        conn.commit.assert_awaited_once()
+        assert result.is_config is True and result.updated_by == "u"
+
+    @pytest.mark.asyncio
+    async def test_mark_configured_missing_application_rolls_back(self, test_settings: Settings):
+        """测试应用不存在时回滚事务并抛出 ValueError。"""
+        cursor = AsyncMock()
+        cursor.fetchone.return_value = None
+        adapter = ApplicationAdapter(test_settings)
+        adapter._pool = _fake_pool(cursor)
+        conn = adapter._pool.acquire.return_value.__aenter__.return_value
+        conn.begin, conn.commit, conn.rollback = AsyncMock(), AsyncMock(), AsyncMock()
+
+        with pytest.raises(ValueError, match="应用不存在"):
+            await adapter.mark_application_configured(1, "u")
+
+        conn.rollback.assert_awaited_once()
+        conn.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_configure_marks_all_items_in_one_call(self):
+        """测试配置应用将应用及全部配置项标记为已配置。"""
+        from src.adapters.mock_application_adapter import MockApplicationAdapter
+
+        service = ApplicationService(MockApplicationAdapter())
+
+        result = await service.configure_application(app_id=1, updated_by="u")
+
+        assert result.is_config is True
+        assert all(item.is_config for item in result.ontology_config + result.agent_config)
+        assert result.updated_by == "u"
+
+
+class TestFastJsonPath:
+    """高吞吐 JSON 序列化路径测试。"""
+
+    def test_list_matches_response_model(
+        self, test_settings: Settings, authenticated, catalog_version
+    ):
+        """测试直接序列化的列表与 ApplicationResponse 的字段和取值完全一致。"""
+        from src.domains.application import ApplicationPage, ReleaseConfigItem
+        from src.routers.schemas.application import ApplicationResponse
+
+        app = Application(
+            id=7,
+            key="k7",
+            name="应用",
+            description="描述",
+            category="分组",
+            version="1.0.0",
+            micro_app=MicroAppInfo(name="m", entry="/m", headless=True),
+            release_config=[ReleaseConfigItem(name="r", namespace="ns")],
+            ontology_config=[OntologyConfigItem(id="1", is_config=True)],
+            agent_config=[AgentConfigItem(id="2", is_config=False)],
+            is_config=True,
+            updated_by="用户",
+            updated_by_id="u1",
+            updated_at=datetime(2024, 1, 2, 3, 4, 5, 123000),
+            icon_exists=True,
+        )
+        with patch.object(ApplicationAdapter, "list_applications") as mock_list:
+            mock_list.return_value = ApplicationPage(items=[app])
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(f"{test_settings.api_prefix}/applications", headers=authenticated)
+
+        item = response.json()[0]
+        assert response.headers["content-type"] == "application/json"
+        assert item == ApplicationResponse.model_validate(item).model_dump(mode="json")
+        assert item["updated_at"] == "2024-01-02T03:04:05.123000"
+        assert item["icon_url"].startswith(f"{test_settings.api_prefix}/applications/7/icon")
+
+    def test_codec_fallback_matches_orjson(self, monkeypatch):
+        """测试未安装 orjson 时标准库编码结果一致。"""
+        from src.infrastructure import json_codec
+
+        value = {"name": "应用", "at": datetime(2024, 1, 2, 3, 4, 5), "items": [1, None, True]}
+        fast = json_codec.dumps(value)
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert json_codec.dumps(value) == fast
+        assert json_codec.loads(fast) == {
+            "name": "应用", "at": "2024-01-02T03:04:05", "items": [1, None, True]
+        }
+
+
+class TestCatalogConditionalRequests:
+    """目录读接口 ETag 协商缓存测试。"""
+
+    def test_list_returns_304_without_querying(
+        self, test_settings: Settings, authenticated, catalog_version
+    ):
+        """测试 If-None-Match 与目录版本一致时返回 304，且不查询列表。"""
+        from src.domains.application import ApplicationPage
+
+        with patch.object(ApplicationAdapter, "list_applications") as mock_list:
+            mock_list.return_value = ApplicationPage(items=[], next_cursor=None)
+            # 关闭目录缓存，使修改后的版本号立即可见
+            settings = test_settings.model_copy(update={"application_cache_enabled": False})
+            client = TestClient(create_app(settings))
+            url = f"{test_settings.api_prefix}/applications"
+
+            first = client.get(url, headers=authenticated)
+            conditional = {**authenticated, "If-None-Match": first.headers["etag"]}
+            second = client.get(url, headers=conditional)
+            catalog_version.return_value = 2
+            third = client.get(url, headers=conditional)
+
+        assert first.status_code == 200
+        assert first.headers["etag"] == 'W/"catalog-1"'
+        assert second.status_code == 304
+        assert second.content == b""
+        assert third.status_code == 200
+        assert mock_list.await_count == 2
+
+    def test_basic_info_returns_304(
+        self, test_settings: Settings, authenticated, catalog_version
+    ):
+        """测试基础信息接口按目录版本返回 304。"""
+        with patch.object(ApplicationAdapter, "get_application_by_id") as mock_get:
+            client = TestClient(create_app(test_settings))
+
+            response = client.get(
+                f"{test_settings.api_prefix}/applications/basic-info",
+                params={"id": 1},
+                headers={**authenticated, "If-None-Match": 'W/"catalog-1"'},
+            )
+
+        assert response.status_code == 304
+        mock_get.assert_not_called()
+
+    def test_agents_etag_follows_content(self, test_settings: Settings, authenticated):
+        """测试智能体接口按响应内容生成 ETag，内容不变时返回 304。"""
+        with patch(
+            'src.application.application_service.ApplicationService.get_application_agents_by_id'
+        ) as mock_agents:
+            mock_agents.return_value = [{"id": "a1", "name": "智能体"}]
+            client = TestClient(create_app(test_settings))
+            url = f"{test_settings.api_prefix}/applications/agents"
+
+            first = client.get(url, params={"id": 1}, headers=authenticated)
+            conditional = {**authenticated, "If-None-Match": first.headers["etag"]}
+            second = client.get(url, params={"id": 1}, headers=conditional)
+            mock_agents.return_value = [{"id": "a1", "name": "改名"}]
+            third = client.get(url, params={"id": 1}, headers=conditional)
+
+        assert first.status_code == 200
+        assert first.json() == [{"id": "a1", "name": "智能体"}]
+        assert second.status_code == 304
+        assert third.status_code == 200
+        assert third.headers["etag"] != first.headers["etag"]
+
+
 class TestExternalServiceMocks:
     """外部服务 Mock 测试。"""
 
@@ -0,0 +1,144 @@
+"""
+Application Cache Tests
+
+Unit tests for the application catalog read cache and the cross-process
+invalidation broadcast.
+"""
+import asyncio
+import functools
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.cached_application_adapter import CachedApplicationAdapter
+from src.adapters.mock_application_adapter import MockApplicationAdapter
+from src.infrastructure.cache import CacheInvalidationBus
+from src.infrastructure.config.settings import Settings
+
+
+class FakeBus:
+    """记录已发布消息的失效广播总线。"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, message):
+        self.messages.append(message)
+
+
+def _cached_adapter():
+    delegate = MockApplicationAdapter()
+    delegate.get_application_by_id = AsyncMock(wraps=delegate.get_application_by_id)
+    delegate.list_applications = AsyncMock(wraps=delegate.list_applications)
+    bus = FakeBus()
+    adapter = CachedApplicationAdapter(delegate, maxsize=100, ttl=60, invalidation_bus=bus)
+    return adapter, delegate, bus
+
+
+class TestCachedApplicationAdapter:
+    """应用目录读缓存测试。"""
+
+    @pytest.mark.asyncio
+    async def test_detail_is_cached_by_id_and_key(self):
+        """测试按 ID 查询后再次按 ID 或 key 查询均命中缓存。"""
+        adapter, delegate, _ = _cached_adapter()
+
+        first = await adapter.get_application_by_id(1)
+        second = await adapter.get_application_by_id(1)
+        by_key = await adapter.get_application_by_key(first.key)
+
+        assert first is second is by_key
+        delegate.get_application_by_id.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_and_publishes(self):
+        """测试写操作失效列表和详情缓存，并广播失效消息。"""
+        adapter, delegate, bus = _cached_adapter()
+        await adapter.list_applications(limit=10)
+        app = await adapter.get_application_by_id(1)
+
+        await adapter.update_application_config(
+            key=app.key, ontology_config=[], agent_config=[], updated_by="u"
+        )
+        page = await adapter.list_applications(limit=10)
+        updated = await adapter.get_application_by_id(1)
+
+        assert delegate.list_applications.await_count == 2
+        assert delegate.get_application_by_id.await_count == 2
+        assert updated.ontology_config == []
+        assert page.items[0].id == 1
+        assert bus.messages == [{"id": None, "key": app.key}]
+
+    @pytest.mark.asyncio
+    async def test_catalog_version_follows_writes(self):
+        """测试目录版本号被缓存，写操作后读取到递增后的版本号。"""
+        adapter, delegate, _ = _cached_adapter()
+        before = await adapter.get_catalog_version()
+
+        await adapter.delete_application_by_id(2)
+
+        assert await adapter.get_catalog_version() == before + 1
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_entries(self):
+        """测试收到其他进程的失效消息后丢弃对应缓存。"""
+        adapter, delegate, _ = _cached_adapter()
+        app = await adapter.get_application_by_id(1)
+        await adapter.get_application_by_id(2)
+
+        adapter.invalidate_local({"id": 1, "key": app.key})
+        await adapter.get_application_by_id(1)
+        await adapter.get_application_by_id(2)
+
+        assert delegate.get_application_by_id.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(self):
+        """测试失效前发起的查询结果不会写回缓存。"""
+        adapter, delegate, _ = _cached_adapter()
+        release = asyncio.Event()
+        original = functools.partial(MockApplicationAdapter.get_application_by_id, delegate)
+
+        async def slow_get(app_id):
+            await release.wait()
+            return await original(app_id)
+
+        delegate.get_application_by_id.side_effect = slow_get
+        pending = asyncio.create_task(adapter.get_application_by_id(1))
+        await asyncio.sleep(0)
+        adapter.invalidate_local({"all": True})
+        release.set()
+        await pending
+        await adapter.get_application_by_id(1)
+
+        assert delegate.get_application_by_id.await_count == 2
+
+
+class TestCacheInvalidationBus:
+    """缓存失效广播测试。"""
+
+    def test_dispatch_ignores_own_messages(self):
+        """测试只分发其他进程发布的消息。"""
+        bus = CacheInvalidationBus(Settings(), channel="test")
+        received = []
+
+        bus._dispatch(json.dumps({"id": 1, "origin": bus._origin}), received.append)
+        bus._dispatch(json.dumps({"id": 2, "origin": "other"}), received.append)
+        bus._dispatch("not json", received.append)
+
+        assert received == [{"id": 2, "origin": "other"}]
+        assert bus.stats()["received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_swallowed(self):
+        """测试 Redis 不可用时发布失败不影响写操作。"""
+        bus = CacheInvalidationBus(Settings(), channel="test")
+        client = AsyncMock()
+        client.publish.side_effect = ConnectionError("down")
+        bus._client = client
+
+        await bus.publish({"id": 1, "key": "a"})
+
+        assert bus.stats()["errors"] == 1
+        await bus.close()
@@ -0,0 +1,378 @@
+"""
+Auth Middleware Tests
+
+Unit tests for token introspection caching, request coalescing and
+the ASGI request handling of the authentication middleware.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.application.logout_service import LogoutService
+from src.domains.session import SessionInfo
+from src.infrastructure.cache import SingleFlight, TTLCache
+from src.infrastructure.context.token_context import TokenContext, UserContext
+from src.infrastructure.middleware.auth_middleware import PUBLIC_PATHS, AuthMiddleware
+from src.ports.hydra_port import IntrospectResponse
+from src.ports.user_management_port import UserInfo
+
+
+class FakeClock:
+    """可手动推进的时钟。"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """TTL 缓存测试。"""
+
+    def test_get_returns_value_before_expiry(self):
+        """测试过期前可以读取缓存值并计为命中。"""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_get_returns_none_after_expiry(self):
+        """测试过期后读取返回 None 并计为未命中。"""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1, ttl=5)
+
+        clock.now = 5
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+
+    def test_ttl_is_capped_by_default(self):
+        """测试单个条目的 TTL 不超过默认上限。"""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1, ttl=1000)
+
+        clock.now = 10
+        assert cache.get("a") is None
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """测试 TTL 不为正时不写入缓存。"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1, ttl=-1)
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """测试超过容量时淘汰最久未使用的条目。"""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+
+class TestIntrospectionCache:
+    """Token 内省缓存测试。"""
+
+    def _container(self, introspect: IntrospectResponse, cache: TTLCache):
+        container = MagicMock()
+        container.introspection_cache = cache
+        container.single_flight = SingleFlight()
+        container.hydra_adapter.introspect = AsyncMock(return_value=introspect)
+        return container
+
+    @pytest.mark.asyncio
+    async def test_active_token_is_introspected_once(self):
+        """测试有效 token 第二次内省命中缓存。"""
+        introspect = IntrospectResponse(active=True, visitor_id="u1", exp=int(time.time()) + 3600)
+        container = self._container(introspect, TTLCache(maxsize=10, ttl=60))
+        middleware = AuthMiddleware(app=MagicMock())
+
+        first = await middleware._introspect(container, "token-1")
+        second = await middleware._introspect(container, "token-1")
+
+        assert first == second == introspect
+        container.hydra_adapter.introspect.assert_awaited_once_with("token-1")
+
+    @pytest.mark.asyncio
+    async def test_inactive_token_is_not_cached(self):
+        """测试无效 token 不会被缓存。"""
+        introspect = IntrospectResponse(active=False)
+        container = self._container(introspect, TTLCache(maxsize=10, ttl=60))
+        middleware = AuthMiddleware(app=MagicMock())
+
+        await middleware._introspect(container, "token-1")
+        await middleware._introspect(container, "token-1")
+
+        assert container.hydra_adapter.introspect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_not_cached(self):
+        """测试已过 exp 的 token 不会被缓存。"""
+        introspect = IntrospectResponse(active=True, visitor_id="u1", exp=int(time.time()) - 1)
+        cache = TTLCache(maxsize=10, ttl=60)
+        container = self._container(introspect, cache)
+        middleware = AuthMiddleware(app=MagicMock())
+
+        await middleware._introspect(container, "token-1")
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_logout_evicts_cached_token(self):
+        """测试登出后 Access Token 从内省缓存中移除，下次请求重新内省。"""
+        introspect = IntrospectResponse(active=True, visitor_id="u1", exp=int(time.time()) + 3600)
+        cache = TTLCache(maxsize=10, ttl=60)
+        container = self._container(introspect, cache)
+        middleware = AuthMiddleware(app=MagicMock())
+        logout_service = LogoutService(
+            AsyncMock(), AsyncMock(), AsyncMock(), introspection_cache=cache
+        )
+
+        await middleware._introspect(container, "token-1")
+        await logout_service.revoke_and_delete_session(
+            SessionInfo(state="s", token="token-1", refresh_token="r"), "sid"
+        )
+        await middleware._introspect(container, "token-1")
+
+        assert container.hydra_adapter.introspect.await_count == 2
+
+
+class TestRequestCoalescing:
+    """并发请求合并测试。"""
+
+    @pytest.mark.asyncio
+    async def test_single_flight_shares_result(self):
+        """测试并发的同键调用只执行一次。"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*[flight.do("k", load) for _ in range(5)])
+
+        assert results == [1] * 5
+        assert calls == 1
+        assert flight.stats()["shared"] == 4
+        assert flight.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_single_flight_propagates_error_to_all_waiters(self):
+        """测试执行异常会传播给所有等待者。"""
+        flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *[flight.do("k", load) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_user_info_lookups_are_coalesced(self):
+        """测试同一用户的并发查询合并为一次下游请求，并写入用户信息缓存。"""
+        user_info = UserInfo(id="u1", account="u1", vision_name="User 1")
+
+        async def batch_get(user_ids):
+            await asyncio.sleep(0.01)
+            return {"u1": user_info}
+
+        container = MagicMock()
+        container.single_flight = SingleFlight()
+        container.user_info_cache = TTLCache(maxsize=10, ttl=30)
+        user_management = container.user_management_adapter
+        user_management.batch_get_user_info_by_id = AsyncMock(side_effect=batch_get)
+        middleware = AuthMiddleware(app=MagicMock())
+
+        results = await asyncio.gather(
+            *[middleware._get_user_info(container, "u1") for _ in range(5)]
+        )
+        cached = await middleware._get_user_info(container, "u1")
+
+        assert all(r is user_info for r in results)
+        assert cached is user_info
+        container.user_management_adapter.batch_get_user_info_by_id.assert_awaited_once_with(["u1"])
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self):
+        """测试查询不到的用户不会被缓存。"""
+        container = MagicMock()
+        container.single_flight = SingleFlight()
+        container.user_info_cache = TTLCache(maxsize=10, ttl=30)
+        container.user_management_adapter.batch_get_user_info_by_id = AsyncMock(return_value={})
+        middleware = AuthMiddleware(app=MagicMock())
+
+        assert await middleware._get_user_info(container, "u1") is None
+        assert await middleware._get_user_info(container, "u1") is None
+        assert container.user_management_adapter.batch_get_user_info_by_id.await_count == 2
+
+
+def _legacy_is_public_path(path: str) -> bool:
+    """逐条比较的公开路径判断，作为预编译匹配规则的对照。"""
+    for public_path in PUBLIC_PATHS:
+        if path == public_path:
+            return True
+        if path.endswith(public_path) or path.endswith(public_path + "/"):
+            return True
+        if path.startswith(public_path + "/") or path.startswith(public_path + "?"):
+            return True
+    return False
+
+
+class TestPublicPathMatcher:
+    """公开路径匹配测试。"""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/healthz",
+            "/healthz/",
+            "/api/dip-hub/v1/healthz",
+            "/api/dip-hub/v1/readyz/",
+            "/api/dip-hub/v1/login/callback",
+            "/docs/oauth2-redirect",
+            "/openapi.json",
+            "/api/dip-hub/v1/metrics",
+            "/api/dip-hub/v1/applications",
+            "/api/dip-hub/v1/applications/1",
+            "/api/dip-hub/v1/healthz/extra",
+            "/docsx",
+            "/loginx",
+            "/",
+        ],
+    )
+    def test_matches_legacy_rules(self, path: str):
+        """测试预编译规则与逐条比较的判断结果一致。"""
+        middleware = AuthMiddleware(app=MagicMock())
+
+        assert middleware._is_public_path(path) is _legacy_is_public_path(path)
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/api/dip-hub/v1/applications/12/icon", True),
+            ("/api/dip-hub/v1/applications/12/icon/", False),
+            ("/api/dip-hub/v1/applications/abc/icon", False),
+            ("/api/dip-hub/v1/uploads/12/icon", False),
+            ("/api/dip-hub/v1/applications/12/icon/extra", False),
+            ("/applications/12/icon", False),
+        ],
+    )
+    def test_public_routes_match_whole_path_under_prefix(self, path: str, expected: bool):
+        """测试公开路由只在 API 前缀下整体匹配，其他以 /icon 结尾的路径仍需认证。"""
+        middleware = AuthMiddleware(app=MagicMock(), api_prefix="/api/dip-hub/v1")
+
+        assert middleware._is_public_path(path) is expected
+
+
+class TestAsgiMiddleware:
+    """ASGI 请求处理测试。"""
+
+    def _client(self) -> TestClient:
+        async def upload(request: Request):
+            size = 0
+            async for chunk in request.stream():
+                size += len(chunk)
+            user_info = UserContext.get_user_info()
+            return JSONResponse({
+                "size": size,
+                "auth_token": request.state.auth_token,
+                "token": TokenContext.get_token(),
+                "user_id": user_info.id if user_info else None,
+            })
+
+        async def download(request: Request):
+            async def chunks():
+                for i in range(3):
+                    yield f"chunk-{i};".encode()
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        app = Starlette(routes=[
+            Route("/applications", upload, methods=["POST"]),
+            Route("/download", download),
+            Route("/healthz", download),
+        ])
+        app.add_middleware(AuthMiddleware)
+        return TestClient(app)
+
+    def _container(self) -> MagicMock:
+        container = MagicMock()
+        container.introspection_cache = None
+        container.user_info_cache = None
+        container.single_flight = SingleFlight()
+        container.hydra_adapter.introspect = AsyncMock(
+            return_value=IntrospectResponse(active=True, visitor_id="u1")
+        )
+        container.user_management_adapter.batch_get_user_info_by_id = AsyncMock(
+            return_value={"u1": UserInfo(id="u1", account="u1", vision_name="User 1")}
+        )
+        return container
+
+    def test_missing_token_is_rejected(self):
+        """测试受保护路径未携带 token 时返回 401。"""
+        response = self._client().get("/download")
+
+        assert response.status_code == 401
+
+    def test_public_path_passes_without_token(self):
+        """测试公开路径无需 token 即可访问。"""
+        response = self._client().get("/healthz")
+
+        assert response.status_code == 200
+
+    def test_request_body_and_context_pass_through(self):
+        """测试请求体原样透传，且下游可读取 token 与用户上下文。"""
+        body = b"x" * (256 * 1024)
+        with patch(
+            "src.infrastructure.middleware.auth_middleware.get_container",
+            return_value=self._container(),
+        ):
+            response = self._client().post(
+                "/applications", content=body, headers={"Authorization": "Bearer t1"}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "size": len(body),
+            "auth_token": "Bearer t1",
+            "token": "t1",
+            "user_id": "u1",
+        }
+
+    def test_streaming_response_passes_through(self):
+        """测试流式响应经过中间件后内容不变。"""
+        with patch(
+            "src.infrastructure.middleware.auth_middleware.get_container",
+            return_value=self._container(),
+        ):
+            response = self._client().get("/download", headers={"Authorization": "t1"})
+
+        assert response.status_code == 200
+        assert response.text == "chunk-0;chunk-1;chunk-2;"
@@ -0,0 +1,101 @@
+"""
+Concurrency Helper Tests
+
+Unit tests for ordered, fail-fast concurrent execution helpers and the
+bounded executor for blocking work.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.concurrency import BlockingExecutor, bounded_map, gather_fail_fast
+
+
+class TestGatherFailFast:
+    """失败即取消的并发执行测试。"""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """测试结果顺序与输入顺序一致，与完成顺序无关。"""
+        async def work(value: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return value
+
+        results = await gather_fail_fast([work(1, 0.03), work(2, 0.01), work(3, 0.02)])
+
+        assert results == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_tasks(self):
+        """测试任一任务失败时取消其余未完成任务。"""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await asyncio.wait_for(gather_fail_fast([slow(), fail()]), timeout=1)
+        assert cancelled.is_set()
+
+
+class TestBoundedMap:
+    """有限并发映射测试。"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """测试同时执行的任务数不超过上限。"""
+        running = 0
+        peak = 0
+
+        async def work(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value * 2
+
+        results = await bounded_map(work, range(10), limit=3)
+
+        assert results == [value * 2 for value in range(10)]
+        assert peak == 3
+
+
+class TestBlockingExecutor:
+    """有界阻塞任务执行器测试。"""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_loop_with_bounded_threads(self):
+        """测试阻塞函数在执行器线程中运行，且同时运行的数量不超过线程数。"""
+        executor = BlockingExecutor(max_workers=2, thread_name_prefix="test-io")
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work(value: int) -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return f"{value}:{threading.current_thread().name.split('_')[0]}"
+
+        try:
+            results = await asyncio.gather(*(executor.run(work, i) for i in range(6)))
+        finally:
+            executor.shutdown()
+
+        assert results == [f"{i}:test-io" for i in range(6)]
+        assert peak == 2
@@ -0,0 +1,78 @@
+"""
+Container Tests
+
+Unit tests for resource ownership in the dependency injection container.
+"""
+import pytest
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.container import Container
+
+
+@pytest.fixture
+def test_settings() -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(
+        app_name="DIP Hub Test",
+        http_pool_max_connections=8,
+        http_pool_max_keepalive_connections=4,
+        http_pool_keepalive_expiry=5.0,
+    )
+
+
+class TestSharedHttpClients:
+    """共享 HTTP 客户端测试。"""
+
+    def test_adapters_reuse_single_client(self, test_settings: Settings):
+        """测试适配器单例持有同一个长生命周期客户端。"""
+        container = Container(test_settings)
+
+        first = container.hydra_adapter._client
+        second = container.hydra_adapter._client
+
+        assert first is second
+        assert first.is_closed is False
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_clients(self, test_settings: Settings):
+        """测试关闭容器时关闭所有共享客户端。"""
+        container = Container(test_settings)
+        clients = [
+            container.hydra_adapter._client,
+            container.oauth2_adapter._client,
+            container.user_management_adapter._client,
+            container.deploy_manager_adapter._client,
+        ]
+
+        await container.close()
+
+        assert len({id(c) for c in clients}) == 4
+        assert all(c.is_closed for c in clients)
+
+
+class TestHttpSessionPool:
+    """外部服务 HTTP 会话池测试。"""
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_pool_with_one_session_per_service(self, test_settings: Settings):
+        """测试外部服务适配器共用会话池，每个服务一个会话，关闭容器时全部关闭。"""
+        container = Container(test_settings)
+        deploy = container.deploy_installer_adapter
+        ontology = container.ontology_manager_adapter
+
+        deploy_session = deploy._get_session()
+        ontology_session = ontology._get_session()
+
+        assert deploy._get_session() is deploy_session
+        assert deploy_session is not ontology_session
+        assert deploy_session.connector.limit_per_host == 20
+
+        await container.close()
+
+        assert deploy_session.closed
+        assert ontology_session.closed
@@ -0,0 +1,135 @@
+"""
+Database Pool Tests
+
+Unit tests for the configurable, instrumented MariaDB connection pool.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.adapters.application_adapter import ApplicationAdapter
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.pool import DatabasePool
+
+
+class FakePool:
+    """只有一个连接的 aiomysql 连接池替身。"""
+
+    maxsize = 1
+
+    def __init__(self):
+        self.conn = MagicMock()
+        self.conn.ping = AsyncMock()
+        self.conn.last_usage = 0.0
+        self._free = asyncio.Queue()
+        self._free.put_nowait(self.conn)
+        self.size = 1
+
+    @property
+    def freesize(self):
+        return self._free.qsize()
+
+    async def acquire(self):
+        return await self._free.get()
+
+    def release(self, conn):
+        self._free.put_nowait(conn)
+
+
+@pytest.fixture
+def test_settings() -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(
+        db_pool_min_size=3, db_pool_max_size=7, db_connect_timeout=2, db_pool_recycle=60
+    )
+
+
+class TestDatabasePool:
+    """数据库连接池测试。"""
+
+    @pytest.mark.asyncio
+    async def test_open_uses_settings(self, test_settings: Settings):
+        """测试连接池参数来自配置，且只创建一次。"""
+        with patch("aiomysql.create_pool", new=AsyncMock(return_value=FakePool())) as create_pool:
+            pool = DatabasePool(test_settings)
+            await asyncio.gather(pool.open(), pool.open())
+
+        create_pool.assert_awaited_once()
+        kwargs = create_pool.await_args.kwargs
+        assert (kwargs["minsize"], kwargs["maxsize"]) == (3, 7)
+        assert (kwargs["connect_timeout"], kwargs["pool_recycle"]) == (2, 60)
+
+    @pytest.mark.asyncio
+    async def test_stats_track_usage_and_waits(self, test_settings: Settings):
+        """测试指标反映使用中的连接数，以及连接耗尽时的排队等待。"""
+        pool = DatabasePool(test_settings.model_copy(update={"db_pool_pre_ping": True}))
+        fake = FakePool()
+        pool._pool = fake
+
+        async with pool.acquire() as conn:
+            assert conn is fake.conn
+            assert pool.stats()["in_use"] == 1
+            waiter = asyncio.create_task(pool.acquire().__aenter__())
+            await asyncio.sleep(0.01)
+            assert pool.stats()["waiting"] == 1
+        await waiter
+
+        stats = pool.stats()
+        assert stats["acquired"] == 2
+        assert stats["waits"] == 1
+        assert stats["wait_ms_max"] > 0
+        assert fake.conn.ping.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ping_only_idle_connections(self, test_settings: Settings):
+        """测试默认不做存活检测；开启后刚用过的连接不检测，空闲超过阈值的连接才检测。"""
+        fake = FakePool()
+        pool = DatabasePool(test_settings)
+        pool._pool = fake
+        async with pool.acquire():
+            pass
+        fake.conn.ping.assert_not_awaited()
+
+        pool = DatabasePool(test_settings.model_copy(update={"db_pool_pre_ping": True}))
+        pool._pool = fake
+        fake.conn.last_usage = asyncio.get_running_loop().time()
+        async with pool.acquire():
+            pass
+        fake.conn.ping.assert_not_awaited()
+
+        fake.conn.last_usage -= test_settings.db_pool_pre_ping_idle
+        async with pool.acquire():
+            pass
+        fake.conn.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_ping_closes_connection(self, test_settings: Settings):
+        """测试存活检测失败时关闭连接、归还连接池并抛出异常。"""
+        pool = DatabasePool(test_settings.model_copy(update={"db_pool_pre_ping": True}))
+        fake = FakePool()
+        fake.conn.ping.side_effect = ConnectionError("gone")
+        pool._pool = fake
+
+        with pytest.raises(ConnectionError):
+            async with pool.acquire():
+                pass
+
+        fake.conn.close.assert_called_once()
+        assert pool.stats()["ping_failures"] == 1
+        assert fake.freesize == 1
+
+    @pytest.mark.asyncio
+    async def test_adapter_does_not_close_shared_pool(self, test_settings: Settings):
+        """测试应用适配器只关闭自行创建的连接池。"""
+        shared = DatabasePool(test_settings)
+        shared.close = AsyncMock()
+
+        await ApplicationAdapter(test_settings, pool=shared).close()
+
+        shared.close.assert_not_awaited()
@@ -0,0 +1,80 @@
+"""
+External Service Adapter Tests
+
+Unit tests for streaming artifact uploads to the Deploy Installer service.
+"""
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.adapters.external_service_adapter import DeployInstallerAdapter, _stream_upload
+from src.infrastructure.concurrency import BlockingExecutor
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.http_client import ClientSessionPool
+
+
+class TestStreamUpload:
+    """镜像/Chart 流式上传测试。"""
+
+    @pytest.mark.asyncio
+    async def test_upload_image_streams_file_in_chunks(self, tmp_path):
+        """测试镜像文件按数据块发送，服务端收到完整内容和 Content-Length。"""
+        received = {}
+
+        async def handle(request: web.Request) -> web.Response:
+            chunks = 0
+            size = 0
+            async for chunk in request.content.iter_any():
+                chunks += 1
+                size += len(chunk)
+            received["size"] = size
+            received["chunks"] = chunks
+            received["content_length"] = request.content_length
+            return web.json_response({"images": [{"from": "a:1", "to": "registry/a:1"}]})
+
+        app = web.Application()
+        app.router.add_put("/internal/api/deploy-installer/v1/agents/image", handle)
+        image_path = tmp_path / "image.tar"
+        image_path.write_bytes(b"x" * (3 * 1024 * 1024 + 7))
+
+        async with TestServer(app) as server:
+            settings = Settings(proton_url=str(server.make_url("")).rstrip("/"))
+            pool = ClientSessionPool(settings)
+            adapter = DeployInstallerAdapter(settings, session_pool=pool)
+            try:
+                with open(image_path, "rb") as f:
+                    results = await adapter.upload_image(f)
+            finally:
+                await pool.close()
+
+        assert results[0].to_name == "registry/a:1"
+        assert received["size"] == 3 * 1024 * 1024 + 7
+        assert received["content_length"] == 3 * 1024 * 1024 + 7
+        assert received["chunks"] > 1
+
+    @pytest.mark.asyncio
+    async def test_stalled_upload_times_out(self, tmp_path):
+        """测试发送阶段长时间无进展时按空闲超时中止上传。"""
+
+        class StalledResponse:
+            async def __aenter__(self):
+                await asyncio.Event().wait()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class StalledSession:
+            def put(self, *args, **kwargs):
+                return StalledResponse()
+
+        file_path = tmp_path / "chart.tgz"
+        file_path.write_bytes(b"chart")
+
+        with open(file_path, "rb") as f:
+            with pytest.raises(asyncio.TimeoutError):
+                await _stream_upload(
+                    StalledSession(), "http://deploy/agents/chart", f, {}, BlockingExecutor(1),
+                    idle_timeout=0.05, response_timeout=10,
+                )
@@ -77,3 +77,15 @@ class TestReadyEndpoint:
         # 响应体应该为空
         assert response.text == ""
 
+
+
+class TestMetricsEndpoint:
+    """运行指标接口测试。"""
+
+    def test_metrics_requires_authentication(
+        self, test_client: TestClient, test_settings: Settings
+    ):
+        """测试运行指标接口需要认证，未提供 token 时返回 401。"""
+        response = test_client.get(f"{test_settings.api_prefix}/metrics")
+
+        assert response.status_code == 401
@@ -0,0 +1,242 @@
+"""
+Install Job Tests
+
+Unit tests for background install jobs and the install job endpoints.
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters.mock_application_adapter import MockApplicationAdapter
+from src.adapters.mock_install_job_adapter import MockInstallJobAdapter
+from src.application.application_service import ApplicationService
+from src.application.install_job_service import InstallJobService
+from src.domains.application import Application
+from src.domains.install_job import InstallJob, InstallJobStatus, InstallStage
+from src.infrastructure.config.settings import Settings
+from src.main import create_app
+from tests.conftest import chunks
+
+
+@pytest.fixture
+def test_settings(tmp_path) -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(
+        app_name="DIP Hub Test",
+        temp_dir=str(tmp_path),
+        install_job_concurrency=1,
+        install_job_stale_timeout=60.0,
+    )
+
+
+async def _wait_finished(service: InstallJobService, job_id: str) -> InstallJob:
+    """等待任务结束并返回任务。"""
+    for _ in range(200):
+        job = await service.get_job(job_id)
+        if job.is_finished():
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"任务未结束: {job_id}")
+
+
+def _service(settings: Settings, install=None):
+    """创建使用内存任务存储的安装任务服务。"""
+    application_service = ApplicationService(MockApplicationAdapter(), settings=settings)
+    if install is not None:
+        application_service.install_application = install
+    port = MockInstallJobAdapter()
+    return InstallJobService(application_service, port, settings), port
+
+
+class TestInstallJobService:
+    """安装任务服务测试。"""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_pending_job_and_runs_install(self, test_settings: Settings):
+        """测试提交后立即返回等待中的任务，后台安装成功后记录应用并删除安装包。"""
+        seen = {}
+
+        async def install(
+            zip_path, updated_by="", updated_by_id="", auth_token=None, progress=None
+        ):
+            seen["zip_exists"] = os.path.exists(zip_path)
+            seen["auth_token"] = auth_token
+            progress.set_stage(InstallStage.UPLOADING)
+            progress.add_total(10)
+            progress.add_uploaded(10)
+            return Application(id=7, key="app-7", name="App")
+
+        service, _ = _service(test_settings, install)
+
+        job = await service.submit_install(chunks(b"PK-data"), "User 1", "u1", auth_token="token")
+        assert job.status == InstallJobStatus.PENDING
+        assert job.package_size == 7
+
+        finished = await _wait_finished(service, job.id)
+        assert finished.status == InstallJobStatus.SUCCEEDED
+        assert finished.stage == InstallStage.DONE
+        assert finished.application_id == 7
+        assert finished.application_key == "app-7"
+        assert finished.bytes_uploaded == 10
+        assert seen == {"zip_exists": True, "auth_token": "token"}
+        await asyncio.sleep(0.01)
+        assert os.listdir(os.path.join(test_settings.temp_dir, "install-jobs")) == []
+
+    @pytest.mark.asyncio
+    async def test_version_conflict_is_recorded_on_job(self, test_settings: Settings):
+        """测试安装失败时任务记录错误码和失败原因。"""
+        install = AsyncMock(side_effect=ValueError("版本号冲突: 新版本 1.0.0 与已安装版本相同"))
+        service, _ = _service(test_settings, install)
+
+        job = await service.submit_install(chunks(b"PK"))
+        finished = await _wait_finished(service, job.id)
+
+        assert finished.status == InstallJobStatus.FAILED
+        assert finished.error_code == "VERSION_CONFLICT"
+        assert "版本号冲突" in finished.error
+
+    @pytest.mark.asyncio
+    async def test_package_digest_mismatch_fails_job(self, test_settings: Settings, tmp_path):
+        """测试任务记录的安装包 SHA-256 不一致时不执行安装，任务以 INVALID_PACKAGE 失败。"""
+        install = AsyncMock()
+        service, _ = _service(test_settings, install)
+        package_file = tmp_path / "package.part"
+        package_file.write_bytes(b"PK-data")
+
+        job = await service.submit_package(str(package_file), package_sha256="0" * 64)
+        finished = await _wait_finished(service, job.id)
+
+        assert finished.package_sha256 == "0" * 64
+        assert finished.status == InstallJobStatus.FAILED
+        assert finished.error_code == "INVALID_PACKAGE"
+        install.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_jobs_beyond_concurrency_limit_stay_pending(self, test_settings: Settings):
+        """测试超过并发上限的任务保持等待状态，前一个任务结束后再执行。"""
+        release = asyncio.Event()
+
+        async def install(zip_path, **kwargs):
+            await release.wait()
+            return Application(id=1, key="app", name="App")
+
+        service, _ = _service(test_settings, install)
+
+        first = await service.submit_install(chunks(b"PK"))
+        second = await service.submit_install(chunks(b"PK"))
+        await asyncio.sleep(0.05)
+
+        assert (await service.get_job(first.id)).status == InstallJobStatus.RUNNING
+        assert (await service.get_job(second.id)).status == InstallJobStatus.PENDING
+
+        release.set()
+        assert (await _wait_finished(service, second.id)).status == InstallJobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_empty_package_is_rejected_without_job(self, test_settings: Settings):
+        """测试安装包为空时直接拒绝，不创建任务也不遗留文件。"""
+        service, port = _service(test_settings, AsyncMock())
+
+        with pytest.raises(ValueError, match="安装包为空"):
+            await service.submit_install(chunks(b""))
+
+        assert port._jobs == {}
+        assert os.listdir(os.path.join(test_settings.temp_dir, "install-jobs")) == []
+
+    @pytest.mark.asyncio
+    async def test_close_marks_running_job_interrupted(self, test_settings: Settings):
+        """测试关闭服务时执行中的任务被置为中断失败。"""
+        started = asyncio.Event()
+
+        async def install(zip_path, **kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        service, _ = _service(test_settings, install)
+        job = await service.submit_install(chunks(b"PK"))
+        await started.wait()
+
+        await service.close()
+
+        finished = await service.get_job(job.id)
+        assert finished.status == InstallJobStatus.FAILED
+        assert finished.error_code == "INSTALL_INTERRUPTED"
+
+    @pytest.mark.asyncio
+    async def test_stale_job_is_reported_failed(self, test_settings: Settings):
+        """测试所在进程已退出（心跳超时）的任务查询时返回失败。"""
+        service, port = _service(test_settings)
+        job = await port.create_job(InstallJob(id="stale"))
+        port._jobs[job.id].status = InstallJobStatus.RUNNING
+        port._jobs[job.id].updated_at = datetime.now() - timedelta(seconds=120)
+
+        stale = await service.get_job("stale")
+
+        assert stale.status == InstallJobStatus.FAILED
+        assert stale.error_code == "INSTALL_INTERRUPTED"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_persists_progress(self, test_settings: Settings):
+        """测试心跳将执行中任务的阶段和上传进度写入任务存储。"""
+        release = asyncio.Event()
+
+        async def install(zip_path, progress=None, **kwargs):
+            progress.set_stage(InstallStage.UPLOADING)
+            progress.add_total(100)
+            progress.add_uploaded(40)
+            await release.wait()
+            return Application(id=1, key="app", name="App")
+
+        service, _ = _service(test_settings, install)
+        job = await service.submit_install(chunks(b"PK"))
+        await asyncio.sleep(0.05)
+
+        await service._heartbeat()
+
+        running = await service.get_job(job.id)
+        assert running.stage == InstallStage.UPLOADING
+        assert (running.bytes_total, running.bytes_uploaded) == (100, 40)
+        release.set()
+        await _wait_finished(service, job.id)
+
+
+class TestInstallJobRouter:
+    """安装任务接口测试。"""
+
+    def test_install_returns_202_with_job_location(self, test_settings: Settings, authenticated):
+        """测试安装接口返回 202、安装任务和任务查询地址。"""
+        job = InstallJob(id="abc123", package_size=2)
+        with patch.object(InstallJobService, "submit_install", AsyncMock(return_value=job)):
+            client = TestClient(create_app(test_settings))
+
+            response = client.post(
+                f"{test_settings.api_prefix}/applications",
+                content=b"PK",
+                headers={**authenticated, "Content-Type": "application/octet-stream"},
+            )
+
+        assert response.status_code == 202
+        assert response.json()["id"] == "abc123"
+        assert response.json()["status"] == "pending"
+        assert response.headers["Location"].endswith("/applications/jobs/abc123")
+
+    def test_get_job_returns_404_when_not_found(self, test_settings: Settings, authenticated):
+        """测试查询不存在的安装任务返回 404。"""
+        client = TestClient(create_app(test_settings))
+
+        not_found = AsyncMock(side_effect=ValueError("安装任务不存在: missing"))
+        with patch.object(InstallJobService, "get_job", not_found):
+            response = client.get(
+                f"{test_settings.api_prefix}/applications/jobs/missing", headers=authenticated
+            )
+
+        assert response.status_code == 404
@@ -0,0 +1,163 @@
+"""
+Install Worker Tests
+
+Unit tests for the queue-backed install worker.
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.mock_application_adapter import MockApplicationAdapter
+from src.adapters.mock_install_job_adapter import MockInstallJobAdapter
+from src.adapters.mock_install_queue_adapter import MockInstallQueueAdapter
+from src.application.application_service import ApplicationService
+from src.application.install_job_service import InstallJobService
+from src.application.install_worker import InstallWorker
+from src.domains.application import Application
+from src.domains.install_job import InstallJob, InstallJobStatus, QueuedInstall
+from src.infrastructure.config.settings import Settings
+from src.ports.oauth2_port import ClientCredentialsResponse
+from tests.conftest import chunks
+
+
+@pytest.fixture
+def test_settings(tmp_path) -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(
+        app_name="DIP Hub Test",
+        temp_dir=str(tmp_path),
+        install_queue_enabled=True,
+        install_queue_claim_idle=0.05,
+        install_queue_max_deliveries=2,
+        install_job_heartbeat_interval=0.01,
+    )
+
+
+class _Installs:
+    """记录安装调用的安装流程替身。"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, zip_path, auth_token=None, **kwargs):
+        self.calls.append((os.path.exists(zip_path), auth_token))
+        return Application(id=3, key="app-3", name="App")
+
+
+def _wire(settings: Settings, installs: _Installs):
+    """组装共享同一任务存储和队列的 API 端服务与 worker。"""
+    application_service = ApplicationService(MockApplicationAdapter(), settings=settings)
+    application_service.install_application = installs
+    job_port = MockInstallJobAdapter()
+    queue = MockInstallQueueAdapter()
+    service = InstallJobService(application_service, job_port, settings, install_queue_port=queue)
+    oauth2_port = AsyncMock()
+    oauth2_port.client_credentials_token.return_value = ClientCredentialsResponse(
+        access_token="service-token", expires_in=3600
+    )
+    worker = InstallWorker(
+        service, job_port, queue, settings, consumer="worker-1", oauth2_port=oauth2_port
+    )
+    return service, worker, job_port, queue
+
+
+async def _run_until(worker: InstallWorker, condition) -> None:
+    """运行 worker 直到条件满足后停止。"""
+    stop = asyncio.Event()
+    task = asyncio.create_task(worker.run(stop))
+    for _ in range(200):
+        if await condition():
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(task, timeout=5)
+
+
+class TestInstallWorker:
+    """安装 worker 测试。"""
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_is_executed_by_worker(self, test_settings: Settings):
+        """测试提交的任务投递到队列，由 worker 使用服务 Token 执行、确认并删除安装包。"""
+        installs = _Installs()
+        service, worker, _, queue = _wire(test_settings, installs)
+
+        job = await service.submit_install(chunks(b"PK"), auth_token="user-token")
+        await asyncio.sleep(0.02)
+        assert installs.calls == []
+        assert list(queue._entries.values()) == [job.id]
+        assert (await service.get_job(job.id)).status == InstallJobStatus.PENDING
+
+        async def finished():
+            return (await service.get_job(job.id)).is_finished()
+
+        await _run_until(worker, finished)
+
+        done = await service.get_job(job.id)
+        assert done.status == InstallJobStatus.SUCCEEDED
+        assert done.application_id == 3
+        assert installs.calls == [(True, "service-token")]
+        assert queue._entries == {}
+        assert not os.path.exists(service.package_path(job.id))
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_is_reclaimed_and_retried(self, test_settings: Settings):
+        """测试原 worker 退出后，无心跳的执行中任务由其他 worker 接管重试。"""
+        installs = _Installs()
+        service, worker, job_port, queue = _wire(test_settings, installs)
+        job = await service.submit_install(chunks(b"PK"), auth_token="user-token")
+
+        # 模拟原 worker 读取并认领任务后退出
+        await queue.consume("dead-worker", 1, 10)
+        await job_port.claim_job(job.id)
+        job_port._jobs[job.id].updated_at = datetime.now() - timedelta(seconds=1)
+        await asyncio.sleep(0.06)
+
+        async def finished():
+            return (await service.get_job(job.id)).is_finished()
+
+        await _run_until(worker, finished)
+
+        assert (await service.get_job(job.id)).status == InstallJobStatus.SUCCEEDED
+        assert installs.calls == [(True, "service-token")]
+
+    @pytest.mark.asyncio
+    async def test_job_fails_after_max_deliveries(self, test_settings: Settings):
+        """测试累计投递次数超过上限的任务置为失败，不再执行。"""
+        installs = _Installs()
+        service, worker, job_port, queue = _wire(test_settings, installs)
+        job = await service.submit_install(chunks(b"PK"))
+        await queue.consume("dead-worker", 1, 10)
+        queue._pending[next(iter(queue._pending))][2] = test_settings.install_queue_max_deliveries
+        await asyncio.sleep(0.06)
+
+        async def finished():
+            return (await service.get_job(job.id)).is_finished()
+
+        await _run_until(worker, finished)
+
+        failed = await service.get_job(job.id)
+        assert failed.status == InstallJobStatus.FAILED
+        assert failed.error_code == "INSTALL_RETRY_EXHAUSTED"
+        assert installs.calls == []
+        assert queue._entries == {}
+
+    @pytest.mark.asyncio
+    async def test_running_job_with_live_heartbeat_is_not_retried(self, test_settings: Settings):
+        """测试执行中且心跳正常的任务被重新投递时不会重复执行。"""
+        installs = _Installs()
+        service, worker, job_port, _ = _wire(test_settings, installs)
+        await job_port.create_job(InstallJob(id="live", status=InstallJobStatus.RUNNING))
+
+        await worker._handle(QueuedInstall(entry_id="1-0", job_id="live", deliveries=2))
+
+        assert installs.calls == []
+        assert (await service.get_job("live")).status == InstallJobStatus.RUNNING
@@ -0,0 +1,84 @@
+"""
+Package Archive Tests
+
+Unit tests for indexing application packages and reading members straight
+from the ZIP without extracting them.
+"""
+import hashlib
+import io
+import zipfile
+
+import pytest
+
+from src.infrastructure.package_archive import PackageArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """
+    创建测试安装包。
+
+    返回:
+        PackageArchive: 已建立索引的安装包
+    """
+    zip_path = str(tmp_path / "package.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("b/manifest.yaml", "name: b")
+        zf.writestr("a/manifest.yml", "name: a-yml")
+        zf.writestr("a/manifest.yaml", "name: a")
+        zf.writestr("a/deep/manifest.yaml", "name: deep")
+        zf.writestr("a/packages/images/x.tar", b"x" * 100000)
+        zf.writestr("a/packages/images/notes.txt", b"")
+        zf.writestr("a/packages/images/sub/y.tar", b"y")
+        zf.writestr("a/packages/", b"")
+        zf.writestr("../escape.txt", b"e")
+    package = PackageArchive.load(zip_path)
+    yield package
+    package.close()
+
+
+class TestPackageArchive:
+    """安装包索引测试。"""
+
+    def test_index_sanitizes_names_and_finds_shallowest(self, archive: PackageArchive):
+        """测试成员名去掉 ".."、忽略目录项，逐层查找时同层按目录排序、同目录按文件名优先级。"""
+        assert archive.exists("escape.txt")
+        assert not archive.exists("a/packages")
+        assert archive.find(["manifest.yaml", "manifest.yml"]) == "a/manifest.yaml"
+        assert archive.find(["manifest.yml", "manifest.yaml"]) == "a/manifest.yml"
+        assert archive.subdir("a/deep").find(["manifest.yaml"]) == "manifest.yaml"
+
+    def test_subdir_lists_direct_children_with_suffix_filter(self, archive: PackageArchive):
+        """测试以子目录为根的视图只列出直接子文件，并按扩展名过滤。"""
+        package = archive.subdir("a")
+
+        assert package.listdir("packages/images", (".tar",)) == ["x.tar"]
+        assert package.listdir("packages/images") == ["notes.txt", "x.tar"]
+        assert package.listdir("missing") == []
+        assert package.read_text("manifest.yaml") == "name: a"
+        assert package.size("packages/images/x.tar") == 100000
+
+    def test_reader_reports_size_without_decompressing_and_hashes_while_reading(
+        self, archive: PackageArchive
+    ):
+        """测试 seek 到末尾获取大小时不解压成员，从头顺序读完后得到 SHA-256。"""
+        reader = archive.open("a/packages/images/x.tar")
+
+        reader.seek(0, io.SEEK_END)
+        assert reader.tell() == 100000
+        assert reader._file.tell() == 0
+        reader.seek(0)
+        while reader.read(4096):
+            pass
+        reader.close()
+
+        assert reader.sha256 == hashlib.sha256(b"x" * 100000).hexdigest()
+        assert archive.sha256("a/packages/images/x.tar") == reader.sha256
+
+    def test_reader_without_full_sequential_read_has_no_digest(self, archive: PackageArchive):
+        """测试未从头顺序读完时不返回 SHA-256。"""
+        with archive.open("a/packages/images/x.tar") as reader:
+            reader.seek(10)
+            reader.read()
+
+        assert reader.sha256 is None
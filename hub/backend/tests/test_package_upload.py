@@ -0,0 +1,259 @@
+"""
+Package Upload Tests
+
+Unit tests for resumable chunked package uploads and the upload endpoints.
+"""
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters.mock_application_adapter import MockApplicationAdapter
+from src.adapters.mock_install_job_adapter import MockInstallJobAdapter
+from src.application.application_service import ApplicationService
+from src.application.install_job_service import InstallJobService
+from src.application.upload_service import PackageUploadService
+from src.domains.install_job import InstallJob
+from src.domains.upload import (
+    UploadBusyError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+)
+from src.infrastructure.config.settings import Settings
+from src.main import create_app
+from tests.conftest import chunks, sha256_hex
+
+
+@pytest.fixture
+def test_settings(tmp_path) -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(
+        app_name="DIP Hub Test",
+        temp_dir=str(tmp_path),
+        install_upload_chunk_max_size=1024,
+    )
+
+
+def _service(settings: Settings):
+    """创建上传服务，安装任务服务使用内存任务存储，安装流程替换为空操作。"""
+    application_service = ApplicationService(MockApplicationAdapter(), settings=settings)
+    application_service.install_application = AsyncMock()
+    install_job_service = InstallJobService(application_service, MockInstallJobAdapter(), settings)
+    return PackageUploadService(install_job_service, settings), install_job_service
+
+
+class TestPackageUploadService:
+    """断点续传上传服务测试。"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_appended_and_complete_submits_job(self, test_settings: Settings):
+        """测试分片按顺序追加写入，完成上传后提交安装任务并删除会话。"""
+        service, install_job_service = _service(test_settings)
+        data = b"PK" + b"x" * 98
+        session = await service.create_session(
+            len(data), created_by_id="u1", sha256=sha256_hex(data)
+        )
+
+        first, second = data[:60], data[60:]
+        session = await service.write_chunk(
+            session.id, 0, len(first), sha256_hex(first), chunks(first[:30], first[30:]),
+            created_by_id="u1",
+        )
+        assert session.offset == 60
+        session = await service.write_chunk(
+            session.id, 60, len(second), sha256_hex(second), chunks(second), created_by_id="u1"
+        )
+        assert session.is_complete()
+
+        job = await service.complete(session.id, updated_by="User 1", updated_by_id="u1")
+
+        assert job.package_size == len(data)
+        assert job.package_sha256 == sha256_hex(data)
+        assert job.updated_by_id == "u1"
+        with pytest.raises(UploadSessionNotFoundError):
+            await service.get_session(session.id, "u1")
+        await install_job_service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_discarded_and_can_be_resent(self, test_settings: Settings):
+        """测试校验和不一致或数据不完整的分片被整片丢弃，已接收字节数不变，可从原位置重传。"""
+        service, _ = _service(test_settings)
+        session = await service.create_session(10, created_by_id="u1")
+        chunk = b"0123456789"
+
+        with pytest.raises(ValueError, match="校验和"):
+            await service.write_chunk(
+                session.id, 0, 10, sha256_hex(b"other"), chunks(chunk), created_by_id="u1"
+            )
+        assert (await service.get_session(session.id, "u1")).offset == 0
+
+        with pytest.raises(ValueError, match="不完整"):
+            await service.write_chunk(
+                session.id, 0, 10, sha256_hex(chunk), chunks(chunk[:4]), created_by_id="u1"
+            )
+        assert (await service.get_session(session.id, "u1")).offset == 0
+
+        session = await service.write_chunk(
+            session.id, 0, 10, sha256_hex(chunk), chunks(chunk), created_by_id="u1"
+        )
+        assert session.offset == 10
+
+    @pytest.mark.asyncio
+    async def test_offset_mismatch_reports_received_offset(self, test_settings: Settings):
+        """测试分片起始位置与已接收字节数不一致、未上传完成即提交时返回已接收字节数。"""
+        service, _ = _service(test_settings)
+        session = await service.create_session(20, created_by_id="u1")
+        await service.write_chunk(
+            session.id, 0, 5, sha256_hex(b"abcde"), chunks(b"abcde"), created_by_id="u1"
+        )
+
+        with pytest.raises(UploadOffsetMismatchError) as exc_info:
+            await service.write_chunk(
+                session.id, 10, 5, sha256_hex(b"fghij"), chunks(b"fghij"), created_by_id="u1"
+            )
+        assert exc_info.value.offset == 5
+
+        with pytest.raises(UploadOffsetMismatchError):
+            await service.complete(session.id, updated_by_id="u1")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_complete_submits_one_job(self, test_settings: Settings):
+        """测试同一会话并发完成上传时只提交一个安装任务，其余请求返回会话不存在或会话忙。"""
+        service, install_job_service = _service(test_settings)
+        session = await service.create_session(10, created_by_id="u1")
+        chunk = b"PK01234567"
+        await service.write_chunk(
+            session.id, 0, 10, sha256_hex(chunk), chunks(chunk), created_by_id="u1"
+        )
+
+        results = await asyncio.gather(
+            *(service.complete(session.id, updated_by_id="u1") for _ in range(4)),
+            return_exceptions=True,
+        )
+
+        jobs = [result for result in results if isinstance(result, InstallJob)]
+        assert len(jobs) == 1
+        for result in results:
+            if not isinstance(result, InstallJob):
+                assert isinstance(result, (UploadSessionNotFoundError, UploadBusyError))
+        assert os.listdir(os.path.join(test_settings.temp_dir, "uploads")) == []
+        await install_job_service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_submit_keeps_session(self, test_settings: Settings):
+        """测试提交安装任务失败时恢复数据文件，会话保留，客户端可以重试完成上传。"""
+        service, install_job_service = _service(test_settings)
+        session = await service.create_session(10, created_by_id="u1")
+        chunk = b"PK01234567"
+        await service.write_chunk(
+            session.id, 0, 10, sha256_hex(chunk), chunks(chunk), created_by_id="u1"
+        )
+
+        submit = AsyncMock(side_effect=OSError("disk full"))
+        with patch.object(install_job_service, "submit_package", submit):
+            with pytest.raises(OSError):
+                await service.complete(session.id, updated_by_id="u1")
+
+        assert (await service.get_session(session.id, "u1")).is_complete()
+        job = await service.complete(session.id, updated_by_id="u1")
+        assert job.package_size == 10
+        await install_job_service.close()
+
+    @pytest.mark.asyncio
+    async def test_abort_while_writing_is_rejected(self, test_settings: Settings):
+        """测试分片写入期间取消上传返回会话忙，写入结束后可以取消。"""
+        service, _ = _service(test_settings)
+        session = await service.create_session(10, created_by_id="u1")
+        f = service._open_locked(session.id, "r+b")
+        try:
+            with pytest.raises(UploadBusyError):
+                await service.abort(session.id, "u1")
+        finally:
+            f.close()
+
+        await service.abort(session.id, "u1")
+        with pytest.raises(UploadSessionNotFoundError):
+            await service.abort(session.id, "u1")
+
+    @pytest.mark.asyncio
+    async def test_session_is_private_and_expires(self, test_settings: Settings):
+        """测试其他用户无法访问会话，过期会话被清理。"""
+        service, _ = _service(test_settings)
+        session = await service.create_session(10, created_by_id="u1")
+        with pytest.raises(UploadSessionNotFoundError):
+            await service.get_session(session.id, "u2")
+        with pytest.raises(UploadSessionNotFoundError):
+            await service.get_session("../../etc/passwd", "u1")
+
+        part_path = os.path.join(test_settings.temp_dir, "uploads", f"{session.id}.part")
+        os.utime(part_path, (0, 0))
+
+        assert await service.purge_expired() == 1
+        assert os.listdir(os.path.join(test_settings.temp_dir, "uploads")) == []
+
+
+class TestPackageUploadRouter:
+    """断点续传上传接口测试。"""
+
+    def test_upload_chunks_and_complete(self, test_settings: Settings, authenticated):
+        """测试创建会话、上传分片、处理起始位置冲突、查询已接收字节数并完成上传。"""
+        client = TestClient(create_app(test_settings))
+        prefix = f"{test_settings.api_prefix}/applications/uploads"
+        data = b"PK" + b"y" * 18
+
+        response = client.post(prefix, json={"size": len(data)}, headers=authenticated)
+        assert response.status_code == 201
+        upload_id = response.json()["id"]
+        assert response.headers["Location"].endswith(f"/applications/uploads/{upload_id}")
+
+        def put(start: int, end: int):
+            chunk = data[start:end + 1]
+            return client.put(
+                f"{prefix}/{upload_id}",
+                content=chunk,
+                headers={
+                    **authenticated,
+                    "Content-Type": "application/octet-stream",
+                    "Content-Range": f"bytes {start}-{end}/{len(data)}",
+                    "X-Chunk-SHA256": sha256_hex(chunk),
+                },
+            )
+
+        assert put(0, 9).json()["offset"] == 10
+        conflict = put(0, 9)
+        assert conflict.status_code == 409
+        assert conflict.json()["code"] == "UPLOAD_OFFSET_MISMATCH"
+        assert conflict.json()["detail"] == {"offset": 10}
+        assert client.get(f"{prefix}/{upload_id}", headers=authenticated).json()["offset"] == 10
+        assert put(10, 19).json()["offset"] == 20
+
+        job = InstallJob(id="job123", package_size=len(data))
+        with patch.object(
+            InstallJobService, "submit_package", AsyncMock(return_value=job)
+        ) as submit:
+            response = client.post(f"{prefix}/{upload_id}/complete", headers=authenticated)
+
+        assert response.status_code == 202
+        assert response.json()["id"] == "job123"
+        assert response.headers["Location"].endswith("/applications/jobs/job123")
+        assert submit.await_args.kwargs["updated_by_id"] == "u1"
+
+    def test_put_without_content_range_returns_400(self, test_settings: Settings, authenticated):
+        """测试缺少 Content-Range 请求头时返回 400。"""
+        client = TestClient(create_app(test_settings))
+
+        response = client.put(
+            f"{test_settings.api_prefix}/applications/uploads/{'0' * 32}",
+            content=b"PK",
+            headers={**authenticated, "X-Chunk-SHA256": sha256_hex(b"PK")},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_CONTENT_RANGE"
@@ -0,0 +1,278 @@
+"""
+Upgrade Plan Tests
+
+Unit tests for the incremental upgrade planner and the dry-run plan endpoint.
+"""
+import io
+import zipfile
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.application_service import ApplicationService
+from src.domains.application import (
+    AgentConfigItem,
+    Application,
+    OntologyConfigItem,
+    ReleaseConfigItem,
+)
+from src.domains.upgrade_plan import PlanAction, PlanItem, PlanItemKind, UpgradePlan
+from src.infrastructure.concurrency import BlockingExecutor
+from src.infrastructure.config.settings import Settings
+from src.main import create_app
+from src.ports.external_service_port import AgentFactoryResult, ChartInfo, ChartUploadResult
+from tests.conftest import sha256_hex
+
+CHART = b"chart-v1"
+IMAGE = b"image-v1"
+ONTOLOGY_SAME = b'{"name": "same"}'
+ONTOLOGY_CHANGED = b'{"name": "changed"}'
+AGENT_NEW = b'{"name": "new"}'
+CHART_PATH = "packages/charts/app.tgz"
+IMAGE_PATH = "packages/images/app.tar"
+
+
+@pytest.fixture
+def test_settings(tmp_path) -> Settings:
+    """
+    创建测试配置。
+
+    返回:
+        Settings: 测试用的应用配置。
+    """
+    return Settings(app_name="DIP Hub Test", temp_dir=str(tmp_path))
+
+
+def _package(
+    version: str = "1.1.0", image: bytes = IMAGE, business_domain: str = "bd"
+) -> io.BytesIO:
+    """创建包含一个镜像、一个 Chart、两个业务知识网络和一个智能体的安装包。"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr(
+            "pkg/manifest.yaml",
+            f"name: App\nversion: {version}\nbusiness-domain: {business_domain}\n"
+            "release-config:\n  namespace: ns\n",
+        )
+        zf.writestr("pkg/application.key", "k")
+        zf.writestr(f"pkg/{IMAGE_PATH}", image)
+        zf.writestr(f"pkg/{CHART_PATH}", CHART)
+        zf.writestr("pkg/ontologies/same.json", ONTOLOGY_SAME)
+        zf.writestr("pkg/ontologies/changed.json", ONTOLOGY_CHANGED)
+        zf.writestr("pkg/agents/new.json", AGENT_NEW)
+    buffer.seek(0)
+    return buffer
+
+
+def _release_digest(namespace: str = "ns", image: bytes = IMAGE) -> str:
+    return ApplicationService._release_fingerprint(
+        sha256_hex(CHART), namespace, [sha256_hex(image)]
+    )
+
+
+def _config_digest(data: bytes, business_domain: str = "bd") -> str:
+    return ApplicationService._config_fingerprint(sha256_hex(data), business_domain)
+
+
+def _installed() -> Application:
+    """已安装的 1.0.0 版本：Release 与 same.json 未变化，changed.json 有变化，gone.json 已移除。"""
+    return Application(
+        id=7,
+        key="k",
+        name="App",
+        version="1.0.0",
+        release_config=[ReleaseConfigItem(
+            name="app", namespace="ns", source=CHART_PATH,
+            digest=_release_digest(),
+        )],
+        ontology_config=[
+            OntologyConfigItem(
+                id="kn-1", is_config=True, source="same.json",
+                digest=_config_digest(ONTOLOGY_SAME),
+            ),
+            OntologyConfigItem(
+                id="kn-2", is_config=True, source="changed.json", digest=_config_digest(b"{}")
+            ),
+            OntologyConfigItem(
+                id="kn-3", is_config=True, source="gone.json", digest=_config_digest(b"{}")
+            ),
+        ],
+        agent_config=[AgentConfigItem(id="agent-1", is_config=True)],
+    )
+
+
+class _CountingExecutor(BlockingExecutor):
+    """记录执行的函数名和最大并发数的执行器。"""
+
+    def __init__(self, max_workers: int = 4):
+        super().__init__(max_workers)
+        self.names = []
+        self.active = 0
+        self.max_active = 0
+
+    async def run(self, fn, *args, **kwargs):
+        self.names.append(getattr(fn, "__name__", ""))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            return await super().run(fn, *args, **kwargs)
+        finally:
+            self.active -= 1
+
+
+def _service(settings: Settings, existing: Application = None):
+    """创建应用服务，外部服务端口全部替换为 AsyncMock。"""
+    application_port = AsyncMock()
+    application_port.get_application_by_key_optional.return_value = existing
+    application_port.upsert_application.side_effect = lambda app, expected_version=None: app
+    deploy_port = AsyncMock()
+    deploy_port.upload_chart.return_value = ChartUploadResult(
+        chart=ChartInfo(name="app", version="1"), values={}
+    )
+    ontology_port = AsyncMock()
+    ontology_port.create_knowledge_network.return_value = "kn-new"
+    agent_port = AsyncMock()
+    agent_port.create_agent.return_value = AgentFactoryResult(id="agent-new", version="v1")
+    service = ApplicationService(
+        application_port,
+        deploy_installer_port=deploy_port,
+        ontology_manager_port=ontology_port,
+        agent_factory_port=agent_port,
+        settings=settings,
+    )
+    return service, deploy_port, ontology_port, agent_port
+
+
+class TestUpgradePlanner:
+    """增量升级计划测试。"""
+
+    @pytest.mark.asyncio
+    async def test_plan_install_diffs_against_installed_version(self, test_settings: Settings):
+        """测试预演按来源文件和指纹对比已安装版本，且不调用任何外部服务。"""
+        service, deploy_port, ontology_port, agent_port = _service(test_settings, _installed())
+
+        plan = await service.plan_install(_package())
+
+        actions = {(item.kind, item.source): (item.action, item.target_id) for item in plan.items}
+        assert plan.installed_version == "1.0.0" and plan.version == "1.1.0"
+        assert actions == {
+            (PlanItemKind.RELEASE, CHART_PATH): (PlanAction.UNCHANGED, "app"),
+            (PlanItemKind.ONTOLOGY, "changed.json"): (PlanAction.RECREATE, "kn-2"),
+            (PlanItemKind.ONTOLOGY, "same.json"): (PlanAction.UNCHANGED, "kn-1"),
+            (PlanItemKind.ONTOLOGY, "gone.json"): (PlanAction.REMOVED, "kn-3"),
+            (PlanItemKind.AGENT, "new.json"): (PlanAction.CREATE, None),
+        }
+        for port in (deploy_port, ontology_port, agent_port):
+            assert port.method_calls == []
+        service._application_port.upsert_application.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_install_applies_plan(self, test_settings: Settings):
+        """测试升级时跳过未变化的 Release 和业务知识网络，有变化的新建并记录新 ID、来源和指纹。"""
+        service, deploy_port, ontology_port, agent_port = _service(test_settings, _installed())
+
+        result = await service.install_application(_package())
+
+        deploy_port.upload_chart.assert_not_called()
+        deploy_port.install_release.assert_not_called()
+        ontology_port.create_knowledge_network.assert_awaited_once()
+        assert ontology_port.create_knowledge_network.await_args.args[0] == {"name": "changed"}
+        agent_port.create_agent.assert_awaited_once()
+        assert [(r.name, r.source) for r in result.release_config] == [("app", CHART_PATH)]
+        assert [(o.id, o.is_config, o.digest) for o in result.ontology_config] == [
+            ("kn-new", False, _config_digest(ONTOLOGY_CHANGED)),
+            ("kn-1", True, _config_digest(ONTOLOGY_SAME)),
+        ]
+        assert [(a.id, a.source) for a in result.agent_config] == [("agent-new", "new.json")]
+
+    @pytest.mark.asyncio
+    async def test_changed_namespace_reinstalls_release(self, test_settings: Settings):
+        """测试 Chart 未变化但命名空间变化时 Release 重新安装并记录新指纹。"""
+        installed = _installed()
+        installed.release_config[0].digest = _release_digest(namespace="old-ns")
+        service, deploy_port, _, _ = _service(test_settings, installed)
+
+        result = await service.install_application(_package())
+
+        deploy_port.install_release.assert_awaited_once()
+        assert result.release_config[0].digest == _release_digest()
+
+    @pytest.mark.asyncio
+    async def test_changed_image_reinstalls_release(self, test_settings: Settings):
+        """测试 Chart 未变化但安装包中的镜像变化时 Release 重新安装。"""
+        service, deploy_port, _, _ = _service(test_settings, _installed())
+
+        plan = await service.plan_install(_package(image=b"image-v2"))
+
+        assert plan.find(PlanItemKind.RELEASE, CHART_PATH).action == PlanAction.INSTALL
+
+    @pytest.mark.asyncio
+    async def test_plan_hashes_in_digest_pool_one_file_at_a_time(self, test_settings: Settings):
+        """测试预演在摘要线程池中逐个计算 Chart 和镜像摘要，不占用文件读写线程池。"""
+        service, _, _, _ = _service(test_settings, _installed())
+        service._digest_executor = digest_executor = _CountingExecutor()
+        service._blocking_executor = io_executor = _CountingExecutor()
+
+        await service.plan_install(_package())
+
+        assert digest_executor.names.count("sha256") >= 2
+        assert digest_executor.max_active == 1
+        assert "sha256" not in io_executor.names
+
+    @pytest.mark.asyncio
+    async def test_changed_business_domain_recreates_configs(self, test_settings: Settings):
+        """测试业务域变化时未改动的业务知识网络也在新业务域中重新新建。"""
+        service, _, _, _ = _service(test_settings, _installed())
+
+        plan = await service.plan_install(_package(business_domain="other"))
+
+        assert plan.find(PlanItemKind.ONTOLOGY, "same.json").action == PlanAction.RECREATE
+
+    @pytest.mark.asyncio
+    async def test_first_install_records_fingerprint_after_upload(self, test_settings: Settings):
+        """测试首次安装不预先计算镜像摘要，Release 指纹在镜像上传后记录。"""
+        service, _, _, _ = _service(test_settings)
+
+        result = await service.install_application(_package())
+
+        assert result.release_config[0].digest == _release_digest()
+
+
+class TestUpgradePlanRouter:
+    """预演安装接口测试。"""
+
+    def test_plan_endpoint_returns_plan(self, test_settings: Settings, authenticated):
+        """测试预演接口返回安装计划。"""
+        client = TestClient(create_app(test_settings))
+        plan = UpgradePlan(
+            key="k", name="App", version="1.1.0", installed_version="1.0.0",
+            items=[PlanItem(
+                kind=PlanItemKind.ONTOLOGY, source="a.json", action=PlanAction.RECREATE,
+                target_id="kn-1",
+            )],
+        )
+
+        url = f"{test_settings.api_prefix}/applications/plan"
+
+        with patch.object(ApplicationService, "plan_install", AsyncMock(return_value=plan)):
+            response = client.post(url, content=b"PK", headers=authenticated)
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [
+            {"kind": "ontology", "source": "a.json", "action": "recreate", "target_id": "kn-1"}
+        ]
+
+    def test_plan_endpoint_returns_409_on_version_conflict(
+        self, test_settings: Settings, authenticated
+    ):
+        """测试版本冲突时返回 409。"""
+        client = TestClient(create_app(test_settings))
+        url = f"{test_settings.api_prefix}/applications/plan"
+        conflict = AsyncMock(side_effect=ValueError("版本号冲突"))
+
+        with patch.object(ApplicationService, "plan_install", conflict):
+            response = client.post(url, content=b"PK", headers=authenticated)
+
+        assert response.status_code == 409
+        assert response.json()["code"] == "VERSION_CONFLICT"
@@ -8,8 +8,10 @@ export interface ApplicationBasicInfo {
   name: string
   /** 应用描述 */
   description?: string
-  /** 应用图标（Base64编码字符串） */
+  /** 应用图标（Base64编码字符串或图标地址） */
   icon?: string
+  /** 应用图标地址 */
+  icon_url?: string
   /** 应用所属分组 */
   category?: string
   /** 应用版本号 */
@@ -41,6 +43,39 @@ export interface ApplicationInfo extends ApplicationBasicInfo {
   agent_ids?: number[]
 }
 
+/** 安装任务状态 */
+export type InstallJobStatus = 'pending' | 'running' | 'succeeded' | 'failed'
+
+/** 安装任务 */
+export interface InstallJob {
+  /** 安装任务 ID */
+  id: string
+  /** 任务状态 */
+  status: InstallJobStatus
+  /** 当前阶段 */
+  stage?: 'queued' | 'extracting' | 'uploading' | 'importing' | 'saving' | 'done'
+  /** 安装包字节数 */
+  package_size?: number
+  /** 需要上传的镜像和 Chart 总字节数 */
+  bytes_total?: number
+  /** 已上传的镜像和 Chart 字节数 */
+  bytes_uploaded?: number
+  /** 安装成功后的应用主键 ID */
+  application_id?: number
+  /** 应用唯一标识 */
+  application_key?: string
+  /** 失败时的错误码 */
+  error_code?: string
+  /** 失败原因 */
+  error?: string
+  /** 创建时间（ISO 8601 date-time） */
+  created_at?: string
+  /** 最近一次状态或进度更新时间（ISO 8601 date-time） */
+  updated_at?: string
+  /** 结束时间（ISO 8601 date-time） */
+  finished_at?: string
+}
+
 /** 业务知识网络信息 */
 export interface OntologyInfo {
   /** 知识网络 ID */
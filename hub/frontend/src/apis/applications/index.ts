@@ -3,20 +3,25 @@ import type {
   AgentInfo,
   ApplicationBasicInfo,
   ApplicationInfo,
+  InstallJob,
   OntologyInfo,
   PinMicroAppParams,
   PinnedMicroAppsResponse,
 } from './index.d'
 
 // 导出类型定义（仅导出外部使用的类型）
-export type { ApplicationInfo, ApplicationBasicInfo, OntologyInfo, AgentInfo }
+export type { ApplicationInfo, ApplicationBasicInfo, InstallJob, OntologyInfo, AgentInfo }
+
+/** 安装任务轮询间隔（毫秒） */
+const INSTALL_JOB_POLL_INTERVAL = 2000
 
 /**
- * 安装应用
+ * 提交安装任务
  * OpenAPI: POST /applications (application/octet-stream, binary)
- * @returns 应用信息
+ * 安装包接收完成后返回 202 和安装任务，安装在后台执行
+ * @returns 安装任务
  */
-export const postApplications = (file: Blob | ArrayBuffer): Promise<ApplicationInfo> => {
+export const postApplications = (file: Blob | ArrayBuffer): Promise<InstallJob> => {
   return post(`/api/dip-hub/v1/applications`, {
     body: file,
     headers: { 'Content-Type': 'application/octet-stream' },
@@ -24,11 +29,101 @@ export const postApplications = (file: Blob | ArrayBuffer): Promise<ApplicationI
   })
 }
 
+/**
+ * 查询安装任务
+ * OpenAPI: GET /applications/jobs/{id}
+ * @returns 安装任务
+ */
+export const getInstallJob = (id: string): Promise<InstallJob> =>
+  get(`/api/dip-hub/v1/applications/jobs/${encodeURIComponent(id)}`)
+
+/**
+ * 安装应用
+ * 提交安装包后轮询安装任务直到成功或失败：成功时返回安装后的应用基础信息，
+ * 失败时以任务的失败原因（description）reject；返回的 Promise 支持 abort
+ * @returns 应用基础信息
+ */
+export const installApplication = (
+  file: Blob | ArrayBuffer,
+): Promise<ApplicationBasicInfo> & { abort: () => void } => {
+  let currentRequest: any = null
+  let aborted = false
+  let timer: ReturnType<typeof setTimeout> | undefined
+  let wake: (() => void) | undefined
+
+  const wait = () =>
+    new Promise<void>((resolve) => {
+      wake = resolve
+      timer = setTimeout(resolve, INSTALL_JOB_POLL_INTERVAL)
+    })
+
+  const load = async (): Promise<ApplicationBasicInfo> => {
+    currentRequest = postApplications(file)
+    let job: InstallJob = await currentRequest
+    while (job.status !== 'succeeded' && job.status !== 'failed') {
+      await wait()
+      if (aborted) throw new Error('CANCEL')
+      currentRequest = getInstallJob(job.id)
+      job = await currentRequest
+    }
+    if (job.status === 'failed') {
+      throw { code: job.error_code, description: job.error || '安装失败，请重试' }
+    }
+    if (aborted) throw new Error('CANCEL')
+    currentRequest = getApplicationsBasicInfo(job.application_id)
+    return await currentRequest
+  }
+
+  const promise: any = load()
+  promise.abort = () => {
+    aborted = true
+    clearTimeout(timer)
+    wake?.()
+    currentRequest?.abort()
+  }
+  return promise
+}
+
+/**
+ * 列表和基础信息接口不再内联图标数据，使用 icon_url 作为图标来源
+ */
+const withIcon = <T extends ApplicationBasicInfo>(app: T): T => ({
+  ...app,
+  icon: app.icon || app.icon_url,
+})
+
 /**
  * 获取应用列表
+ * 接口按游标分页，逐页读取直到响应头不再返回 X-Next-Cursor；返回的 Promise 支持 abort
  * @returns 应用列表
  */
-export const getApplications = (): Promise<ApplicationInfo[]> => get(`/api/dip-hub/v1/applications`)
+export const getApplications = (): Promise<ApplicationInfo[]> & { abort: () => void } => {
+  let currentRequest: any = null
+  let aborted = false
+
+  const load = async (): Promise<ApplicationInfo[]> => {
+    const apps: ApplicationInfo[] = []
+    let cursor: string | undefined
+    do {
+      if (aborted) throw new Error('CANCEL')
+      currentRequest = get(`/api/dip-hub/v1/applications`, {
+        params: cursor ? { cursor } : undefined,
+        returnFullResponse: true,
+      })
+      const response = await currentRequest
+      apps.push(...(response.data as ApplicationInfo[]).map(withIcon))
+      cursor = response.headers?.['x-next-cursor'] || undefined
+    } while (cursor)
+    return apps
+  }
+
+  const promise: any = load()
+  promise.abort = () => {
+    aborted = true
+    currentRequest?.abort()
+  }
+  return promise
+}
 
 /**
  * 配置应用（业务知识网络 & 智能体）
@@ -49,7 +144,10 @@ export const getApplications = (): Promise<ApplicationInfo[]> => get(`/api/dip-h
  * 支持通过 appId 或 packageName 任意一个参数查询
  */
 export const getApplicationsBasicInfo = (id?: number): Promise<ApplicationBasicInfo> => {
-  return get(`/api/dip-hub/v1/applications/basic-info`, { params: { id } })
+  const request = get(`/api/dip-hub/v1/applications/basic-info`, { params: { id } })
+  const promise: any = request.then(withIcon)
+  promise.abort = request.abort
+  return promise
 }
 
 /**
@@ -3,7 +3,7 @@ import clsx from 'clsx'
 import { useState } from 'react'
 
 interface AppIconProps {
-  /** 应用图标（Base64编码字符串） */
+  /** 应用图标（Base64编码字符串或图标地址） */
   icon?: string
   /** 应用名称（用于显示首字母） */
   name?: string
@@ -21,7 +21,7 @@ interface AppIconProps {
 
 /**
  * 应用图标组件
- * 支持显示 base64 图片，加载失败时自动 fallback 到 Avatar 显示首字母
+ * 支持显示 base64 图片或图标地址，加载失败时自动 fallback 到 Avatar 显示首字母
  */
 const AppIcon = ({
   icon,
@@ -48,8 +48,9 @@ const AppIcon = ({
     )
   }
 
-  // 判断 icon 是否已经是完整的 data URL
-  const imageSrc = icon.startsWith('data:') ? icon : `data:image/png;base64,${icon}`
+  // 判断 icon 是否已经是完整的 data URL 或图标地址
+  const isUrl = icon.startsWith('data:') || icon.startsWith('/') || /^https?:\/\//.test(icon)
+  const imageSrc = isUrl ? icon : `data:image/png;base64,${icon}`
 
   return hasBorder ? (
     <Avatar
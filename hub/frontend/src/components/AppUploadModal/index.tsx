@@ -8,8 +8,8 @@ import type { ModalProps, UploadProps } from 'antd'
 import { Button, Modal, message, Spin, Upload } from 'antd'
 import clsx from 'clsx'
 import { useEffect, useRef, useState } from 'react'
-import type { ApplicationInfo } from '@/apis/applications'
-import { postApplications } from '@/apis/applications'
+import type { ApplicationBasicInfo } from '@/apis/applications'
+import { installApplication } from '@/apis/applications'
 import UploadFileIcon from '@/assets/images/uploadFile.svg?react'
 import ScrollBarContainer from '../ScrollBarContainer'
 import styles from './index.module.less'
@@ -20,8 +20,8 @@ import { formatFileSize, getFileInfo, validateFileFormat, validateFileSize } fro
 const { Dragger } = Upload
 
 export interface AppUploadModalProps extends Pick<ModalProps, 'open' | 'onCancel'> {
-  /** 上传成功的回调，传递应用信息 */
-  onSuccess: (appInfo: ApplicationInfo) => void
+  /** 安装成功的回调，传递应用基础信息 */
+  onSuccess: (appInfo: ApplicationBasicInfo) => void
 }
 
 /** 上传应用安装包弹窗 */
@@ -29,7 +29,7 @@ const AppUploadModal = ({ open, onCancel, onSuccess }: AppUploadModalProps) => {
   const [uploadStatus, setUploadStatus] = useState<UploadStatus>(UploadStatus.INITIAL)
   const [fileInfo, setFileInfo] = useState<FileInfo | null>(null)
   const [errorMessage, setErrorMessage] = useState<string>('')
-  const [uploadedAppInfo, setUploadedAppInfo] = useState<ApplicationInfo | null>(null)
+  const [uploadedAppInfo, setUploadedAppInfo] = useState<ApplicationBasicInfo | null>(null)
   const uploadRequestRef = useRef<{ abort: () => void } | null>(null)
 
   // 重置状态
@@ -106,9 +106,9 @@ const AppUploadModal = ({ open, onCancel, onSuccess }: AppUploadModalProps) => {
     setErrorMessage('')
 
     try {
-      // 将文件转换为 Blob
+      // 将文件转换为 Blob，提交安装任务并等待安装完成
       const blob = fileInfo.file
-      const requestPromise = postApplications(blob)
+      const requestPromise = installApplication(blob)
       // 保存请求引用用于取消
       uploadRequestRef.current = requestPromise as any
 
@@ -171,7 +171,7 @@ const AppUploadModal = ({ open, onCancel, onSuccess }: AppUploadModalProps) => {
       // 上传中需要二次确认
       Modal.confirm({
         title: '确认取消安装',
-        content: '正在上传中，取消后将中断上传。是否继续？',
+        content: '正在安装中，取消后将不再等待安装结果（安装包已上传时安装会在后台继续）。是否继续？',
         okText: '确定',
         okType: 'primary',
         okButtonProps: { danger: true },
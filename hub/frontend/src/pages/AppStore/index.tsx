@@ -1,7 +1,11 @@
 import { ExclamationCircleFilled, ReloadOutlined } from '@ant-design/icons'
 import { Button, Modal, message, Spin, Tooltip } from 'antd'
 import { memo, useCallback, useEffect, useRef, useState } from 'react'
-import { type ApplicationInfo, deleteApplications } from '@/apis/applications'
+import {
+  type ApplicationBasicInfo,
+  type ApplicationInfo,
+  deleteApplications,
+} from '@/apis/applications'
 import AppConfigDrawer from '@/components/AppConfigDrawer'
 import AppList from '@/components/AppList'
 import { ModeEnum } from '@/components/AppList/types'
@@ -19,7 +23,7 @@ const AppStore = () => {
     useApplicationsService()
   const [installModalVisible, setInstallModalVisible] = useState(false)
   const [configModalVisible, setConfigModalVisible] = useState(false)
-  const [selectedApp, setSelectedApp] = useState<ApplicationInfo | null>(null)
+  const [selectedApp, setSelectedApp] = useState<ApplicationBasicInfo | null>(null)
   const [hasLoadedData, setHasLoadedData] = useState(false) // 记录是否已经成功加载过数据（有数据的情况）
   const hasEverHadDataRef = useRef(false) // 使用 ref 追踪是否曾经有过数据，避免循环依赖
   const prevSearchValueRef = useRef('') // 追踪上一次的搜索值，用于判断是否是从搜索状态清空
@@ -220,7 +224,7 @@ const AppStore = () => {
                   <span className="inline-block max-w-md truncate align-bottom">
                     {appInfo.name}
                   </span>
-                  "上传成功，请完成配置以启用服务。
+                  "安装成功，请完成配置以启用服务。
                   <button
                     type="button"
                     onClick={() => {